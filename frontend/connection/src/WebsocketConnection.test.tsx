@@ -681,7 +681,7 @@ describe("WebsocketConnection auth token handling", () => {
     server.close()
   })
 
-  it("always sets first Sec-WebSocket-Protocol option to 'streamlit'", async () => {
+  it("always sets first Sec-WebSocket-Protocol option to 'streamlit-batch'", async () => {
     const resetHostAuthToken = vi.fn()
     const ws = new WebsocketConnection(createMockArgs({ resetHostAuthToken }))
 
@@ -693,7 +693,7 @@ describe("WebsocketConnection auth token handling", () => {
 
     expect(websocketSpy).toHaveBeenCalledWith(
       "ws://localhost:1234/_stcore/stream",
-      ["streamlit", "PLACEHOLDER_AUTH_TOKEN"]
+      ["streamlit-batch", "PLACEHOLDER_AUTH_TOKEN"]
     )
     expect(resetHostAuthToken).toHaveBeenCalledTimes(1)
   })
@@ -715,7 +715,7 @@ describe("WebsocketConnection auth token handling", () => {
 
     expect(websocketSpy).toHaveBeenCalledWith(
       "ws://localhost:1234/_stcore/stream",
-      ["streamlit", "iAmAnAuthToken"]
+      ["streamlit-batch", "iAmAnAuthToken"]
     )
   })
 
@@ -733,7 +733,7 @@ describe("WebsocketConnection auth token handling", () => {
     // "lastSessionId" should be the WebSocket's session token
     expect(websocketSpy).toHaveBeenCalledWith(
       "ws://localhost:1234/_stcore/stream",
-      ["streamlit", "PLACEHOLDER_AUTH_TOKEN", "lastSessionId"]
+      ["streamlit-batch", "PLACEHOLDER_AUTH_TOKEN", "lastSessionId"]
     )
   })
 
@@ -756,7 +756,7 @@ describe("WebsocketConnection auth token handling", () => {
 
     expect(websocketSpy).toHaveBeenCalledWith(
       "ws://localhost:1234/_stcore/stream",
-      ["streamlit", "iAmAnAuthToken", "lastSessionId"]
+      ["streamlit-batch", "iAmAnAuthToken", "lastSessionId"]
     )
     expect(resetHostAuthToken).toHaveBeenCalledTimes(1)
   })
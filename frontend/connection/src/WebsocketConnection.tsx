@@ -24,7 +24,7 @@ import {
 } from "@streamlit/utils"
 
 import { ForwardMsgCache } from "./ForwardMessageCache"
-import { buildWsUri } from "./utils"
+import { buildWsUri, splitForwardMsgFrame } from "./utils"
 import {
   PING_MAXIMUM_RETRY_PERIOD_MS,
   PING_MINIMUM_RETRY_PERIOD_MS,
@@ -369,9 +369,12 @@ export class WebsocketConnection {
     // The reason why these tokens are set as the second/third values is that,
     // when Sec-WebSocket-Protocol is set, many clients expect the server to
     // respond with a selected subprotocol to use. We don't want that reply to
-    // contain sensitive data, so we just hard-code it to "streamlit".
+    // contain sensitive data, so we just hard-code it to "streamlit-batch",
+    // which also tells the server that we can decode frames containing several
+    // ForwardMsgs (see splitForwardMsgFrame). Servers that don't know about
+    // batching simply echo it back and send a single message per frame.
     const sessionTokens = await this.getSessionTokens()
-    this.websocket = new WebSocket(uri, ["streamlit", ...sessionTokens])
+    this.websocket = new WebSocket(uri, ["streamlit-batch", ...sessionTokens])
     this.websocket.binaryType = "arraybuffer"
 
     this.setConnectionTimeout(uri)
@@ -493,11 +496,24 @@ export class WebsocketConnection {
   }
 
   private async handleMessage(data: ArrayBuffer): Promise<void> {
-    // Assign this message an index.
-    const messageIndex = this.nextMessageIndex
-    this.nextMessageIndex += 1
+    const encodedMsgs = splitForwardMsgFrame(data)
 
-    const encodedMsg = new Uint8Array(data)
+    // Assign indices to all messages in the frame before processing any of
+    // them, so that they're dispatched in the order they were sent.
+    const firstMessageIndex = this.nextMessageIndex
+    this.nextMessageIndex += encodedMsgs.length
+
+    await Promise.all(
+      encodedMsgs.map((encodedMsg, i) =>
+        this.processMessage(firstMessageIndex + i, encodedMsg)
+      )
+    )
+  }
+
+  private async processMessage(
+    messageIndex: number,
+    encodedMsg: Uint8Array
+  ): Promise<void> {
     const msg = ForwardMsg.decode(encodedMsg)
 
     this.messageQueue[messageIndex] = await this.cache.processMessagePayload(
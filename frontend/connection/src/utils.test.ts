@@ -20,6 +20,7 @@ import {
   buildWsUri,
   getPossibleBaseUris,
   getWindowBaseUriParts,
+  splitForwardMsgFrame,
 } from "./utils"
 
 const location: Partial<Location> = {}
@@ -187,3 +188,25 @@ describe("getPossibleBaseUris", () => {
     })
   })
 })
+
+describe("splitForwardMsgFrame", () => {
+  it("returns a single message as is", () => {
+    const data = new Uint8Array([0x0a, 0x01, 0x61]).buffer
+    expect(splitForwardMsgFrame(data)).toEqual([new Uint8Array(data)])
+  })
+
+  it("splits a batch frame", () => {
+    const data = new Uint8Array([
+      0x00, 0x00, 0x00, 0x00, 0x01, 0x61, 0x00, 0x00, 0x00, 0x02, 0x62, 0x63,
+    ]).buffer
+    expect(splitForwardMsgFrame(data)).toEqual([
+      new Uint8Array([0x61]),
+      new Uint8Array([0x62, 0x63]),
+    ])
+  })
+
+  it("throws on a truncated batch frame", () => {
+    const data = new Uint8Array([0x00, 0x00, 0x00, 0x00, 0x02, 0x61]).buffer
+    expect(() => splitForwardMsgFrame(data)).toThrow("Truncated batch frame")
+  })
+})
@@ -18,6 +18,12 @@ import { isHttps, makePath } from "@streamlit/utils"
 
 import { IS_DEV_ENV, WEBSOCKET_PORT_DEV } from "./constants"
 
+/**
+ * The first byte of a websocket frame that contains several ForwardMsgs. A
+ * serialized ForwardMsg never starts with a zero byte.
+ */
+const BATCH_FRAME_MARKER = 0x00
+
 const FINAL_SLASH_RE = /\/+$/
 const INITIAL_SLASH_RE = /^\/+/
 
@@ -91,3 +97,34 @@ export function buildWsUri(
   const fullPath = makePath(pathname, path)
   return `${protocol}://${hostname}:${port}/${fullPath}`
 }
+
+/**
+ * Split a websocket frame into the serialized ForwardMsgs it contains.
+ *
+ * A frame is either a single serialized ForwardMsg, or a batch frame: a zero
+ * byte followed by any number of messages, each prefixed with its length as
+ * a big-endian uint32.
+ */
+export function splitForwardMsgFrame(data: ArrayBuffer): Uint8Array[] {
+  const bytes = new Uint8Array(data)
+  if (bytes.length === 0 || bytes[0] !== BATCH_FRAME_MARKER) {
+    return [bytes]
+  }
+
+  const view = new DataView(data)
+  const encodedMsgs: Uint8Array[] = []
+  let offset = 1
+  while (offset < bytes.length) {
+    if (offset + 4 > bytes.length) {
+      throw new Error("Truncated batch frame")
+    }
+    const length = view.getUint32(offset, false)
+    offset += 4
+    if (offset + length > bytes.length) {
+      throw new Error("Truncated batch frame")
+    }
+    encodedMsgs.push(bytes.subarray(offset, offset + length))
+    offset += length
+  }
+  return encodedMsgs
+}
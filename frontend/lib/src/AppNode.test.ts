@@ -30,6 +30,7 @@ import {
 import { isNullOrUndefined } from "~lib/util/utils"
 
 import { AppNode, AppRoot, BlockNode, ElementNode } from "./AppNode"
+import { getArrowSchemaMessage } from "./dataframes/arrowParseUtils"
 import { UNICODE } from "./mocks/arrow"
 
 const NO_SCRIPT_RUN_ID = "NO_SCRIPT_RUN_ID"
@@ -302,6 +303,48 @@ describe("ElementNode.arrowAddRows", () => {
     })
   })
 
+  describe("streamed datasets", () => {
+    const SCHEMA = getArrowSchemaMessage(UNICODE)
+    const MOCK_STREAMED_DATASET = {
+      hasName: false,
+      name: "",
+      data: { data: UNICODE },
+      isStreamed: true,
+      schemaOmitted: false,
+    } as ArrowNamedDataSet
+    const MOCK_SCHEMALESS_DATASET = {
+      hasName: false,
+      name: "",
+      data: { data: UNICODE.subarray(SCHEMA.length) },
+      isStreamed: true,
+      schemaOmitted: true,
+    } as ArrowNamedDataSet
+
+    test("addRows restores the schema of rows that were streamed without it", () => {
+      const node = arrowDataFrame()
+        .arrowAddRows(MOCK_STREAMED_DATASET, NO_SCRIPT_RUN_ID)
+        .arrowAddRows(MOCK_SCHEMALESS_DATASET, NO_SCRIPT_RUN_ID)
+      const q = node.quiverElement
+
+      expect(q.columnNames).toEqual([["", "c1", "c2"]])
+      expect(q.dimensions.numDataRows).toEqual(6)
+      expect(q.getCell(4, 0).content).toEqual("i1")
+      expect(q.getCell(4, 1).content).toEqual("foo")
+    })
+
+    test("getArrowSchemaMessage copies the schema out of the stream", () => {
+      expect(SCHEMA.buffer).not.toBe(UNICODE.buffer)
+      expect(SCHEMA.byteLength).toEqual(SCHEMA.buffer.byteLength)
+    })
+
+    test("addRows throws an error when the schema of streamed rows is unknown", () => {
+      const node = arrowDataFrame()
+      expect(() =>
+        node.arrowAddRows(MOCK_SCHEMALESS_DATASET, NO_SCRIPT_RUN_ID)
+      ).toThrow("Add rows received rows without the schema of their dataset.")
+    })
+  })
+
   describe("arrowVegaLiteChart", () => {
     const getVegaLiteChart = (
       datasets?: ArrowNamedDataSet[],
@@ -43,6 +43,7 @@ import {
   VegaLiteChartElement,
   WrappedNamedDataset,
 } from "./components/elements/ArrowVegaLiteChart"
+import { getArrowSchemaMessage } from "./dataframes/arrowParseUtils"
 import { Quiver } from "./dataframes/Quiver"
 import { ensureError } from "./util/ErrorHandling"
 
@@ -175,6 +176,10 @@ export class ElementNode implements AppNode {
 
   private lazyVegaLiteChartElement?: VegaLiteChartElement
 
+  // The schema messages of the datasets that were last streamed to this
+  // element with add_rows, by dataset name.
+  private streamedSchemas: ReadonlyMap<string, Uint8Array> = new Map()
+
   // The hash of the script that created this element.
   public readonly activeScriptHash: string
 
@@ -306,6 +311,14 @@ export class ElementNode implements AppNode {
       this.activeScriptHash,
       this.fragmentId
     )
+    newNode.streamedSchemas = this.streamedSchemas
+
+    if (namedDataSet.isStreamed) {
+      const [restoredDataSet, streamedSchemas] =
+        ElementNode.streamedAddRowsHelper(this.streamedSchemas, namedDataSet)
+      namedDataSet = restoredDataSet
+      newNode.streamedSchemas = streamedSchemas
+    }
 
     switch (elementType) {
       case "arrowTable":
@@ -335,6 +348,41 @@ export class ElementNode implements AppNode {
     return newNode
   }
 
+  /**
+   * Restore the schema of a streamed dataset if the server left it out, or
+   * remember it for later appends otherwise.
+   */
+  private static streamedAddRowsHelper(
+    streamedSchemas: ReadonlyMap<string, Uint8Array>,
+    namedDataSet: ArrowNamedDataSet
+  ): [ArrowNamedDataSet, ReadonlyMap<string, Uint8Array>] {
+    const name = namedDataSet.hasName ? namedDataSet.name : ""
+    const data = namedDataSet.data?.data ?? new Uint8Array()
+
+    if (!namedDataSet.schemaOmitted) {
+      const newStreamedSchemas = new Map(streamedSchemas)
+      newStreamedSchemas.set(name, getArrowSchemaMessage(data))
+      return [namedDataSet, newStreamedSchemas]
+    }
+
+    const schema = streamedSchemas.get(name)
+    if (schema === undefined) {
+      throw new Error(
+        "Add rows received rows without the schema of their dataset."
+      )
+    }
+
+    const ipcBytes = new Uint8Array(schema.length + data.length)
+    ipcBytes.set(schema)
+    ipcBytes.set(data, schema.length)
+    const restoredDataSet = ArrowNamedDataSet.create({
+      name: namedDataSet.name,
+      hasName: namedDataSet.hasName,
+      data: { data: ipcBytes },
+    })
+    return [restoredDataSet, streamedSchemas]
+  }
+
   private static quiverAddRowsHelper(
     element: Quiver,
     namedDataSet: ArrowNamedDataSet
@@ -86,7 +86,15 @@ function parsePandasSchema(table: Table): PandasSchema | undefined {
     // did not touch Pandas during serialization.
     return undefined
   }
-  return JSON.parse(schema)
+  const pandasSchema: PandasSchema = JSON.parse(schema)
+  // The length of a range index is that of the table. Streamed add_rows
+  // reuse the schema of an earlier append, whose stop can be out of date.
+  pandasSchema.index_columns = pandasSchema.index_columns.map(indexCol =>
+    isPandasRangeIndex(indexCol)
+      ? { ...indexCol, stop: indexCol.start + table.numRows * indexCol.step }
+      : indexCol
+  )
+  return pandasSchema
 }
 
 /** Parse DataFrame's index data values. */
@@ -407,3 +415,24 @@ export function parseArrowIpcBytes(
     dataColumnTypes,
   }
 }
+
+/**
+ * Return a copy of the schema message that Arrow bytes (IPC stream format)
+ * start with. It's copied so that keeping it around doesn't keep the whole
+ * stream in memory.
+ *
+ * @param ipcBytes - Arrow bytes (IPC stream format)
+ * @returns - The bytes of the schema message.
+ */
+export function getArrowSchemaMessage(ipcBytes: Uint8Array): Uint8Array {
+  const view = new DataView(
+    ipcBytes.buffer,
+    ipcBytes.byteOffset,
+    ipcBytes.byteLength
+  )
+  // A message starts with a continuation marker (missing in the legacy
+  // format) and the length of its metadata. Schema messages have no body.
+  const prefixLength = view.getInt32(0, true) === -1 ? 8 : 4
+  const metadataLength = view.getInt32(prefixLength - 4, true)
+  return ipcBytes.slice(0, prefixLength + metadataLength)
+}
@@ -420,6 +420,104 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "global.hashEngine",
+    description="""
+        The hash function used to compute the IDs of cached ForwardMsgs,
+        media files and elements.
+
+        Allowed values:
+        - "auto"    : Use the fastest installed engine, trying xxhash, blake3
+                      and sha256 in that order.
+        - "xxhash"  : Use XXH3 from the xxhash module.
+        - "blake3"  : Use the blake3 module.
+        - "sha256"  : Use sha256 from the standard library.
+        - "blake2b" : Use blake2b from the standard library.
+        - "md5"     : Use md5 from the standard library.
+    """,
+    visibility="hidden",
+    default_val="auto",
+    type_=str,
+)
+
+_create_option(
+    "global.maxMessageCacheBytes",
+    description="""
+        The maximum total size, in bytes, of the ForwardMsgs stored in
+        backend memory. When the cache grows past this size, the least
+        recently used messages that no session references anymore are
+        evicted. Messages still referenced by a session are kept, even if
+        that exceeds the limit. Set to 0 to disable the limit.
+    """,
+    visibility="hidden",
+    default_val=1024 * 1024 * 1024,
+    type_=int,
+)  # 1 GiB
+
+_create_option(
+    "global.maxCacheMemoryBytes",
+    description="""
+        The maximum total size, in bytes, of the in-memory contents of
+        st.cache_data, st.cache_resource, the ForwardMsg cache, media files,
+        and uploaded files. When they grow past this size, entries of
+        st.cache_data, st.cache_resource, and the ForwardMsg cache are
+        evicted, starting with large entries that haven't been used for a
+        while and are cheap to recreate. Set to 0 to disable the limit.
+    """,
+    visibility="hidden",
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "global.messageCacheSpillDir",
+    description="""
+        If set, the payloads of large cached ForwardMsgs are written to this
+        directory instead of being kept in backend memory. They're read back
+        when a client requests them.
+    """,
+    visibility="hidden",
+    default_val=None,
+    type_=str,
+)
+
+_create_option(
+    "global.messageCacheSpillThreshold",
+    description="""
+        Only spill cached ForwardMsgs that are greater than or equal to this
+        size, in bytes, to `global.messageCacheSpillDir`.
+    """,
+    visibility="hidden",
+    default_val=10 * 1024 * 1024,
+    type_=int,
+)  # 10 MiB
+
+_create_option(
+    "global.maxDiskCacheBytes",
+    description="""
+        The maximum total size, in bytes, of the values that
+        `@st.cache_data(persist="disk")` functions store on disk. When the
+        cache directory grows larger, the least recently used values are
+        removed. Set to 0 to let the directory grow without limit.
+    """,
+    visibility="hidden",
+    default_val=10 * 1024 * 1024 * 1024,
+    type_=int,
+)  # 10 GiB
+
+_create_option(
+    "global.cacheCompressionThresholdBytes",
+    description="""
+        `@st.cache_data` values whose pickled size is at least this many
+        bytes are compressed, both in memory and on disk. They're compressed
+        with zstd or lz4 if the `zstandard` or `lz4` package is installed,
+        and with zlib otherwise. Set to 0 to disable compression.
+    """,
+    visibility="hidden",
+    default_val=0,
+    type_=int,
+)
+
 _create_option(
     "global.includeFragmentRunsInForwardMessageCacheCount",
     description="""
@@ -812,6 +910,20 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "server.streamAddRows",
+    description="""
+        If true, `.add_rows()` only sends the schema of the appended data with
+        the first call on an element, and again whenever it changes. Other
+        calls only send the new rows, and calls that happen before the app's
+        messages are sent to the browser are merged into one message.
+    """,
+    visibility="hidden",
+    default_val=False,
+    scriptable=True,
+    type_=bool,
+)
+
 _create_option(
     "server.enableWebsocketCompression",
     description="""
@@ -821,6 +933,18 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "server.enableWebsocketBatching",
+    description="""
+        Enables sending all messages that are flushed to a session at the
+        same time in a single websocket frame.
+
+        Batching is only used with clients that ask for it when connecting.
+    """,
+    default_val=False,
+    type_=bool,
+)
+
 _create_option(
     "server.enableStaticServing",
     description="""
@@ -19,7 +19,6 @@ from __future__ import annotations
 import contextlib
 import dataclasses
 import inspect
-import math
 import re
 from collections import ChainMap, UserDict, UserList, deque
 from collections.abc import ItemsView, Iterable, Mapping, Sequence
@@ -65,12 +64,22 @@ _LOGGER: Final = logger.get_logger(__name__)
 # Maximum number of rows to request from an unevaluated (out-of-core) dataframe
 _MAX_UNEVALUATED_DF_ROWS = 10000
 
+# Bytes of server.maxMessageSize that are kept for the rest of the protobuf
+# message when truncating Arrow data.
+_ARROW_MESSAGE_OVERHEAD_BYTES: Final = int(1e6)
+# The number of row chunks that a truncated Arrow table is written in.
+_TRUNCATION_CHUNKS_PER_MESSAGE: Final = 64
+# The end-of-stream marker of the Arrow IPC stream format.
+_ARROW_STREAM_EOS: Final = b"\xff\xff\xff\xff\x00\x00\x00\x00"
+
 _PANDAS_DATA_OBJECT_TYPE_RE: Final = re.compile(r"^pandas.*$")
 
 _DASK_DATAFRAME: Final = "dask.dataframe.core.DataFrame"
 _DASK_INDEX: Final = "dask.dataframe.core.Index"
 _DASK_SERIES: Final = "dask.dataframe.core.Series"
 _DUCKDB_RELATION: Final = "duckdb.duckdb.DuckDBPyRelation"
+# DuckDB >= 1.4 moved its native module.
+_DUCKDB_NATIVE_RELATION: Final = "_duckdb.DuckDBPyRelation"
 _MODIN_DF_TYPE_STR: Final = "modin.pandas.dataframe.DataFrame"
 _MODIN_SERIES_TYPE_STR: Final = "modin.pandas.series.Series"
 _PANDAS_STYLER_TYPE_STR: Final = "pandas.io.formats.style.Styler"
@@ -445,7 +454,7 @@ def is_duckdb_relation(obj: object) -> bool:
     https://duckdb.org/docs/api/python/relational_api
     """
 
-    return is_type(obj, _DUCKDB_RELATION)
+    return is_type(obj, _DUCKDB_RELATION) or is_type(obj, _DUCKDB_NATIVE_RELATION)
 
 
 def _is_list_of_scalars(data: Iterable[Any]) -> bool:
@@ -759,7 +768,9 @@ Offending object:
         ) from ex
 
 
-def convert_arrow_table_to_arrow_bytes(table: pa.Table) -> bytes:
+def convert_arrow_table_to_arrow_bytes(
+    table: pa.Table, truncated_rows: int | None = None
+) -> bytes:
     """Serialize pyarrow.Table to Arrow IPC bytes.
 
     Parameters
@@ -767,32 +778,172 @@ def convert_arrow_table_to_arrow_bytes(table: pa.Table) -> bytes:
     table : pyarrow.Table
         A table to convert.
 
+    truncated_rows : int or None
+        The number of rows that were already dropped from the end of the data
+        before it was converted to the table, because they wouldn't fit into
+        the message. Only used to tell the user how many rows are shown.
+
     Returns
     -------
     bytes
         The serialized Arrow IPC bytes.
     """
-    try:
-        table = _maybe_truncate_table(table)
-    except RecursionError as err:
-        # This is a very unlikely edge case, but we want to make sure that
-        # it doesn't lead to unexpected behavior.
-        # If there is a recursion error, we just return the table as-is
-        # which will lead to the normal message limit exceed error.
-        _LOGGER.warning(
-            "Recursion error while truncating Arrow table. This is not "
-            "supposed to happen.",
-            exc_info=err,
+    import pyarrow as pa
+
+    if not config.get_option("server.enableArrowTruncation"):
+        sink = pa.BufferOutputStream()
+        writer = pa.RecordBatchStreamWriter(sink, table.schema)
+        writer.write_table(table)
+        writer.close()
+        return cast(bytes, sink.getvalue().to_pybytes())
+
+    # We keep 1 MB for the rest of the protobuf message.
+    max_bytes = max(
+        int(config.get_option("server.maxMessageSize") * 1e6)
+        - _ARROW_MESSAGE_OVERHEAD_BYTES,
+        0,
+    )
+    data, num_rows = _write_truncated_arrow_stream(table, max_bytes)
+
+    truncated_rows = (truncated_rows or 0) + table.num_rows - num_rows
+    if truncated_rows:
+        displayed_rows = string_util.simplify_number(num_rows)
+        total_rows = string_util.simplify_number(num_rows + truncated_rows)
+
+        if displayed_rows == total_rows:
+            # If the simplified numbers are the same,
+            # we just display the exact numbers.
+            displayed_rows = str(num_rows)
+            total_rows = str(num_rows + truncated_rows)
+        _show_data_information(
+            f"⚠️ Showing {displayed_rows} out of {total_rows} "
+            "rows due to data size limitations."
         )
+    return data
+
+
+def _write_truncated_arrow_stream(
+    table: pa.Table,
+    max_bytes: int,
+    chunk_rows: int | None = None,
+) -> tuple[bytes, int]:
+    """Serialize the largest prefix of a table's rows whose Arrow IPC stream
+    fits into max_bytes. At least one row is always kept.
+
+    The rows are written in chunks of chunk_rows, which by default is sized
+    so that about _TRUNCATION_CHUNKS_PER_MESSAGE chunks fit into max_bytes.
+    Only the chunk that crosses the limit is serialized again, to find out
+    how many of its rows fit. The sizes are those of the actual messages, so
+    they include the schema, dictionaries, offsets and padding.
 
+    Returns
+    -------
+    tuple[bytes, int]
+        The serialized Arrow IPC stream and the number of rows it contains.
+    """
     import pyarrow as pa
 
-    # Convert table to bytes
+    if chunk_rows is None:
+        bytes_per_row = max(table.nbytes / max(table.num_rows, 1), 1)
+        chunk_rows = int(max_bytes / _TRUNCATION_CHUNKS_PER_MESSAGE / bytes_per_row)
+    chunk_rows = max(chunk_rows, 1)
+
     sink = pa.BufferOutputStream()
     writer = pa.RecordBatchStreamWriter(sink, table.schema)
-    writer.write_table(table)
+    offset = 0
+    while offset < table.num_rows:
+        chunk = table.slice(offset, chunk_rows)
+        start_pos = sink.tell()
+        writer.write_table(chunk)
+        if sink.tell() + len(_ARROW_STREAM_EOS) > max_bytes:
+            writer.close()
+            data = sink.getvalue()
+            tail, tail_rows = _fit_arrow_chunk(
+                chunk,
+                data.slice(start_pos),
+                max_bytes - start_pos - len(_ARROW_STREAM_EOS),
+                keep_one_row=offset == 0,
+            )
+            return (
+                data.slice(0, start_pos).to_pybytes() + tail + _ARROW_STREAM_EOS,
+                offset + tail_rows,
+            )
+        offset += chunk.num_rows
     writer.close()
-    return cast(bytes, sink.getvalue().to_pybytes())
+    return cast(bytes, sink.getvalue().to_pybytes()), table.num_rows
+
+
+def _fit_arrow_chunk(
+    chunk: pa.Table,
+    chunk_stream: pa.Buffer,
+    max_bytes: int,
+    keep_one_row: bool,
+) -> tuple[bytes, int]:
+    """Return the IPC messages of the largest prefix of chunk's rows that fit
+    into max_bytes, and the number of rows in it.
+
+    chunk_stream is the stream data that was written for the whole chunk. Only
+    the kinds of messages it contains are kept, e.g. the schema is dropped if
+    it was already written for an earlier chunk.
+    """
+    import pyarrow as pa
+
+    message_types = {
+        message.type for message in pa.ipc.MessageReader.open_stream(chunk_stream)
+    }
+
+    def serialize(num_rows: int) -> bytes:
+        sink = pa.BufferOutputStream()
+        writer = pa.RecordBatchStreamWriter(sink, chunk.schema)
+        writer.write_table(chunk.slice(0, num_rows))
+        writer.close()
+        return b"".join(
+            message.serialize().to_pybytes()
+            for message in pa.ipc.MessageReader.open_stream(sink.getvalue())
+            if message.type in message_types
+        )
+
+    # The serialized size grows with the number of rows, so we look for the
+    # largest number of rows that still fits.
+    low, high = 0, chunk.num_rows - 1
+    best = b""
+    while low < high:
+        mid = (low + high + 1) // 2
+        data = serialize(mid)
+        if len(data) <= max_bytes:
+            low, best = mid, data
+        else:
+            high = mid - 1
+
+    if low == 0 and keep_one_row:
+        # Even a single row doesn't fit, but we always show at least one.
+        return serialize(1), 1
+    return best, low
+
+
+def strip_arrow_stream_schema(arrow_bytes: bytes) -> bytes:
+    """Return Arrow IPC stream bytes without the schema message they start
+    with.
+
+    The rest of the stream can be appended to another stream with the same
+    schema via `concat_arrow_streams`, or to the schema message by the
+    frontend.
+    """
+    import pyarrow as pa
+
+    schema_message = pa.ipc.MessageReader.open_stream(
+        pa.py_buffer(arrow_bytes)
+    ).read_next_message()
+    return arrow_bytes[schema_message.serialize().size :]
+
+
+def concat_arrow_streams(arrow_bytes: bytes, continuation: bytes) -> bytes:
+    """Append the messages of a stream without schema, as returned by
+    `strip_arrow_stream_schema`, to an Arrow IPC stream with the same schema.
+    """
+    if arrow_bytes.endswith(_ARROW_STREAM_EOS):
+        arrow_bytes = arrow_bytes[: -len(_ARROW_STREAM_EOS)]
+    return arrow_bytes + continuation
 
 
 def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
@@ -808,10 +959,27 @@ def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
     bytes
         The serialized Arrow IPC bytes.
     """
+    return convert_arrow_table_to_arrow_bytes(convert_pandas_df_to_arrow_table(df))
+
+
+def convert_pandas_df_to_arrow_table(df: DataFrame) -> pa.Table:
+    """Convert pandas.DataFrame to pyarrow.Table, fixing column types that
+    Arrow doesn't support.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe to convert.
+
+    Returns
+    -------
+    pyarrow.Table
+        The converted table.
+    """
     import pyarrow as pa
 
     try:
-        table = pa.Table.from_pandas(df)
+        return pa.Table.from_pandas(df)
     except (pa.ArrowTypeError, pa.ArrowInvalid, pa.ArrowNotImplementedError) as ex:
         _LOGGER.info(
             "Serialization of dataframe to Arrow table was unsuccessful. "
@@ -820,8 +988,7 @@ def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
             exc_info=ex,
         )
         df = fix_arrow_incompatible_column_types(df)
-        table = pa.Table.from_pandas(df)
-    return convert_arrow_table_to_arrow_bytes(table)
+        return pa.Table.from_pandas(df)
 
 
 def convert_arrow_bytes_to_pandas_df(source: bytes) -> DataFrame:
@@ -861,9 +1028,11 @@ def convert_anything_to_arrow_bytes(
 ) -> bytes:
     """Try to convert different formats to Arrow IPC format (bytes).
 
-    This method tries to directly convert the input data to Arrow bytes
-    for some supported formats, but falls back to conversion to a Pandas
-    DataFrame and then to Arrow bytes.
+    This method directly converts Arrow tables, Polars objects, DuckDB
+    relations, PySpark dataframes and objects that implement the Arrow
+    PyCapsule stream or dataframe interchange protocols to Arrow bytes,
+    without a round-trip through Pandas. All other formats are converted
+    to a Pandas DataFrame first.
 
     Parameters
     ----------
@@ -885,7 +1054,10 @@ def convert_anything_to_arrow_bytes(
     if isinstance(data, pa.Table):
         return convert_arrow_table_to_arrow_bytes(data)
 
-    # TODO(lukasmasuch): Add direct conversion to Arrow for supported formats here
+    converted = _convert_to_arrow_table(data, max_unevaluated_rows)
+    if converted is not None:
+        table, truncated_rows = converted
+        return convert_arrow_table_to_arrow_bytes(table, truncated_rows)
 
     # Fallback: try to convert to pandas DataFrame
     # and then to Arrow bytes.
@@ -893,6 +1065,196 @@ def convert_anything_to_arrow_bytes(
     return convert_pandas_df_to_arrow_bytes(df)
 
 
+def _convert_to_arrow_table(
+    data: Any, max_unevaluated_rows: int
+) -> tuple[pa.Table, int | None] | None:
+    """Convert data that can provide Arrow data natively to a pyarrow.Table.
+
+    Unevaluated data is limited to max_unevaluated_rows before it's loaded.
+    Arrow streams are read batch by batch: if Arrow truncation is enabled,
+    batches beyond the maximum message size are counted but not kept.
+
+    Returns
+    -------
+    tuple[pyarrow.Table, int or None] or None
+        The table and the number of rows that were dropped from the end of
+        the stream, or None if the data can't be converted directly. In that
+        case, or if the direct conversion fails, the caller should convert
+        the data via Pandas instead.
+    """
+    import pyarrow as pa
+
+    try:
+        truncated_rows: int | None = None
+        if is_polars_dataframe(data):
+            table = data.to_arrow()
+        elif is_polars_series(data):
+            table = data.to_frame().to_arrow()
+        elif is_polars_lazyframe(data):
+            table = data.limit(max_unevaluated_rows).collect().to_arrow()
+            if table.num_rows == max_unevaluated_rows:
+                _show_data_information(
+                    "⚠️ Showing only "
+                    f"{string_util.simplify_number(max_unevaluated_rows)} "
+                    "rows. Call `collect()` on the dataframe to show more."
+                )
+        elif is_duckdb_relation(data):
+            relation = data.limit(max_unevaluated_rows)
+            if has_callable_attr(relation, "fetch_arrow_reader"):
+                table, truncated_rows = _read_arrow_stream(
+                    relation.fetch_arrow_reader()
+                )
+            else:
+                table = relation.arrow()
+            if table.num_rows + (truncated_rows or 0) == max_unevaluated_rows:
+                _show_data_information(
+                    "⚠️ Showing only "
+                    f"{string_util.simplify_number(max_unevaluated_rows)} "
+                    "rows. Call `df()` on the relation to show more."
+                )
+        elif is_pyspark_data_object(data) and has_callable_attr(data, "toArrow"):
+            # Only available in PySpark >= 4.0.
+            table = data.limit(max_unevaluated_rows).toArrow()
+            if table.num_rows == max_unevaluated_rows:
+                _show_data_information(
+                    "⚠️ Showing only "
+                    f"{string_util.simplify_number(max_unevaluated_rows)} "
+                    "rows. Call `toPandas()` on the data object to show more."
+                )
+        elif determine_data_format(data) != DataFormat.UNKNOWN:
+            # All other known formats, e.g. Pandas objects, which implement
+            # the protocols below as well, are converted via Pandas.
+            return None
+        elif has_callable_attr(data, "__arrow_c_stream__") and hasattr(
+            pa.RecordBatchReader, "from_stream"
+        ):
+            # Only available in pyarrow >= 15.0.
+            table, truncated_rows = _read_arrow_stream(
+                pa.RecordBatchReader.from_stream(data)
+            )
+        elif has_callable_attr(data, "__dataframe__") and hasattr(pa, "interchange"):
+            table = pa.interchange.from_dataframe(data)
+        else:
+            return None
+
+        return _cast_to_regular_arrow_types(table), truncated_rows
+    except (pa.ArrowException, TypeError, ValueError) as ex:
+        _LOGGER.debug(
+            "Direct conversion to Arrow failed, converting via Pandas instead.",
+            exc_info=ex,
+        )
+        return None
+
+
+def _read_arrow_stream(reader: pa.RecordBatchReader) -> tuple[pa.Table, int | None]:
+    """Read an Arrow stream into a table.
+
+    If Arrow truncation is enabled, the batches that come after the maximum
+    message size is reached are only counted, so that the data that doesn't
+    fit into the message is never held in memory.
+
+    Returns
+    -------
+    tuple[pyarrow.Table, int or None]
+        The table and the number of rows that were dropped, if any.
+    """
+    import pyarrow as pa
+
+    max_bytes = (
+        int(config.get_option("server.maxMessageSize") * 1e6)
+        if config.get_option("server.enableArrowTruncation")
+        else None
+    )
+
+    batches: list[pa.RecordBatch] = []
+    num_bytes = 0
+    truncated_rows = 0
+    for batch in reader:
+        if max_bytes is not None and num_bytes > max_bytes:
+            truncated_rows += batch.num_rows
+            continue
+        batches.append(batch)
+        num_bytes += batch.nbytes
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+    return table, truncated_rows or None
+
+
+def _to_regular_arrow_type(arrow_type: pa.DataType) -> pa.DataType:
+    """Return the type that the frontend supports for the given Arrow type.
+
+    Native Arrow sources, e.g. Polars, use large and view types for strings,
+    binaries and lists, which the frontend can't read. They're replaced with
+    the regular types, which are also what a round-trip through Pandas
+    produces.
+    """
+    import pyarrow as pa
+
+    types = pa.types
+    if types.is_large_string(arrow_type) or _is_arrow_type(arrow_type, "string_view"):
+        return pa.string()
+    if types.is_large_binary(arrow_type) or _is_arrow_type(arrow_type, "binary_view"):
+        return pa.binary()
+    if (
+        types.is_list(arrow_type)
+        or types.is_large_list(arrow_type)
+        or _is_arrow_type(arrow_type, "list_view")
+        or _is_arrow_type(arrow_type, "large_list_view")
+    ):
+        value_field = arrow_type.value_field
+        return pa.list_(value_field.with_type(_to_regular_arrow_type(value_field.type)))
+    if types.is_fixed_size_list(arrow_type):
+        value_field = arrow_type.value_field
+        return pa.list_(
+            value_field.with_type(_to_regular_arrow_type(value_field.type)),
+            arrow_type.list_size,
+        )
+    if types.is_struct(arrow_type):
+        return pa.struct(
+            [
+                arrow_type.field(i).with_type(
+                    _to_regular_arrow_type(arrow_type.field(i).type)
+                )
+                for i in range(arrow_type.num_fields)
+            ]
+        )
+    if types.is_map(arrow_type):
+        return pa.map_(
+            _to_regular_arrow_type(arrow_type.key_type),
+            _to_regular_arrow_type(arrow_type.item_type),
+            arrow_type.keys_sorted,
+        )
+    if types.is_dictionary(arrow_type):
+        return pa.dictionary(
+            arrow_type.index_type,
+            _to_regular_arrow_type(arrow_type.value_type),
+            arrow_type.ordered,
+        )
+    return arrow_type
+
+
+def _is_arrow_type(arrow_type: pa.DataType, type_name: str) -> bool:
+    """True if arrow_type is of the given kind. For kinds that were added in
+    later pyarrow versions, this is False in older versions.
+    """
+    import pyarrow as pa
+
+    is_type_func = getattr(pa.types, f"is_{type_name}", None)
+    return is_type_func is not None and bool(is_type_func(arrow_type))
+
+
+def _cast_to_regular_arrow_types(table: pa.Table) -> pa.Table:
+    """Cast the columns of a table to types that the frontend supports."""
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [field.with_type(_to_regular_arrow_type(field.type)) for field in table.schema],
+        metadata=table.schema.metadata,
+    )
+    if schema.equals(table.schema):
+        return table
+    return table.cast(schema)
+
+
 def convert_anything_to_list(obj: OptionSequence[V_co]) -> list[V_co]:
     """Try to convert different formats to a list.
 
@@ -950,81 +1312,6 @@ def convert_anything_to_list(obj: OptionSequence[V_co]) -> list[V_co]:
         return [obj]  # type: ignore
 
 
-def _maybe_truncate_table(
-    table: pa.Table, truncated_rows: int | None = None
-) -> pa.Table:
-    """Experimental feature to automatically truncate tables that
-    are larger than the maximum allowed message size. It needs to be enabled
-    via the server.enableArrowTruncation config option.
-
-    Parameters
-    ----------
-    table : pyarrow.Table
-        A table to truncate.
-
-    truncated_rows : int or None
-        The number of rows that have been truncated so far. This is used by
-        the recursion logic to keep track of the total number of truncated
-        rows.
-
-    """
-
-    if config.get_option("server.enableArrowTruncation"):
-        # This is an optimization problem: We don't know at what row
-        # the perfect cut-off is to comply with the max size. But we want to figure
-        # it out in as few iterations as possible. We almost always will cut out
-        # more than required to keep the iterations low.
-
-        # The maximum size allowed for protobuf messages in bytes:
-        max_message_size = int(config.get_option("server.maxMessageSize") * 1e6)
-        # We add 1 MB for other overhead related to the protobuf message.
-        # This is a very conservative estimate, but it should be good enough.
-        table_size = int(table.nbytes + 1 * 1e6)
-        table_rows = table.num_rows
-
-        if table_rows > 1 and table_size > max_message_size:
-            # targeted rows == the number of rows the table should be truncated to.
-            # Calculate an approximation of how many rows we need to truncate to.
-            targeted_rows = math.ceil(table_rows * (max_message_size / table_size))
-            # Make sure to cut out at least a couple of rows to avoid running
-            # this logic too often since it is quite inefficient and could lead
-            # to infinity recursions without these precautions.
-            targeted_rows = math.floor(
-                max(
-                    min(
-                        # Cut out:
-                        # an additional 5% of the estimated num rows to cut out:
-                        targeted_rows - math.floor((table_rows - targeted_rows) * 0.05),
-                        # at least 1% of table size:
-                        table_rows - (table_rows * 0.01),
-                        # at least 5 rows:
-                        table_rows - 5,
-                    ),
-                    1,  # but it should always have at least 1 row
-                )
-            )
-            sliced_table = table.slice(0, targeted_rows)
-            return _maybe_truncate_table(
-                sliced_table, (truncated_rows or 0) + (table_rows - targeted_rows)
-            )
-
-        if truncated_rows:
-            displayed_rows = string_util.simplify_number(table.num_rows)
-            total_rows = string_util.simplify_number(table.num_rows + truncated_rows)
-
-            if displayed_rows == total_rows:
-                # If the simplified numbers are the same,
-                # we just display the exact numbers.
-                displayed_rows = str(table.num_rows)
-                total_rows = str(table.num_rows + truncated_rows)
-            _show_data_information(
-                f"⚠️ Showing {displayed_rows} out of {total_rows} "
-                "rows due to data size limitations."
-            )
-
-    return table
-
-
 def is_colum_type_arrow_incompatible(column: Series[Any] | Index) -> bool:
     """Return True if the column type is known to cause issues during
     Arrow conversion."""
@@ -28,7 +28,7 @@ from typing import (
 
 from typing_extensions import TypeAlias
 
-from streamlit import dataframe_util
+from streamlit import config, dataframe_util
 from streamlit.elements.lib.column_config_utils import (
     INDEX_IDENTIFIER,
     ColumnConfigMappingInput,
@@ -55,12 +55,16 @@ from streamlit.runtime.state import WidgetCallback, register_widget
 if TYPE_CHECKING:
     from collections.abc import Hashable, Iterable
 
+    import pyarrow as pa
     from numpy import typing as npt
     from pandas import DataFrame
 
     from streamlit.dataframe_util import Data
     from streamlit.delta_generator import DeltaGenerator
     from streamlit.elements.lib.built_in_chart_utils import AddRowsMetadata
+    from streamlit.proto.ArrowNamedDataSet_pb2 import (
+        ArrowNamedDataSet as ArrowNamedDataSetProto,
+    )
 
 
 SelectionMode: TypeAlias = Literal[
@@ -912,8 +916,18 @@ def _arrow_add_rows(
     msg = ForwardMsg()
     msg.metadata.delta_path[:] = dg._cursor.delta_path
 
-    default_uuid = str(hash(dg._get_delta_path_str()))
-    marshall(msg.delta.arrow_add_rows.data, new_data, default_uuid)
+    if config.get_option("server.streamAddRows") and not (
+        dataframe_util.is_pandas_styler(new_data)
+    ):
+        _marshall_streamed_rows(
+            msg.delta.arrow_add_rows,
+            cast("DataFrame", new_data),
+            dg._cursor.props.setdefault("streamed_schemas", {}),
+            name,
+        )
+    else:
+        default_uuid = str(hash(dg._get_delta_path_str()))
+        marshall(msg.delta.arrow_add_rows.data, new_data, default_uuid)
 
     if name:
         msg.delta.arrow_add_rows.name = name
@@ -924,6 +938,74 @@ def _arrow_add_rows(
     return dg
 
 
+def _marshall_streamed_rows(
+    proto: ArrowNamedDataSetProto,
+    df: DataFrame,
+    streamed_schemas: dict[str, pa.Schema],
+    name: str,
+) -> None:
+    """Marshall the rows of an add_rows call with server.streamAddRows.
+
+    The schema is left out of the Arrow stream if it's the one that was sent
+    with the last append to the same dataset of the element. The frontend
+    then reuses that one.
+
+    Parameters
+    ----------
+    proto : proto.ArrowNamedDataSet
+        Output. The protobuf of the appended dataset.
+
+    df : pandas.DataFrame
+        The rows to append.
+
+    streamed_schemas : dict[str, pyarrow.Schema]
+        The schemas that were sent to the element by dataset name, which is
+        updated with the schema of these rows.
+
+    name : str
+        The name of the dataset, or an empty string.
+    """
+    table = dataframe_util.convert_pandas_df_to_arrow_table(df)
+    arrow_bytes = dataframe_util.convert_arrow_table_to_arrow_bytes(table)
+    schema = _get_streamed_schema(table.schema)
+
+    proto.is_streamed = True
+    sent_schema = streamed_schemas.get(name)
+    if sent_schema is not None and sent_schema.equals(schema, check_metadata=True):
+        proto.data.data = dataframe_util.strip_arrow_stream_schema(arrow_bytes)
+        proto.schema_omitted = True
+        return
+
+    proto.data.data = arrow_bytes
+    if table.num_rows > 0:
+        # Rows without a schema are always appended to existing rows this way,
+        # which the frontend continues the range index of.
+        streamed_schemas[name] = schema
+    else:
+        streamed_schemas.pop(name, None)
+
+
+def _get_streamed_schema(schema: pa.Schema) -> pa.Schema:
+    """Return the schema without the bounds of its range index, if it has one.
+
+    The frontend continues the range index of the rows that are appended to,
+    and derives the length of the appended range from the number of rows, so
+    appends of different lengths and offsets can share their schema.
+    """
+    metadata = schema.metadata or {}
+    if b"pandas" not in metadata:
+        return schema
+
+    pandas_metadata = json.loads(metadata[b"pandas"])
+    for index_column in pandas_metadata.get("index_columns", []):
+        if isinstance(index_column, dict) and index_column.get("kind") == "range":
+            index_column.pop("start", None)
+            index_column.pop("stop", None)
+    return schema.with_metadata(
+        {**metadata, b"pandas": json.dumps(pandas_metadata).encode()}
+    )
+
+
 def marshall(proto: ArrowProto, data: Data, default_uuid: str | None = None) -> None:
     """Marshall pandas.DataFrame into an Arrow proto.
 
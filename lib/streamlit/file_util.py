@@ -18,11 +18,16 @@ import contextlib
 import errno
 import io
 import os
+import tempfile
 from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
 
 from streamlit import env_util, errors
 from streamlit.string_util import is_binary_string
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 # Configuration and credentials are stored inside the ~/.streamlit folder
 CONFIG_FOLDER_NAME = ".streamlit"
 
@@ -87,7 +92,7 @@ def streamlit_read(path, binary=False):
 
 
 @contextlib.contextmanager
-def streamlit_write(path, binary=False):
+def streamlit_write(path, binary=False, atomic=False):
     """Opens a file for writing within the streamlit path, and
     ensuring that the path exists. For example:
 
@@ -99,6 +104,9 @@ def streamlit_write(path, binary=False):
 
     path   - the path to write to (within the streamlit directory)
     binary - set to True for binary IO
+    atomic - set to True to write to a temporary file that replaces the file
+             at path once it has been written completely. Readers then see
+             either the old or the new file, but never a partial one.
     """
     mode = "w"
     if binary:
@@ -106,7 +114,7 @@ def streamlit_write(path, binary=False):
     path = get_streamlit_file_path(path)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     try:
-        with open(path, mode) as handle:
+        with atomic_write(path, mode) if atomic else open(path, mode) as handle:
             yield handle
     except OSError as e:
         msg = [f"Unable to write file: {os.path.abspath(path)}"]
@@ -118,6 +126,28 @@ def streamlit_write(path, binary=False):
         raise errors.Error("\n".join(msg))
 
 
+@contextlib.contextmanager
+def atomic_write(path: str, mode: str = "w") -> Iterator[IO[Any]]:
+    """Opens a temporary file for writing that replaces the file at path once
+    it has been written completely. If writing fails, the file at path is left
+    untouched.
+
+    path - the path to write to. Its directory must exist.
+    mode - the mode to open the file with, e.g. "w" or "wb"
+    """
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}."
+    )
+    try:
+        with os.fdopen(fd, mode) as handle:
+            yield handle
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
 def get_static_dir() -> str:
     """Get the folder where static HTML/JS/CSS files live."""
     dirname = os.path.dirname(os.path.normpath(__file__))
@@ -0,0 +1,150 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content hashing for IDs and cache keys.
+
+The hashes produced here identify content (cached ForwardMsgs, media files,
+elements) within a running server. They're not used for anything
+security-related, so the fastest available engine is used by default.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from typing import Callable, Final, Protocol, cast
+
+from streamlit import config
+from streamlit.logger import get_logger
+
+_LOGGER: Final = get_logger(__name__)
+
+# All engines produce digests of this many bytes, so that IDs have the same
+# length whichever engine is used.
+_DIGEST_SIZE: Final = 16
+
+
+class Hasher(Protocol):
+    """The subset of the hashlib hash object interface used by Streamlit."""
+
+    def update(self, data: bytes, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
+class _TruncatedHasher:
+    """Adapts a hasher with a longer digest to produce digests of _DIGEST_SIZE
+    bytes.
+    """
+
+    def __init__(self, hasher: Hasher) -> None:
+        self._hasher = hasher
+
+    def update(self, data: bytes, /) -> None:
+        self._hasher.update(data)
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()[: 2 * _DIGEST_SIZE]
+
+
+def _new_xxhash_hasher() -> Hasher:
+    import xxhash
+
+    return cast(Hasher, xxhash.xxh3_128())
+
+
+def _new_blake3_hasher() -> Hasher:
+    from blake3 import blake3
+
+    return _TruncatedHasher(cast(Hasher, blake3()))
+
+
+def _new_sha256_hasher() -> Hasher:
+    # On most current CPUs, OpenSSL computes SHA-256 with dedicated
+    # instructions, which makes it the fastest hash in the standard library.
+    return _TruncatedHasher(hashlib.sha256(usedforsecurity=False))
+
+
+def _new_blake2b_hasher() -> Hasher:
+    return hashlib.blake2b(digest_size=_DIGEST_SIZE)
+
+
+def _new_md5_hasher() -> Hasher:
+    return hashlib.new("md5", usedforsecurity=False)
+
+
+HASH_ENGINES: Final[dict[str, Callable[[], Hasher]]] = {
+    "xxhash": _new_xxhash_hasher,
+    "blake3": _new_blake3_hasher,
+    "sha256": _new_sha256_hasher,
+    "blake2b": _new_blake2b_hasher,
+    "md5": _new_md5_hasher,
+}
+
+# The engines "auto" picks from, fastest first. The last one is always
+# available.
+_AUTO_ENGINES: Final = ("xxhash", "blake3", "sha256")
+
+
+def _is_engine_available(engine: str) -> bool:
+    try:
+        HASH_ENGINES[engine]()
+        return True
+    except ImportError:
+        return False
+
+
+@functools.cache
+def get_hasher_factory(engine: str) -> Callable[[], Hasher]:
+    """Return the function that creates hashers for the given engine.
+
+    Parameters
+    ----------
+    engine
+        One of the keys of HASH_ENGINES, or "auto" to use the fastest
+        installed engine. Engines that aren't installed fall back to "auto".
+    """
+    if engine != "auto":
+        if engine not in HASH_ENGINES:
+            _LOGGER.warning(
+                'Unknown hash engine "%s". Using the fastest available one.', engine
+            )
+        elif not _is_engine_available(engine):
+            _LOGGER.warning(
+                'Hash engine "%s" is not installed. Using the fastest available one.',
+                engine,
+            )
+        else:
+            return HASH_ENGINES[engine]
+
+    return next(
+        HASH_ENGINES[candidate]
+        for candidate in _AUTO_ENGINES
+        if _is_engine_available(candidate)
+    )
+
+
+def new_hasher() -> Hasher:
+    """Return a new hasher using the engine set by `global.hashEngine`."""
+    return get_hasher_factory(config.get_option("global.hashEngine"))()
+
+
+def calc_hash(data: bytes | str) -> str:
+    """Return the hex digest of the given data.
+
+    This should not be used for security-related purposes.
+    """
+    h = new_hasher()
+    h.update(data.encode("utf-8") if isinstance(data, str) else data)
+    return h.hexdigest()
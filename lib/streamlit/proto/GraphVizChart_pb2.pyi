@@ -0,0 +1,53 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+*!
+Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import builtins
+import google.protobuf.descriptor
+import google.protobuf.message
+import typing
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing.final
+class GraphVizChart(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SPEC_FIELD_NUMBER: builtins.int
+    USE_CONTAINER_WIDTH_FIELD_NUMBER: builtins.int
+    ELEMENT_ID_FIELD_NUMBER: builtins.int
+    ENGINE_FIELD_NUMBER: builtins.int
+    spec: builtins.str
+    """A specification of the GraphViz graph in the "Dot" language."""
+    use_container_width: builtins.bool
+    """If True, will overwrite the chart width spec to fit to container."""
+    element_id: builtins.str
+    """A unique ID of this element."""
+    engine: builtins.str
+    """The engine used to layout and render the graph."""
+    def __init__(
+        self,
+        *,
+        spec: builtins.str = ...,
+        use_container_width: builtins.bool = ...,
+        element_id: builtins.str = ...,
+        engine: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["element_id", b"element_id", "engine", b"engine", "spec", b"spec", "use_container_width", b"use_container_width"]) -> None: ...
+
+global___GraphVizChart = GraphVizChart
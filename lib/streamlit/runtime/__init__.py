@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from streamlit.runtime.runtime import Runtime, RuntimeConfig, RuntimeState
 from streamlit.runtime.session_manager import (
+    BatchingSessionClient,
+    BufferedSessionClient,
     SessionClient,
     SessionClientDisconnectedError,
 )
@@ -43,6 +45,8 @@ __all__ = [
     "Runtime",
     "RuntimeConfig",
     "RuntimeState",
+    "BatchingSessionClient",
+    "BufferedSessionClient",
     "SessionClient",
     "SessionClientDisconnectedError",
     "get_instance",
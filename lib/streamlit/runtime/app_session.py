@@ -88,7 +88,7 @@ class AppSession:
         script_data: ScriptData,
         uploaded_file_manager: UploadedFileManager,
         script_cache: ScriptCache,
-        message_enqueued_callback: Callable[[], None] | None,
+        message_enqueued_callback: Callable[[str], None] | None,
         user_info: dict[str, str | bool | None],
         session_id_override: str | None = None,
     ) -> None:
@@ -108,7 +108,8 @@ class AppSession:
             on each rerun.
 
         message_enqueued_callback
-            After enqueuing a message, this callable notification will be invoked.
+            After enqueuing a message, this callable notification will be invoked
+            with the ID of this session.
 
         user_info
             A dict that contains information about the current user. For now,
@@ -281,7 +282,7 @@ class AppSession:
 
         self._browser_queue.enqueue(msg)
         if self._message_enqueued_callback:
-            self._message_enqueued_callback()
+            self._message_enqueued_callback(self.id)
 
     def handle_backmsg(self, msg: BackMsg) -> None:
         """Process a BackMsg."""
@@ -17,7 +17,9 @@
 from __future__ import annotations
 
 import pickle
+import struct
 import threading
+import time
 import types
 from typing import (
     TYPE_CHECKING,
@@ -50,6 +52,7 @@ from streamlit.runtime.caching.cached_message_replay import (
     MsgData,
     show_widget_replay_deprecation,
 )
+from streamlit.runtime.caching.hashing import HASH_MODES
 from streamlit.runtime.caching.storage import (
     CacheStorage,
     CacheStorageContext,
@@ -63,14 +66,25 @@ from streamlit.runtime.caching.storage.cache_storage_protocol import (
 from streamlit.runtime.caching.storage.dummy_cache_storage import (
     MemoryCacheStorageManager,
 )
+from streamlit.runtime.memory_governor import (
+    EvictableCache,
+    EvictionCandidate,
+    MemoryUsageProvider,
+)
 from streamlit.runtime.metrics_util import gather_metrics
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import (
+    CacheStat,
+    CacheStatsProvider,
+    CounterStat,
+    CounterStatsProvider,
+    group_stats,
+)
 from streamlit.time_util import time_to_seconds
 
 if TYPE_CHECKING:
     from datetime import timedelta
 
-    from streamlit.runtime.caching.hashing import HashFuncsDict
+    from streamlit.runtime.caching.hashing import HashFuncsDict, HashMode
 
 _LOGGER: Final = get_logger(__name__)
 
@@ -79,6 +93,115 @@ CACHE_DATA_MESSAGE_REPLAY_CTX = CachedMessageReplayContext(CacheType.DATA)
 # The cache persistence options we support: "disk" or None
 CachePersistType: TypeAlias = Union[Literal["disk"], None]
 
+# How entries whose ttl has passed are recomputed: "blocking" recomputes them
+# before returning, "background" returns the stale value and recomputes it on
+# a worker thread.
+CacheRefreshType: TypeAlias = Literal["blocking", "background"]
+
+# Cache entries whose value has buffers that can be pickled out-of-band (e.g.
+# the arrays backing numpy arrays, pandas DataFrames and pyarrow Tables) are
+# stored as a sequence of frames: the pickle stream followed by the buffers.
+# Entries without such buffers are stored as plain pickles. A pickle never
+# starts with a zero byte, so the two formats can be told apart.
+_FRAMED_ENTRY_MAGIC: Final = b"\x00stcache"
+_FRAME_COUNT: Final = struct.Struct("<I")
+_FRAME_LENGTH: Final = struct.Struct("<Q")
+# Frames start at offsets that are multiples of this many bytes, so that values
+# rebuilt over a page-aligned copy of the entry (e.g. a memory-mapped file) are
+# suitably aligned for vectorized operations.
+_FRAME_ALIGNMENT: Final = 64
+
+
+def _serialize_entry(entry: CachedResult) -> bytes:
+    """Pickle a cache entry, storing large buffers out-of-band.
+
+    Raises
+    ------
+    pickle.PicklingError, TypeError
+        If the entry can't be pickled.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    pickled = pickle.dumps(entry, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return pickled
+
+    frames = [memoryview(pickled)] + [buffer.raw() for buffer in buffers]
+    parts: list[bytes | memoryview] = [
+        _FRAMED_ENTRY_MAGIC,
+        _FRAME_COUNT.pack(len(frames)),
+        *(_FRAME_LENGTH.pack(frame.nbytes) for frame in frames),
+    ]
+    offset = sum(len(part) for part in parts)
+    for frame in frames:
+        padding = -offset % _FRAME_ALIGNMENT
+        parts.append(bytes(padding))
+        parts.append(frame)
+        offset += padding + frame.nbytes
+    return b"".join(parts)
+
+
+def _deserialize_entry(data: bytes | memoryview, copy: bool) -> Any:
+    """Unpickle a cache entry written by `_serialize_entry`.
+
+    Unless `copy` is True, values that were stored out-of-band are rebuilt
+    over read-only views of `data`, so all readers of an entry share the same
+    memory.
+
+    Raises
+    ------
+    pickle.UnpicklingError
+        If the data is not a valid cache entry.
+    """
+    view = memoryview(data).toreadonly()
+    if bytes(view[: len(_FRAMED_ENTRY_MAGIC)]) != _FRAMED_ENTRY_MAGIC:
+        return pickle.loads(view)
+
+    try:
+        offset = len(_FRAMED_ENTRY_MAGIC)
+        (num_frames,) = _FRAME_COUNT.unpack_from(view, offset)
+        offset += _FRAME_COUNT.size
+        lengths = [
+            _FRAME_LENGTH.unpack_from(view, offset + i * _FRAME_LENGTH.size)[0]
+            for i in range(num_frames)
+        ]
+        offset += num_frames * _FRAME_LENGTH.size
+    except struct.error as exc:
+        raise pickle.UnpicklingError("Truncated cache entry header") from exc
+
+    frames: list[memoryview] = []
+    for length in lengths:
+        offset += -offset % _FRAME_ALIGNMENT
+        if offset + length > view.nbytes:
+            raise pickle.UnpicklingError("Truncated cache entry")
+        frames.append(view[offset : offset + length])
+        offset += length
+
+    if not frames:
+        raise pickle.UnpicklingError("Cache entry has no frames")
+
+    buffers: list[bytearray] | list[memoryview] = (
+        [bytearray(frame) for frame in frames[1:]] if copy else frames[1:]
+    )
+    return pickle.loads(frames[0], buffers=buffers)
+
+
+def _get_storage_ttl_seconds(
+    ttl_seconds: float | None,
+    refresh: CacheRefreshType,
+    max_staleness: float | timedelta | str | None,
+) -> float | None:
+    """Return how long the storage should keep entries for the given params.
+
+    With background refresh, entries are kept for ``max_staleness`` past their
+    ttl so they can be returned while they're recomputed.
+    """
+    if refresh != "background" or ttl_seconds is None:
+        return ttl_seconds
+    staleness_seconds = time_to_seconds(max_staleness, coerce_none_to_inf=False)
+    if staleness_seconds is None:
+        staleness_seconds = ttl_seconds
+    return ttl_seconds + staleness_seconds
+
 
 class CachedDataFuncInfo(CachedFuncInfo):
     """Implements the CachedFuncInfo interface for @st.cache_data"""
@@ -91,15 +214,23 @@ class CachedDataFuncInfo(CachedFuncInfo):
         max_entries: int | None,
         ttl: float | timedelta | str | None,
         hash_funcs: HashFuncsDict | None = None,
+        copy: bool = False,
+        refresh: CacheRefreshType = "blocking",
+        max_staleness: float | timedelta | str | None = None,
+        hash_mode: HashMode | None = None,
     ):
         super().__init__(
             func,
             show_spinner=show_spinner,
             hash_funcs=hash_funcs,
+            hash_mode=hash_mode,
         )
         self.persist = persist
         self.max_entries = max_entries
         self.ttl = ttl
+        self.copy = copy
+        self.refresh = refresh
+        self.max_staleness = max_staleness
 
         self.validate_params()
 
@@ -123,6 +254,9 @@ class CachedDataFuncInfo(CachedFuncInfo):
             max_entries=self.max_entries,
             ttl=self.ttl,
             display_name=self.display_name,
+            copy=self.copy,
+            refresh=self.refresh,
+            max_staleness=self.max_staleness,
         )
 
     def validate_params(self) -> None:
@@ -137,10 +271,12 @@ class CachedDataFuncInfo(CachedFuncInfo):
             persist=self.persist,
             max_entries=self.max_entries,
             ttl=self.ttl,
+            refresh=self.refresh,
+            max_staleness=self.max_staleness,
         )
 
 
-class DataCaches(CacheStatsProvider):
+class DataCaches(CacheStatsProvider, CounterStatsProvider, EvictableCache):
     """Manages all DataCache instances"""
 
     def __init__(self):
@@ -154,6 +290,9 @@ class DataCaches(CacheStatsProvider):
         max_entries: int | None,
         ttl: int | float | timedelta | str | None,
         display_name: str,
+        copy: bool = False,
+        refresh: CacheRefreshType = "blocking",
+        max_staleness: float | timedelta | str | None = None,
     ) -> DataCache:
         """Return the mem cache for the given key.
 
@@ -161,6 +300,9 @@ class DataCaches(CacheStatsProvider):
         """
 
         ttl_seconds = time_to_seconds(ttl, coerce_none_to_inf=False)
+        storage_ttl_seconds = _get_storage_ttl_seconds(
+            ttl_seconds, refresh, max_staleness
+        )
 
         # Get the existing cache, if it exists, and validate that its params
         # haven't changed.
@@ -169,9 +311,14 @@ class DataCaches(CacheStatsProvider):
             if (
                 cache is not None
                 and cache.ttl_seconds == ttl_seconds
+                and cache.storage_ttl_seconds == storage_ttl_seconds
+                and cache.refresh == refresh
                 and cache.max_entries == max_entries
                 and cache.persist == persist
             ):
+                # Whether results are copied doesn't affect the storage, so
+                # there's no need to recreate the cache if it changed.
+                cache.copy = copy
                 return cache
 
             # Close the existing cache's storage, if it exists.
@@ -199,7 +346,7 @@ class DataCaches(CacheStatsProvider):
             cache_context = self.create_cache_storage_context(
                 function_key=key,
                 function_name=display_name,
-                ttl_seconds=ttl_seconds,
+                ttl_seconds=storage_ttl_seconds,
                 max_entries=max_entries,
                 persist=persist,
             )
@@ -213,6 +360,9 @@ class DataCaches(CacheStatsProvider):
                 max_entries=max_entries,
                 ttl_seconds=ttl_seconds,
                 display_name=display_name,
+                copy=copy,
+                refresh=refresh,
+                storage_ttl_seconds=storage_ttl_seconds,
             )
             self._function_caches[key] = cache
             return cache
@@ -243,12 +393,41 @@ class DataCaches(CacheStatsProvider):
             stats.extend(cache.get_stats())
         return group_stats(stats)
 
+    def get_counter_stats(self) -> list[CounterStat]:
+        with self._caches_lock:
+            function_caches = list(self._function_caches.values())
+        return [stat for cache in function_caches for stat in cache.get_counter_stats()]
+
+    def get_memory_usage(self) -> int:
+        with self._caches_lock:
+            function_caches = list(self._function_caches.values())
+        return sum(cache.get_memory_usage() for cache in function_caches)
+
+    def get_eviction_candidates(self) -> list[EvictionCandidate]:
+        with self._caches_lock:
+            function_caches = list(self._function_caches.values())
+        # Candidate keys are prefixed with their function's key, so that
+        # `evict` can find their cache.
+        return [
+            candidate._replace(key=f"{cache.key}:{candidate.key}")
+            for cache in function_caches
+            for candidate in cache.get_eviction_candidates()
+        ]
+
+    def evict(self, key: str) -> int:
+        function_key, _, value_key = key.partition(":")
+        with self._caches_lock:
+            cache = self._function_caches.get(function_key)
+        return 0 if cache is None else cache.evict(value_key)
+
     def validate_cache_params(
         self,
         function_name: str,
         persist: CachePersistType,
         max_entries: int | None,
         ttl: int | float | timedelta | str | None,
+        refresh: CacheRefreshType = "blocking",
+        max_staleness: float | timedelta | str | None = None,
     ) -> None:
         """Validate that the cache params are valid for given storage.
 
@@ -264,7 +443,7 @@ class DataCaches(CacheStatsProvider):
         cache_context = self.create_cache_storage_context(
             function_key="DUMMY_KEY",
             function_name=function_name,
-            ttl_seconds=ttl_seconds,
+            ttl_seconds=_get_storage_ttl_seconds(ttl_seconds, refresh, max_staleness),
             max_entries=max_entries,
             persist=persist,
         )
@@ -309,7 +488,7 @@ class DataCaches(CacheStatsProvider):
 _data_caches = DataCaches()
 
 
-def get_data_cache_stats_provider() -> CacheStatsProvider:
+def get_data_cache_stats_provider() -> DataCaches:
     """Return the StatsProvider for all @st.cache_data functions."""
     return _data_caches
 
@@ -353,6 +532,10 @@ class CacheDataAPI:
         persist: CachePersistType | bool = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        copy: bool = False,
+        refresh: CacheRefreshType = "blocking",
+        max_staleness: float | timedelta | str | None = None,
+        hash_mode: HashMode | None = None,
     ) -> Callable[[F], F]: ...
 
     def __call__(
@@ -365,6 +548,10 @@ class CacheDataAPI:
         persist: CachePersistType | bool = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        copy: bool = False,
+        refresh: CacheRefreshType = "blocking",
+        max_staleness: float | timedelta | str | None = None,
+        hash_mode: HashMode | None = None,
     ):
         return self._decorator(
             func,
@@ -374,6 +561,10 @@ class CacheDataAPI:
             show_spinner=show_spinner,
             experimental_allow_widgets=experimental_allow_widgets,
             hash_funcs=hash_funcs,
+            copy=copy,
+            refresh=refresh,
+            max_staleness=max_staleness,
+            hash_mode=hash_mode,
         )
 
     def _decorator(
@@ -386,12 +577,19 @@ class CacheDataAPI:
         persist: CachePersistType | bool,
         experimental_allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        copy: bool = False,
+        refresh: CacheRefreshType = "blocking",
+        max_staleness: float | timedelta | str | None = None,
+        hash_mode: HashMode | None = None,
     ):
         """Decorator to cache functions that return data (e.g. dataframe transforms, database queries, ML inference).
 
         Cached objects are stored in "pickled" form, which means that the return
         value of a cached function must be pickleable. Each caller of the cached
-        function gets its own copy of the cached data.
+        function gets its own copy of the cached data. The exceptions are the
+        arrays backing numpy arrays, pandas DataFrames and similar objects: by
+        default, these are shared between callers and are read-only. Set
+        ``copy=True`` to give every caller its own writable copy instead.
 
         You can clear a function's cache with ``func.clear()`` or clear the entire
         cache with ``st.cache_data.clear()``.
@@ -410,6 +608,10 @@ class CacheDataAPI:
         ----------
         func : callable
             The function to cache. Streamlit hashes the function's source code.
+            If this is a coroutine function (``async def``), calling the cached
+            function returns an awaitable. Concurrent calls that miss the cache
+            with the same arguments, including from other sessions, await a
+            single call of the function.
 
         ttl : float, timedelta, str, or None
             The maximum time to keep an entry in the cache. Can be one of:
@@ -423,7 +625,8 @@ class CacheDataAPI:
               <https://docs.python.org/3/library/datetime.html#timedelta-objects>`_,
               e.g. ``timedelta(days=1)``.
 
-            Note that ``ttl`` will be ignored if ``persist="disk"`` or ``persist=True``.
+            Set ``refresh="background"`` to keep returning an expired entry
+            while it's recomputed.
 
         max_entries : int or None
             The maximum number of entries to keep in the cache, or None
@@ -451,6 +654,42 @@ class CacheDataAPI:
             the provided function to generate a hash for it. See below for an example
             of how this can be used.
 
+        copy : bool
+            Whether to give each caller a writable copy of the arrays in the
+            cached value (e.g. the data of a DataFrame). If this is ``False``
+            (default), all callers share a single read-only copy of these
+            arrays, which saves memory and makes cache hits on large values
+            much faster. Set this to ``True`` if you modify the returned data
+            in place.
+
+        refresh : "blocking" or "background"
+            How to recompute an entry once its ``ttl`` has passed. If this is
+            ``"blocking"`` (default), the function is rerun before the call
+            returns. If this is ``"background"``, the call returns the expired
+            value right away and the function is rerun on a worker thread,
+            once for all sessions. Later calls return the new value as soon as
+            it's ready. Requires a ``ttl``.
+
+            Functions that call Streamlit commands are always recomputed
+            before the call returns.
+
+        max_staleness : float, timedelta, str, or None
+            With ``refresh="background"``, how long after its ``ttl`` an entry
+            may still be returned while it's being recomputed. After that, the
+            entry is removed and the next call recomputes it before returning.
+            Accepts the same formats as ``ttl``. None (default) means the same
+            as ``ttl``.
+
+        hash_mode : "sample", "full", or None
+            How to hash large dataframes and arrays passed to the function.
+            If this is ``"sample"``, Streamlit hashes a random sample of the
+            rows of dataframes with 100,000 or more rows and of arrays with
+            1,000,000 or more elements, so changes outside the sample don't
+            cause a cache miss. If this is ``"full"``, Streamlit hashes all of
+            their data, in parallel chunks. If this is None (default), large
+            pandas dataframes and NumPy arrays are sampled, and Polars
+            dataframes and series are hashed in full.
+
         .. deprecated::
             The cached widget replay functionality was removed in 1.38. Please
             remove the ``experimental_allow_widgets`` parameter from your
@@ -561,6 +800,24 @@ class CacheDataAPI:
                 f"Unsupported persist option '{persist}'. Valid values are 'disk' or None."
             )
 
+        if refresh not in ("blocking", "background"):
+            raise StreamlitAPIException(
+                f"Unsupported refresh option '{refresh}'. "
+                "Valid values are 'blocking' or 'background'."
+            )
+
+        if refresh == "background" and ttl is None:
+            raise StreamlitAPIException(
+                "`refresh='background'` requires a `ttl`, since entries without "
+                "one never go stale."
+            )
+
+        if hash_mode is not None and hash_mode not in HASH_MODES:
+            raise StreamlitAPIException(
+                f"Unsupported hash_mode option '{hash_mode}'. "
+                "Valid values are 'sample' or 'full'."
+            )
+
         if experimental_allow_widgets:
             show_widget_replay_deprecation("cache_data")
 
@@ -573,6 +830,10 @@ class CacheDataAPI:
                     max_entries=max_entries,
                     ttl=ttl,
                     hash_funcs=hash_funcs,
+                    copy=copy,
+                    refresh=refresh,
+                    max_staleness=max_staleness,
+                    hash_mode=hash_mode,
                 )
             )
 
@@ -587,6 +848,10 @@ class CacheDataAPI:
                 max_entries=max_entries,
                 ttl=ttl,
                 hash_funcs=hash_funcs,
+                copy=copy,
+                refresh=refresh,
+                max_staleness=max_staleness,
+                hash_mode=hash_mode,
             )
         )
 
@@ -607,6 +872,9 @@ class DataCache(Cache):
         max_entries: int | None,
         ttl_seconds: float | None,
         display_name: str,
+        copy: bool = False,
+        refresh: CacheRefreshType = "blocking",
+        storage_ttl_seconds: float | None = None,
     ):
         super().__init__()
         self.key = key
@@ -615,12 +883,39 @@ class DataCache(Cache):
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
         self.persist = persist
+        self.copy = copy
+        self.refresh = refresh
+        # How long the storage keeps entries. This is longer than ttl_seconds
+        # if stale entries are returned while they're being recomputed.
+        self.storage_ttl_seconds = (
+            ttl_seconds if storage_ttl_seconds is None else storage_ttl_seconds
+        )
 
     def get_stats(self) -> list[CacheStat]:
         if isinstance(self.storage, CacheStatsProvider):
             return self.storage.get_stats()
         return []
 
+    def get_counter_stats(self) -> list[CounterStat]:
+        if isinstance(self.storage, CounterStatsProvider):
+            return self.storage.get_counter_stats()
+        return []
+
+    def get_memory_usage(self) -> int:
+        if isinstance(self.storage, MemoryUsageProvider):
+            return self.storage.get_memory_usage()
+        return 0
+
+    def get_eviction_candidates(self) -> list[EvictionCandidate]:
+        if isinstance(self.storage, EvictableCache):
+            return self.storage.get_eviction_candidates()
+        return []
+
+    def evict(self, key: str) -> int:
+        if isinstance(self.storage, EvictableCache):
+            return self.storage.evict(key)
+        return 0
+
     def read_result(self, key: str) -> CachedResult:
         """Read a value and messages from the cache. Raise `CacheKeyNotFoundError`
         if the value doesn't exist, and `CacheError` if the value exists but can't
@@ -634,7 +929,7 @@ class DataCache(Cache):
             raise CacheError(str(e)) from e
 
         try:
-            entry = pickle.loads(pickled_entry)
+            entry = _deserialize_entry(pickled_entry, self.copy)
             if not isinstance(entry, CachedResult):
                 # Loaded an old cache file format, remove it and let the caller
                 # rerun the function.
@@ -653,11 +948,25 @@ class DataCache(Cache):
             main_id = st._main.id
             sidebar_id = st.sidebar.id
             entry = CachedResult(value, messages, main_id, sidebar_id)
-            pickled_entry = pickle.dumps(entry)
+            if self.refresh == "background":
+                # Only recorded when needed, to keep other entries small.
+                entry.computed_at = time.time()
+            pickled_entry = _serialize_entry(entry)
         except (pickle.PicklingError, TypeError) as exc:
             raise CacheError(f"Failed to pickle {key}") from exc
         self.storage.set(key, pickled_entry)
 
+    def is_stale(self, result: CachedResult) -> bool:
+        """Return True if the result's ttl has passed and it should be
+        recomputed in the background.
+        """
+        return (
+            self.refresh == "background"
+            and self.ttl_seconds is not None
+            and result.computed_at is not None
+            and time.time() >= result.computed_at + self.ttl_seconds
+        )
+
     def _clear(self, key: str | None = None) -> None:
         if not key:
             self.storage.clear()
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import math
+import sys
 import threading
 import types
 from typing import TYPE_CHECKING, Any, Callable, Final, TypeVar, cast, overload
@@ -25,6 +26,7 @@ from cachetools import TTLCache
 from typing_extensions import TypeAlias
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
 from streamlit.runtime.caching import cache_utils
 from streamlit.runtime.caching.cache_errors import CacheKeyNotFoundError
@@ -40,14 +42,17 @@ from streamlit.runtime.caching.cached_message_replay import (
     MsgData,
     show_widget_replay_deprecation,
 )
+from streamlit.runtime.caching.hashing import HASH_MODES
+from streamlit.runtime.memory_governor import MemoryUsageProvider
 from streamlit.runtime.metrics_util import gather_metrics
+from streamlit.runtime.object_size import ObjectSizeCache, get_known_size
 from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
 from streamlit.time_util import time_to_seconds
 
 if TYPE_CHECKING:
     from datetime import timedelta
 
-    from streamlit.runtime.caching.hashing import HashFuncsDict
+    from streamlit.runtime.caching.hashing import HashFuncsDict, HashMode
 
 _LOGGER: Final = get_logger(__name__)
 
@@ -66,7 +71,7 @@ def _equal_validate_funcs(a: ValidateFunc | None, b: ValidateFunc | None) -> boo
     return (a is None and b is None) or (a is not None and b is not None)
 
 
-class ResourceCaches(CacheStatsProvider):
+class ResourceCaches(CacheStatsProvider, MemoryUsageProvider):
     """Manages all ResourceCache instances"""
 
     def __init__(self):
@@ -130,6 +135,11 @@ class ResourceCaches(CacheStatsProvider):
             stats.extend(cache.get_stats())
         return group_stats(stats)
 
+    def get_memory_usage(self) -> int:
+        with self._caches_lock:
+            function_caches = list(self._function_caches.values())
+        return sum(cache.get_memory_usage() for cache in function_caches)
+
 
 # Singleton ResourceCaches instance
 _resource_caches = ResourceCaches()
@@ -151,11 +161,13 @@ class CachedResourceFuncInfo(CachedFuncInfo):
         ttl: float | timedelta | str | None,
         validate: ValidateFunc | None,
         hash_funcs: HashFuncsDict | None = None,
+        hash_mode: HashMode | None = None,
     ):
         super().__init__(
             func,
             show_spinner=show_spinner,
             hash_funcs=hash_funcs,
+            hash_mode=hash_mode,
         )
         self.max_entries = max_entries
         self.ttl = ttl
@@ -222,6 +234,7 @@ class CacheResourceAPI:
         validate: ValidateFunc | None = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        hash_mode: HashMode | None = None,
     ) -> Callable[[F], F]: ...
 
     def __call__(
@@ -234,6 +247,7 @@ class CacheResourceAPI:
         validate: ValidateFunc | None = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        hash_mode: HashMode | None = None,
     ):
         return self._decorator(
             func,
@@ -243,6 +257,7 @@ class CacheResourceAPI:
             validate=validate,
             experimental_allow_widgets=experimental_allow_widgets,
             hash_funcs=hash_funcs,
+            hash_mode=hash_mode,
         )
 
     def _decorator(
@@ -255,6 +270,7 @@ class CacheResourceAPI:
         validate: ValidateFunc | None,
         experimental_allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        hash_mode: HashMode | None = None,
     ):
         """Decorator to cache functions that return global resources (e.g. database connections, ML models).
 
@@ -280,7 +296,10 @@ class CacheResourceAPI:
         ----------
         func : callable
             The function that creates the cached resource. Streamlit hashes the
-            function's source code.
+            function's source code. If this is a coroutine function
+            (``async def``), calling the cached function returns an awaitable.
+            Concurrent calls that miss the cache with the same arguments,
+            including from other sessions, await a single call of the function.
 
         ttl : float, timedelta, str, or None
             The maximum time to keep an entry in the cache. Can be one of:
@@ -323,6 +342,19 @@ class CacheResourceAPI:
             the provided function to generate a hash for it. See below for an example
             of how this can be used.
 
+        hash_mode : "sample", "full", or None
+            How to hash large dataframes and arrays passed to the function,
+            e.g. the data a model is trained on. Since every call with the same
+            arguments returns the same shared resource, a sampled hash can
+            hand back a resource built from data that has since changed
+            outside the sample. If this is ``"full"``, Streamlit hashes all
+            the data with blake2b, spread over a thread pool, so each call
+            reads the whole input. If this is ``"sample"``, it hashes a random
+            sample of the rows of dataframes with 100,000 or more rows and of
+            arrays with 1,000,000 or more elements. If this is None (default),
+            large pandas dataframes and NumPy arrays are sampled, and Polars
+            dataframes and series are hashed in full.
+
         .. deprecated::
             The cached widget replay functionality was removed in 1.38. Please
             remove the ``experimental_allow_widgets`` parameter from your
@@ -411,6 +443,12 @@ class CacheResourceAPI:
         ... def get_person_name(person: Person):
         ...     return person.name
         """
+        if hash_mode is not None and hash_mode not in HASH_MODES:
+            raise StreamlitAPIException(
+                f"Unsupported hash_mode option '{hash_mode}'. "
+                "Valid values are 'sample' or 'full'."
+            )
+
         if experimental_allow_widgets:
             show_widget_replay_deprecation("cache_resource")
 
@@ -425,6 +463,7 @@ class CacheResourceAPI:
                     ttl=ttl,
                     validate=validate,
                     hash_funcs=hash_funcs,
+                    hash_mode=hash_mode,
                 )
             )
 
@@ -436,6 +475,7 @@ class CacheResourceAPI:
                 ttl=ttl,
                 validate=validate,
                 hash_funcs=hash_funcs,
+                hash_mode=hash_mode,
             )
         )
 
@@ -463,6 +503,9 @@ class ResourceCache(Cache):
             maxsize=max_entries, ttl=ttl_seconds, timer=cache_utils.TTLCACHE_TIMER
         )
         self._mem_cache_lock = threading.Lock()
+        # The size of each entry, measured when it's written. It's used for
+        # the stats and the MemoryGovernor.
+        self._entry_sizes = ObjectSizeCache(_get_known_entry_size)
         self.validate = validate
 
     @property
@@ -497,8 +540,11 @@ class ResourceCache(Cache):
         main_id = st._main.id
         sidebar_id = st.sidebar.id
 
+        entry = CachedResult(value, messages, main_id, sidebar_id)
+        self._entry_sizes.get_size(key, entry)
+
         with self._mem_cache_lock:
-            self._mem_cache[key] = CachedResult(value, messages, main_id, sidebar_id)
+            self._mem_cache[key] = entry
 
     def _clear(self, key: str | None = None) -> None:
         with self._mem_cache_lock:
@@ -506,22 +552,40 @@ class ResourceCache(Cache):
                 self._mem_cache.clear()
             elif key in self._mem_cache:
                 del self._mem_cache[key]
+            self._entry_sizes.retain(self._mem_cache.keys())
 
-    def get_stats(self) -> list[CacheStat]:
-        # Shallow clone our cache. Computing item sizes is potentially
-        # expensive, and we want to minimize the time we spend holding
-        # the lock.
+    def _get_entry_sizes(self) -> dict[str, int]:
+        """Return the size of each entry. This doesn't walk the entries, so
+        it's cheap enough to be called whenever stats are requested.
+        """
         with self._mem_cache_lock:
-            cache_entries = list(self._mem_cache.values())
+            self._entry_sizes.retain(self._mem_cache.keys())
+            entries = list(self._mem_cache.items())
+
+        return {key: self._entry_sizes.get_size(key, entry) for key, entry in entries}
 
-        # Lazy-load vendored package to prevent import of numpy
-        from streamlit.vendor.pympler.asizeof import asizeof
+    def get_memory_usage(self) -> int:
+        return sum(self._get_entry_sizes().values())
 
+    def get_stats(self) -> list[CacheStat]:
         return [
             CacheStat(
                 category_name="st_cache_resource",
                 cache_name=self.display_name,
-                byte_length=asizeof(entry),
+                byte_length=byte_length,
             )
-            for entry in cache_entries
+            for byte_length in self._get_entry_sizes().values()
         ]
+
+
+def _get_known_entry_size(entry: CachedResult) -> int | None:
+    """Return the size of a cache entry whose value has a well-known type.
+
+    Entries that replay messages are measured as a whole by the sampler.
+    """
+    if entry.messages:
+        return None
+    value_size = get_known_size(entry.value)
+    if value_size is None:
+        return None
+    return sys.getsizeof(entry) + value_size
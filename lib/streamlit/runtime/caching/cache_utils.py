@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import functools
 import hashlib
@@ -24,6 +25,7 @@ import threading
 import time
 from abc import abstractmethod
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Callable, Final
 
 from streamlit import type_util
@@ -45,7 +47,7 @@ from streamlit.runtime.caching.cached_message_replay import (
     MsgData,
     replay_cached_messages,
 )
-from streamlit.runtime.caching.hashing import HashFuncsDict, update_hash
+from streamlit.runtime.caching.hashing import HashFuncsDict, HashMode, update_hash
 from streamlit.runtime.scriptrunner_utils.script_run_context import (
     in_cached_function,
 )
@@ -61,6 +63,27 @@ _LOGGER: Final = get_logger(__name__)
 # is exposed here as a constant so that it can be patched in unit tests.
 TTLCACHE_TIMER = time.monotonic
 
+# The maximum number of stale cached values that are recomputed in the
+# background at the same time, across all cached functions.
+_MAX_REFRESH_WORKERS: Final = 4
+
+_refresh_executor: ThreadPoolExecutor | None = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """Return the thread pool that recomputes stale cached values, creating it
+    on first use.
+    """
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=_MAX_REFRESH_WORKERS,
+                thread_name_prefix="CacheRefresh",
+            )
+        return _refresh_executor
+
 
 class Cache:
     """Function cache interface. Caches persist across script runs."""
@@ -68,6 +91,11 @@ class Cache:
     def __init__(self):
         self._value_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
         self._value_locks_lock = threading.Lock()
+        # The keys of the values that are being recomputed in the background.
+        self._refreshing_keys: set[str] = set()
+        # The values that are being computed by cached coroutines, which other
+        # callers wait for instead of computing them again.
+        self._async_computations: dict[str, Future[None]] = {}
 
     @abstractmethod
     def read_result(self, value_key: str) -> CachedResult:
@@ -100,6 +128,64 @@ class Cache:
         with self._value_locks_lock:
             return self._value_locks[value_key]
 
+    def is_stale(self, result: CachedResult) -> bool:
+        """Return True if the result should be recomputed in the background,
+        while it's still returned to callers.
+        """
+        return False
+
+    def start_refresh(self, value_key: str) -> bool:
+        """Record that the value for value_key is being recomputed in the
+        background. Return False if it already was, in which case the caller
+        shouldn't recompute it.
+        """
+        with self._value_locks_lock:
+            if value_key in self._refreshing_keys:
+                return False
+            self._refreshing_keys.add(value_key)
+            return True
+
+    def finish_refresh(self, value_key: str) -> None:
+        """Record that the background recomputation of value_key has ended."""
+        with self._value_locks_lock:
+            self._refreshing_keys.discard(value_key)
+
+    def start_or_join_async_computation(
+        self, value_key: str
+    ) -> tuple[Future[None], bool]:
+        """Return the future of the in-flight computation of value_key by a
+        cached coroutine, and whether the caller started it.
+
+        If the caller started it, it must compute the value and then call
+        `finish_async_computation`. Otherwise, it should wait for the future
+        and read the value from the cache. The future is a
+        `concurrent.futures.Future` so that it can be awaited from the event
+        loops of different sessions.
+        """
+        with self._value_locks_lock:
+            future = self._async_computations.get(value_key)
+            if future is not None:
+                return future, False
+            future = Future()
+            # Running futures can't be cancelled, so a waiter that's cancelled
+            # doesn't cancel the computation for the others.
+            future.set_running_or_notify_cancel()
+            self._async_computations[value_key] = future
+            return future, True
+
+    def finish_async_computation(
+        self, value_key: str, error: BaseException | None = None
+    ) -> None:
+        """Record that the computation of value_key started by
+        `start_or_join_async_computation` has ended, and wake up its waiters.
+        """
+        with self._value_locks_lock:
+            future = self._async_computations.pop(value_key)
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
     def clear(self, key: str | None = None):
         """Clear values from this cache.
         If no argument is passed, all items are cleared from the cache.
@@ -129,10 +215,12 @@ class CachedFuncInfo:
         func: FunctionType,
         show_spinner: bool | str,
         hash_funcs: HashFuncsDict | None,
+        hash_mode: HashMode | None = None,
     ):
         self.func = func
         self.show_spinner = show_spinner
         self.hash_funcs = hash_funcs
+        self.hash_mode = hash_mode
 
     @property
     def cache_type(self) -> CacheType:
@@ -190,6 +278,7 @@ class CachedFunc:
     def __init__(self, info: CachedFuncInfo):
         self._info = info
         self._function_key = _make_function_key(info.cache_type, info.func)
+        self._is_coroutine_function = inspect.iscoroutinefunction(info.func)
 
     def __repr__(self):
         return f"<CachedFunc: {self._info.func}>"
@@ -214,6 +303,8 @@ class CachedFunc:
             else:
                 spinner_message = f"Running `{name}(...)`."
 
+        if self._is_coroutine_function:
+            return self._get_or_create_cached_value_async(args, kwargs, spinner_message)
         return self._get_or_create_cached_value(args, kwargs, spinner_message)
 
     def _get_or_create_cached_value(
@@ -235,12 +326,73 @@ class CachedFunc:
             func_args=func_args,
             func_kwargs=func_kwargs,
             hash_funcs=self._info.hash_funcs,
+            hash_mode=self._info.hash_mode,
         )
 
         with contextlib.suppress(CacheKeyNotFoundError):
-            cached_result = cache.read_result(value_key)
-            return self._handle_cache_hit(cached_result)
+            return self._get_cached_value(cache, value_key, func_args, func_kwargs)
+
+        with self._spinner_or_no_context(spinner_message):
+            return self._handle_cache_miss(cache, value_key, func_args, func_kwargs)
 
+    async def _get_or_create_cached_value_async(
+        self,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+        spinner_message: str | None = None,
+    ) -> Any:
+        """The coroutine returned by calling a cached coroutine function. It
+        shares the cache of the function with `_get_or_create_cached_value`.
+        """
+        cache = self._info.get_function_cache(self._function_key)
+        value_key = _make_value_key(
+            cache_type=self._info.cache_type,
+            func=self._info.func,
+            func_args=func_args,
+            func_kwargs=func_kwargs,
+            hash_funcs=self._info.hash_funcs,
+            hash_mode=self._info.hash_mode,
+        )
+
+        with contextlib.suppress(CacheKeyNotFoundError):
+            return self._get_cached_value(cache, value_key, func_args, func_kwargs)
+
+        with self._spinner_or_no_context(spinner_message):
+            return await self._handle_cache_miss_async(
+                cache, value_key, func_args, func_kwargs
+            )
+
+    def _get_cached_value(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> Any:
+        """Return the cached value for value_key, and replay its messages.
+
+        Raises
+        ------
+        CacheKeyNotFoundError
+            Raised if the value isn't cached, or if it's stale and must be
+            recomputed before returning.
+
+        """
+        cached_result = cache.read_result(value_key)
+        if cache.is_stale(cached_result):
+            if cached_result.messages:
+                # The elements created by a function can only be recorded
+                # while it's running in a script thread, so stale results that
+                # replay elements are recomputed in the foreground.
+                raise CacheKeyNotFoundError()
+            # Return the stale value right away, and recompute it in the
+            # background.
+            self._refresh_in_background(cache, value_key, func_args, func_kwargs)
+        return self._handle_cache_hit(cached_result)
+
+    def _spinner_or_no_context(
+        self, spinner_message: str | None
+    ) -> contextlib.AbstractContextManager[None]:
         # only show spinner if there is a message to show and always only for the
         # outermost cache function if cache functions are nested, because the outermost
         # function has to wait for the inner functions anyways. This avoids surprising
@@ -250,13 +402,9 @@ class CachedFunc:
         # basically like auto-setting "show_spinner=False" on the @st.cache decorators
         # on behalf of the user.
         is_nested_cache_function = in_cached_function.get()
-        spinner_or_no_context = (
-            spinner(spinner_message, _cache=True)
-            if spinner_message is not None and not is_nested_cache_function
-            else contextlib.nullcontext()
-        )
-        with spinner_or_no_context:
-            return self._handle_cache_miss(cache, value_key, func_args, func_kwargs)
+        if spinner_message is not None and not is_nested_cache_function:
+            return spinner(spinner_message, _cache=True)
+        return contextlib.nullcontext()
 
     def _handle_cache_hit(self, result: CachedResult) -> Any:
         """Handle a cache hit: replay the result's cached messages, and return its
@@ -303,12 +451,14 @@ class CachedFunc:
             # before computing.
             try:
                 cached_result = cache.read_result(value_key)
-                # Another thread computed the value before us. Early exit!
-                return self._handle_cache_hit(cached_result)
             except CacheKeyNotFoundError:
                 # No cache hit -> we will call the cached function
                 # below.
                 pass
+            else:
+                if not cache.is_stale(cached_result):
+                    # Another thread computed the value before us. Early exit!
+                    return self._handle_cache_hit(cached_result)
 
             # We acquired the lock before any other thread. Compute the value!
             with self._info.cached_message_replay_ctx.calling_cached_function(
@@ -319,29 +469,153 @@ class CachedFunc:
             # We've computed our value, and now we need to write it back to the cache
             # along with any "replay messages" that were generated during value computation.
             messages = self._info.cached_message_replay_ctx._most_recent_messages
-            try:
+            self._write_computed_value(cache, value_key, computed_value, messages)
+            return computed_value
+
+    async def _handle_cache_miss_async(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> Any:
+        """Handle a cache miss of a cached coroutine function: await a new
+        value, write it back to the cache, and return it.
+
+        Concurrent misses on the same value, in any session, are coalesced:
+        the first caller awaits the function, and the others wait for it to
+        finish and then read its result from the cache, without blocking
+        their event loop.
+        """
+        while True:
+            future, is_owner = cache.start_or_join_async_computation(value_key)
+            if is_owner:
+                break
+            # Raises the error of the computation, if it failed.
+            await asyncio.wrap_future(future)
+            with contextlib.suppress(CacheKeyNotFoundError):
+                return self._get_cached_value(cache, value_key, func_args, func_kwargs)
+            # The computed value was evicted already, or the computation was
+            # cancelled. Compute it ourselves.
+
+        error: BaseException | None = None
+        try:
+            with contextlib.suppress(CacheKeyNotFoundError):
+                cached_result = cache.read_result(value_key)
+                if not cache.is_stale(cached_result):
+                    # Another caller computed the value before us.
+                    return self._handle_cache_hit(cached_result)
+
+            with self._info.cached_message_replay_ctx.calling_cached_function(
+                self._info.func
+            ):
+                computed_value = await self._info.func(*func_args, **func_kwargs)
+
+            messages = self._info.cached_message_replay_ctx._most_recent_messages
+            self._write_computed_value(cache, value_key, computed_value, messages)
+            return computed_value
+        except Exception as ex:
+            error = ex
+            raise
+        finally:
+            # If we were cancelled, the waiters retry instead of failing.
+            cache.finish_async_computation(value_key, error)
+
+    def _write_computed_value(
+        self,
+        cache: Cache,
+        value_key: str,
+        computed_value: Any,
+        messages: list[MsgData],
+    ) -> None:
+        """Write a newly-computed value and its replay messages to the cache,
+        raising a user-facing error if the value can't be cached.
+        """
+        try:
+            cache.write_result(value_key, computed_value, messages)
+        except (CacheError, RuntimeError) as ex:
+            # An exception was thrown while we tried to write to the cache. Report
+            # it to the user. (We catch `RuntimeError` here because it will be
+            # raised by Apache Spark if we do not collect dataframe before
+            # using `st.cache_data`.)
+            if is_unevaluated_data_object(computed_value):
+                # If the returned value is an unevaluated dataframe, raise an error.
+                # Unevaluated dataframes are not yet in the local memory, which also
+                # means they cannot be properly cached (serialized).
+                raise UnevaluatedDataFrameError(
+                    f"The function {get_cached_func_name_md(self._info.func)} is "
+                    "decorated with `st.cache_data` but it returns an unevaluated "
+                    f"data object of type `{type_util.get_fqn_type(computed_value)}`. "
+                    "Please convert the object to a serializable format "
+                    "(e.g. Pandas DataFrame) before returning it, so "
+                    "`st.cache_data` can serialize and cache it."
+                ) from ex
+            raise UnserializableReturnValueError(
+                return_value=computed_value, func=self._info.func
+            )
+
+    def _refresh_in_background(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> None:
+        """Recompute the stale value for value_key on the refresh thread pool,
+        unless it's already being recomputed.
+        """
+        if not cache.start_refresh(value_key):
+            return
+        try:
+            _get_refresh_executor().submit(
+                self._refresh_cached_value, cache, value_key, func_args, func_kwargs
+            )
+        except RuntimeError:
+            # The executor was shut down because the interpreter is exiting.
+            cache.finish_refresh(value_key)
+
+    def _refresh_cached_value(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> None:
+        """Recompute a stale value and replace it in the cache. Runs on the
+        refresh thread pool. If recomputing fails, callers keep getting the
+        stale value until it expires.
+        """
+        try:
+            with cache.compute_value_lock(value_key):
+                # The value may have been recomputed in the foreground since
+                # the refresh was scheduled.
+                with contextlib.suppress(CacheKeyNotFoundError):
+                    if not cache.is_stale(cache.read_result(value_key)):
+                        return
+
+                with self._info.cached_message_replay_ctx.calling_cached_function(
+                    self._info.func
+                ):
+                    computed_value = self._info.func(*func_args, **func_kwargs)
+                    if self._is_coroutine_function:
+                        computed_value = asyncio.run(computed_value)
+
+                messages = self._info.cached_message_replay_ctx._most_recent_messages
+                if messages:
+                    # The function now creates elements, which can't be
+                    # recorded here. Drop the stale value so that the next
+                    # call recomputes it in the foreground.
+                    cache.clear(key=value_key)
+                    return
+
                 cache.write_result(value_key, computed_value, messages)
-                return computed_value
-            except (CacheError, RuntimeError) as ex:
-                # An exception was thrown while we tried to write to the cache. Report
-                # it to the user. (We catch `RuntimeError` here because it will be
-                # raised by Apache Spark if we do not collect dataframe before
-                # using `st.cache_data`.)
-                if is_unevaluated_data_object(computed_value):
-                    # If the returned value is an unevaluated dataframe, raise an error.
-                    # Unevaluated dataframes are not yet in the local memory, which also
-                    # means they cannot be properly cached (serialized).
-                    raise UnevaluatedDataFrameError(
-                        f"The function {get_cached_func_name_md(self._info.func)} is "
-                        "decorated with `st.cache_data` but it returns an unevaluated "
-                        f"data object of type `{type_util.get_fqn_type(computed_value)}`. "
-                        "Please convert the object to a serializable format "
-                        "(e.g. Pandas DataFrame) before returning it, so "
-                        "`st.cache_data` can serialize and cache it."
-                    ) from ex
-                raise UnserializableReturnValueError(
-                    return_value=computed_value, func=self._info.func
-                )
+        except Exception:
+            _LOGGER.exception(
+                "Failed to refresh the cached value of %s in the background.",
+                self._info.func.__qualname__,
+            )
+        finally:
+            cache.finish_refresh(value_key)
 
     def clear(self, *args, **kwargs):
         """Clear the cached function's associated cache.
@@ -388,6 +662,7 @@ class CachedFunc:
                 func_args=args,
                 func_kwargs=kwargs,
                 hash_funcs=self._info.hash_funcs,
+                hash_mode=self._info.hash_mode,
             )
         else:
             key = None
@@ -400,6 +675,7 @@ def _make_value_key(
     func_args: tuple[Any, ...],
     func_kwargs: dict[str, Any],
     hash_funcs: HashFuncsDict | None,
+    hash_mode: HashMode | None = None,
 ) -> str:
     """Create the key for a value within a cache.
 
@@ -451,6 +727,7 @@ def _make_value_key(
                 cache_type=cache_type,
                 hash_funcs=hash_funcs,
                 hash_source=func,
+                hash_mode=hash_mode,
             )
         except UnhashableTypeError as exc:
             raise UnhashableParamError(cache_type, func, arg_name, arg_value, exc)
@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 import contextlib
-import threading
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, Union
 
@@ -80,6 +80,9 @@ class CachedResult:
     messages: list[MsgData]
     main_id: str
     sidebar_id: str
+    # When the value was computed, as a Unix timestamp. Only set for caches
+    # that recompute stale values in the background.
+    computed_at: float | None = None
 
 
 """
@@ -113,32 +116,57 @@ Explicit invocation on an unknown DG -> Raise an error
 """
 
 
-class CachedMessageReplayContext(threading.local):
+class CachedMessageReplayContext:
     """A utility for storing messages generated by `st` commands called inside
     a cached function.
 
-    Data is stored in a thread-local object, so it's safe to use an instance
-    of this class across multiple threads.
+    Data is stored in context variables, so it's safe to use an instance of
+    this class across multiple threads, and across cached coroutines that are
+    awaited concurrently on the same thread.
     """
 
     def __init__(self, cache_type: CacheType):
-        self._cached_message_stack: list[list[MsgData]] = []
-        self._seen_dg_stack: list[set[str]] = []
-        self._most_recent_messages: list[MsgData] = []
-        self._media_data: list[MediaMsgData] = []
+        # The stacks are replaced rather than mutated, so that each thread and
+        # asyncio task sees the cached functions it's running in. The lists
+        # and sets they contain are shared, so messages produced in a task
+        # are recorded for all its enclosing cached functions.
+        self._cached_message_stack_var: ContextVar[tuple[list[MsgData], ...]] = (
+            ContextVar(f"{cache_type.value}_cached_message_stack", default=())
+        )
+        self._seen_dg_stack_var: ContextVar[tuple[set[str], ...]] = ContextVar(
+            f"{cache_type.value}_seen_dg_stack", default=()
+        )
+        self._most_recent_messages_var: ContextVar[list[MsgData]] = ContextVar(
+            f"{cache_type.value}_most_recent_messages"
+        )
+        self._media_data_var: ContextVar[tuple[MediaMsgData, ...]] = ContextVar(
+            f"{cache_type.value}_media_data", default=()
+        )
         self._cache_type = cache_type
 
     def __repr__(self) -> str:
         return util.repr_(self)
 
+    @property
+    def _most_recent_messages(self) -> list[MsgData]:
+        """The messages recorded by the cached function that most recently
+        returned in the current context.
+        """
+        return self._most_recent_messages_var.get([])
+
     @contextlib.contextmanager
     def calling_cached_function(self, func: FunctionType) -> Iterator[None]:
         """Context manager that should wrap the invocation of a cached function.
         It allows us to track any `st.foo` messages that are generated from inside the
         function for playback during cache retrieval.
         """
-        self._cached_message_stack.append([])
-        self._seen_dg_stack.append(set())
+        messages: list[MsgData] = []
+        message_stack_token = self._cached_message_stack_var.set(
+            (*self._cached_message_stack_var.get(), messages)
+        )
+        seen_dg_stack_token = self._seen_dg_stack_var.set(
+            (*self._seen_dg_stack_var.get(), set())
+        )
         nested_call = False
         if in_cached_function.get():
             nested_call = True
@@ -150,8 +178,9 @@ class CachedMessageReplayContext(threading.local):
         try:
             yield
         finally:
-            self._most_recent_messages = self._cached_message_stack.pop()
-            self._seen_dg_stack.pop()
+            self._most_recent_messages_var.set(messages)
+            self._cached_message_stack_var.reset(message_stack_token)
+            self._seen_dg_stack_var.reset(seen_dg_stack_token)
             if not nested_call:
                 # Reset the in_cached_function flag. But only if this
                 # is not nested inside a cached function that disallows widget usage.
@@ -171,10 +200,11 @@ class CachedMessageReplayContext(threading.local):
         """
         if not runtime.exists():
             return
-        if len(self._cached_message_stack) >= 1:
+        cached_message_stack = self._cached_message_stack_var.get()
+        if len(cached_message_stack) >= 1:
             id_to_save = self.select_dg_to_save(invoked_dg_id, used_dg_id)
 
-            media_data = self._media_data
+            media_data = list(self._media_data_var.get())
 
             element_msg_data = ElementMsgData(
                 delta_type,
@@ -183,14 +213,14 @@ class CachedMessageReplayContext(threading.local):
                 returned_dg_id,
                 media_data,
             )
-            for msgs in self._cached_message_stack:
+            for msgs in cached_message_stack:
                 msgs.append(element_msg_data)
 
         # Reset instance state, now that it has been used for the
         # associated element.
-        self._media_data = []
+        self._media_data_var.set(())
 
-        for s in self._seen_dg_stack:
+        for s in self._seen_dg_stack_var.get():
             s.add(returned_dg_id)
 
     def save_block_message(
@@ -201,9 +231,9 @@ class CachedMessageReplayContext(threading.local):
         returned_dg_id: str,
     ) -> None:
         id_to_save = self.select_dg_to_save(invoked_dg_id, used_dg_id)
-        for msgs in self._cached_message_stack:
+        for msgs in self._cached_message_stack_var.get():
             msgs.append(BlockMsgData(block_proto, id_to_save, returned_dg_id))
-        for s in self._seen_dg_stack:
+        for s in self._seen_dg_stack_var.get():
             s.add(returned_dg_id)
 
     def select_dg_to_save(self, invoked_id: str, acting_on_id: str) -> str:
@@ -216,7 +246,8 @@ class CachedMessageReplayContext(threading.local):
         acting_on_id is the DG the st function ultimately runs on, which may be different
         if the invoked DG delegated to another one because it was in a `with` block.
         """
-        if len(self._seen_dg_stack) > 0 and acting_on_id in self._seen_dg_stack[-1]:
+        seen_dg_stack = self._seen_dg_stack_var.get()
+        if len(seen_dg_stack) > 0 and acting_on_id in seen_dg_stack[-1]:
             return acting_on_id
         else:
             return invoked_id
@@ -224,7 +255,9 @@ class CachedMessageReplayContext(threading.local):
     def save_image_data(
         self, image_data: bytes | str, mimetype: str, image_id: str
     ) -> None:
-        self._media_data.append(MediaMsgData(image_data, mimetype, image_id))
+        self._media_data_var.set(
+            (*self._media_data_var.get(), MediaMsgData(image_data, mimetype, image_id))
+        )
 
 
 def replay_cached_messages(
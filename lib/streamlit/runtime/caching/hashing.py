@@ -31,10 +31,11 @@ import tempfile
 import threading
 import uuid
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from re import Pattern
 from types import MappingProxyType
-from typing import Any, Callable, Final, Union, cast
+from typing import Any, Callable, Final, Literal, NamedTuple, TypeVar, Union, cast
 
 from typing_extensions import TypeAlias
 
@@ -52,8 +53,29 @@ _PANDAS_SAMPLE_SIZE: Final = 10000
 _NP_SIZE_LARGE: Final = 1000000
 _NP_SAMPLE_SIZE: Final = 100000
 
+# With hash_mode="full", large dataframes and arrays are hashed in chunks of
+# this many rows or bytes on a thread pool.
+_FULL_HASH_CHUNK_ROWS: Final = 1_000_000
+_FULL_HASH_CHUNK_BYTES: Final = 16 * 1024 * 1024
+_MAX_HASH_WORKERS: Final = min(8, os.cpu_count() or 1)
+
+# Hashes of immutable arrays and dataframes of at least this many bytes are
+# kept across key computations and reruns, for as long as the objects live.
+_IDENTITY_MEMO_MIN_BYTES: Final = 1024 * 1024
+
+# Immutable objects with at least this many items are memoized by identity
+# while a key is computed, so that shared sub-objects are only hashed once.
+_MEMOIZE_BY_ID_MIN_SIZE: Final = 16
+
 HashFuncsDict: TypeAlias = dict[Union[str, type[Any]], Callable[[Any], Any]]
 
+# How large dataframes and arrays are hashed: "sample" hashes a fixed-size
+# random sample of their rows, "full" hashes all of them. Without a mode, large
+# pandas dataframes and numpy arrays are sampled, and polars data is hashed in
+# full, since it's cheap to read from its Arrow buffers.
+HashMode: TypeAlias = Literal["sample", "full"]
+HASH_MODES: Final[tuple[HashMode, ...]] = ("sample", "full")
+
 # Arbitrary item to denote where we found a cycle in a hashed object.
 # This allows us to hash self-referencing lists, dictionaries, etc.
 _CYCLE_PLACEHOLDER: Final = (
@@ -148,6 +170,7 @@ def update_hash(
     cache_type: CacheType,
     hash_source: Callable[..., Any] | None = None,
     hash_funcs: HashFuncsDict | None = None,
+    hash_mode: HashMode | None = None,
 ) -> None:
     """Updates a hashlib hasher with the hash of val.
 
@@ -156,7 +179,7 @@ def update_hash(
 
     hash_stacks.current.hash_source = hash_source
 
-    ch = _CacheFuncHasher(cache_type, hash_funcs)
+    ch = _CacheFuncHasher(cache_type, hash_funcs, hash_mode)
     ch.update(hasher, val)
 
 
@@ -227,6 +250,114 @@ class _HashStacks:
 hash_stacks = _HashStacks()
 
 
+_hash_executor: ThreadPoolExecutor | None = None
+_hash_executor_lock = threading.Lock()
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    """Return the thread pool that hashes chunks of large dataframes and
+    arrays, creating it on first use.
+    """
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is None:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=_MAX_HASH_WORKERS, thread_name_prefix="CacheHash"
+            )
+        return _hash_executor
+
+
+_T = TypeVar("_T")
+
+
+def _map_chunks(func: Callable[[_T], bytes], chunks: list[_T]) -> bytes:
+    """Return the concatenated results of func for each chunk, computed on
+    the hash thread pool if there's more than one.
+    """
+    if len(chunks) <= 1:
+        return b"".join(func(chunk) for chunk in chunks)
+    return b"".join(_get_hash_executor().map(func, chunks))
+
+
+def _digest_buffer(buffer: Any) -> bytes:
+    # hashlib releases the GIL while hashing large buffers, so chunks are
+    # really hashed in parallel.
+    return hashlib.blake2b(buffer, digest_size=16).digest()
+
+
+def _hash_numpy_array_full(arr: Any) -> bytes:
+    """Hash all the data of a numpy array that doesn't hold Python objects."""
+    import numpy as np
+
+    data = np.ascontiguousarray(arr).view(np.uint8).reshape(-1)
+    chunks = [
+        data[start : start + _FULL_HASH_CHUNK_BYTES]
+        for start in range(0, data.size, _FULL_HASH_CHUNK_BYTES)
+    ]
+    return _map_chunks(_digest_buffer, chunks)
+
+
+def _hash_pandas_chunk(chunk: Any) -> bytes:
+    import pandas as pd
+
+    return _digest_buffer(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+
+
+def _hash_pandas_columns_full(columns: list[Any]) -> bytes:
+    """Hash all the rows of the given pandas Series and Indexes, in chunks of
+    rows of each column.
+
+    Raises
+    ------
+    TypeError
+        Raised if pandas can't hash the values of a column.
+
+    """
+    chunks = [
+        column[start : start + _FULL_HASH_CHUNK_ROWS]
+        for column in columns
+        for start in range(0, len(column), _FULL_HASH_CHUNK_ROWS)
+    ]
+    return _map_chunks(_hash_pandas_chunk, chunks)
+
+
+class _HashingSink:
+    """A writable file-like object that hashes what's written to it."""
+
+    def __init__(self) -> None:
+        self._hasher = hashlib.blake2b(digest_size=16)
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        self._hasher.update(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def digest(self) -> bytes:
+        return self._hasher.digest()
+
+
+def _hash_arrow_table(table: Any) -> bytes:
+    """Hash all the data of a pyarrow Table.
+
+    The table is hashed in its Arrow IPC stream form, which only holds the
+    visible part of sliced buffers and is specified independently of the
+    library that produced the table. The stream is hashed as it's written,
+    without being copied.
+    """
+    import pyarrow as pa
+
+    sink = _HashingSink()
+    with pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), table.schema) as writer:
+        writer.write_table(table)
+    return sink.digest()
+
+
 def _int_to_bytes(i: int) -> bytes:
     num_bytes = (i.bit_length() + 8) // 8
     return i.to_bytes(num_bytes, "little", signed=True)
@@ -240,33 +371,29 @@ def _float_to_bytes(f: float) -> bytes:
     return struct.pack("<d", f)
 
 
+# Types whose values are used as memoization keys as-is.
+_SIMPLE_TYPES: Final = (bytes, str, float, int, uuid.UUID)
+
+
+def _is_simple(obj: Any) -> bool:
+    return obj is None or isinstance(obj, _SIMPLE_TYPES)
+
+
 def _key(obj: Any | None) -> Any:
     """Return key for memoization."""
 
     if obj is None:
         return None
 
-    def is_simple(obj):
-        return (
-            isinstance(obj, bytes)
-            or isinstance(obj, bytearray)
-            or isinstance(obj, str)
-            or isinstance(obj, float)
-            or isinstance(obj, int)
-            or isinstance(obj, bool)
-            or isinstance(obj, uuid.UUID)
-            or obj is None
-        )
-
-    if is_simple(obj):
+    if _is_simple(obj):
         return obj
 
     if isinstance(obj, tuple):
-        if all(map(is_simple, obj)):
+        if all(map(_is_simple, obj)):
             return obj
 
     if isinstance(obj, list):
-        if all(map(is_simple, obj)):
+        if all(map(_is_simple, obj)):
             return ("__l", tuple(obj))
 
     if inspect.isbuiltin(obj) or inspect.isroutine(obj) or inspect.iscode(obj):
@@ -275,10 +402,204 @@ def _key(obj: Any | None) -> Any:
     return NoResult
 
 
+def _value_key(obj: Any) -> Any:
+    return obj
+
+
+def _no_key(obj: Any) -> Any:
+    return NoResult
+
+
+class _TypeDispatch(NamedTuple):
+    """How objects of a single type are hashed."""
+
+    # The type's name, which prefixes the bytes of all its objects.
+    name: bytes
+    # The type's fully-qualified name, which user hash_funcs are keyed by.
+    fqn: str
+    # The handler for objects of exactly this type, or None if they're hashed
+    # by _CacheFuncHasher._to_bytes_fallback.
+    handler: Callable[[_CacheFuncHasher, Any], bytes] | None
+    # Returns the memoization key of an object of this type; `_key` for
+    # types without a shortcut.
+    key: Callable[[Any], Any]
+    # Whether objects of this type are immutable, so that their bytes can be
+    # memoized by identity within a single key computation.
+    memoize_by_id: bool
+    # Whether the bytes of large objects of this type can be kept in
+    # _identity_hash_memo, if they can't be mutated.
+    identity_memo: bool
+
+
+def _get_type_dispatch(obj_type: type) -> _TypeDispatch:
+    """Return how objects of obj_type are hashed.
+
+    This is cached per type, so the handler lookup and the type name
+    formatting happen once per type rather than once per object.
+    """
+    try:
+        return _get_cached_type_dispatch(cast("collections.abc.Hashable", obj_type))
+    except TypeError:
+        # The type's metaclass makes it unhashable.
+        return _make_type_dispatch(obj_type)
+
+
+def _make_type_dispatch(obj_type: type) -> _TypeDispatch:
+    fqn = type_util.get_fqn(obj_type)
+    handler = _TYPE_HANDLERS.get(obj_type)
+    if handler is None:
+        # Handlers for types from optional dependencies are keyed by name, so
+        # that the dependencies aren't imported until they're used.
+        handler = _NAMED_TYPE_HANDLERS.get(fqn)
+    return _TypeDispatch(
+        name=obj_type.__qualname__.encode(),
+        fqn=fqn,
+        handler=handler,
+        key=_TYPE_KEYS.get(obj_type, _key),
+        memoize_by_id=obj_type in _MEMOIZE_BY_ID_TYPES,
+        identity_memo=fqn in _IDENTITY_MEMO_TYPES,
+    )
+
+
+# Bounded, since types defined in the user's script are recreated on every
+# rerun.
+_get_cached_type_dispatch = functools.lru_cache(maxsize=1024)(_make_type_dispatch)
+
+
+def _is_frozen_numpy_array(arr: Any) -> bool:
+    """Whether the data of a numpy array can't be changed through it or any
+    array it's a view of.
+
+    This is the case for the arrays of values returned by st.cache_data.
+    It can't detect an array that owns its data being made writable again.
+    """
+    import numpy as np
+
+    if arr.dtype.hasobject:
+        # The array's objects themselves may be mutable.
+        return False
+    base = arr
+    while isinstance(base, np.ndarray):
+        if base.flags.writeable:
+            return False
+        base = base.base
+    return (
+        base is None
+        or isinstance(base, bytes)
+        or (isinstance(base, memoryview) and base.readonly)
+    )
+
+
+def _get_identity_memo_guard(obj: Any, fqn: str) -> tuple[Any, ...] | None:
+    """Return the objects that a memoized hash of obj is valid for, or None
+    if obj's hash can't be memoized by identity.
+
+    A memoized hash is only used while these objects are still the ones obj
+    holds, so it's invalidated if e.g. a column of a DataFrame is replaced.
+    """
+    import numpy as np
+
+    if fqn == "numpy.ndarray":
+        if obj.nbytes >= _IDENTITY_MEMO_MIN_BYTES and _is_frozen_numpy_array(obj):
+            return ()
+        return None
+
+    if fqn in _ARROW_TYPES:
+        # Arrow data is immutable.
+        return () if obj.nbytes >= _IDENTITY_MEMO_MIN_BYTES else None
+
+    # A pandas DataFrame or Series. Index objects are immutable, but the
+    # DataFrame's blocks must all be frozen arrays.
+    try:
+        manager = obj._mgr
+        arrays = list(manager.arrays)
+    except AttributeError:
+        return None
+    if not all(
+        isinstance(arr, np.ndarray) and _is_frozen_numpy_array(arr) for arr in arrays
+    ):
+        return None
+    if sum(arr.nbytes for arr in arrays) < _IDENTITY_MEMO_MIN_BYTES:
+        return None
+    indexes = (obj.index,) if obj.ndim == 1 else (obj.index, obj.columns)
+    return (manager, *arrays, *indexes)
+
+
+class _IdentityHashMemo:
+    """The bytes of large immutable objects, keyed by the objects' identity.
+
+    The same DataFrame is often passed to several cached functions on every
+    rerun. This lets its hash be computed once for as long as it's alive and
+    unchanged. Objects are only referenced weakly.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (id(obj), hash_mode) -> (ref to obj, refs to guard objects, bytes)
+        self._entries: dict[
+            tuple[int, HashMode | None],
+            tuple[weakref.ref[Any], tuple[weakref.ref[Any], ...], bytes],
+        ] = {}
+
+    def get(
+        self, obj: Any, hash_mode: HashMode | None, guard: tuple[Any, ...]
+    ) -> bytes | None:
+        """Return the memoized bytes of obj, or None if they're missing or
+        were computed for different guard objects.
+        """
+        entry = self._entries.get((id(obj), hash_mode))
+        if entry is None:
+            return None
+        ref, guard_refs, b = entry
+        if ref() is not obj or len(guard_refs) != len(guard):
+            return None
+        if any(
+            guard_ref() is not guard_obj
+            for guard_ref, guard_obj in zip(guard_refs, guard)
+        ):
+            return None
+        return b
+
+    def set(
+        self, obj: Any, hash_mode: HashMode | None, guard: tuple[Any, ...], b: bytes
+    ) -> None:
+        key = (id(obj), hash_mode)
+
+        def remove(ref: weakref.ref[Any]) -> None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] is ref:
+                    del self._entries[key]
+
+        try:
+            ref = weakref.ref(obj, remove)
+            guard_refs = tuple(weakref.ref(guard_obj) for guard_obj in guard)
+        except TypeError:
+            # Not all objects can be weakly referenced.
+            return
+        with self._lock:
+            self._entries[key] = (ref, guard_refs, b)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_identity_hash_memo = _IdentityHashMemo()
+
+
 class _CacheFuncHasher:
     """A hasher that can hash objects with cycles."""
 
-    def __init__(self, cache_type: CacheType, hash_funcs: HashFuncsDict | None = None):
+    def __init__(
+        self,
+        cache_type: CacheType,
+        hash_funcs: HashFuncsDict | None = None,
+        hash_mode: HashMode | None = None,
+    ):
         # Can't use types as the keys in the internal _hash_funcs because
         # we always remove user-written modules from memory when rerunning a
         # script in order to reload it and grab the latest code changes.
@@ -295,34 +616,59 @@ class _CacheFuncHasher:
         else:
             self._hash_funcs = {}
         self._hashes: dict[Any, bytes] = {}
+        # The bytes of immutable objects that can't be memoized by value,
+        # keyed by id. The objects are kept alive so their ids aren't reused.
+        self._hashes_by_id: dict[int, tuple[Any, bytes]] = {}
+        # A hasher is only used on the thread that created it.
+        self._hash_stack = hash_stacks.current
 
         # The number of the bytes in the hash.
         self.size = 0
 
         self.cache_type = cache_type
+        self.hash_mode = hash_mode
 
     def __repr__(self) -> str:
         return util.repr_(self)
 
     def to_bytes(self, obj: Any) -> bytes:
         """Add memoization to _to_bytes and protect against cycles in data structures."""
-        tname = type(obj).__qualname__.encode()
-        key = (tname, _key(obj))
+        dispatch = _get_type_dispatch(type(obj))
+        tname = dispatch.name
+        key = (tname, dispatch.key(obj))
 
         # Memoize if possible.
         if key[1] is not NoResult:
             if key in self._hashes:
                 return self._hashes[key]
+        elif self._can_memoize_by_id(obj, dispatch):
+            memoized = self._hashes_by_id.get(id(obj))
+            if memoized is not None:
+                return memoized[1]
+
+        # User hash_funcs may apply to anything inside obj, so they bypass the
+        # memo of hashes across key computations.
+        identity_memo_guard = (
+            _get_identity_memo_guard(obj, dispatch.fqn)
+            if dispatch.identity_memo and not self._hash_funcs
+            else None
+        )
+        if identity_memo_guard is not None:
+            memoized_bytes = _identity_hash_memo.get(
+                obj, self.hash_mode, identity_memo_guard
+            )
+            if memoized_bytes is not None:
+                return memoized_bytes
 
         # Break recursive cycles.
-        if obj in hash_stacks.current:
+        if obj in self._hash_stack:
             return _CYCLE_PLACEHOLDER
 
-        hash_stacks.current.push(obj)
+        self._hash_stack.push(obj)
 
         try:
             # Hash the input
-            b = b"%s:%s" % (tname, self._to_bytes(obj))
+            b = b"%s:%s" % (tname, self._to_bytes(obj, dispatch))
 
             # Hmmm... It's possible that the size calculation is wrong. When we
             # call to_bytes inside _to_bytes things get double-counted.
@@ -330,11 +676,15 @@ class _CacheFuncHasher:
 
             if key[1] is not NoResult:
                 self._hashes[key] = b
+            elif self._can_memoize_by_id(obj, dispatch):
+                self._hashes_by_id[id(obj)] = (obj, b)
+            if identity_memo_guard is not None:
+                _identity_hash_memo.set(obj, self.hash_mode, identity_memo_guard, b)
 
         finally:
             # In case an UnhashableTypeError (or other) error is thrown, clean up the
             # stack so we don't get false positives in future hashing calls
-            hash_stacks.current.pop()
+            self._hash_stack.pop()
 
         return b
 
@@ -343,18 +693,35 @@ class _CacheFuncHasher:
         b = self.to_bytes(obj)
         hasher.update(b)
 
-    def _to_bytes(self, obj: Any) -> bytes:
+    def _can_memoize_by_id(self, obj: Any, dispatch: _TypeDispatch) -> bool:
+        if dispatch.memoize_by_id:
+            return len(obj) >= _MEMOIZE_BY_ID_MIN_SIZE
+        # Read-only arrays, e.g. the ones returned by st.cache_data, can't
+        # change while a key is computed.
+        return (
+            dispatch.fqn == "numpy.ndarray"
+            and not obj.flags.writeable
+            and obj.size >= _MEMOIZE_BY_ID_MIN_SIZE
+        )
+
+    def _to_bytes(self, obj: Any, dispatch: _TypeDispatch) -> bytes:
         """Hash objects to bytes, including code with dependencies.
 
         Python's built in `hash` does not produce consistent results across
         runs.
         """
+        if dispatch.handler is not None and dispatch.fqn not in self._hash_funcs:
+            return dispatch.handler(self, obj)
+        return self._to_bytes_fallback(obj, dispatch.fqn)
+
+    def _to_bytes_fallback(self, obj: Any, fqn: str) -> bytes:
+        """Hash objects that don't have a handler for their exact type, or
+        that have a user hash function.
+        """
 
         h = hashlib.new("md5", usedforsecurity=False)
 
-        if type_util.is_type(obj, "unittest.mock.Mock") or type_util.is_type(
-            obj, "unittest.mock.MagicMock"
-        ):
+        if fqn in _MOCK_TYPES:
             # Mock objects can appear to be infinitely
             # deep, so we don't try to hash them at all.
             return self.to_bytes(id(obj))
@@ -362,9 +729,9 @@ class _CacheFuncHasher:
         elif isinstance(obj, bytes) or isinstance(obj, bytearray):
             return obj
 
-        elif type_util.get_fqn_type(obj) in self._hash_funcs:
+        elif fqn in self._hash_funcs:
             # Escape hatch for unsupported objects
-            hash_func = self._hash_funcs[type_util.get_fqn_type(obj)]
+            hash_func = self._hash_funcs[fqn]
             try:
                 output = hash_func(obj)
             except Exception as ex:
@@ -412,73 +779,6 @@ class _CacheFuncHasher:
         elif isinstance(obj, Enum):
             return str(obj).encode()
 
-        elif type_util.is_type(obj, "pandas.core.series.Series"):
-            import pandas as pd
-
-            obj = cast(pd.Series, obj)
-            self.update(h, obj.size)
-            self.update(h, obj.dtype.name)
-
-            if len(obj) >= _PANDAS_ROWS_LARGE:
-                obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
-
-            try:
-                self.update(h, pd.util.hash_pandas_object(obj).values.tobytes())
-                return h.digest()
-            except TypeError:
-                # Use pickle if pandas cannot hash the object for example if
-                # it contains unhashable objects.
-                return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
-
-        elif type_util.is_type(obj, "pandas.core.frame.DataFrame"):
-            import pandas as pd
-
-            obj = cast(pd.DataFrame, obj)
-            self.update(h, obj.shape)
-
-            if len(obj) >= _PANDAS_ROWS_LARGE:
-                obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
-            try:
-                column_hash_bytes = self.to_bytes(
-                    pd.util.hash_pandas_object(obj.dtypes)
-                )
-                self.update(h, column_hash_bytes)
-                values_hash_bytes = self.to_bytes(pd.util.hash_pandas_object(obj))
-                self.update(h, values_hash_bytes)
-                return h.digest()
-            except TypeError:
-                # Use pickle if pandas cannot hash the object for example if
-                # it contains unhashable objects.
-                return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
-
-        elif type_util.is_type(obj, "numpy.ndarray"):
-            import numpy as np
-
-            # write cast type as string to make it work with our Python 3.8 tests
-            # - can be removed once we sunset support for Python 3.8
-            obj = cast("np.ndarray[Any, Any]", obj)
-            self.update(h, obj.shape)
-            self.update(h, str(obj.dtype))
-
-            if obj.size >= _NP_SIZE_LARGE:
-                import numpy as np
-
-                state = np.random.RandomState(0)
-                obj = state.choice(obj.flat, size=_NP_SAMPLE_SIZE)
-
-            self.update(h, obj.tobytes())
-            return h.digest()
-        elif type_util.is_type(obj, "PIL.Image.Image"):
-            import numpy as np
-            from PIL.Image import Image
-
-            obj = cast(Image, obj)
-
-            # we don't just hash the results of obj.tobytes() because we want to use
-            # the sampling logic for numpy data
-            np_array = np.frombuffer(obj.tobytes(), dtype="uint8")
-            return self.to_bytes(np_array)
-
         elif inspect.isbuiltin(obj):
             return bytes(obj.__name__.encode())
 
@@ -487,9 +787,6 @@ class _CacheFuncHasher:
         ):
             return self.to_bytes(dict(obj))
 
-        elif type_util.is_type(obj, "builtins.getset_descriptor"):
-            return bytes(obj.__qualname__.encode())
-
         elif isinstance(obj, UploadedFile):
             # UploadedFile is a BytesIO (thus IOBase) but has a name.
             # It does not have a timestamp so this must come before
@@ -525,10 +822,6 @@ class _CacheFuncHasher:
             self.update(h, obj.getvalue())
             return h.digest()
 
-        elif type_util.is_type(obj, "numpy.ufunc"):
-            # For numpy.remainder, this returns remainder.
-            return bytes(obj.__name__.encode())
-
         elif inspect.ismodule(obj):
             # TODO: Figure out how to best show this kind of warning to the
             # user. In the meantime, show nothing. This scenario is too common,
@@ -568,6 +861,247 @@ class _CacheFuncHasher:
                 self.update(h, item)
             return h.digest()
 
+    def _hash_bytes(self, obj: bytes) -> bytes:
+        return obj
+
+    def _hash_str(self, obj: str) -> bytes:
+        return obj.encode()
+
+    def _hash_float(self, obj: float) -> bytes:
+        return _float_to_bytes(obj)
+
+    def _hash_int(self, obj: int) -> bytes:
+        return _int_to_bytes(obj)
+
+    def _hash_none(self, obj: None) -> bytes:
+        return b"0"
+
+    def _hash_uuid(self, obj: uuid.UUID) -> bytes:
+        return obj.bytes
+
+    def _hash_datetime(self, obj: datetime.datetime) -> bytes:
+        return obj.isoformat().encode()
+
+    def _hash_sequence(self, obj: list[Any] | tuple[Any, ...]) -> bytes:
+        h = hashlib.new("md5", usedforsecurity=False)
+        for item in obj:
+            self.update(h, item)
+        return h.digest()
+
+    def _hash_dict(self, obj: dict[Any, Any]) -> bytes:
+        h = hashlib.new("md5", usedforsecurity=False)
+        for item in obj.items():
+            self.update(h, item)
+        return h.digest()
+
+    def _hash_mock(self, obj: Any) -> bytes:
+        # Mock objects can appear to be infinitely
+        # deep, so we don't try to hash them at all.
+        return self.to_bytes(id(obj))
+
+    def _hash_name(self, obj: Any) -> bytes:
+        # For numpy.remainder, this returns remainder.
+        return bytes(obj.__name__.encode())
+
+    def _hash_qualname(self, obj: Any) -> bytes:
+        return bytes(obj.__qualname__.encode())
+
+    def _hash_pandas_series(self, obj: Any) -> bytes:
+        import pandas as pd
+
+        h = hashlib.new("md5", usedforsecurity=False)
+        obj = cast(pd.Series, obj)
+        self.update(h, obj.size)
+        self.update(h, obj.dtype.name)
+
+        if len(obj) >= _PANDAS_ROWS_LARGE:
+            if self.hash_mode == "full":
+                try:
+                    self.update(h, _hash_pandas_columns_full([obj.index, obj]))
+                    return h.digest()
+                except TypeError:
+                    return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+            obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
+
+        try:
+            self.update(h, pd.util.hash_pandas_object(obj).values.tobytes())
+            return h.digest()
+        except TypeError:
+            # Use pickle if pandas cannot hash the object for example if
+            # it contains unhashable objects.
+            return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def _hash_pandas_dataframe(self, obj: Any) -> bytes:
+        import pandas as pd
+
+        h = hashlib.new("md5", usedforsecurity=False)
+        obj = cast(pd.DataFrame, obj)
+        self.update(h, obj.shape)
+
+        if len(obj) >= _PANDAS_ROWS_LARGE:
+            if self.hash_mode == "full":
+                return self._hash_pandas_dataframe_full(obj)
+            obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
+        try:
+            column_hash_bytes = self.to_bytes(pd.util.hash_pandas_object(obj.dtypes))
+            self.update(h, column_hash_bytes)
+            values_hash_bytes = self.to_bytes(pd.util.hash_pandas_object(obj))
+            self.update(h, values_hash_bytes)
+            return h.digest()
+        except TypeError:
+            # Use pickle if pandas cannot hash the object for example if
+            # it contains unhashable objects.
+            return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def _hash_pandas_dataframe_full(self, obj: Any) -> bytes:
+        """Hash all the rows of a large DataFrame, in chunks of rows of each
+        column on the hash thread pool.
+        """
+        import pandas as pd
+
+        h = hashlib.new("md5", usedforsecurity=False)
+        self.update(h, obj.shape)
+        try:
+            # The column names and types.
+            self.update(h, self.to_bytes(pd.util.hash_pandas_object(obj.dtypes)))
+            columns = [obj.index, *(obj.iloc[:, i] for i in range(obj.shape[1]))]
+            self.update(h, _hash_pandas_columns_full(columns))
+            return h.digest()
+        except TypeError:
+            # Use pickle if pandas cannot hash the object for example if
+            # it contains unhashable objects.
+            return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def _hash_numpy_array(self, obj: Any) -> bytes:
+        import numpy as np
+
+        h = hashlib.new("md5", usedforsecurity=False)
+        # write cast type as string to make it work with our Python 3.8 tests
+        # - can be removed once we sunset support for Python 3.8
+        obj = cast("np.ndarray[Any, Any]", obj)
+        self.update(h, obj.shape)
+        self.update(h, str(obj.dtype))
+
+        if obj.size >= _NP_SIZE_LARGE:
+            if self.hash_mode == "full":
+                if obj.dtype.hasobject:
+                    # The buffer holds pointers, as it does for small arrays.
+                    self.update(h, obj.tobytes())
+                else:
+                    self.update(h, _hash_numpy_array_full(obj))
+                return h.digest()
+            state = np.random.RandomState(0)
+            obj = state.choice(obj.flat, size=_NP_SAMPLE_SIZE)
+
+        self.update(h, obj.tobytes())
+        return h.digest()
+
+    def _hash_pil_image(self, obj: Any) -> bytes:
+        import numpy as np
+        from PIL.Image import Image
+
+        obj = cast(Image, obj)
+
+        # we don't just hash the results of obj.tobytes() because we want to use
+        # the sampling logic for numpy data
+        np_array = np.frombuffer(obj.tobytes(), dtype="uint8")
+        return self.to_bytes(np_array)
+
+    def _hash_polars_series(self, obj: Any) -> bytes:
+        h = hashlib.new("md5", usedforsecurity=False)
+        self.update(h, len(obj))
+        self.update(h, str(obj.dtype))
+
+        if len(obj) >= _PANDAS_ROWS_LARGE and self.hash_mode == "sample":
+            obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, seed=0)
+
+        try:
+            self.update(h, _hash_arrow_table(obj.to_frame().to_arrow()))
+            return h.digest()
+        except Exception:
+            # Use pickle if the values can't be converted to Arrow, e.g. for
+            # object columns.
+            return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def _hash_polars_dataframe(self, obj: Any) -> bytes:
+        h = hashlib.new("md5", usedforsecurity=False)
+        self.update(h, obj.shape)
+        self.update(h, [(name, str(dtype)) for name, dtype in obj.schema.items()])
+
+        if len(obj) >= _PANDAS_ROWS_LARGE and self.hash_mode == "sample":
+            obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, seed=0)
+
+        try:
+            self.update(h, _hash_arrow_table(obj.to_arrow()))
+            return h.digest()
+        except Exception:
+            # Use pickle if the values can't be converted to Arrow, e.g. for
+            # object columns.
+            return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+# Handlers for objects of exactly these types. Objects of subclasses go
+# through _CacheFuncHasher._to_bytes_fallback, which checks the types in the
+# same order as before the table existed.
+_TYPE_HANDLERS: Final[dict[type, Callable[[_CacheFuncHasher, Any], bytes]]] = {
+    bytes: _CacheFuncHasher._hash_bytes,
+    bytearray: _CacheFuncHasher._hash_bytes,
+    str: _CacheFuncHasher._hash_str,
+    float: _CacheFuncHasher._hash_float,
+    int: _CacheFuncHasher._hash_int,
+    # bool is an int subclass and has always been hashed as one.
+    bool: _CacheFuncHasher._hash_int,
+    type(None): _CacheFuncHasher._hash_none,
+    uuid.UUID: _CacheFuncHasher._hash_uuid,
+    datetime.datetime: _CacheFuncHasher._hash_datetime,
+    list: _CacheFuncHasher._hash_sequence,
+    tuple: _CacheFuncHasher._hash_sequence,
+    dict: _CacheFuncHasher._hash_dict,
+}
+
+# Handlers for types that are matched by fully-qualified name, either because
+# their modules are expensive to import or because they're optional.
+_NAMED_TYPE_HANDLERS: Final[dict[str, Callable[[_CacheFuncHasher, Any], bytes]]] = {
+    "unittest.mock.Mock": _CacheFuncHasher._hash_mock,
+    "unittest.mock.MagicMock": _CacheFuncHasher._hash_mock,
+    "pandas.core.series.Series": _CacheFuncHasher._hash_pandas_series,
+    "pandas.core.frame.DataFrame": _CacheFuncHasher._hash_pandas_dataframe,
+    "numpy.ndarray": _CacheFuncHasher._hash_numpy_array,
+    "numpy.ufunc": _CacheFuncHasher._hash_name,
+    "PIL.Image.Image": _CacheFuncHasher._hash_pil_image,
+    "polars.series.series.Series": _CacheFuncHasher._hash_polars_series,
+    "polars.dataframe.frame.DataFrame": _CacheFuncHasher._hash_polars_dataframe,
+    "builtins.getset_descriptor": _CacheFuncHasher._hash_qualname,
+}
+
+# Shortcuts for `_key` for types whose key doesn't depend on the object's
+# contents.
+_TYPE_KEYS: Final[dict[type, Callable[[Any], Any]]] = {
+    **{simple_type: _value_key for simple_type in (*_SIMPLE_TYPES, bool, type(None))},
+    dict: _no_key,
+    datetime.datetime: _no_key,
+}
+
+_MOCK_TYPES: Final = frozenset({"unittest.mock.Mock", "unittest.mock.MagicMock"})
+
+# Immutable container types whose bytes are memoized by identity. Values of
+# simple types are already memoized by value.
+_MEMOIZE_BY_ID_TYPES: Final = frozenset({tuple, frozenset})
+
+_ARROW_TYPES: Final = frozenset(
+    {"pyarrow.lib.Table", "pyarrow.lib.RecordBatch", "pyarrow.lib.ChunkedArray"}
+)
+
+# Types whose bytes may be kept in _identity_hash_memo.
+_IDENTITY_MEMO_TYPES: Final = frozenset(
+    {
+        "numpy.ndarray",
+        "pandas.core.frame.DataFrame",
+        "pandas.core.series.Series",
+        *_ARROW_TYPES,
+    }
+)
+
 
 class NoResult:
     """Placeholder class for return values when None is meaningful."""
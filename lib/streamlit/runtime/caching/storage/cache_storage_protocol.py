@@ -126,8 +126,9 @@ class CacheStorage(Protocol):
     """
 
     @abstractmethod
-    def get(self, key: str) -> bytes:
-        """Returns the stored value for the key.
+    def get(self, key: str) -> bytes | memoryview:
+        """Returns the stored value for the key. Storages may return a read-only
+        view of the value (e.g. of a memory-mapped file) instead of a copy.
 
         Raises
         ------
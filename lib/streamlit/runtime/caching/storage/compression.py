@@ -0,0 +1,226 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transparent compression of cache storage entries.
+
+Entries at least `global.cacheCompressionThresholdBytes` large are compressed
+with zstd or lz4 if the `zstandard` or `lz4` package is installed, and with
+zlib otherwise. A compressed entry starts with `_COMPRESSED_ENTRY_MAGIC`,
+followed by one byte that identifies the codec. Entries without the magic
+prefix are stored as they are, so entries written before compression was
+enabled can still be read.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from typing import Callable, Final, NamedTuple
+
+from streamlit import config
+from streamlit.logger import get_logger
+from streamlit.runtime.caching.storage.cache_storage_protocol import (
+    CacheStorageError,
+    CacheStorageKeyNotFoundError,
+)
+from streamlit.runtime.stats import CounterStat
+
+_LOGGER: Final = get_logger(__name__)
+
+# Pickles start with the PROTO opcode (0x80) and framed cache entries with
+# "\x00stcache", so this prefix can't be mistaken for an uncompressed entry.
+_COMPRESSED_ENTRY_MAGIC: Final = b"\x00stzip"
+
+_ZLIB_LEVEL: Final = 1
+_ZSTD_LEVEL: Final = 3
+
+
+class _Codec(NamedTuple):
+    codec_id: int
+    name: str
+    compress: Callable[[bytes | memoryview], bytes]
+    decompress: Callable[[bytes | memoryview], bytes]
+
+
+def _zlib_codec() -> _Codec:
+    return _Codec(
+        1,
+        "zlib",
+        lambda data: zlib.compress(data, _ZLIB_LEVEL),
+        zlib.decompress,
+    )
+
+
+def _lz4_codec() -> _Codec | None:
+    try:
+        import lz4.frame  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return _Codec(2, "lz4", lz4.frame.compress, lz4.frame.decompress)
+
+
+def _zstd_codec() -> _Codec | None:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    # Compressor objects aren't thread-safe, so they're created per call.
+    return _Codec(
+        3,
+        "zstd",
+        lambda data: zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+_codecs: dict[int, _Codec | None] | None = None
+_codecs_lock = threading.Lock()
+
+
+def _get_codecs() -> dict[int, _Codec | None]:
+    """Return the codecs by ID, with None for codecs whose package isn't
+    installed. The packages are imported when this is first called.
+    """
+    global _codecs
+    with _codecs_lock:
+        if _codecs is None:
+            _codecs = {1: _zlib_codec(), 2: _lz4_codec(), 3: _zstd_codec()}
+        return _codecs
+
+
+def _get_best_codec() -> _Codec:
+    codecs = _get_codecs()
+    for codec_id in (3, 2, 1):
+        codec = codecs[codec_id]
+        if codec is not None:
+            return codec
+    raise AssertionError("zlib is always available")
+
+
+class CompressionStats:
+    """Counts the bytes compressed by a cache storage and the time spent on
+    compressing and decompressing them.
+
+    Threading: SAFE. May be called from any thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.num_compressed_entries = 0
+        self.num_input_bytes = 0
+        self.num_output_bytes = 0
+        self.compression_ns = 0
+        self.decompression_ns = 0
+
+    def record_compression(
+        self, num_input_bytes: int, num_output_bytes: int, duration_ns: int
+    ) -> None:
+        with self._lock:
+            self.num_compressed_entries += 1
+            self.num_input_bytes += num_input_bytes
+            self.num_output_bytes += num_output_bytes
+            self.compression_ns += duration_ns
+
+    def record_decompression(self, duration_ns: int) -> None:
+        with self._lock:
+            self.decompression_ns += duration_ns
+
+    def get_counter_stats(
+        self, category_name: str, cache_name: str
+    ) -> list[CounterStat]:
+        """Return the counters, or nothing if no entry was compressed yet.
+
+        The compression ratio is `cache_compression_input_bytes` divided by
+        `cache_compression_output_bytes`.
+        """
+        with self._lock:
+            if self.num_compressed_entries == 0:
+                return []
+            values = {
+                "cache_compressed_entries": self.num_compressed_entries,
+                "cache_compression_input_bytes": self.num_input_bytes,
+                "cache_compression_output_bytes": self.num_output_bytes,
+                "cache_compression_microseconds": self.compression_ns // 1000,
+                "cache_decompression_microseconds": self.decompression_ns // 1000,
+            }
+        return [
+            CounterStat(
+                family_name=family_name,
+                category_name=category_name,
+                cache_name=cache_name,
+                value=value,
+            )
+            for family_name, value in values.items()
+        ]
+
+
+def compress_entry(value: bytes, stats: CompressionStats) -> bytes:
+    """Compress a cache entry if it's at least as large as the configured
+    threshold, and if compressing it makes it smaller. Otherwise, return
+    the entry unchanged.
+    """
+    threshold = config.get_option("global.cacheCompressionThresholdBytes")
+    if threshold <= 0 or len(value) < threshold:
+        return value
+
+    codec = _get_best_codec()
+    start = time.perf_counter_ns()
+    compressed = codec.compress(value)
+    duration_ns = time.perf_counter_ns() - start
+
+    entry = b"".join((_COMPRESSED_ENTRY_MAGIC, bytes((codec.codec_id,)), compressed))
+    if len(entry) >= len(value):
+        # Incompressible, e.g. because the value is already compressed.
+        return value
+
+    stats.record_compression(len(value), len(entry), duration_ns)
+    return entry
+
+
+def decompress_entry(
+    entry: bytes | memoryview, stats: CompressionStats
+) -> bytes | memoryview:
+    """Return the original content of a cache entry written by
+    `compress_entry`.
+
+    Raises
+    ------
+    CacheStorageKeyNotFoundError
+        If the entry was compressed with a codec whose package isn't
+        installed, so that the value is computed again.
+    CacheStorageError
+        If the entry can't be decompressed.
+    """
+    header_length = len(_COMPRESSED_ENTRY_MAGIC) + 1
+    view = memoryview(entry)
+    if bytes(view[: len(_COMPRESSED_ENTRY_MAGIC)]) != _COMPRESSED_ENTRY_MAGIC:
+        return entry
+
+    codec_id = view[header_length - 1] if len(view) >= header_length else 0
+    codec = _get_codecs().get(codec_id)
+    if codec is None:
+        _LOGGER.warning(
+            "Ignoring a cache entry compressed with an unavailable codec (id=%s)",
+            codec_id,
+        )
+        raise CacheStorageKeyNotFoundError("Cache entry codec is not available")
+
+    start = time.perf_counter_ns()
+    try:
+        value = codec.decompress(view[header_length:])
+    except Exception as ex:
+        raise CacheStorageError("Unable to decompress cache entry") from ex
+    stats.record_decompression(time.perf_counter_ns() - start)
+    return value
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import math
 import threading
+import time
 
 from cachetools import TTLCache
 
@@ -25,7 +26,17 @@ from streamlit.runtime.caching.storage.cache_storage_protocol import (
     CacheStorageContext,
     CacheStorageKeyNotFoundError,
 )
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.caching.storage.compression import (
+    CompressionStats,
+    compress_entry,
+    decompress_entry,
+)
+from streamlit.runtime.memory_governor import (
+    REBUILD_COST_RECOMPUTE,
+    REBUILD_COST_RELOAD,
+    EvictionCandidate,
+)
+from streamlit.runtime.stats import CacheStat, CounterStat
 
 _LOGGER = get_logger(__name__)
 
@@ -55,6 +66,14 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     However, we do not hold this lock when calling into the underlying storage,
     so it is the responsibility of the that storage to ensure that it is safe to use
     it from multiple threads.
+
+    The MemoryGovernor may evict entries from the in-memory layer. They stay in
+    the underlying storage.
+
+    Entries at least `global.cacheCompressionThresholdBytes` large are
+    compressed once when they're set. Both the in-memory layer and the
+    underlying storage hold the compressed entry, and it's decompressed
+    whenever it's read.
     """
 
     def __init__(self, persist_storage: CacheStorage, context: CacheStorageContext):
@@ -62,13 +81,18 @@ class InMemoryCacheStorageWrapper(CacheStorage):
         self.function_display_name = context.function_display_name
         self._ttl_seconds = context.ttl_seconds
         self._max_entries = context.max_entries
-        self._mem_cache: TTLCache[str, bytes] = TTLCache(
+        self._mem_cache: TTLCache[str, bytes | memoryview] = TTLCache(
             maxsize=self.max_entries,
             ttl=self.ttl_seconds,
             timer=cache_utils.TTLCACHE_TIMER,
         )
         self._mem_cache_lock = threading.Lock()
+        # When each entry of the in-memory layer was last read or written, as
+        # a `time.monotonic()` timestamp.
+        self._last_access: dict[str, float] = {}
         self._persist_storage = persist_storage
+        self._persist = context.persist
+        self._compression_stats = CompressionStats()
 
     @property
     def ttl_seconds(self) -> float:
@@ -78,7 +102,7 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     def max_entries(self) -> float:
         return float(self._max_entries) if self._max_entries is not None else math.inf
 
-    def get(self, key: str) -> bytes:
+    def get(self, key: str) -> bytes | memoryview:
         """
         Returns the stored value for the key or raise CacheStorageKeyNotFoundError if
         the key is not found
@@ -88,12 +112,13 @@ class InMemoryCacheStorageWrapper(CacheStorage):
         except CacheStorageKeyNotFoundError:
             entry_bytes = self._persist_storage.get(key)
             self._write_to_mem_cache(key, entry_bytes)
-        return entry_bytes
+        return decompress_entry(entry_bytes, self._compression_stats)
 
     def set(self, key: str, value: bytes) -> None:
         """Sets the value for a given key"""
-        self._write_to_mem_cache(key, value)
-        self._persist_storage.set(key, value)
+        entry_bytes = compress_entry(value, self._compression_stats)
+        self._write_to_mem_cache(key, entry_bytes)
+        self._persist_storage.set(key, entry_bytes)
 
     def delete(self, key: str) -> None:
         """Delete a given key"""
@@ -104,6 +129,7 @@ class InMemoryCacheStorageWrapper(CacheStorage):
         """Delete all keys for the in memory cache, and also the persistent storage"""
         with self._mem_cache_lock:
             self._mem_cache.clear()
+            self._last_access.clear()
         self._persist_storage.clear()
 
     def get_stats(self) -> list[CacheStat]:
@@ -121,14 +147,52 @@ class InMemoryCacheStorageWrapper(CacheStorage):
                 )
         return stats
 
+    def get_counter_stats(self) -> list[CounterStat]:
+        """Returns the compression ratio and time of the entries of this
+        storage, if any were compressed
+        """
+        return self._compression_stats.get_counter_stats(
+            "st_cache_data", self.function_display_name
+        )
+
+    def get_memory_usage(self) -> int:
+        """Returns the number of bytes held by the in-memory layer"""
+        with self._mem_cache_lock:
+            return sum(len(item) for item in self._mem_cache.values())
+
+    def get_eviction_candidates(self) -> list[EvictionCandidate]:
+        """Returns the entries of the in-memory layer"""
+        rebuild_cost = (
+            REBUILD_COST_RELOAD if self._persist == "disk" else REBUILD_COST_RECOMPUTE
+        )
+        with self._mem_cache_lock:
+            self._prune_last_access()
+            return [
+                EvictionCandidate(
+                    key=key,
+                    byte_length=len(item),
+                    last_access=self._last_access.get(key, 0.0),
+                    rebuild_cost=rebuild_cost,
+                )
+                for key, item in self._mem_cache.items()
+            ]
+
+    def evict(self, key: str) -> int:
+        """Removes an entry from the in-memory layer only, and returns its size"""
+        with self._mem_cache_lock:
+            self._last_access.pop(key, None)
+            entry_bytes = self._mem_cache.pop(key, None)
+        return 0 if entry_bytes is None else len(entry_bytes)
+
     def close(self) -> None:
         """Closes the cache storage"""
         self._persist_storage.close()
 
-    def _read_from_mem_cache(self, key: str) -> bytes:
+    def _read_from_mem_cache(self, key: str) -> bytes | memoryview:
         with self._mem_cache_lock:
             if key in self._mem_cache:
-                entry = bytes(self._mem_cache[key])
+                entry = self._mem_cache[key]
+                self._last_access[key] = time.monotonic()
                 _LOGGER.debug("Memory cache HIT: %s", key)
                 return entry
 
@@ -136,10 +200,23 @@ class InMemoryCacheStorageWrapper(CacheStorage):
                 _LOGGER.debug("Memory cache MISS: %s", key)
                 raise CacheStorageKeyNotFoundError("Key not found in mem cache")
 
-    def _write_to_mem_cache(self, key: str, entry_bytes: bytes) -> None:
+    def _write_to_mem_cache(self, key: str, entry_bytes: bytes | memoryview) -> None:
         with self._mem_cache_lock:
             self._mem_cache[key] = entry_bytes
+            self._last_access[key] = time.monotonic()
+            # Entries that expire or are pushed out of the in-memory layer
+            # aren't removed from _last_access right away.
+            if len(self._last_access) > 2 * len(self._mem_cache):
+                self._prune_last_access()
+
+    def _prune_last_access(self) -> None:
+        """Forget about entries that are no longer in the in-memory layer.
+        Must be called with the lock held.
+        """
+        for key in self._last_access.keys() - self._mem_cache.keys():
+            del self._last_access[key]
 
     def _remove_from_mem_cache(self, key: str) -> None:
         with self._mem_cache_lock:
             self._mem_cache.pop(key, None)
+            self._last_access.pop(key, None)
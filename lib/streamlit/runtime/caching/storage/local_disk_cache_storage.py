@@ -33,6 +33,10 @@ if the context is not valid.
 entries from disk for a single `@st.cache_data` decorated function if `persist="disk"`
 is used in CacheStorageContext.
 
+- _DiskCacheIndex : records the size, last access time and expiry of every entry in
+the cache directory. It is shared by all LocalDiskCacheStorage instances, and used
+to expire entries and to keep the directory within `global.maxDiskCacheBytes`.
+
 
     ┌───────────────────────────────┐
     │  LocalDiskCacheStorageManager │
@@ -58,13 +62,24 @@ is used in CacheStorageContext.
 
 from __future__ import annotations
 
+import json
 import math
+import mmap
 import os
 import shutil
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Final
 
-from streamlit import errors
-from streamlit.file_util import get_streamlit_file_path, streamlit_read, streamlit_write
+from streamlit import config, errors
+from streamlit.file_util import (
+    atomic_write,
+    get_streamlit_file_path,
+    streamlit_read,
+    streamlit_write,
+)
 from streamlit.logger import get_logger
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
     CacheStorage,
@@ -88,6 +103,17 @@ _CACHE_DIR_NAME: Final = "cache"
 # (`@st.cache_data` was originally called `@st.memo`)
 _CACHED_FILE_EXTENSION: Final = "memo"
 
+# The file in the cache directory that the _DiskCacheIndex is stored in.
+_INDEX_FILE_NAME: Final = "memo-index.json"
+_INDEX_VERSION: Final = 1
+
+# Entries at least this large are memory-mapped instead of read into memory, so
+# that values deserialized from them can share the mapped pages.
+_MMAP_THRESHOLD_BYTES: Final = 1024 * 1024
+
+# Windows can't remove or replace a file while it's memory-mapped.
+_CAN_MMAP: Final = os.name != "nt"
+
 
 class LocalDiskCacheStorageManager(CacheStorageManager):
     def create(self, context: CacheStorageContext) -> CacheStorage:
@@ -101,18 +127,12 @@ class LocalDiskCacheStorageManager(CacheStorageManager):
         cache_path = get_cache_folder_path()
         if os.path.isdir(cache_path):
             shutil.rmtree(cache_path)
+        _get_disk_cache_index(cache_path).reset()
 
     def check_context(self, context: CacheStorageContext) -> None:
-        if (
-            context.persist == "disk"
-            and context.ttl_seconds is not None
-            and not math.isinf(context.ttl_seconds)
-        ):
-            _LOGGER.warning(
-                f"The cached function '{context.function_display_name}' has a TTL "
-                "that will be ignored. Persistent cached functions currently don't "
-                "support TTL."
-            )
+        # Every context is valid. In particular, persisted entries honour the
+        # TTL, so there's nothing to warn about for persist="disk".
+        return None
 
 
 class LocalDiskCacheStorage(CacheStorage):
@@ -134,66 +154,102 @@ class LocalDiskCacheStorage(CacheStorage):
     def max_entries(self) -> float:
         return float(self._max_entries) if self._max_entries is not None else math.inf
 
-    def get(self, key: str) -> bytes:
+    def get(self, key: str) -> bytes | memoryview:
         """
         Returns the stored value for the key if persisted,
         raise CacheStorageKeyNotFoundError if not found, or not configured
         with persist="disk"
+
+        Large values are returned as a read-only view of the memory-mapped file.
         """
-        if self.persist == "disk":
-            path = self._get_cache_file_path(key)
-            try:
-                with streamlit_read(path, binary=True) as input:
-                    value = input.read()
-                    _LOGGER.debug("Disk cache HIT: %s", key)
-                    return bytes(value)
-            except FileNotFoundError:
-                raise CacheStorageKeyNotFoundError("Key not found in disk cache")
-            except Exception as ex:
-                _LOGGER.exception("Error reading from cache")
-                raise CacheStorageError("Unable to read from cache") from ex
-        else:
+        if self.persist != "disk":
             raise CacheStorageKeyNotFoundError(
                 f"Local disk cache storage is disabled (persist={self.persist})"
             )
 
+        file_name = self._get_cache_file_name(key)
+        path = self._get_cache_file_path(key)
+        index = _get_disk_cache_index(get_cache_folder_path())
+
+        entry = index.touch(file_name)
+        if entry is not None and entry.is_expired(time.time()):
+            index.remove(file_name)
+            index.save()
+            _remove_cache_file(path)
+            raise CacheStorageKeyNotFoundError("Key expired in disk cache")
+
+        try:
+            if entry is not None and _CAN_MMAP and entry.size >= _MMAP_THRESHOLD_BYTES:
+                value: bytes | memoryview = _map_file(path)
+            else:
+                with streamlit_read(path, binary=True) as input:
+                    value = bytes(input.read())
+        except FileNotFoundError:
+            if entry is not None:
+                index.remove(file_name)
+            raise CacheStorageKeyNotFoundError("Key not found in disk cache")
+        except Exception as ex:
+            _LOGGER.exception("Error reading from cache")
+            raise CacheStorageError("Unable to read from cache") from ex
+
+        _LOGGER.debug("Disk cache HIT: %s", key)
+        if entry is None:
+            # The entry was written by an older version of Streamlit, or the
+            # index couldn't be saved.
+            index.add(file_name, len(value), expires=None)
+            index.save()
+        return value
+
     def set(self, key: str, value: bytes) -> None:
         """Sets the value for a given key"""
         if self.persist == "disk":
+            file_name = self._get_cache_file_name(key)
             path = self._get_cache_file_path(key)
             try:
-                with streamlit_write(path, binary=True) as output:
+                with streamlit_write(path, binary=True, atomic=True) as output:
                     output.write(value)
             except errors.Error as ex:
                 _LOGGER.debug("Unable to write to cache", exc_info=ex)
-                # Clean up file so we don't leave zero byte files.
-                try:
-                    os.remove(path)
-                except (FileNotFoundError, OSError):
-                    # If we can't remove the file, it's not a big deal.
-                    pass
                 raise CacheStorageError("Unable to write to cache") from ex
 
+            expires = (
+                time.time() + self.ttl_seconds
+                if not math.isinf(self.ttl_seconds)
+                else None
+            )
+            index = _get_disk_cache_index(get_cache_folder_path())
+            index.add(file_name, len(value), expires)
+
+            evicted_file_names = index.evict(
+                prefix=f"{self.function_key}-",
+                max_entries=self._max_entries,
+                max_bytes=config.get_option("global.maxDiskCacheBytes"),
+            )
+            for evicted_file_name in evicted_file_names:
+                _remove_cache_file(
+                    os.path.join(get_cache_folder_path(), evicted_file_name)
+                )
+            index.save()
+
     def delete(self, key: str) -> None:
         """Delete a cache file from disk. If the file does not exist on disk,
         return silently. If another exception occurs, log it. Does not throw.
         """
         if self.persist == "disk":
-            path = self._get_cache_file_path(key)
-            try:
-                os.remove(path)
-            except FileNotFoundError:
-                # The file is already removed.
-                pass
-            except Exception as ex:
-                _LOGGER.exception(
-                    "Unable to remove a file from the disk cache", exc_info=ex
-                )
+            file_name = self._get_cache_file_name(key)
+            index = _get_disk_cache_index(get_cache_folder_path())
+            index.remove(file_name)
+            index.save()
+            _remove_cache_file(self._get_cache_file_path(key))
 
     def clear(self) -> None:
         """Delete all keys for the current storage"""
         cache_dir = get_cache_folder_path()
 
+        index = _get_disk_cache_index(cache_dir)
+        index.remove_prefix(f"{self.function_key}-")
+        index.save()
+
         if os.path.isdir(cache_dir):
             # We try to remove all files in the cache directory that start with
             # the function key, whether `clear` called for `self.persist`
@@ -203,13 +259,20 @@ class LocalDiskCacheStorage(CacheStorage):
                     os.remove(os.path.join(cache_dir, file_name))
 
     def close(self) -> None:
-        """Dummy implementation of close, we don't need to actually "close" anything"""
+        """Save the access times of the entries read since the index was last
+        saved.
+        """
+        if self.persist == "disk":
+            _get_disk_cache_index(get_cache_folder_path()).save()
+
+    def _get_cache_file_name(self, value_key: str) -> str:
+        """Return the name of the disk cache file for the given value."""
+        return f"{self.function_key}-{value_key}.{_CACHED_FILE_EXTENSION}"
 
     def _get_cache_file_path(self, value_key: str) -> str:
         """Return the path of the disk cache file for the given value."""
-        cache_dir = get_cache_folder_path()
         return os.path.join(
-            cache_dir, f"{self.function_key}-{value_key}.{_CACHED_FILE_EXTENSION}"
+            get_cache_folder_path(), self._get_cache_file_name(value_key)
         )
 
     def _is_cache_file(self, fname: str) -> bool:
@@ -219,5 +282,257 @@ class LocalDiskCacheStorage(CacheStorage):
         )
 
 
+@dataclass
+class _IndexEntry:
+    size: int
+    # The time the entry was last read or written, in seconds since the epoch.
+    atime: float
+    # The time after which the entry is expired, in seconds since the epoch.
+    expires: float | None
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires is not None and self.expires <= now
+
+
+class _DiskCacheIndex:
+    """Records the size, last access time and expiry of the entries in a disk
+    cache directory, so that expired and least recently used entries can be
+    removed without scanning the directory.
+
+    The index is loaded when it's first used. Cache files that aren't in the
+    index (e.g. because they were written by an older version of Streamlit)
+    are added to it at that point, and entries whose file is gone are dropped.
+    The index is saved to `_INDEX_FILE_NAME` when entries are added or
+    removed. Access times of entries that were only read are saved along with
+    the next change, or when a storage is closed.
+
+    Notes
+    -----
+    Threading: SAFE. May be called from any thread.
+    """
+
+    def __init__(self, cache_dir: str):
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        # Ordered from least to most recently used. None until loaded.
+        self._entries: OrderedDict[str, _IndexEntry] | None = None
+        self._num_bytes = 0
+        # True if the index has changed since it was last saved.
+        self._dirty = False
+        # True if we loaded the index from, or saved it to, the index file.
+        self._has_file = False
+
+    @property
+    def _path(self) -> str:
+        return os.path.join(self._cache_dir, _INDEX_FILE_NAME)
+
+    def touch(self, file_name: str) -> _IndexEntry | None:
+        """Record that the given file was read, and return its entry, or None
+        if the file isn't in the index.
+        """
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(file_name)
+            if entry is not None:
+                entry.atime = time.time()
+                entries.move_to_end(file_name)
+                self._dirty = True
+            return entry
+
+    def add(self, file_name: str, size: int, expires: float | None) -> None:
+        """Add or replace the entry of the given file."""
+        with self._lock:
+            entries = self._load()
+            self._pop(file_name)
+            entries[file_name] = _IndexEntry(size, time.time(), expires)
+            self._num_bytes += size
+            self._dirty = True
+
+    def remove(self, file_name: str) -> None:
+        """Remove the entry of the given file, if there is one."""
+        with self._lock:
+            self._load()
+            self._pop(file_name)
+
+    def remove_prefix(self, prefix: str) -> None:
+        """Remove the entries of all files whose name starts with prefix."""
+        with self._lock:
+            entries = self._entries
+            if entries is None:
+                # Entries of files that are gone are dropped on load anyway.
+                return
+            for file_name in [name for name in entries if name.startswith(prefix)]:
+                self._pop(file_name)
+
+    def evict(self, prefix: str, max_entries: int | None, max_bytes: int) -> list[str]:
+        """Remove expired entries, the least recently used entries of the files
+        starting with prefix beyond max_entries, and the least recently used
+        entries beyond max_bytes. Return the names of the removed files, which
+        the caller is responsible for deleting.
+
+        Parameters
+        ----------
+        prefix
+            The common prefix of the files of the cached function that max_entries
+            applies to.
+        max_entries
+            The maximum number of entries with the prefix, or None for no limit.
+        max_bytes
+            The maximum total size of all entries, or 0 for no limit.
+        """
+        with self._lock:
+            entries = self._load()
+            now = time.time()
+            evicted = [name for name, entry in entries.items() if entry.is_expired(now)]
+            for file_name in evicted:
+                self._pop(file_name)
+
+            if max_entries is not None:
+                own_file_names = [name for name in entries if name.startswith(prefix)]
+                num_excess = len(own_file_names) - max_entries
+                for file_name in own_file_names[: max(num_excess, 0)]:
+                    self._pop(file_name)
+                    evicted.append(file_name)
+
+            if max_bytes > 0:
+                while self._num_bytes > max_bytes:
+                    file_name = next(iter(entries))
+                    self._pop(file_name)
+                    evicted.append(file_name)
+
+            return evicted
+
+    def save(self) -> None:
+        """Write the index to disk if it has changed.
+
+        Failing to write the index is logged but not raised: the index is
+        rebuilt from the cache directory's content when it's next loaded.
+        """
+        with self._lock:
+            if self._entries is None or not self._dirty:
+                return
+
+            try:
+                if self._entries:
+                    with atomic_write(self._path) as output:
+                        json.dump(
+                            {
+                                "version": _INDEX_VERSION,
+                                "entries": {
+                                    name: [entry.size, entry.atime, entry.expires]
+                                    for name, entry in self._entries.items()
+                                },
+                            },
+                            output,
+                        )
+                    self._has_file = True
+                elif self._has_file:
+                    # Don't leave an empty index behind in a cleared directory.
+                    os.remove(self._path)
+                    self._has_file = False
+                self._dirty = False
+            except FileNotFoundError:
+                # The cache directory doesn't exist (anymore), so there's
+                # nothing to index.
+                self._has_file = False
+            except OSError as ex:
+                _LOGGER.debug("Unable to write the disk cache index", exc_info=ex)
+
+    def reset(self) -> None:
+        """Forget all entries, e.g. after the cache directory was removed. The
+        index is loaded again when it's next used.
+        """
+        with self._lock:
+            self._entries = None
+            self._num_bytes = 0
+            self._dirty = False
+            self._has_file = False
+
+    def _pop(self, file_name: str) -> None:
+        assert self._entries is not None
+        entry = self._entries.pop(file_name, None)
+        if entry is not None:
+            self._num_bytes -= entry.size
+            self._dirty = True
+
+    def _load(self) -> OrderedDict[str, _IndexEntry]:
+        if self._entries is not None:
+            return self._entries
+
+        entries: dict[str, _IndexEntry] = {}
+        try:
+            with open(self._path) as input:
+                data = json.load(input)
+            self._has_file = True
+            if data["version"] == _INDEX_VERSION:
+                entries = {
+                    name: _IndexEntry(size, atime, expires)
+                    for name, (size, atime, expires) in data["entries"].items()
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, KeyError) as ex:
+            _LOGGER.warning("Ignoring invalid disk cache index", exc_info=ex)
+
+        try:
+            file_names = {
+                name
+                for name in os.listdir(self._cache_dir)
+                if name.endswith(f".{_CACHED_FILE_EXTENSION}")
+                and not name.startswith(".")
+            }
+        except OSError:
+            file_names = set()
+
+        # Drop the entries of files that were removed, e.g. by another process.
+        entries = {name: entries[name] for name in entries.keys() & file_names}
+        for name in file_names - entries.keys():
+            try:
+                stat = os.stat(os.path.join(self._cache_dir, name))
+            except OSError:
+                continue
+            entries[name] = _IndexEntry(stat.st_size, stat.st_mtime, None)
+
+        self._entries = OrderedDict(
+            sorted(entries.items(), key=lambda item: item[1].atime)
+        )
+        self._num_bytes = sum(entry.size for entry in self._entries.values())
+        self._dirty = False
+        return self._entries
+
+
+# The _DiskCacheIndex of each cache directory, by path.
+_disk_cache_indexes: dict[str, _DiskCacheIndex] = {}
+_disk_cache_indexes_lock = threading.Lock()
+
+
+def _get_disk_cache_index(cache_dir: str) -> _DiskCacheIndex:
+    with _disk_cache_indexes_lock:
+        index = _disk_cache_indexes.get(cache_dir)
+        if index is None:
+            index = _DiskCacheIndex(cache_dir)
+            _disk_cache_indexes[cache_dir] = index
+        return index
+
+
+def _map_file(path: str) -> memoryview:
+    """Return a read-only view of the memory-mapped content of a file."""
+    with open(path, "rb") as input:
+        return memoryview(mmap.mmap(input.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _remove_cache_file(path: str) -> None:
+    """Remove a cache file. If the file does not exist on disk, return silently.
+    If another exception occurs, log it. Does not throw.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        # The file is already removed.
+        pass
+    except Exception as ex:
+        _LOGGER.exception("Unable to remove a file from the disk cache", exc_info=ex)
+
+
 def get_cache_folder_path() -> str:
     return get_streamlit_file_path(_CACHE_DIR_NAME)
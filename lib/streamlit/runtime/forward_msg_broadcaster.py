@@ -0,0 +1,179 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+from streamlit import util
+from streamlit.runtime.forward_msg_cache import (
+    populate_hash_if_needed,
+    serialize_forward_msg_body,
+)
+from streamlit.runtime.runtime_util import (
+    NEVER_CACHED_MSG_TYPES,
+    is_cacheable_msg,
+    serialize_forward_msg,
+)
+from streamlit.runtime.stats import CounterStat, CounterStatsProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+# Messages are only compared against this many earlier messages with the same
+# type and delta path. Sessions rendering the same app produce identical
+# messages in the same order, so a match is almost always found right away;
+# the limit keeps the cost bounded when sessions render different data.
+# Messages are compared by their serialized payloads, which are produced once
+# per message anyway, rather than field by field.
+_MAX_CANDIDATES_PER_KEY: Final = 4
+
+
+class ForwardMsgBroadcaster(CounterStatsProvider):
+    """Serializes ForwardMsgs that are shared by several sessions only once.
+
+    When many sessions run the same app, they tend to enqueue identical
+    messages (e.g. the same dataframe delta) that get flushed in the same
+    tick of the Runtime's loop. Before those messages are sent, `prepare`
+    serializes the payload of each message, groups messages with identical
+    payloads and metadata together, and hashes and encodes each distinct
+    payload a single time. `get_serialized_msg` then hands out the same
+    bytes for every websocket the payload is written to.
+
+    This class is *not* thread safe. It's intended to only be accessed by
+    the server thread.
+
+    """
+
+    class _Payload:
+        """The serialized form shared by a group of identical messages."""
+
+        def __init__(self, msg: ForwardMsg, body: bytes):
+            # The first message of the group. All other messages of the group
+            # are equal to it.
+            self.msg = msg
+            self.body = body
+            self.serialized_msg: bytes | None = None
+
+        def __repr__(self) -> str:
+            return util.repr_(self)
+
+    def __init__(self):
+        # Maps id(msg) -> _Payload for every message of the current flush.
+        self._payloads: dict[int, ForwardMsgBroadcaster._Payload] = {}
+        # Keep the prepared messages alive so that their ids stay unique
+        # until `clear` is called.
+        self._msgs: list[ForwardMsg] = []
+
+        self._num_msgs = 0
+        self._num_payloads = 0
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def prepare(self, msgs: Iterable[ForwardMsg]) -> None:
+        """Group identical messages and serialize each distinct payload once.
+
+        Every message that qualifies for caching gets its hash and its
+        `metadata.cacheable` flag populated here.
+
+        Parameters
+        ----------
+        msgs : Iterable[ForwardMsg]
+            All messages flushed from all sessions in this tick.
+
+        """
+        self.clear()
+
+        candidates: dict[
+            tuple[str | None, tuple[int, ...]], list[ForwardMsgBroadcaster._Payload]
+        ] = {}
+        for msg in msgs:
+            msg_type = msg.WhichOneof("type")
+            if msg_type in NEVER_CACHED_MSG_TYPES:
+                continue
+
+            key = (msg_type, tuple(msg.metadata.delta_path))
+            key_candidates = candidates.setdefault(key, [])
+
+            body = serialize_forward_msg_body(msg)
+            payload = next(
+                (
+                    candidate
+                    for candidate in key_candidates[-_MAX_CANDIDATES_PER_KEY:]
+                    if candidate.body == body and candidate.msg.metadata == msg.metadata
+                ),
+                None,
+            )
+            if payload is None:
+                payload = ForwardMsgBroadcaster._Payload(msg, body)
+                key_candidates.append(payload)
+                self._num_payloads += 1
+
+            self._num_msgs += 1
+            self._msgs.append(msg)
+            self._payloads[id(msg)] = payload
+
+        for msg in self._msgs:
+            payload = self._payloads[id(msg)]
+            msg.metadata.cacheable = is_cacheable_msg(msg, payload.body)
+            if msg.metadata.cacheable:
+                # Identical messages share the hash of their payload, which
+                # is only computed for the first one.
+                msg.hash = populate_hash_if_needed(payload.msg, payload.body)
+
+    def get_serialized_body(self, msg: ForwardMsg) -> bytes | None:
+        """Return the serialized payload of a message prepared in this flush,
+        or None if the message wasn't prepared.
+        """
+        payload = self._payloads.get(id(msg), None)
+        return payload.body if payload is not None else None
+
+    def get_serialized_msg(self, msg: ForwardMsg) -> bytes | None:
+        """Return the wire bytes of a message prepared in this flush, or None
+        if the message wasn't prepared.
+
+        The bytes are produced once per distinct payload and shared by all
+        identical messages.
+        """
+        payload = self._payloads.get(id(msg), None)
+        if payload is None:
+            return None
+
+        if payload.serialized_msg is None:
+            payload.serialized_msg = serialize_forward_msg(msg, payload.body)
+        return payload.serialized_msg
+
+    def clear(self) -> None:
+        """Forget the messages of the current flush."""
+        self._payloads.clear()
+        self._msgs.clear()
+
+    def get_counter_stats(self) -> list[CounterStat]:
+        return [
+            CounterStat(
+                family_name="forward_msg_broadcast_messages",
+                category_name="ForwardMessageBroadcast",
+                cache_name="",
+                value=self._num_msgs,
+            ),
+            CounterStat(
+                family_name="forward_msg_broadcast_payloads",
+                category_name="ForwardMessageBroadcast",
+                cache_name="",
+                value=self._num_payloads,
+            ),
+        ]
@@ -14,13 +14,32 @@
 
 from __future__ import annotations
 
+import contextlib
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Final
 from weakref import WeakKeyDictionary
 
 from streamlit import config, util
+from streamlit.hash_util import calc_hash
 from streamlit.logger import get_logger
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.memory_governor import (
+    REBUILD_COST_RESEND,
+    EvictableCache,
+    EvictionCandidate,
+)
+from streamlit.runtime.stats import (
+    CacheStat,
+    CacheStatsProvider,
+    CounterStat,
+    CounterStatsProvider,
+    group_stats,
+)
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
@@ -30,7 +49,51 @@ if TYPE_CHECKING:
 _LOGGER: Final = get_logger(__name__)
 
 
-def populate_hash_if_needed(msg: ForwardMsg) -> str:
+def serialize_forward_msg_body(msg: ForwardMsg) -> bytes:
+    """Serialize a ForwardMsg's payload.
+
+    The payload is everything in the message except its hash and metadata.
+    Protobuf messages can be concatenated on the wire, so the full message can
+    be produced by appending the output of `serialize_forward_msg_envelope` to
+    the payload, which lets us encode the (potentially huge) payload only once.
+
+    Parameters
+    ----------
+    msg : ForwardMsg
+
+    Returns
+    -------
+    bytes
+        The serialized payload.
+
+    """
+    # Move the message's hash and metadata aside. Neither is part of the payload.
+    msg_hash = msg.hash
+    metadata = msg.metadata
+    msg.ClearField("hash")
+    msg.ClearField("metadata")
+
+    body = msg.SerializeToString()
+
+    # Restore hash and metadata.
+    if msg_hash:
+        msg.hash = msg_hash
+    msg.metadata.CopyFrom(metadata)
+
+    return body
+
+
+def serialize_forward_msg_envelope(msg: ForwardMsg) -> bytes:
+    """Serialize the hash and metadata of a ForwardMsg.
+
+    This is the complement of `serialize_forward_msg_body`.
+    """
+    envelope = ForwardMsg(hash=msg.hash)
+    envelope.metadata.CopyFrom(msg.metadata)
+    return envelope.SerializeToString()
+
+
+def populate_hash_if_needed(msg: ForwardMsg, body: bytes | None = None) -> str:
     """Computes and assigns the unique hash for a ForwardMsg.
 
     If the ForwardMsg already has a hash, this is a no-op.
@@ -38,6 +101,10 @@ def populate_hash_if_needed(msg: ForwardMsg) -> str:
     Parameters
     ----------
     msg : ForwardMsg
+    body : bytes | None
+        The message's serialized payload, as returned by
+        `serialize_forward_msg_body`. If this is None, the payload will be
+        serialized here.
 
     Returns
     -------
@@ -48,16 +115,11 @@ def populate_hash_if_needed(msg: ForwardMsg) -> str:
 
     """
     if msg.hash == "":
-        # Move the message's metadata aside. It's not part of the
-        # hash calculation.
-        metadata = msg.metadata
-        msg.ClearField("metadata")
+        if body is None:
+            body = serialize_forward_msg_body(msg)
 
-        # MD5 is good enough for what we need, which is uniqueness.
-        msg.hash = util.calc_md5(msg.SerializeToString())
-
-        # Restore metadata.
-        msg.metadata.CopyFrom(metadata)
+        # We only need uniqueness here, so use the fastest available hash.
+        msg.hash = calc_hash(body)
 
     return msg.hash
 
@@ -86,7 +148,7 @@ def create_reference_msg(msg: ForwardMsg) -> ForwardMsg:
     return ref_msg
 
 
-class ForwardMsgCache(CacheStatsProvider):
+class ForwardMsgCache(CacheStatsProvider, CounterStatsProvider, EvictableCache):
     """A cache of ForwardMsgs.
 
     Large ForwardMsgs (e.g. those containing big DataFrame payloads) are
@@ -94,6 +156,17 @@ class ForwardMsgCache(CacheStatsProvider):
     rather than the message itself, to a client. Clients can then
     request messages from this cache via another endpoint.
 
+    The total size of the stored messages is bounded by the
+    `global.maxMessageCacheBytes` config option. When the cache grows past
+    it, entries whose sessions have all been garbage collected are evicted in
+    least-recently-used order. Entries that are still referenced by a live
+    session are never evicted to fit the budget.
+
+    If the `global.messageCacheSpillDir` config option is set, the wire bytes
+    of messages of at least `global.messageCacheSpillThreshold` bytes are written
+    to that directory and read back when they're needed, rather than being
+    kept in memory.
+
     This cache is *not* thread safe. It's intended to only be accessed by
     the server thread.
 
@@ -107,11 +180,94 @@ class ForwardMsgCache(CacheStatsProvider):
 
         """
 
-        def __init__(self, msg: ForwardMsg | None):
-            self.msg = msg
+        def __init__(self, msg: ForwardMsg | None, body: bytes | None = None):
+            # We only keep the message's wire bytes around: they can be served
+            # to clients that request the message by hash as-is, and the message
+            # itself is only rarely needed.
+            self._serialized_msg: bytes | None = None
+            # The length of the message's payload, which is the first part of
+            # its wire bytes (see `serialize_forward_msg_body`).
+            self._body_length = 0
+            # The file the wire bytes were spilled to, if any.
+            self._spill_path: str | None = None
+            # The size of the cached message in bytes. It's computed once here
+            # so that the cache's byte accounting never re-measures entries.
+            self.byte_length = 0
+            if msg is not None:
+                if body is None:
+                    body = serialize_forward_msg_body(msg)
+                self._serialized_msg = body + serialize_forward_msg_envelope(msg)
+                self._body_length = len(body)
+                self.byte_length = len(self._serialized_msg)
             self._session_script_run_counts: MutableMapping[AppSession, int] = (
                 WeakKeyDictionary()
             )
+            # When the entry was last added or read, for the MemoryGovernor.
+            self.last_access = time.monotonic()
+
+        @property
+        def serialized_msg(self) -> memoryview | None:
+            """The cached message's wire bytes, without a copy."""
+            if self._spill_path is not None:
+                with open(self._spill_path, "rb") as f:
+                    # The mapping stays valid after the file is closed, and is
+                    # unmapped once the returned view is garbage collected.
+                    return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            if self._serialized_msg is None:
+                return None
+            return memoryview(self._serialized_msg)
+
+        @property
+        def body(self) -> bytes | None:
+            """The cached message's serialized payload."""
+            serialized_msg = self.serialized_msg
+            if serialized_msg is None:
+                return None
+            return bytes(serialized_msg[: self._body_length])
+
+        @property
+        def msg(self) -> ForwardMsg | None:
+            """The cached message, decoded from its serialized form."""
+            serialized_msg = self.serialized_msg
+            if serialized_msg is None:
+                return None
+            msg = ForwardMsg()
+            # Protobuf parses any buffer, but its stubs only admit bytes.
+            msg.ParseFromString(serialized_msg)  # type: ignore[arg-type]
+            return msg
+
+        @property
+        def is_spilled(self) -> bool:
+            return self._spill_path is not None
+
+        def spill(self, path: str) -> None:
+            """Move the cached message's wire bytes out of memory, into the file
+            at the given path.
+
+            Raises
+            ------
+            OSError
+                If the file can't be written. The bytes stay in memory.
+            """
+            if self._serialized_msg is None:
+                return
+
+            # Write to a temporary file first, so that a half-written file is
+            # never mistaken for a spilled message.
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(self._serialized_msg)
+            os.replace(tmp_path, path)
+
+            self._spill_path = path
+            self._serialized_msg = None
+
+        def release(self) -> None:
+            """Delete the file the wire bytes were spilled to, if any."""
+            if self._spill_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(self._spill_path)
+                self._spill_path = None
 
         def __repr__(self) -> str:
             return util.repr_(self)
@@ -161,13 +317,35 @@ class ForwardMsgCache(CacheStatsProvider):
             return len(self._session_script_run_counts) > 0
 
     def __init__(self):
-        self._entries: dict[str, ForwardMsgCache.Entry] = {}
+        # Entries are kept in least-recently-used order: the first entry is
+        # the next one to be evicted.
+        self._entries: OrderedDict[str, ForwardMsgCache.Entry] = OrderedDict()
+        # The total byte_length of all entries.
+        self._num_bytes = 0
+        # The total byte_length of the entries that weren't spilled to disk.
+        self._num_memory_bytes = 0
+
+        # The directory spilled payloads are written to. It's created inside
+        # the configured spill directory when the first payload is spilled.
+        self._spill_dir: str | None = None
+
+        self._num_hits = 0
+        self._num_evictions = 0
+        self._num_evicted_bytes = 0
+        self._num_spilled_bytes = 0
+        # How often the cache had to grow past its byte budget because all of
+        # its entries were still referenced by a session.
+        self._num_budget_overshoots = 0
 
     def __repr__(self) -> str:
         return util.repr_(self)
 
     def add_message(
-        self, msg: ForwardMsg, session: AppSession, script_run_count: int
+        self,
+        msg: ForwardMsg,
+        session: AppSession,
+        script_run_count: int,
+        body: bytes | None = None,
     ) -> None:
         """Add a ForwardMsg to the cache.
 
@@ -181,18 +359,32 @@ class ForwardMsgCache(CacheStatsProvider):
         session : AppSession
         script_run_count : int
             The number of times the session's script has run
+        body : bytes | None
+            The message's serialized payload, as returned by
+            `serialize_forward_msg_body`. Passing this in avoids serializing
+            the message again.
 
         """
-        populate_hash_if_needed(msg)
+        populate_hash_if_needed(msg, body)
         entry = self._entries.get(msg.hash, None)
         if entry is None:
             if config.get_option("global.storeCachedForwardMessagesInMemory"):
-                entry = ForwardMsgCache.Entry(msg)
+                entry = ForwardMsgCache.Entry(msg, body)
+                self._maybe_spill(msg.hash, entry)
             else:
                 entry = ForwardMsgCache.Entry(None)
             self._entries[msg.hash] = entry
+            self._num_bytes += entry.byte_length
+            if not entry.is_spilled:
+                self._num_memory_bytes += entry.byte_length
+        else:
+            self._entries.move_to_end(msg.hash)
+            entry.last_access = time.monotonic()
         entry.add_session_ref(session, script_run_count)
 
+        if entry.byte_length > 0:
+            self._evict_to_fit()
+
     def get_message(self, hash: str) -> ForwardMsg | None:
         """Return the message with the given ID if it exists in the cache.
 
@@ -207,7 +399,57 @@ class ForwardMsgCache(CacheStatsProvider):
 
         """
         entry = self._entries.get(hash, None)
-        return entry.msg if entry else None
+        msg = entry.msg if entry else None
+        if entry is not None and msg is not None:
+            self._entries.move_to_end(hash)
+            entry.last_access = time.monotonic()
+            self._num_hits += 1
+        return msg
+
+    def get_serialized_msg(self, hash: str) -> memoryview | None:
+        """Return the wire bytes of the message with the given ID if it exists
+        in the cache.
+
+        The bytes aren't copied, so large messages can be served straight from
+        the cache.
+
+        Parameters
+        ----------
+        hash : str
+            The id of the message to retrieve.
+
+        Returns
+        -------
+        memoryview | None
+
+        """
+        entry = self._entries.get(hash, None)
+        serialized_msg = entry.serialized_msg if entry else None
+        if entry is not None and serialized_msg is not None:
+            self._entries.move_to_end(hash)
+            entry.last_access = time.monotonic()
+            self._num_hits += 1
+        return serialized_msg
+
+    def get_serialized_body(self, hash: str) -> bytes | None:
+        """Return the serialized payload of the message with the given ID,
+        if it exists in the cache.
+
+        The payload can be passed to `serialize_forward_msg` to produce the
+        wire bytes of any message with this hash without encoding it again.
+
+        Parameters
+        ----------
+        hash : str
+            The id of the message to retrieve.
+
+        Returns
+        -------
+        bytes | None
+
+        """
+        entry = self._entries.get(hash, None)
+        return entry.body if entry else None
 
     def has_message_reference(
         self, msg: ForwardMsg, session: AppSession, script_run_count: int
@@ -221,7 +463,11 @@ class ForwardMsgCache(CacheStatsProvider):
 
         # Ensure we're not expired
         age = entry.get_session_ref_age(session, script_run_count)
-        return age <= int(config.get_option("global.maxCachedMessageAge"))
+        if age > int(config.get_option("global.maxCachedMessageAge")):
+            return False
+
+        self._num_hits += 1
+        return True
 
     def remove_refs_for_session(self, session: AppSession) -> None:
         """Remove refs for all entries for the given session.
@@ -242,7 +488,7 @@ class ForwardMsgCache(CacheStatsProvider):
             if not entry.has_refs():
                 # The entry has no more references. Remove it from
                 # the cache completely.
-                del self._entries[msg_hash]
+                self._remove_entry(msg_hash)
 
     def remove_expired_entries_for_session(
         self, session: AppSession, script_run_count: int
@@ -278,19 +524,167 @@ class ForwardMsgCache(CacheStatsProvider):
                 if not entry.has_refs():
                     # The entry has no more references. Remove it from
                     # the cache completely.
-                    del self._entries[msg_hash]
+                    self._remove_entry(msg_hash)
+
+    def _remove_entry(self, msg_hash: str) -> ForwardMsgCache.Entry:
+        entry = self._entries.pop(msg_hash)
+        if not entry.is_spilled:
+            self._num_memory_bytes -= entry.byte_length
+        entry.release()
+        self._num_bytes -= entry.byte_length
+        return entry
+
+    def _maybe_spill(self, msg_hash: str, entry: ForwardMsgCache.Entry) -> None:
+        """Spill a new entry's payload to disk if it's large enough."""
+        spill_root = config.get_option("global.messageCacheSpillDir")
+        if not spill_root:
+            return
+
+        threshold = int(config.get_option("global.messageCacheSpillThreshold"))
+        if entry.byte_length < max(threshold, 1):
+            return
+
+        try:
+            if self._spill_dir is None:
+                os.makedirs(spill_root, exist_ok=True)
+                self._spill_dir = tempfile.mkdtemp(
+                    prefix="forward-msg-cache-", dir=spill_root
+                )
+            entry.spill(os.path.join(self._spill_dir, msg_hash))
+        except OSError:
+            _LOGGER.warning(
+                "Failed to spill cached message to %s. Keeping it in memory.",
+                spill_root,
+                exc_info=True,
+            )
+            return
+
+        self._num_spilled_bytes += entry.byte_length
+
+    def _evict_to_fit(self) -> None:
+        """Evict entries until the cache fits into its byte budget.
+
+        Only entries whose sessions have all gone away are evicted, in
+        least-recently-used order. Evicting an entry that a live session still
+        references would make the session receive a reference the cache can no
+        longer resolve, so if the remaining entries are all referenced, the
+        cache is allowed to grow past its budget and the overshoot is counted.
+
+        """
+        max_bytes = int(config.get_option("global.maxMessageCacheBytes"))
+        if max_bytes <= 0 or self._num_bytes <= max_bytes:
+            return
+
+        # Collect the victims first, since we can't delete from the entries
+        # while iterating over them.
+        victims: list[str] = []
+        num_bytes = self._num_bytes
+        for msg_hash, entry in self._entries.items():
+            if num_bytes <= max_bytes:
+                break
+            if not entry.has_refs():
+                victims.append(msg_hash)
+                num_bytes -= entry.byte_length
+
+        for msg_hash in victims:
+            self._evict_entry(msg_hash)
+
+        if self._num_bytes > max_bytes:
+            self._num_budget_overshoots += 1
+            _LOGGER.debug(
+                "Cache exceeds its byte budget, but all entries are referenced "
+                "[bytes=%s, max_bytes=%s]",
+                self._num_bytes,
+                max_bytes,
+            )
+
+    def _evict_entry(self, msg_hash: str) -> ForwardMsgCache.Entry:
+        """Remove an entry to free up memory, and count the eviction."""
+        entry = self._remove_entry(msg_hash)
+        self._num_evictions += 1
+        self._num_evicted_bytes += entry.byte_length
+        _LOGGER.debug("Evicted entry [hash=%s, bytes=%s]", msg_hash, entry.byte_length)
+        return entry
 
     def clear(self) -> None:
-        """Remove all entries from the cache"""
+        """Remove all entries from the cache, and the directory their
+        messages were spilled to.
+        """
+        for entry in self._entries.values():
+            entry.release()
         self._entries.clear()
+        self._num_bytes = 0
+        self._num_memory_bytes = 0
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def get_memory_usage(self) -> int:
+        return self._num_memory_bytes
+
+    def get_eviction_candidates(self) -> list[EvictionCandidate]:
+        """Return the entries whose messages are held in memory.
+
+        Entries still referenced by a session cost more to evict, since their
+        messages must then be sent in full again.
+        """
+        return [
+            EvictionCandidate(
+                key=msg_hash,
+                byte_length=entry.byte_length,
+                last_access=entry.last_access,
+                rebuild_cost=REBUILD_COST_RESEND * (2 if entry.has_refs() else 1),
+            )
+            for msg_hash, entry in self._entries.items()
+            if entry.byte_length > 0 and not entry.is_spilled
+        ]
+
+    def evict(self, key: str) -> int:
+        if key not in self._entries:
+            return 0
+        return self._evict_entry(key).byte_length
 
     def get_stats(self) -> list[CacheStat]:
         stats: list[CacheStat] = [
             CacheStat(
                 category_name="ForwardMessageCache",
                 cache_name="",
-                byte_length=entry.msg.ByteSize() if entry.msg is not None else 0,
+                byte_length=entry.byte_length,
             )
             for _, entry in self._entries.items()
         ]
         return group_stats(stats)
+
+    def get_counter_stats(self) -> list[CounterStat]:
+        return [
+            CounterStat(
+                family_name="forward_msg_cache_hits",
+                category_name="ForwardMessageCache",
+                cache_name="",
+                value=self._num_hits,
+            ),
+            CounterStat(
+                family_name="forward_msg_cache_evictions",
+                category_name="ForwardMessageCache",
+                cache_name="",
+                value=self._num_evictions,
+            ),
+            CounterStat(
+                family_name="forward_msg_cache_evicted_bytes",
+                category_name="ForwardMessageCache",
+                cache_name="",
+                value=self._num_evicted_bytes,
+            ),
+            CounterStat(
+                family_name="forward_msg_cache_spilled_bytes",
+                category_name="ForwardMessageCache",
+                cache_name="",
+                value=self._num_spilled_bytes,
+            ),
+            CounterStat(
+                family_name="forward_msg_cache_budget_overshoots",
+                category_name="ForwardMessageCache",
+                cache_name="",
+                value=self._num_budget_overshoots,
+            ),
+        ]
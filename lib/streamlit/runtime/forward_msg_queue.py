@@ -14,13 +14,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable
+from typing import Any, Callable
 
+from streamlit.proto.Delta_pb2 import Delta
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 
-if TYPE_CHECKING:
-    from streamlit.proto.Delta_pb2 import Delta
-
 
 class ForwardMsgQueue:
     """Accumulates a session's outgoing ForwardMsgs.
@@ -166,11 +164,15 @@ def _is_composable_message(msg: ForwardMsg) -> bool:
         # Non-delta messages are never composable.
         return False
 
-    # We never compose add_rows messages in Python, because the add_rows
+    # We don't compose add_rows messages in Python, because the add_rows
     # operation can raise errors, and we don't have a good way of handling
-    # those errors in the message queue.
+    # those errors in the message queue. Streamed appends are the exception:
+    # the ones that are composed share their schema, so appending them to
+    # each other can't fail.
     delta_type = msg.delta.WhichOneof("type")
-    return delta_type != "add_rows" and delta_type != "arrow_add_rows"
+    if delta_type == "arrow_add_rows":
+        return msg.delta.arrow_add_rows.is_streamed
+    return delta_type != "add_rows"
 
 
 def _maybe_compose_deltas(old_delta: Delta, new_delta: Delta) -> Delta | None:
@@ -206,9 +208,38 @@ def _maybe_compose_deltas(old_delta: Delta, new_delta: Delta) -> Delta | None:
     if new_delta_type == "add_block":
         return new_delta
 
+    if new_delta_type == "arrow_add_rows" and old_delta_type == "arrow_add_rows":
+        return _maybe_compose_streamed_rows(old_delta, new_delta)
+
     return None
 
 
+def _maybe_compose_streamed_rows(old_delta: Delta, new_delta: Delta) -> Delta | None:
+    """Appends the rows of new_delta to those of old_delta, if both are
+    streamed appends to the same dataset, and new_delta continues the Arrow
+    stream of old_delta without sending its schema again.
+    """
+    old_rows = old_delta.arrow_add_rows
+    new_rows = new_delta.arrow_add_rows
+    if (
+        not old_rows.is_streamed
+        or not new_rows.schema_omitted
+        or old_rows.name != new_rows.name
+        or old_rows.has_name != new_rows.has_name
+    ):
+        return None
+
+    from streamlit import dataframe_util
+
+    composed_delta = Delta()
+    composed_delta.CopyFrom(old_delta)
+    composed_delta.fragment_id = new_delta.fragment_id
+    composed_delta.arrow_add_rows.data.data = dataframe_util.concat_arrow_streams(
+        old_rows.data.data, new_rows.data.data
+    )
+    return composed_delta
+
+
 def _update_script_finished_message(
     msg: ForwardMsg, is_fragment_run: bool
 ) -> ForwardMsg:
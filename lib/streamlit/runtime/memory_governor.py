@@ -0,0 +1,231 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A process-wide memory budget shared by the runtime's caches."""
+
+from __future__ import annotations
+
+import time
+from abc import abstractmethod
+from typing import Final, NamedTuple, Protocol, runtime_checkable
+
+from streamlit import config, util
+from streamlit.logger import get_logger
+from streamlit.runtime.stats import (
+    CacheStatsProvider,
+    CounterStat,
+    CounterStatsProvider,
+)
+
+_LOGGER: Final = get_logger(__name__)
+
+# How often the runtime enforces the budget.
+BUDGET_CHECK_INTERVAL_SECONDS: Final = 1.0
+
+# Relative costs of recreating an evicted entry, used as
+# `EvictionCandidate.rebuild_cost`.
+REBUILD_COST_RESEND: Final = 1.0  # The entry is sent to clients again.
+REBUILD_COST_RELOAD: Final = 1.0  # The entry is read back from disk.
+REBUILD_COST_RECOMPUTE: Final = 8.0  # The cached function is rerun.
+
+
+class EvictionCandidate(NamedTuple):
+    """An entry that a cache offers to the MemoryGovernor for eviction.
+
+    Properties
+    ----------
+    key : str
+        Identifies the entry within its cache. It's passed back to
+        `EvictableCache.evict`.
+    byte_length : int
+        The memory that evicting the entry frees, in bytes.
+    last_access : float
+        When the entry was last read or written, as a `time.monotonic()`
+        timestamp.
+    rebuild_cost : float
+        How expensive the entry is to recreate once it's evicted, relative to
+        other entries. One of the REBUILD_COST_* constants.
+    """
+
+    key: str
+    byte_length: int
+    last_access: float
+    rebuild_cost: float
+
+
+@runtime_checkable
+class MemoryUsageProvider(Protocol):
+    @abstractmethod
+    def get_memory_usage(self) -> int:
+        """Return the number of bytes held in memory.
+
+        This is called often, so it should be cheap to compute.
+        """
+        raise NotImplementedError
+
+
+@runtime_checkable
+class EvictableCache(MemoryUsageProvider, Protocol):
+    @abstractmethod
+    def get_eviction_candidates(self) -> list[EvictionCandidate]:
+        """Return the entries that can be evicted to free memory."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def evict(self, key: str) -> int:
+        """Evict the entry with the given candidate key, and return the
+        number of bytes freed. Return 0 if the entry no longer exists.
+        """
+        raise NotImplementedError
+
+
+def _get_eviction_score(candidate: EvictionCandidate, now: float) -> float:
+    """Entries with a higher score are evicted first: large entries that
+    haven't been used for a while and are cheap to recreate.
+    """
+    idle_seconds = max(now - candidate.last_access, 0.0) + 1.0
+    return idle_seconds * candidate.byte_length / candidate.rebuild_cost
+
+
+class MemoryGovernor(CounterStatsProvider):
+    """Keeps the total memory used by the runtime's caches within the
+    `global.maxCacheMemoryBytes` budget.
+
+    Each cache still enforces its own limits. The governor adds up the memory
+    used by all registered providers and, when the sum is over the budget,
+    evicts entries across all caches that implement `EvictableCache`. Caches
+    whose entries can't be recreated, such as uploaded files, or that other
+    code may still hold on to, such as `st.cache_resource` values, count
+    towards the budget but are never evicted.
+
+    This class is *not* thread safe. It's intended to only be used on the
+    runtime's eventloop thread, which is the only thread that may access the
+    ForwardMsgCache.
+    """
+
+    def __init__(self):
+        self._providers: list[tuple[str, CacheStatsProvider]] = []
+        self._warned_over_budget = False
+        # Category name -> number of entries / bytes evicted.
+        self._num_evictions: dict[str, int] = {}
+        self._num_evicted_bytes: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def register_provider(
+        self, category_name: str, provider: CacheStatsProvider
+    ) -> None:
+        """Count the memory of a cache towards the budget.
+
+        Providers that implement `MemoryUsageProvider` report their usage
+        directly. For the others, the byte lengths of their stats are added
+        up, so only providers whose stats are cheap to compute should be
+        registered.
+
+        This function is not thread-safe. Call it immediately after creation.
+        """
+        self._providers.append((category_name, provider))
+        self._num_evictions.setdefault(category_name, 0)
+        self._num_evicted_bytes.setdefault(category_name, 0)
+
+    def get_memory_usage(self) -> int:
+        """Return the total number of bytes used by all registered caches."""
+        return sum(
+            _get_provider_memory_usage(provider) for _, provider in self._providers
+        )
+
+    def enforce_budget(self) -> int:
+        """Evict entries until the caches fit into the budget.
+
+        Returns
+        -------
+        int
+            The number of bytes freed.
+        """
+        max_bytes = int(config.get_option("global.maxCacheMemoryBytes"))
+        if max_bytes <= 0:
+            return 0
+
+        usage = self.get_memory_usage()
+        if usage <= max_bytes:
+            self._warned_over_budget = False
+            return 0
+
+        now = time.monotonic()
+        candidates = [
+            (category_name, provider, candidate)
+            for category_name, provider in self._providers
+            if isinstance(provider, EvictableCache)
+            for candidate in provider.get_eviction_candidates()
+        ]
+        candidates.sort(
+            key=lambda item: _get_eviction_score(item[2], now), reverse=True
+        )
+
+        num_freed_bytes = 0
+        for category_name, provider, candidate in candidates:
+            if usage - num_freed_bytes <= max_bytes:
+                break
+            num_bytes = provider.evict(candidate.key)
+            if num_bytes <= 0:
+                continue
+            num_freed_bytes += num_bytes
+            self._num_evictions[category_name] += 1
+            self._num_evicted_bytes[category_name] += num_bytes
+            _LOGGER.debug(
+                "Evicted cache entry [cache=%s, key=%s, bytes=%s]",
+                category_name,
+                candidate.key,
+                num_bytes,
+            )
+
+        if usage - num_freed_bytes > max_bytes and not self._warned_over_budget:
+            # Warn only once, since the budget is checked every second.
+            self._warned_over_budget = True
+            _LOGGER.warning(
+                "The caches use %s bytes, which is more than the %s bytes "
+                "allowed by global.maxCacheMemoryBytes, and no more entries "
+                "can be evicted.",
+                usage - num_freed_bytes,
+                max_bytes,
+            )
+        return num_freed_bytes
+
+    def get_counter_stats(self) -> list[CounterStat]:
+        stats: list[CounterStat] = [
+            CounterStat(
+                family_name="memory_governor_evictions",
+                category_name=category_name,
+                cache_name="",
+                value=value,
+            )
+            for category_name, value in self._num_evictions.items()
+        ]
+        stats.extend(
+            CounterStat(
+                family_name="memory_governor_evicted_bytes",
+                category_name=category_name,
+                cache_name="",
+                value=value,
+            )
+            for category_name, value in self._num_evicted_bytes.items()
+        )
+        return stats
+
+
+def _get_provider_memory_usage(provider: CacheStatsProvider) -> int:
+    if isinstance(provider, MemoryUsageProvider):
+        return provider.get_memory_usage()
+    return sum(stat.byte_length for stat in provider.get_stats())
@@ -17,11 +17,11 @@
 from __future__ import annotations
 
 import contextlib
-import hashlib
 import mimetypes
 import os.path
 from typing import Final, NamedTuple
 
+from streamlit.hash_util import new_hasher
 from streamlit.logger import get_logger
 from streamlit.runtime.media_file_storage import (
     MediaFileKind,
@@ -54,7 +54,7 @@ def _calculate_file_id(data: bytes, mimetype: str, filename: str | None = None)
     filename
         Any string. Will be converted to bytes and used to compute a hash.
     """
-    filehash = hashlib.new("sha224", usedforsecurity=False)
+    filehash = new_hasher()
     filehash.update(data)
     filehash.update(bytes(mimetype.encode()))
 
@@ -14,22 +14,55 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
-from cachetools import TTLCache
+from cachetools import Cache, TTLCache
 
-from streamlit.runtime.session_manager import SessionInfo, SessionStorage
+from streamlit.runtime.session_manager import ExpiringSessionStorage, SessionInfo
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
 
 
-class MemorySessionStorage(SessionStorage):
+class _NotifyingTTLCache(TTLCache):  # type: ignore[type-arg]
+    """A TTLCache that calls a function with each item it drops on its own, either
+    because the item expired or because the cache is full.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.on_drop: Callable[[Any], None] | None = None
+
+    def expire(self, time: Any = None) -> Any:
+        if self.on_drop is None:
+            return super().expire(time)
+
+        # cachetools < 5.3 doesn't return the expired items, so we find them by
+        # comparing the stored items before and after expiring. The base Cache
+        # methods see expired items, which TTLCache's own methods hide.
+        items = {key: Cache.__getitem__(self, key) for key in Cache.__iter__(self)}
+        expired = super().expire(time)
+        for key, value in items.items():
+            if not Cache.__contains__(self, key):
+                self.on_drop(value)
+        return expired
+
+    def popitem(self) -> Any:
+        key, value = super().popitem()
+        if self.on_drop is not None:
+            self.on_drop(value)
+        return key, value
+
+
+class MemorySessionStorage(ExpiringSessionStorage):
     """A SessionStorage that stores sessions in memory.
 
     At most maxsize sessions are stored with a TTL of ttl seconds. This class is really
     just a thin wrapper around cachetools.TTLCache that complies with the SessionStorage
     protocol.
+
+    Expired sessions are only removed when the storage is next accessed, so the
+    expiration callback is called lazily.
     """
 
     # NOTE: The defaults for maxsize and ttl are chosen arbitrarily for now. These
@@ -60,9 +93,13 @@ class MemorySessionStorage(SessionStorage):
             inaccessible and will be removed eventually.
         """
 
-        self._cache: MutableMapping[str, SessionInfo] = TTLCache(
-            maxsize=maxsize, ttl=ttl_seconds
-        )
+        self._ttl_cache = _NotifyingTTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._cache: MutableMapping[str, SessionInfo] = self._ttl_cache
+
+    def set_expiration_callback(
+        self, callback: Callable[[SessionInfo], None] | None
+    ) -> None:
+        self._ttl_cache.on_drop = callback
 
     def get(self, session_id: str) -> SessionInfo | None:
         return self._cache.get(session_id, None)
@@ -74,4 +111,7 @@ class MemorySessionStorage(SessionStorage):
         del self._cache[session_id]
 
     def list(self) -> list[SessionInfo]:
+        # Drop expired sessions now rather than on the next write, so that their
+        # expiration is reported in a timely manner.
+        self._ttl_cache.expire()
         return list(self._cache.values())
@@ -0,0 +1,279 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cheap, incremental memory accounting for the objects held by the runtime.
+
+Walking an object graph with `asizeof` is expensive, and doing it whenever the
+metrics endpoint is scraped stalls the server. Instead, `ObjectSizeCache`
+remembers the size of each entry of a container. Objects of well-known types
+are measured directly, which is cheap. All other objects get a provisional
+size and are measured with `asizeof` on a background thread, which also
+re-measures them every now and then in case they were mutated in place.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Final
+
+from streamlit import type_util
+from streamlit.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_LOGGER: Final = get_logger(__name__)
+
+# How long the measurement of an object of an unknown type is trusted before
+# the sampler measures it again.
+_RESAMPLE_INTERVAL_SECONDS: Final = 60.0
+
+_SCALAR_TYPES: Final = (type(None), bool, int, float, complex, str, bytes, bytearray)
+_PANDAS_TYPES: Final = ("pandas.core.frame.DataFrame", "pandas.core.series.Series")
+
+
+def get_known_size(obj: object) -> int | None:
+    """Return the number of bytes used by obj if its type is well-known and its
+    size can be computed without walking the object, or None otherwise.
+    """
+    if isinstance(obj, _SCALAR_TYPES):
+        return sys.getsizeof(obj)
+
+    if isinstance(obj, memoryview):
+        return sys.getsizeof(obj) + obj.nbytes
+
+    fqn = type_util.get_fqn_type(obj)
+
+    if fqn == "numpy.ndarray":
+        if obj.dtype.kind == "O":  # type: ignore[attr-defined]
+            return None
+        return sys.getsizeof(obj) if obj.base is None else obj.nbytes  # type: ignore[attr-defined]
+
+    if fqn in _PANDAS_TYPES or fqn.startswith("pandas.core.indexes."):
+        # Without `deep=True`, object columns are only counted as pointers,
+        # and measuring them deeply means visiting every value.
+        if _has_object_dtype(obj):
+            return None
+        if fqn == "pandas.core.frame.DataFrame":
+            return int(obj.memory_usage(index=True, deep=False).sum())  # type: ignore[attr-defined]
+        if fqn == "pandas.core.series.Series":
+            return int(obj.memory_usage(index=True, deep=False))  # type: ignore[attr-defined]
+        return int(obj.memory_usage(deep=False))  # type: ignore[attr-defined]
+
+    if fqn in (
+        "pyarrow.lib.Table",
+        "pyarrow.lib.RecordBatch",
+        "pyarrow.lib.ChunkedArray",
+    ) or (fqn.startswith("pyarrow.lib.") and fqn.endswith("Array")):
+        return int(obj.nbytes)  # type: ignore[attr-defined]
+
+    return None
+
+
+def _has_object_dtype(obj: Any) -> bool:
+    """True if a pandas object has an object-backed index, column or values."""
+    if hasattr(obj, "columns"):
+        dtypes = list(obj.dtypes)
+    else:
+        dtypes = [obj.dtype]
+    if hasattr(obj, "index"):
+        dtypes.append(obj.index.dtype)
+    return any(dtype.kind == "O" for dtype in dtypes)
+
+
+def _measure_deep(obj: object) -> int:
+    # Lazy-load vendored package to prevent import of numpy
+    from streamlit.vendor.pympler.asizeof import asizeof
+
+    return int(asizeof(obj))
+
+
+class _Measurement:
+    """The size of one entry of an ObjectSizeCache."""
+
+    __slots__ = ("byte_length", "measured_at", "obj")
+
+    def __init__(self, obj: object, byte_length: int, measured_at: float | None):
+        self.obj = obj
+        self.byte_length = byte_length
+        # When the object was last measured with asizeof, or None if it wasn't
+        # yet. Only set for objects of unknown types.
+        self.measured_at = measured_at
+
+
+class ObjectSizeCache:
+    """Remembers the memory footprint of the entries of a keyed container.
+
+    An entry is measured when it's first seen, and again whenever the object
+    stored under its key changes. Objects that `get_known_size` can't measure
+    are sized with `sys.getsizeof` until the background sampler has measured
+    them with `asizeof`.
+
+    This class is thread-safe.
+
+    Parameters
+    ----------
+    get_size
+        Returns the size of objects of well-known types, or None.
+    sampler
+        The sampler that measures the other objects. Defaults to the
+        process-wide one.
+    """
+
+    def __init__(
+        self,
+        get_size: Callable[[Any], int | None] = get_known_size,
+        sampler: _SizeSampler | None = None,
+    ):
+        self._get_size = get_size
+        self._sampler = sampler if sampler is not None else _sampler
+        self._lock = threading.Lock()
+        self._measurements: dict[str, _Measurement] = {}
+        # Measurements that the sampler needs to look at.
+        self._unknown: dict[str, _Measurement] = {}
+        self._sampler.register(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> ObjectSizeCache:
+        # A copy of a container starts out with no measurements, rather than
+        # sharing the measured objects with the original.
+        return ObjectSizeCache(self._get_size, self._sampler)
+
+    def get_size(self, key: str, obj: object) -> int:
+        """Return the size of obj, which is stored under key.
+
+        This is O(1) for objects that were already measured.
+        """
+        with self._lock:
+            measurement = self._measurements.get(key)
+            if measurement is not None and measurement.obj is obj:
+                return measurement.byte_length
+
+            byte_length = self._get_size(obj)
+            if byte_length is not None:
+                self._measurements[key] = _Measurement(obj, byte_length, None)
+                self._unknown.pop(key, None)
+                return byte_length
+
+            measurement = _Measurement(obj, sys.getsizeof(obj), None)
+            self._measurements[key] = measurement
+            self._unknown[key] = measurement
+
+        self._sampler.wake_up()
+        return measurement.byte_length
+
+    def get_total_size(self, entries: Iterable[tuple[str, object]]) -> int:
+        """Return the total size of the given entries, and forget about all
+        entries that aren't part of them.
+        """
+        keys: set[str] = set()
+        total = 0
+        for key, obj in entries:
+            keys.add(key)
+            total += self.get_size(key, obj)
+        self.retain(keys)
+        return total
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """Forget about all entries whose keys aren't in the given keys."""
+        with self._lock:
+            for key in self._measurements.keys() - set(keys):
+                del self._measurements[key]
+                self._unknown.pop(key, None)
+
+    def discard(self, key: str) -> int | None:
+        """Forget about the entry with the given key, and return its last
+        known size.
+        """
+        with self._lock:
+            self._unknown.pop(key, None)
+            measurement = self._measurements.pop(key, None)
+        return None if measurement is None else measurement.byte_length
+
+    def clear(self) -> None:
+        with self._lock:
+            self._measurements.clear()
+            self._unknown.clear()
+
+    def sample(self, now: float) -> None:
+        """Measure the objects of unknown types that were never measured, or
+        whose measurement is older than the resample interval.
+        """
+        with self._lock:
+            due = [
+                measurement
+                for measurement in self._unknown.values()
+                if measurement.measured_at is None
+                or now - measurement.measured_at >= _RESAMPLE_INTERVAL_SECONDS
+            ]
+
+        for measurement in due:
+            try:
+                measurement.byte_length = _measure_deep(measurement.obj)
+            except Exception:
+                # Some objects can't be walked. Keep the shallow size for
+                # them rather than failing the whole pass.
+                _LOGGER.debug("Failed to measure object size", exc_info=True)
+            measurement.measured_at = now
+
+
+class _SizeSampler:
+    """Measures the objects of unknown types of all ObjectSizeCaches on a
+    daemon thread, so that their sizes can be reported without walking them.
+    """
+
+    def __init__(self):
+        self._caches: weakref.WeakSet[ObjectSizeCache] = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._wake_up = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register(self, cache: ObjectSizeCache) -> None:
+        with self._lock:
+            self._caches.add(cache)
+
+    def wake_up(self) -> None:
+        """Measure newly added objects as soon as possible."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ObjectSizeSampler", daemon=True
+                )
+                self._thread.start()
+        self._wake_up.set()
+
+    def sample(self) -> None:
+        with self._lock:
+            caches = list(self._caches)
+        now = time.monotonic()
+        for cache in caches:
+            cache.sample(now)
+
+    def _run(self) -> None:
+        while True:
+            self._wake_up.wait(_RESAMPLE_INTERVAL_SECONDS)
+            self._wake_up.clear()
+            self.sample()
+
+
+_sampler: Final = _SizeSampler()
+
+
+def measure_unknown_sizes() -> None:
+    """Measure all objects of unknown types that are waiting for the sampler
+    right away, on the calling thread.
+    """
+    _sampler.sample()
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import time
 import traceback
 from dataclasses import dataclass, field
@@ -33,20 +34,30 @@ from streamlit.runtime.caching import (
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
+from streamlit.runtime.forward_msg_broadcaster import ForwardMsgBroadcaster
 from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
     populate_hash_if_needed,
+    serialize_forward_msg_body,
 )
 from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_governor import (
+    BUDGET_CHECK_INTERVAL_SECONDS,
+    MemoryGovernor,
+)
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
-from streamlit.runtime.runtime_util import is_cacheable_msg
+from streamlit.runtime.runtime_util import is_cacheable_msg, serialize_forward_msg
 from streamlit.runtime.script_data import ScriptData
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
 from streamlit.runtime.session_manager import (
     ActiveSessionInfo,
+    BatchingSessionClient,
+    BufferedSessionClient,
+    ExpiringSessionStorage,
     SessionClient,
     SessionClientDisconnectedError,
+    SessionInfo,
     SessionManager,
     SessionStorage,
 )
@@ -54,7 +65,7 @@ from streamlit.runtime.state import (
     SCRIPT_RUN_WITHOUT_ERRORS_KEY,
     SessionStateStatProvider,
 )
-from streamlit.runtime.stats import StatsManager
+from streamlit.runtime.stats import CacheStatsProvider, StatsManager
 from streamlit.runtime.websocket_session_manager import WebsocketSessionManager
 
 if TYPE_CHECKING:
@@ -112,6 +123,26 @@ class RuntimeConfig:
     # True if the command used to start Streamlit was `streamlit hello`.
     is_hello: bool = False
 
+    # The maximum number of ForwardMsgs written to a single session per tick of
+    # the Runtime's loop. Sessions with more pending messages are flushed again
+    # on a later tick, so that one busy session can't starve the others.
+    max_flush_msgs_per_session: int = 100
+
+    # The maximum number of bytes written to a single session per tick of the
+    # Runtime's loop. At least one message is always written.
+    max_flush_bytes_per_session: int = 16 * 1024 * 1024
+
+    # The maximum time (in seconds) the Runtime's loop spends writing messages
+    # before it yields to other tasks on the eventloop (e.g. reading incoming
+    # websocket messages).
+    flush_latency_target: float = 0.005
+
+    # The maximum number of bytes a session's client may have buffered before
+    # the Runtime stops writing to it. Until the buffer has drained, the
+    # session's messages stay in its queue, where superseded deltas are still
+    # coalesced. Only applies to clients that report their buffer size.
+    max_buffered_bytes_per_session: int = 64 * 1024 * 1024
+
     # TODO(vdonato): Eventually add a new fragment_storage_class field enabling the code
     # creating a new Streamlit Runtime to configure the FragmentStorage instances
     # created by each new AppSession. We choose not to do this for now to avoid adding
@@ -141,7 +172,9 @@ class AsyncObjects(NamedTuple):
     # Set when a client connects; cleared when we have no connected clients.
     has_connection: asyncio.Event
 
-    # Set after a ForwardMsg is enqueued; cleared when we flush ForwardMsgs.
+    # Set when the Runtime's loop has work to do: after a ForwardMsg is enqueued,
+    # a session connects, or the Runtime is asked to stop. Cleared when the
+    # loop wakes up.
     need_send_data: asyncio.Event
 
     # Completed when the Runtime has started.
@@ -198,12 +231,29 @@ class Runtime:
 
         self._main_script_path = config.script_path
         self._is_hello = config.is_hello
+        self._max_flush_msgs_per_session = config.max_flush_msgs_per_session
+        self._max_flush_bytes_per_session = config.max_flush_bytes_per_session
+        self._flush_latency_target = config.flush_latency_target
+        self._max_buffered_bytes_per_session = config.max_buffered_bytes_per_session
+
+        # IDs of the sessions that enqueued messages since their last flush, in
+        # the order they did so. (We use a dict as an ordered set.) If this is
+        # empty when the loop wakes up, all sessions get flushed.
+        self._sessions_to_flush: dict[str, None] = {}
+        # Messages flushed from a session's queue that didn't fit into the
+        # session's budget for the tick they were flushed in.
+        self._unsent_msgs: dict[str, list[ForwardMsg]] = {}
+        # When _flush_sessions last yielded to the eventloop. This is kept
+        # across calls, because the ticks that write the messages that were
+        # left over run right after each other.
+        self._last_flush_yield = time.monotonic()
 
         self._state = RuntimeState.INITIAL
 
         # Initialize managers
         self._component_registry = config.component_registry
         self._message_cache = ForwardMsgCache()
+        self._broadcaster = ForwardMsgBroadcaster()
         self._uploaded_file_mgr = config.uploaded_file_manager
         self._media_file_mgr = MediaFileManager(storage=config.media_file_storage)
         self._cache_storage_manager = config.cache_storage_manager
@@ -216,12 +266,46 @@ class Runtime:
             message_enqueued_callback=self._enqueued_some_message,
         )
 
+        # If the SessionStorage tells us when it drops a disconnected session, we
+        # keep that session's ForwardMsgCache refs until then, so that a client
+        # reconnecting to it is sent references instead of full messages.
+        self._keep_message_cache_refs_on_disconnect = False
+        if isinstance(config.session_storage, ExpiringSessionStorage):
+            config.session_storage.set_expiration_callback(self._on_session_expired)
+            self._keep_message_cache_refs_on_disconnect = True
+
         self._stats_mgr = StatsManager()
         self._stats_mgr.register_provider(get_data_cache_stats_provider())
         self._stats_mgr.register_provider(get_resource_cache_stats_provider())
         self._stats_mgr.register_provider(self._message_cache)
         self._stats_mgr.register_provider(self._uploaded_file_mgr)
         self._stats_mgr.register_provider(SessionStateStatProvider(self._session_mgr))
+        self._stats_mgr.register_counter_provider(self._message_cache)
+        self._stats_mgr.register_counter_provider(self._broadcaster)
+        self._stats_mgr.register_counter_provider(get_data_cache_stats_provider())
+
+        # Session state isn't registered, since it can't be evicted.
+        self._memory_governor = MemoryGovernor()
+        # The timer that enforces the memory budget. It runs independently of
+        # the loop, which may sleep for a long time when nothing is sent.
+        self._budget_check_handle: asyncio.TimerHandle | None = None
+        self._memory_governor.register_provider(
+            "st_cache_data", get_data_cache_stats_provider()
+        )
+        self._memory_governor.register_provider(
+            "st_cache_resource", get_resource_cache_stats_provider()
+        )
+        self._memory_governor.register_provider(
+            "ForwardMessageCache", self._message_cache
+        )
+        self._memory_governor.register_provider(
+            "UploadedFileManager", self._uploaded_file_mgr
+        )
+        if isinstance(config.media_file_storage, CacheStatsProvider):
+            self._memory_governor.register_provider(
+                "st_memory_media_file_storage", config.media_file_storage
+            )
+        self._stats_mgr.register_counter_provider(self._memory_governor)
 
     @property
     def state(self) -> RuntimeState:
@@ -251,6 +335,10 @@ class Runtime:
     def stats_mgr(self) -> StatsManager:
         return self._stats_mgr
 
+    @property
+    def memory_governor(self) -> MemoryGovernor:
+        return self._memory_governor
+
     @property
     def stopped(self) -> Awaitable[None]:
         """A Future that completes when the Runtime's run loop has exited."""
@@ -333,6 +421,7 @@ class Runtime:
             _LOGGER.debug("Runtime stopping...")
             self._set_state(RuntimeState.STOPPING)
             async_objs.must_stop.set()
+            async_objs.need_send_data.set()
 
         async_objs.eventloop.call_soon_threadsafe(stop_on_eventloop)
 
@@ -401,8 +490,15 @@ class Runtime:
             existing_session_id=existing_session_id,
             session_id_override=session_id_override,
         )
+        if isinstance(client, BufferedSessionClient):
+            # Resume writing to the client once it has caught up.
+            client.set_drain_callback(
+                functools.partial(self._on_message_enqueued, session_id),
+                self._max_buffered_bytes_per_session,
+            )
         self._set_state(RuntimeState.ONE_OR_MORE_SESSIONS_CONNECTED)
         self._get_async_objs().has_connection.set()
+        self._get_async_objs().need_send_data.set()
 
         return session_id
 
@@ -451,6 +547,7 @@ class Runtime:
         if session_info:
             self._message_cache.remove_refs_for_session(session_info.session)
             self._session_mgr.close_session(session_id)
+        self._unsent_msgs.pop(session_id, None)
         self._on_session_disconnected()
 
     def disconnect_session(self, session_id: str) -> None:
@@ -474,17 +571,33 @@ class Runtime:
         """
         session_info = self._session_mgr.get_active_session_info(session_id)
         if session_info:
-            # NOTE: Ideally, we'd like to keep ForwardMsgCache refs for a session around
-            # when a session is disconnected (and defer their cleanup until the session
-            # is garbage collected), but this would be difficult to do as the
-            # ForwardMsgCache is not thread safe, and we have no guarantee that the
-            # garbage collector will only run on the eventloop thread. Because of this,
-            # we clean up refs now and accept the risk that we're deleting cache entries
-            # that will be useful once the browser tab reconnects.
-            self._message_cache.remove_refs_for_session(session_info.session)
+            # NOTE: If the SessionStorage reports expired sessions, we keep the
+            # session's ForwardMsgCache refs until it expires (see
+            # `_on_session_expired`), so that a reconnecting browser tab doesn't
+            # need to be sent every cached message again. Otherwise, we clean up refs
+            # now and accept the risk that we're deleting cache entries that will be
+            # useful once the browser tab reconnects.
+            if not self._keep_message_cache_refs_on_disconnect:
+                self._message_cache.remove_refs_for_session(session_info.session)
             self._session_mgr.disconnect_session(session_id)
+        self._unsent_msgs.pop(session_id, None)
         self._on_session_disconnected()
 
+    def _on_session_expired(self, session_info: SessionInfo) -> None:
+        """Called by the SessionStorage when it drops a disconnected session.
+
+        Notes
+        -----
+        Threading: SAFE. May be called on any thread. The ForwardMsgCache isn't
+        thread safe, so the session's refs are removed on the eventloop thread.
+        """
+        async_objs = self._async_objs
+        if async_objs is None:
+            return
+        async_objs.eventloop.call_soon_threadsafe(
+            self._message_cache.remove_refs_for_session, session_info.session
+        )
+
     def handle_backmsg(self, session_id: str, msg: BackMsg) -> None:
         """Send a BackMsg to an active session.
 
@@ -620,62 +733,30 @@ class Runtime:
             else:
                 raise RuntimeError(f"Bad Runtime state at start: {self._state}")
 
+            self._schedule_budget_check()
+
             # Signal that we're started and ready to accept sessions
             async_objs.started.set_result(None)
 
             while not async_objs.must_stop.is_set():
-                if self._state == RuntimeState.NO_SESSIONS_CONNECTED:  # type: ignore[comparison-overlap]
-                    # mypy 1.4 incorrectly thinks this if-clause is unreachable,
-                    # because it thinks self._state must be INITIAL | ONE_OR_MORE_SESSIONS_CONNECTED.
-
-                    # Wait for new websocket connections (new sessions):
-                    _, pending_tasks = await asyncio.wait(  # type: ignore[unreachable]
-                        (
-                            asyncio.create_task(async_objs.must_stop.wait()),
-                            asyncio.create_task(async_objs.has_connection.wait()),
-                        ),
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-                    # Clean up pending tasks to avoid memory leaks
-                    for task in pending_tasks:
-                        task.cancel()
-                elif self._state == RuntimeState.ONE_OR_MORE_SESSIONS_CONNECTED:
-                    async_objs.need_send_data.clear()
-
-                    for active_session_info in self._session_mgr.list_active_sessions():
-                        msg_list = active_session_info.session.flush_browser_queue()
-                        for msg in msg_list:
-                            try:
-                                self._send_message(active_session_info, msg)
-                            except SessionClientDisconnectedError:
-                                self._session_mgr.disconnect_session(
-                                    active_session_info.session.id
-                                )
-
-                            # Yield for a tick after sending a message.
-                            await asyncio.sleep(0)
-
-                    # Yield for a few milliseconds between session message
-                    # flushing.
-                    await asyncio.sleep(0.01)
-                else:
+                # Wait until there's something to do. We wait on a single
+                # event (rather than racing several waiter tasks) so that no
+                # new tasks need to be created on each iteration.
+                await async_objs.need_send_data.wait()
+                async_objs.need_send_data.clear()
+
+                if async_objs.must_stop.is_set():
+                    break
+
+                if self._state == RuntimeState.ONE_OR_MORE_SESSIONS_CONNECTED:
+                    await self._flush_sessions()
+                elif self._state != RuntimeState.NO_SESSIONS_CONNECTED:  # type: ignore[comparison-overlap]
+                    # mypy incorrectly narrows self._state here, as it can't see
+                    # that the state may change while we're awaiting above.
                     # Break out of the thread loop if we encounter any other state.
                     break
 
-                # Wait for new proto messages that need to be sent out:
-                _, pending_tasks = await asyncio.wait(
-                    (
-                        asyncio.create_task(async_objs.must_stop.wait()),
-                        asyncio.create_task(async_objs.need_send_data.wait()),
-                    ),
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                # We need to cancel the pending tasks (the `must_stop` one in most situations).
-                # Otherwise, this would stack up one waiting task per loop
-                # (e.g. per forward message). These tasks cannot be garbage collected
-                # causing an increase in memory (-> memory leak).
-                for task in pending_tasks:
-                    task.cancel()
+            self._cancel_budget_check()
 
             # Shut down all AppSessions.
             for session_info in self._session_mgr.list_sessions():
@@ -684,10 +765,15 @@ class Runtime:
                 # is no longer so tightly coupled to a browser tab.
                 self._session_mgr.close_session(session_info.session.id)
 
+            # Drop the cached messages, which also removes the directory
+            # that large ones were spilled to.
+            self._message_cache.clear()
+
             self._set_state(RuntimeState.STOPPED)
             async_objs.stopped.set_result(None)
 
         except Exception as e:
+            self._cancel_budget_check()
             async_objs.stopped.set_exception(e)
             traceback.print_exc()
             _LOGGER.info(
@@ -696,9 +782,189 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
 """
             )
 
+    def _schedule_budget_check(self) -> None:
+        """Enforce the memory budget after BUDGET_CHECK_INTERVAL_SECONDS.
+
+        Threading: UNSAFE. Must be called on the eventloop thread.
+        """
+        self._budget_check_handle = self._get_async_objs().eventloop.call_later(
+            BUDGET_CHECK_INTERVAL_SECONDS, self._check_budget
+        )
+
+    def _cancel_budget_check(self) -> None:
+        if self._budget_check_handle is not None:
+            self._budget_check_handle.cancel()
+            self._budget_check_handle = None
+
+    def _check_budget(self) -> None:
+        """Enforce the memory budget, and schedule the next check."""
+        try:
+            self._memory_governor.enforce_budget()
+        finally:
+            self._schedule_budget_check()
+
+    async def _flush_sessions(self) -> None:
+        """Write the pending ForwardMsgs of all sessions that enqueued messages.
+
+        Each session gets a message and byte budget per call. Messages that
+        exceed it are kept and written on a later call, after every other
+        session had its turn. The loop yields to the eventloop whenever it has
+        been writing for longer than the configured latency target.
+
+        Sessions whose client has too much data buffered are skipped until the
+        client reports that its buffer has drained.
+
+        Notes
+        -----
+        Threading: UNSAFE. Must be called on the eventloop thread.
+        """
+        # The loop doesn't yield between ticks if another one is already due,
+        # e.g. to write the messages that were left over from the last one.
+        await self._maybe_yield_flush()
+
+        session_ids = self._sessions_to_flush
+        self._sessions_to_flush = {}
+
+        if session_ids:
+            session_infos = [
+                session_info
+                for session_info in map(
+                    self._session_mgr.get_active_session_info, session_ids
+                )
+                if session_info is not None
+            ]
+        else:
+            # We were woken up without being told which sessions have
+            # messages, so we need to check all of them.
+            session_infos = self._session_mgr.list_active_sessions()
+
+        # Sessions we stopped writing to because their client is backed up.
+        # They're flushed again once the client's buffer has drained.
+        backed_up_session_ids: set[str] = set()
+
+        flushed_msgs: list[tuple[ActiveSessionInfo, list[ForwardMsg]]] = []
+        for session_info in session_infos:
+            session_id = session_info.session.id
+            if self._is_client_backed_up(session_info):
+                backed_up_session_ids.add(session_id)
+                continue
+            # Only flush the session's queue once the messages left over from
+            # previous ticks have been sent. Until then, new messages stay in
+            # the queue where superseded deltas can still be coalesced.
+            msg_list = self._unsent_msgs.pop(session_id, None)
+            if msg_list is None:
+                msg_list = session_info.session.flush_browser_queue()
+            if not msg_list:
+                continue
+
+            if len(msg_list) > self._max_flush_msgs_per_session:
+                self._unsent_msgs[session_id] = msg_list[
+                    self._max_flush_msgs_per_session :
+                ]
+                msg_list = msg_list[: self._max_flush_msgs_per_session]
+            flushed_msgs.append((session_info, msg_list))
+
+        # Sessions running the same app often flush identical messages. Hash
+        # and encode each distinct message only once.
+        self._broadcaster.prepare(
+            msg for _, msg_list in flushed_msgs for msg in msg_list
+        )
+
+        for session_info, msg_list in flushed_msgs:
+            session_id = session_info.session.id
+            client = session_info.client
+            # Clients that support it get all of this tick's messages in a
+            # single write.
+            batch: list[ForwardMsg] | None = (
+                [] if isinstance(client, BatchingSessionClient) else None
+            )
+            num_bytes = 0
+            try:
+                for i, msg in enumerate(msg_list):
+                    backed_up = self._is_client_backed_up(session_info)
+                    if backed_up:
+                        backed_up_session_ids.add(session_id)
+                    if backed_up or num_bytes >= self._max_flush_bytes_per_session:
+                        self._unsent_msgs[session_id] = msg_list[i:] + (
+                            self._unsent_msgs.get(session_id, [])
+                        )
+                        break
+
+                    # Messages the broadcaster skipped, e.g. references,
+                    # weren't serialized, but they count towards the budget.
+                    body = self._broadcaster.get_serialized_body(msg)
+                    num_bytes += len(body) if body is not None else msg.ByteSize()
+                    if batch is not None:
+                        batch.append(self._prepare_message(session_info, msg))
+                    else:
+                        self._send_message(session_info, msg)
+
+                    await self._maybe_yield_flush()
+
+                if batch:
+                    # The type checker can't narrow client from the batch's
+                    # existence, so we check again.
+                    assert isinstance(client, BatchingSessionClient)
+                    client.write_forward_msg_batch(batch)
+            except SessionClientDisconnectedError:
+                self._session_mgr.disconnect_session(session_id)
+                self._unsent_msgs.pop(session_id, None)
+
+        self._broadcaster.clear()
+
+        # Come back for the messages that didn't fit into this tick.
+        retry_session_ids = [
+            session_id
+            for session_id in self._unsent_msgs
+            if session_id not in backed_up_session_ids
+        ]
+        if retry_session_ids:
+            self._sessions_to_flush.update(dict.fromkeys(retry_session_ids))
+            self._get_async_objs().need_send_data.set()
+
+    async def _maybe_yield_flush(self) -> None:
+        """Yield to the eventloop if flushing has kept it busy for longer
+        than the configured latency target.
+        """
+        if time.monotonic() - self._last_flush_yield >= self._flush_latency_target:
+            await asyncio.sleep(0)
+            self._last_flush_yield = time.monotonic()
+
+    def _is_client_backed_up(self, session_info: ActiveSessionInfo) -> bool:
+        """True if the session's client has too much data buffered to be
+        written to.
+        """
+        client = session_info.client
+        return (
+            isinstance(client, BufferedSessionClient)
+            and client.buffered_bytes >= self._max_buffered_bytes_per_session
+        )
+
     def _send_message(self, session_info: ActiveSessionInfo, msg: ForwardMsg) -> None:
         """Send a message to a client.
 
+        See `_prepare_message` for how the message that actually gets sent is
+        determined.
+
+        Parameters
+        ----------
+        session_info : ActiveSessionInfo
+            The ActiveSessionInfo associated with websocket
+        msg : ForwardMsg
+            The message to send to the client
+
+        Notes
+        -----
+        Threading: UNSAFE. Must be called on the eventloop thread.
+        """
+        session_info.client.write_forward_msg(self._prepare_message(session_info, msg))
+
+    def _prepare_message(
+        self, session_info: ActiveSessionInfo, msg: ForwardMsg
+    ) -> ForwardMsg:
+        """Prepare a message to be sent to a client, and return the message
+        that should actually be sent.
+
         If the client is likely to have already cached the message, we may
         instead send a "reference" message that contains only the hash of the
         message.
@@ -710,14 +976,26 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
         msg : ForwardMsg
             The message to send to the client
 
+        Returns
+        -------
+        ForwardMsg
+            Either the message itself, or a reference message pointing to it.
+
         Notes
         -----
         Threading: UNSAFE. Must be called on the eventloop thread.
         """
-        msg.metadata.cacheable = is_cacheable_msg(msg)
+        # If the message was prepared by the broadcaster, its payload has
+        # already been serialized (possibly for another session).
+        body = self._broadcaster.get_serialized_body(msg)
+        msg.metadata.cacheable = is_cacheable_msg(msg, body)
         msg_to_send = msg
         if msg.metadata.cacheable:
-            populate_hash_if_needed(msg)
+            # Serialize the message's payload only once. The hash, the cache
+            # entry and the eventual websocket write all share these bytes.
+            if body is None:
+                body = serialize_forward_msg_body(msg)
+            populate_hash_if_needed(msg, body)
 
             if self._message_cache.has_message_reference(
                 msg, session_info.session, session_info.script_run_count
@@ -732,7 +1010,7 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
             # age.
             _LOGGER.debug("Caching message (hash=%s)", msg.hash)
             self._message_cache.add_message(
-                msg, session_info.session, session_info.script_run_count
+                msg, session_info.session, session_info.script_run_count, body
             )
 
         # If this was a `script_finished` message, we increment the
@@ -757,20 +1035,51 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
                 session_info.session, session_info.script_run_count
             )
 
-        # Ship it off!
-        session_info.client.write_forward_msg(msg_to_send)
+        return msg_to_send
 
-    def _enqueued_some_message(self) -> None:
+    def serialize_forward_msg(self, msg: ForwardMsg) -> bytes:
+        """Serialize a ForwardMsg that is about to be written to a client.
+
+        Bytes that were already produced for the message (or for an identical
+        message sent to another session) are reused instead of encoding the
+        message again.
+
+        Notes
+        -----
+        Threading: UNSAFE. Must be called on the eventloop thread.
+        """
+        serialized_msg = self._broadcaster.get_serialized_msg(msg)
+        if serialized_msg is not None:
+            return serialized_msg
+
+        body = self._message_cache.get_serialized_body(msg.hash) if msg.hash else None
+        return serialize_forward_msg(msg, body)
+
+    def _enqueued_some_message(self, session_id: str | None = None) -> None:
         """Callback called by AppSession after the AppSession has enqueued a
-        message. Sets the "needs_send_data" event, which causes our core
-        loop to wake up and flush client message queues.
+        message. Records the session as having pending messages and sets the
+        "needs_send_data" event, which causes our core loop to wake up and
+        flush that session's message queue.
+
+        If session_id is None, the queues of all sessions are flushed.
 
         Notes
         -----
         Threading: SAFE. May be called on any thread.
         """
         async_objs = self._get_async_objs()
-        async_objs.eventloop.call_soon_threadsafe(async_objs.need_send_data.set)
+        async_objs.eventloop.call_soon_threadsafe(self._on_message_enqueued, session_id)
+
+    def _on_message_enqueued(self, session_id: str | None) -> None:
+        """Eventloop-side part of `_enqueued_some_message`.
+
+        Notes
+        -----
+        Threading: UNSAFE. Must be called on the eventloop thread.
+        """
+        if session_id is not None:
+            self._sessions_to_flush[session_id] = None
+        self._get_async_objs().need_send_data.set()
 
     def _get_async_objs(self) -> AsyncObjects:
         """Return our AsyncObjects instance. If the Runtime hasn't been
@@ -16,11 +16,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from streamlit import config
 from streamlit.errors import MarkdownFormattedException, StreamlitAPIException
-from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
+from streamlit.runtime.forward_msg_cache import (
+    populate_hash_if_needed,
+    serialize_forward_msg_body,
+    serialize_forward_msg_envelope,
+)
 
 if TYPE_CHECKING:
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
@@ -60,22 +64,44 @@ class BadDurationStringError(StreamlitAPIException):
         )
 
 
-def is_cacheable_msg(msg: ForwardMsg) -> bool:
-    """True if the given message qualifies for caching."""
-    if msg.WhichOneof("type") in {"ref_hash", "initialize"}:
-        # Some message types never get cached
+# Some message types never get cached.
+NEVER_CACHED_MSG_TYPES: Final = frozenset({"ref_hash", "initialize"})
+
+
+def is_cacheable_msg(msg: ForwardMsg, body: bytes | None = None) -> bool:
+    """True if the given message qualifies for caching.
+
+    If the message's serialized payload (see `serialize_forward_msg_body`) is
+    given, its length is used as the message size instead of computing it
+    from the message.
+    """
+    if msg.WhichOneof("type") in NEVER_CACHED_MSG_TYPES:
         return False
-    return msg.ByteSize() >= int(config.get_option("global.minCachedMessageSize"))
+    size = len(body) if body is not None else msg.ByteSize()
+    return size >= int(config.get_option("global.minCachedMessageSize"))
 
 
-def serialize_forward_msg(msg: ForwardMsg) -> bytes:
+def serialize_forward_msg(msg: ForwardMsg, body: bytes | None = None) -> bytes:
     """Serialize a ForwardMsg to send to a client.
 
     If the message is too large, it will be converted to an exception message
     instead.
+
+    Parameters
+    ----------
+    msg : ForwardMsg
+        The message to serialize.
+    body : bytes | None
+        The message's serialized payload, as returned by
+        `serialize_forward_msg_body` (e.g. from the ForwardMsgCache). If this
+        is None, the payload will be serialized here. Either way, the payload
+        is only encoded once and shared by the hash calculation, the size
+        check and the returned bytes.
     """
-    populate_hash_if_needed(msg)
-    msg_str = msg.SerializeToString()
+    if body is None:
+        body = serialize_forward_msg_body(msg)
+    populate_hash_if_needed(msg, body)
+    msg_str = body + serialize_forward_msg_envelope(msg)
 
     if len(msg_str) > get_max_message_size_bytes():
         import streamlit.elements.exception as exception
@@ -16,7 +16,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Protocol, cast
+from typing import TYPE_CHECKING, Callable, Protocol, cast, runtime_checkable
 
 if TYPE_CHECKING:
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
@@ -43,6 +43,59 @@ class SessionClient(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class BatchingSessionClient(SessionClient, Protocol):
+    """Interface for a SessionClient that can deliver several ForwardMsgs at once.
+
+    The Runtime hands all messages flushed from a session in one tick of its
+    loop to `write_forward_msg_batch` instead of calling `write_forward_msg`
+    for each of them.
+    """
+
+    @abstractmethod
+    def write_forward_msg_batch(self, msgs: list[ForwardMsg]) -> None:
+        """Deliver several ForwardMsgs to the client, in order.
+
+        If the SessionClient has been disconnected, it should raise a
+        SessionClientDisconnectedError.
+        """
+        raise NotImplementedError
+
+
+@runtime_checkable
+class BufferedSessionClient(SessionClient, Protocol):
+    """Interface for a SessionClient that buffers the data written to it.
+
+    The Runtime stops writing to a client whose buffer has grown too large, and
+    resumes once the client reports that its buffer has drained.
+    """
+
+    @property
+    @abstractmethod
+    def buffered_bytes(self) -> int:
+        """The number of bytes written to the client that haven't been sent yet."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_drain_callback(
+        self, callback: Callable[[], None] | None, high_water_mark: int
+    ) -> None:
+        """Set the function to call when the client's buffer drains after it
+        was backed up.
+
+        Parameters
+        ----------
+        callback
+            The function to call on the eventloop thread, or None to stop
+            reporting drained buffers.
+        high_water_mark
+            The number of buffered bytes at which the client counts as backed
+            up. The callback is called once each time the buffer drops back
+            below it, not after every write.
+        """
+        raise NotImplementedError
+
+
 @dataclass
 class ActiveSessionInfo:
     """Type containing data related to an active session.
@@ -168,6 +221,34 @@ class SessionStorage(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class ExpiringSessionStorage(SessionStorage, Protocol):
+    """Interface for a SessionStorage that reports the sessions it drops on its own.
+
+    Sessions stored in a SessionStorage may disappear without `delete` being called
+    (e.g. because they've expired). If the SessionStorage reports when this happens,
+    the Runtime can hold on to resources associated with a disconnected session
+    until then, rather than releasing them as soon as the session disconnects.
+    """
+
+    @abstractmethod
+    def set_expiration_callback(
+        self, callback: Callable[[SessionInfo], None] | None
+    ) -> None:
+        """Set the function to call with each session this SessionStorage drops
+        without `delete` being called.
+
+        The callback may be called from any thread that accesses the
+        SessionStorage.
+
+        Parameters
+        ----------
+        callback
+            The function to call, or None to stop reporting dropped sessions.
+        """
+        raise NotImplementedError
+
+
 class SessionManager(Protocol):
     """SessionManagers are responsible for encapsulating all session lifecycle behavior
     that the Streamlit Runtime may care about.
@@ -211,7 +292,7 @@ class SessionManager(Protocol):
         session_storage: SessionStorage,
         uploaded_file_manager: UploadedFileManager,
         script_cache: ScriptCache,
-        message_enqueued_callback: Callable[[], None] | None,
+        message_enqueued_callback: Callable[[str], None] | None,
     ) -> None:
         """Initialize a SessionManager with the given SessionStorage.
 
@@ -228,6 +309,7 @@ class SessionManager(Protocol):
 
         message_enqueued_callback
             A callback invoked after a message is enqueued to be sent to a web client.
+            It is passed the ID of the session that enqueued the message.
         """
         raise NotImplementedError
 
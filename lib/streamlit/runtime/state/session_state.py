@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import json
 import pickle
+import sys
 from collections.abc import Iterator, KeysView, MutableMapping
 from copy import deepcopy
 from dataclasses import dataclass, field, replace
@@ -34,6 +35,7 @@ from streamlit import config, util
 from streamlit.errors import StreamlitAPIException, UnserializableSessionStateError
 from streamlit.proto.WidgetStates_pb2 import WidgetState as WidgetStateProto
 from streamlit.proto.WidgetStates_pb2 import WidgetStates as WidgetStatesProto
+from streamlit.runtime.object_size import ObjectSizeCache, get_known_size
 from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
 from streamlit.runtime.state.common import (
     RegisterWidgetResult,
@@ -364,6 +366,14 @@ class SessionState:
     # widget state at one point.
     query_params: QueryParams = field(default_factory=QueryParams)
 
+    # The sizes of the values above, for the stats. Values are keyed by the
+    # dict they're stored in, followed by their key or widget ID.
+    _value_sizes: ObjectSizeCache = field(
+        default_factory=lambda: ObjectSizeCache(_get_known_state_size),
+        repr=False,
+        compare=False,
+    )
+
     def __repr__(self):
         return util.repr_(self)
 
@@ -389,6 +399,7 @@ class SessionState:
         self._new_session_state.clear()
         self._new_widget_state.clear()
         self._key_id_mapper.clear()
+        self._value_sizes.clear()
 
     @property
     def filtered_state(self) -> dict[str, Any]:
@@ -540,6 +551,14 @@ class SessionState:
         if widget_id in self._old_state:
             del self._old_state[widget_id]
 
+        for size_key in (
+            f"new:{key}",
+            f"old:{key}",
+            f"widget:{widget_id}",
+            f"old:{widget_id}",
+        ):
+            self._value_sizes.discard(size_key)
+
     def set_widgets_from_proto(self, widget_states: WidgetStatesProto) -> None:
         """Set the value of all widgets represented in the given WidgetStatesProto."""
         for state in widget_states.widgets:
@@ -709,10 +728,32 @@ class SessionState:
             return True
 
     def get_stats(self) -> list[CacheStat]:
-        # Lazy-load vendored package to prevent import of numpy
-        from streamlit.vendor.pympler.asizeof import asizeof
+        # Copy the dicts, since the script thread may modify them while
+        # the stats are being computed.
+        stores = [
+            ("old", dict(self._old_state)),
+            ("new", dict(self._new_session_state)),
+            ("widget", dict(self._new_widget_state.states)),
+        ]
+        byte_length = self._value_sizes.get_total_size(
+            (f"{name}:{key}", value)
+            for name, store in stores
+            for key, value in store.items()
+        )
 
-        stat = CacheStat("st_session_state", "", asizeof(self))
+        # The values are measured incrementally. The bookkeeping around them
+        # is only measured shallowly.
+        widget_metadata = dict(self._new_widget_state.widget_metadata)
+        for _, store in stores:
+            byte_length += sys.getsizeof(store)
+            byte_length += sum(sys.getsizeof(key) for key in store)
+        byte_length += sys.getsizeof(widget_metadata)
+        byte_length += sum(sys.getsizeof(meta) for meta in widget_metadata.values())
+        byte_length += sys.getsizeof(self._key_id_mapper._key_id_mapping)
+        byte_length += sys.getsizeof(self._key_id_mapper._id_key_mapping)
+        byte_length += sys.getsizeof(self)
+
+        stat = CacheStat("st_session_state", "", byte_length)
         return [stat]
 
     def _check_serializable(self) -> None:
@@ -739,6 +780,18 @@ class SessionState:
             self._check_serializable()
 
 
+def _get_known_state_size(value: Any) -> int | None:
+    """Return the size of a session state value whose type is well-known,
+    looking into the wrappers that widget values are stored in.
+    """
+    if isinstance(value, Value):
+        value_size = get_known_size(value.value)
+        return None if value_size is None else sys.getsizeof(value) + value_size
+    if isinstance(value, Serialized):
+        return sys.getsizeof(value) + value.value.ByteSize()
+    return get_known_size(value)
+
+
 def _is_internal_key(key: str) -> bool:
     return key.startswith(STREAMLIT_INTERNAL_KEY_PREFIX)
 
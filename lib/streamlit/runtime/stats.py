@@ -60,6 +60,48 @@ class CacheStat(NamedTuple):
         metric_point.gauge_value.int_value = self.byte_length
 
 
+class CounterStat(NamedTuple):
+    """Describes a monotonically increasing count, e.g. the number of hits
+    of a cache.
+
+    Properties
+    ----------
+    family_name : str
+        The name of the metric family the count belongs to - e.g.
+        "cache_hits". When exported, counters get a "_total" suffix.
+    category_name : str
+        A human-readable name for the "category" that the count belongs to -
+        e.g. "ForwardMessageCache".
+    cache_name : str
+        A human-readable name for the instance that the count belongs to. If
+        the category doesn't have multiple separate instances, this can just
+        be the empty string.
+    value : int
+        The current value of the counter.
+    """
+
+    family_name: str
+    category_name: str
+    cache_name: str
+    value: int
+
+    def to_metric_str(self) -> str:
+        return f'{self.family_name}_total{{cache_type="{self.category_name}",cache="{self.cache_name}"}} {self.value}'
+
+    def marshall_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object."""
+        label = metric.labels.add()
+        label.name = "cache_type"
+        label.value = self.category_name
+
+        label = metric.labels.add()
+        label.name = "cache"
+        label.value = self.cache_name
+
+        metric_point = metric.metric_points.add()
+        metric_point.counter_value.int_value = self.value
+
+
 def group_stats(stats: list[CacheStat]) -> list[CacheStat]:
     """Group a list of CacheStats by category_name and cache_name and sum byte_length"""
 
@@ -89,9 +131,17 @@ class CacheStatsProvider(Protocol):
         raise NotImplementedError
 
 
+@runtime_checkable
+class CounterStatsProvider(Protocol):
+    @abstractmethod
+    def get_counter_stats(self) -> list[CounterStat]:
+        raise NotImplementedError
+
+
 class StatsManager:
     def __init__(self):
         self._cache_stats_providers: list[CacheStatsProvider] = []
+        self._counter_stats_providers: list[CounterStatsProvider] = []
 
     def register_provider(self, provider: CacheStatsProvider) -> None:
         """Register a CacheStatsProvider with the manager.
@@ -107,3 +157,18 @@ class StatsManager:
             all_stats.extend(provider.get_stats())
 
         return all_stats
+
+    def register_counter_provider(self, provider: CounterStatsProvider) -> None:
+        """Register a CounterStatsProvider with the manager.
+        This function is not thread-safe. Call it immediately after
+        creation.
+        """
+        self._counter_stats_providers.append(provider)
+
+    def get_counter_stats(self) -> list[CounterStat]:
+        """Return a list containing all counters from each registered provider."""
+        all_stats: list[CounterStat] = []
+        for provider in self._counter_stats_providers:
+            all_stats.extend(provider.get_counter_stats())
+
+        return all_stats
@@ -49,7 +49,7 @@ class WebsocketSessionManager(SessionManager):
         session_storage: SessionStorage,
         uploaded_file_manager: UploadedFileManager,
         script_cache: ScriptCache,
-        message_enqueued_callback: Callable[[], None] | None,
+        message_enqueued_callback: Callable[[str], None] | None,
     ) -> None:
         self._session_storage = session_storage
         self._uploaded_file_mgr = uploaded_file_manager
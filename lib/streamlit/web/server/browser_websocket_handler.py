@@ -16,7 +16,8 @@ from __future__ import annotations
 
 import hmac
 import json
-from typing import TYPE_CHECKING, Any, Final
+import struct
+from typing import TYPE_CHECKING, Any, Callable, Final
 from urllib.parse import urlparse
 
 import tornado.concurrent
@@ -30,8 +31,12 @@ from tornado.websocket import WebSocketHandler
 from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.proto.BackMsg_pb2 import BackMsg
-from streamlit.runtime import Runtime, SessionClient, SessionClientDisconnectedError
-from streamlit.runtime.runtime_util import serialize_forward_msg
+from streamlit.runtime import (
+    BatchingSessionClient,
+    BufferedSessionClient,
+    Runtime,
+    SessionClientDisconnectedError,
+)
 from streamlit.web.server.server_util import (
     AUTH_COOKIE_NAME,
     is_url_from_allowed_origins,
@@ -39,19 +44,53 @@ from streamlit.web.server.server_util import (
 )
 
 if TYPE_CHECKING:
+    import asyncio
     from collections.abc import Awaitable
 
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 
 _LOGGER: Final = get_logger(__name__)
 
+# The subprotocol a client selects to tell us that it can decode batch frames.
+BATCH_SUBPROTOCOL: Final = "streamlit-batch"
+
+# The first byte of a batch frame. A serialized ForwardMsg never starts with a
+# zero byte (that would be a tag for field number 0, which is invalid), so
+# clients can tell batch frames and single messages apart.
+_BATCH_FRAME_MARKER: Final = b"\x00"
+
+# Each message in a batch frame is prefixed with its length as a big-endian
+# unsigned 32-bit int.
+_BATCH_LENGTH_PREFIX: Final = struct.Struct(">I")
+
+
+def pack_batch_frame(serialized_msgs: list[bytes]) -> bytes:
+    """Pack several serialized ForwardMsgs into a single batch frame."""
+    parts = [_BATCH_FRAME_MARKER]
+    for serialized_msg in serialized_msgs:
+        parts.append(_BATCH_LENGTH_PREFIX.pack(len(serialized_msg)))
+        parts.append(serialized_msg)
+    return b"".join(parts)
+
 
-class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
+class BrowserWebSocketHandler(
+    WebSocketHandler, BatchingSessionClient, BufferedSessionClient
+):
     """Handles a WebSocket connection from the browser"""
 
     def initialize(self, runtime: Runtime) -> None:
         self._runtime = runtime
         self._session_id: str | None = None
+        # True if the client asked for batch frames and batching is enabled.
+        self._batch_forward_msgs = False
+        # The number of bytes passed to write_message that haven't been
+        # written to the socket yet.
+        self._buffered_bytes = 0
+        self._drain_callback: Callable[[], None] | None = None
+        self._high_water_mark = 0
+        # True while _buffered_bytes is at or above the high-water mark. The
+        # drain callback is only called when this goes back to False.
+        self._paused = False
         # The XSRF cookie is normally set when xsrf_form_html is used, but in a
         # pure-Javascript application that does not use any regular forms we just
         # need to read the self.xsrf_token manually to set the cookie as a side
@@ -114,13 +153,63 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
 
         return user_info
 
-    def write_forward_msg(self, msg: ForwardMsg) -> None:
-        """Send a ForwardMsg to the browser."""
+    @property
+    def buffered_bytes(self) -> int:
+        return self._buffered_bytes
+
+    def set_drain_callback(
+        self, callback: Callable[[], None] | None, high_water_mark: int
+    ) -> None:
+        self._drain_callback = callback
+        self._high_water_mark = high_water_mark
+
+    def _write_binary(self, data: bytes) -> None:
+        """Write a binary frame and keep track of how much of it is still
+        waiting to be sent.
+        """
         try:
-            self.write_message(serialize_forward_msg(msg), binary=True)
+            future = self.write_message(data, binary=True)
         except tornado.websocket.WebSocketClosedError as e:
             raise SessionClientDisconnectedError from e
 
+        num_bytes = len(data)
+        self._buffered_bytes += num_bytes
+        if self._buffered_bytes >= self._high_water_mark > 0:
+            self._paused = True
+        future.add_done_callback(lambda f: self._on_write_done(f, num_bytes))
+
+    def _on_write_done(self, future: asyncio.Future[None], num_bytes: int) -> None:
+        if not future.cancelled():
+            # Retrieve the exception so that a write failing because the
+            # connection was closed isn't logged as unhandled. on_close
+            # takes care of disconnecting the session.
+            future.exception()
+
+        self._buffered_bytes -= num_bytes
+        if self._paused and self._buffered_bytes < self._high_water_mark:
+            self._paused = False
+            if self._drain_callback is not None:
+                self._drain_callback()
+
+    def write_forward_msg(self, msg: ForwardMsg) -> None:
+        """Send a ForwardMsg to the browser."""
+        self._write_binary(self._runtime.serialize_forward_msg(msg))
+
+    def write_forward_msg_batch(self, msgs: list[ForwardMsg]) -> None:
+        """Send several ForwardMsgs to the browser.
+
+        If the browser negotiated batching, the messages are sent in a single
+        frame. Otherwise, each message gets its own frame.
+        """
+        if not self._batch_forward_msgs or len(msgs) == 1:
+            for msg in msgs:
+                self.write_forward_msg(msg)
+            return
+
+        self._write_binary(
+            pack_batch_frame([self._runtime.serialize_forward_msg(msg) for msg in msgs])
+        )
+
     def select_subprotocol(self, subprotocols: list[str]) -> str | None:
         """Return the first subprotocol in the given list.
 
@@ -138,7 +227,8 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
           - when Sec-WebSocket-Protocol is set, many clients expect the server to
             respond with a selected subprotocol to use. We don't want that reply to be
             the session token, so we by convention have the client always set the first
-            protocol to "streamlit" and select that.
+            protocol to "streamlit" and select that. Clients that can decode batch
+            frames set it to "streamlit-batch" instead.
           - the second protocol in the list is reserved in some deployment environments
             for an auth token that we currently don't use
         """
@@ -168,6 +258,10 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
                 # See the NOTE in the docstring of the `select_subprotocol` method above
                 # for a detailed explanation of why this is done.
                 existing_session_id = ws_protocols[2]
+
+            self._batch_forward_msgs = config.get_option(
+                "server.enableWebsocketBatching"
+            ) and (ws_protocols[0] == BATCH_SUBPROTOCOL)
         except KeyError:
             # Just let existing_session_id=None if we run into any error while trying to
             # extract it from the Sec-Websocket-Protocol header.
@@ -17,11 +17,11 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Final
 
+import tornado.iostream
 import tornado.web
 
 from streamlit import config, file_util
 from streamlit.logger import get_logger
-from streamlit.runtime.runtime_util import serialize_forward_msg
 from streamlit.web.server.server_util import (
     emit_endpoint_deprecation_notice,
     is_xsrf_enabled,
@@ -241,6 +241,11 @@ class HostConfigHandler(_SpecialRequestHandler):
         self.set_status(200)
 
 
+# Cached messages are written to the response in chunks of this size, so that
+# a large message doesn't have to be copied into tornado's write buffer at once.
+_MESSAGE_CHUNK_SIZE: Final = 1024 * 1024  # 1 MiB
+
+
 class MessageCacheHandler(tornado.web.RequestHandler):
     """Returns ForwardMsgs from our MessageCache"""
 
@@ -258,7 +263,7 @@ class MessageCacheHandler(tornado.web.RequestHandler):
         if allow_cross_origin_requests():
             self.set_header("Access-Control-Allow-Origin", "*")
 
-    def get(self):
+    async def get(self):
         msg_hash = self.get_argument("hash", None)
         if not config.get_option("global.storeCachedForwardMessagesInMemory"):
             # We use rare status code here, to distinguish between normal 404s.
@@ -273,8 +278,8 @@ class MessageCacheHandler(tornado.web.RequestHandler):
             self.set_status(404)
             raise tornado.web.Finish()
 
-        message = self._cache.get_message(msg_hash)
-        if message is None:
+        serialized_msg = self._cache.get_serialized_msg(msg_hash)
+        if serialized_msg is None:
             # Message not in our cache.
             _LOGGER.error(
                 "HTTP request for cached message could not be fulfilled. "
@@ -284,10 +289,23 @@ class MessageCacheHandler(tornado.web.RequestHandler):
             raise tornado.web.Finish()
 
         _LOGGER.debug("MessageCache HIT")
-        msg_str = serialize_forward_msg(message)
+        # A message's hash is derived from its contents, so the response for a
+        # given hash never changes.
+        self.set_header("ETag", f'"{msg_hash}"')
+        self.set_header("Cache-Control", "public, max-age=31536000, immutable")
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+
         self.set_header("Content-Type", "application/octet-stream")
-        self.write(msg_str)
-        self.set_status(200)
+        self.set_header("Content-Length", len(serialized_msg))
+        try:
+            for start in range(0, len(serialized_msg), _MESSAGE_CHUNK_SIZE):
+                self.write(bytes(serialized_msg[start : start + _MESSAGE_CHUNK_SIZE]))
+                await self.flush()
+        except tornado.iostream.StreamClosedError:
+            # The client went away while we were sending the message.
+            pass
 
     def options(self):
         """/OPTIONS handler for preflight CORS checks."""
@@ -23,7 +23,7 @@ from streamlit.web.server.server_util import emit_endpoint_deprecation_notice
 
 if TYPE_CHECKING:
     from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-    from streamlit.runtime.stats import CacheStat, StatsManager
+    from streamlit.runtime.stats import CacheStat, CounterStat, StatsManager
 
 
 class StatsRequestHandler(tornado.web.RequestHandler):
@@ -44,36 +44,44 @@ class StatsRequestHandler(tornado.web.RequestHandler):
             emit_endpoint_deprecation_notice(self, new_path="/_stcore/metrics")
 
         stats = self._manager.get_stats()
+        counter_stats = self._manager.get_counter_stats()
 
         # If the request asked for protobuf output, we return a serialized
         # protobuf. Else we return text.
         if "application/x-protobuf" in self.request.headers.get_list("Accept"):
-            self.write(self._stats_to_proto(stats).SerializeToString())
+            self.write(self._stats_to_proto(stats, counter_stats).SerializeToString())
             self.set_header("Content-Type", "application/x-protobuf")
             self.set_status(200)
         else:
-            self.write(self._stats_to_text(self._manager.get_stats()))
+            self.write(self._stats_to_text(stats, counter_stats))
             self.set_header("Content-Type", "application/openmetrics-text")
             self.set_status(200)
 
     @staticmethod
-    def _stats_to_text(stats: list[CacheStat]) -> str:
+    def _stats_to_text(
+        stats: list[CacheStat], counter_stats: list[CounterStat] | None = None
+    ) -> str:
         metric_type = "# TYPE cache_memory_bytes gauge"
         metric_unit = "# UNIT cache_memory_bytes bytes"
         metric_help = "# HELP Total memory consumed by a cache."
         openmetrics_eof = "# EOF\n"
 
-        # Format: header, stats, EOF
+        # Format: header, stats, [counter header, counters]..., EOF
         result = [metric_type, metric_unit, metric_help]
         result.extend(stat.to_metric_str() for stat in stats)
+        for family_name, family_stats in _group_by_family(counter_stats or []):
+            result.append(f"# TYPE {family_name} counter")
+            result.extend(stat.to_metric_str() for stat in family_stats)
         result.append(openmetrics_eof)
 
         return "\n".join(result)
 
     @staticmethod
-    def _stats_to_proto(stats: list[CacheStat]) -> MetricSetProto:
+    def _stats_to_proto(
+        stats: list[CacheStat], counter_stats: list[CounterStat] | None = None
+    ) -> MetricSetProto:
         # Lazy load the import of this proto message for better performance:
-        from streamlit.proto.openmetrics_data_model_pb2 import GAUGE
+        from streamlit.proto.openmetrics_data_model_pb2 import COUNTER, GAUGE
         from streamlit.proto.openmetrics_data_model_pb2 import (
             MetricSet as MetricSetProto,
         )
@@ -92,4 +100,26 @@ class StatsRequestHandler(tornado.web.RequestHandler):
 
         metric_set = MetricSetProto()
         metric_set.metric_families.append(metric_family)
+
+        for family_name, family_stats in _group_by_family(counter_stats or []):
+            counter_family = metric_set.metric_families.add()
+            counter_family.name = family_name
+            counter_family.type = COUNTER
+
+            for counter_stat in family_stats:
+                metric_proto = counter_family.metrics.add()
+                counter_stat.marshall_metric_proto(metric_proto)
+
         return metric_set
+
+
+def _group_by_family(
+    counter_stats: list[CounterStat],
+) -> list[tuple[str, list[CounterStat]]]:
+    """Group counters by metric family, preserving the order families first
+    appear in.
+    """
+    families: dict[str, list[CounterStat]] = {}
+    for stat in counter_stats:
+        families.setdefault(stat.family_name, []).append(stat)
+    return list(families.items())
@@ -408,6 +408,13 @@ class ConfigTest(unittest.TestCase):
                 "global.minCachedMessageSize",
                 "global.showWarningOnDirectExecution",
                 "global.storeCachedForwardMessagesInMemory",
+                "global.hashEngine",
+                "global.maxMessageCacheBytes",
+                "global.maxCacheMemoryBytes",
+                "global.messageCacheSpillDir",
+                "global.messageCacheSpillThreshold",
+                "global.maxDiskCacheBytes",
+                "global.cacheCompressionThresholdBytes",
                 "global.includeFragmentRunsInForwardMessageCacheCount",
                 "global.suppressDeprecationWarnings",
                 "global.unitTest",
@@ -428,6 +435,7 @@ class ConfigTest(unittest.TestCase):
                 "server.cookieSecret",
                 "server.scriptHealthCheckEnabled",
                 "server.enableWebsocketCompression",
+                "server.enableWebsocketBatching",
                 "server.enableXsrfProtection",
                 "server.fileWatcherType",
                 "server.folderWatchBlacklist",
@@ -440,6 +448,7 @@ class ConfigTest(unittest.TestCase):
                 "server.maxMessageSize",
                 "server.enableStaticServing",
                 "server.enableArrowTruncation",
+                "server.streamAddRows",
                 "server.sslCertFile",
                 "server.sslKeyFile",
                 "server.disconnectedSessionTTL",
@@ -217,6 +217,139 @@ class DataframeUtilTest(unittest.TestCase):
         self.assertEqual(reconstructed_df.shape[0], metadata.expected_rows)
         self.assertEqual(reconstructed_df.shape[1], metadata.expected_cols)
 
+    def test_convert_anything_to_arrow_bytes_reads_arrow_streams(self):
+        """Test that objects implementing the Arrow PyCapsule stream protocol
+        are converted without a round-trip through Pandas.
+        """
+        table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+        class ArrowStream:
+            def __arrow_c_stream__(self, requested_schema=None):
+                return table.__arrow_c_stream__(requested_schema)
+
+        with patch(
+            "streamlit.dataframe_util.convert_anything_to_pandas_df"
+        ) as convert_to_pandas:
+            converted_bytes = dataframe_util.convert_anything_to_arrow_bytes(
+                ArrowStream()
+            )
+        convert_to_pandas.assert_not_called()
+        self.assertTrue(
+            dataframe_util.convert_arrow_bytes_to_pandas_df(converted_bytes).equals(
+                table.to_pandas()
+            )
+        )
+
+    def test_convert_anything_to_arrow_bytes_converts_pandas_via_pandas(self):
+        """Test that Pandas objects aren't converted via the protocols they
+        implement, since the Pandas conversion fixes incompatible columns.
+        """
+        self.assertIsNone(
+            dataframe_util._convert_to_arrow_table(pd.DataFrame({"a": [1]}), 10)
+        )
+
+    def test_cast_to_regular_arrow_types(self):
+        """Test that large and nested types are cast to the regular types
+        that the frontend supports.
+        """
+        table = pa.table(
+            {
+                "str": pa.array(["a", "b"], pa.large_string()),
+                "bin": pa.array([b"a", b"b"], pa.large_binary()),
+                "list": pa.array([["a"], ["b"]], pa.large_list(pa.large_string())),
+                "struct": pa.array(
+                    [{"x": "a"}, {"x": "b"}], pa.struct([("x", pa.large_string())])
+                ),
+                "dict": pa.array(["a", "b"], pa.large_string()).dictionary_encode(),
+                "int": pa.array([1, 2], pa.int64()),
+            }
+        )
+
+        cast_table = dataframe_util._cast_to_regular_arrow_types(table)
+
+        self.assertEqual(
+            pa.schema(
+                [
+                    ("str", pa.string()),
+                    ("bin", pa.binary()),
+                    ("list", pa.list_(pa.string())),
+                    ("struct", pa.struct([("x", pa.string())])),
+                    ("dict", pa.dictionary(pa.int32(), pa.string())),
+                    ("int", pa.int64()),
+                ]
+            ),
+            cast_table.schema,
+        )
+        self.assertEqual(table.to_pylist(), cast_table.to_pylist())
+
+    @patch_config_options(
+        {"server.maxMessageSize": 1, "server.enableArrowTruncation": True}
+    )
+    def test_read_arrow_stream_drops_batches_beyond_max_message_size(self):
+        """Test that batches that don't fit into the message are only counted."""
+        batch = pa.record_batch({"a": pa.array(range(100_000), pa.int64())})
+        reader = pa.RecordBatchReader.from_batches(batch.schema, [batch] * 5)
+
+        table, truncated_rows = dataframe_util._read_arrow_stream(reader)
+
+        # The first two batches exceed the 1 MB limit, the rest are skipped.
+        self.assertEqual(200_000, table.num_rows)
+        self.assertEqual(300_000, truncated_rows)
+
+    @patch_config_options({"server.enableArrowTruncation": False})
+    def test_read_arrow_stream_without_truncation(self):
+        batch = pa.record_batch({"a": pa.array(range(100_000), pa.int64())})
+        reader = pa.RecordBatchReader.from_batches(batch.schema, [batch] * 5)
+
+        table, truncated_rows = dataframe_util._read_arrow_stream(reader)
+
+        self.assertEqual(500_000, table.num_rows)
+        self.assertIsNone(truncated_rows)
+
+    @pytest.mark.require_integration
+    def test_verify_polars_direct_arrow_conversion(self):
+        """Test that Polars objects are converted to Arrow bytes without a
+        round-trip through Pandas.
+        """
+        import polars as pl
+
+        df = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [[1], [2], []]})
+
+        with patch(
+            "streamlit.dataframe_util.convert_anything_to_pandas_df"
+        ) as convert_to_pandas:
+            for data in (df, df["b"], df.lazy()):
+                converted_bytes = dataframe_util.convert_anything_to_arrow_bytes(data)
+                table = dataframe_util.convert_arrow_bytes_to_pandas_df(converted_bytes)
+                self.assertEqual(3, table.shape[0])
+        convert_to_pandas.assert_not_called()
+
+        lazy_table = dataframe_util._convert_to_arrow_table(df.lazy(), 2)
+        assert lazy_table is not None
+        self.assertEqual(2, lazy_table[0].num_rows)
+        self.assertEqual(pa.string(), lazy_table[0].schema.field("b").type)
+
+    @pytest.mark.require_integration
+    def test_verify_duckdb_direct_arrow_conversion(self):
+        """Test that DuckDB relations are limited and converted to Arrow
+        without a round-trip through Pandas.
+        """
+        import duckdb
+
+        relation = duckdb.sql("SELECT range AS a FROM range(100)")
+
+        with patch(
+            "streamlit.dataframe_util.convert_anything_to_pandas_df"
+        ) as convert_to_pandas:
+            converted_bytes = dataframe_util.convert_anything_to_arrow_bytes(
+                relation, max_unevaluated_rows=10
+            )
+        convert_to_pandas.assert_not_called()
+        self.assertEqual(
+            10,
+            dataframe_util.convert_arrow_bytes_to_pandas_df(converted_bytes).shape[0],
+        )
+
     @parameterized.expand(
         [
             # Complex numbers:
@@ -825,8 +958,8 @@ class TestArrowTruncation(DeltaGeneratorTestCase):
         {"server.maxMessageSize": 3, "server.enableArrowTruncation": True}
     )
     def test_truncate_larger_table(self):
-        """Test that `_maybe_truncate_table` correctly truncates a table that is
-        larger than the max message size.
+        """Test that `convert_arrow_table_to_arrow_bytes` correctly truncates a
+        table that is larger than the max message size.
         """
         col_data = list(range(200000))
         original_df = pd.DataFrame(
@@ -838,15 +971,16 @@ class TestArrowTruncation(DeltaGeneratorTestCase):
         )
 
         original_table = pa.Table.from_pandas(original_df)
-        truncated_table = dataframe_util._maybe_truncate_table(
-            pa.Table.from_pandas(original_df)
-        )
-        # Should be under the configured 3MB limit:
-        self.assertLess(truncated_table.nbytes, 3 * int(1e6))
+        arrow_bytes = dataframe_util.convert_arrow_table_to_arrow_bytes(original_table)
+        truncated_table = pa.ipc.open_stream(arrow_bytes).read_all()
+        # Should be under the configured 3MB limit, minus the protobuf overhead:
+        self.assertLessEqual(len(arrow_bytes), 2 * int(1e6))
 
         # Test that the table should have been truncated
-        self.assertLess(truncated_table.nbytes, original_table.nbytes)
         self.assertLess(truncated_table.num_rows, original_table.num_rows)
+        self.assertTrue(
+            truncated_table.equals(original_table.slice(0, truncated_table.num_rows))
+        )
 
         # Test that it prints out a caption test:
         el = self.get_delta_from_queue().new_element
@@ -857,7 +991,8 @@ class TestArrowTruncation(DeltaGeneratorTestCase):
         {"server.maxMessageSize": 3, "server.enableArrowTruncation": True}
     )
     def test_dont_truncate_smaller_table(self):
-        """Test that `_maybe_truncate_table` doesn't truncate smaller tables."""
+        """Test that `convert_arrow_table_to_arrow_bytes` doesn't truncate
+        smaller tables."""
         col_data = list(range(100))
         original_df = pd.DataFrame(
             {
@@ -868,18 +1003,20 @@ class TestArrowTruncation(DeltaGeneratorTestCase):
         )
 
         original_table = pa.Table.from_pandas(original_df)
-        truncated_table = dataframe_util._maybe_truncate_table(
-            pa.Table.from_pandas(original_df)
-        )
+        truncated_table = pa.ipc.open_stream(
+            dataframe_util.convert_arrow_table_to_arrow_bytes(original_table)
+        ).read_all()
 
         # Test that the tables are the same:
-        self.assertEqual(truncated_table.nbytes, original_table.nbytes)
-        self.assertEqual(truncated_table.num_rows, original_table.num_rows)
+        self.assertTrue(truncated_table.equals(original_table))
+        self.assertEqual(len(self.get_all_deltas_from_queue()), 0)
 
-    @patch_config_options({"server.enableArrowTruncation": False})
+    @patch_config_options(
+        {"server.maxMessageSize": 3, "server.enableArrowTruncation": False}
+    )
     def test_dont_truncate_if_deactivated(self):
-        """Test that `_maybe_truncate_table` doesn't do anything
-        when server.enableArrowTruncation is decatived
+        """Test that `convert_arrow_table_to_arrow_bytes` doesn't truncate
+        when server.enableArrowTruncation is deactivated
         """
         col_data = list(range(200000))
         original_df = pd.DataFrame(
@@ -891,13 +1028,72 @@ class TestArrowTruncation(DeltaGeneratorTestCase):
         )
 
         original_table = pa.Table.from_pandas(original_df)
-        truncated_table = dataframe_util._maybe_truncate_table(
-            pa.Table.from_pandas(original_df)
-        )
+        truncated_table = pa.ipc.open_stream(
+            dataframe_util.convert_arrow_table_to_arrow_bytes(original_table)
+        ).read_all()
 
         # Test that the tables are the same:
-        self.assertEqual(truncated_table.nbytes, original_table.nbytes)
-        self.assertEqual(truncated_table.num_rows, original_table.num_rows)
+        self.assertTrue(truncated_table.equals(original_table))
+
+    @parameterized.expand(
+        [
+            (
+                "strings",
+                pa.table({"s": ["x" * (i % 300) for i in range(5000)]}),
+            ),
+            (
+                "nested",
+                pa.table(
+                    {
+                        "list": [[i] * (i % 7) for i in range(5000)],
+                        "struct": [{"a": i, "b": str(i) * 3} for i in range(5000)],
+                    }
+                ),
+            ),
+            (
+                "dictionary",
+                pa.table(
+                    {
+                        "d": pa.array(
+                            [f"category {i % 50}" for i in range(5000)]
+                        ).dictionary_encode(),
+                        "i": list(range(5000)),
+                    }
+                ),
+            ),
+        ]
+    )
+    def test_truncated_stream_is_exact(self, _, table):
+        """Test that the largest prefix of rows that fits is kept."""
+        full_bytes, _ = dataframe_util._write_truncated_arrow_stream(
+            table, 10**9, chunk_rows=100
+        )
+        max_bytes = len(full_bytes) // 3
+
+        arrow_bytes, num_rows = dataframe_util._write_truncated_arrow_stream(
+            table, max_bytes, chunk_rows=100
+        )
+        self.assertLessEqual(len(arrow_bytes), max_bytes)
+        self.assertTrue(
+            pa.ipc.open_stream(arrow_bytes).read_all().equals(table.slice(0, num_rows))
+        )
+
+        # One more row wouldn't fit:
+        larger_bytes, _ = dataframe_util._write_truncated_arrow_stream(
+            table.slice(0, num_rows + 1), 10**9, chunk_rows=100
+        )
+        self.assertGreater(len(larger_bytes), max_bytes)
+
+    def test_truncated_stream_keeps_one_row(self):
+        """Test that at least one row is kept, even if it doesn't fit."""
+        table = pa.table({"s": ["x" * 1000, "y"]})
+
+        arrow_bytes, num_rows = dataframe_util._write_truncated_arrow_stream(table, 10)
+
+        self.assertEqual(num_rows, 1)
+        self.assertTrue(
+            pa.ipc.open_stream(arrow_bytes).read_all().equals(table.slice(0, 1))
+        )
 
     @patch_config_options(
         {"server.maxMessageSize": 3, "server.enableArrowTruncation": True}
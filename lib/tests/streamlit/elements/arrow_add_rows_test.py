@@ -15,11 +15,16 @@
 """Unit test of dg.add_rows()."""
 
 import pandas as pd
+import pyarrow as pa
 from parameterized import parameterized
 
 import streamlit as st
-from streamlit.dataframe_util import convert_arrow_bytes_to_pandas_df
+from streamlit.dataframe_util import (
+    convert_arrow_bytes_to_pandas_df,
+    strip_arrow_stream_schema,
+)
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
+from tests.testutil import patch_config_options
 
 DATAFRAME = pd.DataFrame({"a": [10], "b": [20], "c": [30]})
 NEW_ROWS = pd.DataFrame({"a": [11, 12, 13], "b": [21, 22, 23], "c": [31, 32, 33]})
@@ -202,3 +207,63 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
         )
 
         pd.testing.assert_frame_equal(proto, expected)
+
+
+class StreamedAddRowsTest(DeltaGeneratorTestCase):
+    """Test dg.add_rows with server.streamAddRows."""
+
+    @patch_config_options({"server.streamAddRows": True})
+    def test_schema_is_only_sent_once(self):
+        element = st.dataframe(DATAFRAME)
+        element.add_rows(NEW_ROWS)
+        first = self.get_delta_from_queue().arrow_add_rows
+        self.forward_msg_queue.clear()
+        # The range index of these rows has a different length.
+        element.add_rows(NEW_ROWS.iloc[:1])
+        second = self.get_delta_from_queue().arrow_add_rows
+
+        self.assertTrue(first.is_streamed)
+        self.assertFalse(first.schema_omitted)
+        self.assertTrue(second.is_streamed)
+        self.assertTrue(second.schema_omitted)
+
+        rows = first.data.data
+        schema = rows[: len(rows) - len(strip_arrow_stream_schema(rows))]
+        table = pa.ipc.open_stream(schema + second.data.data).read_all()
+        self.assertEqual([11], table.column("a").to_pylist())
+
+    @patch_config_options({"server.streamAddRows": True})
+    def test_schema_is_sent_when_it_changes(self):
+        element = st.dataframe(DATAFRAME)
+        element.add_rows(NEW_ROWS)
+        self.forward_msg_queue.clear()
+        element.add_rows(NEW_ROWS.astype(float))
+
+        add_rows = self.get_delta_from_queue().arrow_add_rows
+        self.assertTrue(add_rows.is_streamed)
+        self.assertFalse(add_rows.schema_omitted)
+
+    @patch_config_options({"server.streamAddRows": True})
+    def test_streamed_rows_are_merged(self):
+        """Rows that are appended before the queue is flushed are sent in a
+        single message."""
+        element = st.line_chart(DATAFRAME)
+        element.add_rows(NEW_ROWS)
+        element.add_rows(NEW_ROWS)
+
+        deltas = self.get_all_deltas_from_queue()
+        self.assertEqual(2, len(deltas))
+        add_rows = deltas[1].arrow_add_rows
+        self.assertFalse(add_rows.schema_omitted)
+        table = pa.ipc.open_stream(add_rows.data.data).read_all()
+        self.assertEqual(
+            [1, 2, 3, 1, 2, 3, 1, 2, 3, 4, 5, 6, 4, 5, 6, 4, 5, 6],
+            table.column("index--p5bJXXpQgvPz6yvQMFiy").to_pylist(),
+        )
+
+    @patch_config_options({"server.streamAddRows": True})
+    def test_styler_is_not_streamed(self):
+        element = st.dataframe(DATAFRAME.style)
+        element.add_rows(NEW_ROWS.style)
+
+        self.assertFalse(self.get_delta_from_queue().arrow_add_rows.is_streamed)
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import errno
 import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -339,3 +340,49 @@ class FileInPythonPathTest(unittest.TestCase):
             file_util.normalize_path_join("some", "random", "path", "../.."),
             "some",
         )
+
+
+class StreamlitWriteAtomicTest(unittest.TestCase):
+    def test_streamlit_write_atomic(self):
+        """An atomic write replaces the file only once it has been written."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "file")
+            with open(path, "w") as f:
+                f.write("old data")
+
+            with (
+                patch(
+                    "streamlit.file_util.get_streamlit_file_path",
+                    MagicMock(return_value=path),
+                ),
+                file_util.streamlit_write(path, atomic=True) as output,
+            ):
+                output.write("new data")
+                with open(path) as f:
+                    self.assertEqual("old data", f.read())
+
+            with open(path) as f:
+                self.assertEqual("new data", f.read())
+            self.assertEqual(["file"], os.listdir(tmpdir))
+
+    def test_streamlit_write_atomic_exception(self):
+        """A failed atomic write leaves the existing file untouched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "file")
+            with open(path, "w") as f:
+                f.write("old data")
+
+            with (
+                patch(
+                    "streamlit.file_util.get_streamlit_file_path",
+                    MagicMock(return_value=path),
+                ),
+                pytest.raises(RuntimeError),
+                file_util.streamlit_write(path, atomic=True) as output,
+            ):
+                output.write("new data")
+                raise RuntimeError("write failed")
+
+            with open(path) as f:
+                self.assertEqual("old data", f.read())
+            self.assertEqual(["file"], os.listdir(tmpdir))
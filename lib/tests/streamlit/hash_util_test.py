@@ -0,0 +1,68 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import unittest
+from unittest.mock import patch
+
+from parameterized import parameterized
+
+from streamlit import hash_util
+from tests.testutil import patch_config_options
+
+
+class HashUtilTest(unittest.TestCase):
+    def setUp(self):
+        hash_util.get_hasher_factory.cache_clear()
+
+    def tearDown(self):
+        hash_util.get_hasher_factory.cache_clear()
+
+    @parameterized.expand(list(hash_util.HASH_ENGINES) + ["auto"])
+    def test_calc_hash(self, engine: str):
+        """All engines produce stable digests of the same length."""
+        with patch_config_options({"global.hashEngine": engine}):
+            digest = hash_util.calc_hash(b"streamlit")
+            self.assertEqual(32, len(digest))
+            self.assertEqual(digest, hash_util.calc_hash("streamlit"))
+            self.assertNotEqual(digest, hash_util.calc_hash(b"streamlit!"))
+
+    @patch_config_options({"global.hashEngine": "md5"})
+    def test_md5_engine(self):
+        self.assertEqual(
+            hashlib.new("md5", b"streamlit", usedforsecurity=False).hexdigest(),
+            hash_util.calc_hash(b"streamlit"),
+        )
+
+    def test_unknown_engine_falls_back(self):
+        with patch.object(hash_util, "_LOGGER") as logger:
+            factory = hash_util.get_hasher_factory("not-an-engine")
+
+        logger.warning.assert_called_once()
+        self.assertIs(hash_util.get_hasher_factory("auto"), factory)
+
+    def test_auto_falls_back_to_stdlib(self):
+        """Without any optional hash module installed, "auto" uses sha256."""
+
+        def not_installed():
+            raise ImportError
+
+        with patch.dict(
+            hash_util.HASH_ENGINES, {"xxhash": not_installed, "blake3": not_installed}
+        ):
+            factory = hash_util.get_hasher_factory("auto")
+
+        self.assertIs(hash_util.HASH_ENGINES["sha256"], factory)
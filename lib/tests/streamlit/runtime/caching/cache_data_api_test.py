@@ -25,6 +25,8 @@ import unittest
 from typing import Any
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
+import numpy as np
+import pandas as pd
 from parameterized import parameterized
 
 import streamlit as st
@@ -33,7 +35,12 @@ from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Text_pb2 import Text as TextProto
 from streamlit.runtime import Runtime
 from streamlit.runtime.caching import cached_message_replay
-from streamlit.runtime.caching.cache_data_api import get_data_cache_stats_provider
+from streamlit.runtime.caching.cache_data_api import (
+    _data_caches,
+    _deserialize_entry,
+    _serialize_entry,
+    get_data_cache_stats_provider,
+)
 from streamlit.runtime.caching.cache_errors import CacheError
 from streamlit.runtime.caching.cached_message_replay import (
     CachedResult,
@@ -119,6 +126,40 @@ class CacheDataTest(unittest.TestCase):
         self.assertEqual(r1, [1, 1])
         self.assertEqual(r2, [0, 1])
 
+    def test_arrays_are_shared_and_read_only(self):
+        """By default, cache hits share the memory of the cached arrays."""
+
+        @st.cache_data
+        def f():
+            return np.arange(1000)
+
+        r1 = f()
+        r2 = f()
+        r3 = f()
+
+        np.testing.assert_array_equal(np.arange(1000), r2)
+        self.assertTrue(np.shares_memory(r2, r3))
+        self.assertFalse(r2.flags.writeable)
+        with self.assertRaises(ValueError):
+            r2[0] = 1
+        # The value returned by the function itself is not affected.
+        self.assertTrue(r1.flags.writeable)
+
+    def test_copy_returns_writable_arrays(self):
+        """With copy=True, every cache hit gets its own copy of the arrays."""
+
+        @st.cache_data(copy=True)
+        def f():
+            return pd.DataFrame({"a": np.arange(1000)})
+
+        f()
+        r1 = f()
+        r1.loc[0, "a"] = 1000
+        r2 = f()
+
+        self.assertEqual(1000, r1.loc[0, "a"])
+        self.assertEqual(0, r2.loc[0, "a"])
+
     def test_cached_member_function_with_hash_func(self):
         """@st.cache_data can be applied to class member functions
         with corresponding hash_func.
@@ -516,8 +557,8 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         foo(1)
 
     @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
-    def test_warning_memo_ttl_persist(self, _):
-        """Using @st.cache_data with ttl and persist produces a warning."""
+    def test_no_warning_memo_ttl_persist(self, _):
+        """Using @st.cache_data with ttl and persist doesn't produce a warning."""
         with self.assertLogs(
             "streamlit.runtime.caching.storage.local_disk_cache_storage",
             level=logging.WARNING,
@@ -529,11 +570,12 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
 
             st.write(user_function())
 
+            logging.getLogger(
+                "streamlit.runtime.caching.storage.local_disk_cache_storage"
+            ).warning("irrelevant warning so assertLogs passes")
+
             output = "".join(logs.output)
-            self.assertIn(
-                "The cached function 'user_function' has a TTL that will be ignored.",
-                output,
-            )
+            self.assertNotIn("has a TTL that will be ignored", output)
 
     @parameterized.expand(
         [
@@ -565,6 +607,207 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
             mock_write.assert_not_called()
 
 
+class CacheDataBackgroundRefreshTest(unittest.TestCase):
+    def setUp(self) -> None:
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+        Runtime._instance = mock_runtime
+
+        self.executor = MagicMock()
+        executor_patch = patch(
+            "streamlit.runtime.caching.cache_utils._get_refresh_executor",
+            return_value=self.executor,
+        )
+        executor_patch.start()
+        self.addCleanup(executor_patch.stop)
+
+        self.now = 1000.0
+        time_patch = patch(
+            "streamlit.runtime.caching.cache_data_api.time.time",
+            side_effect=lambda: self.now,
+        )
+        time_patch.start()
+        self.addCleanup(time_patch.stop)
+
+    def tearDown(self):
+        st.cache_data.clear()
+
+    def run_submitted_refresh(self) -> None:
+        fn, *args = self.executor.submit.call_args.args
+        fn(*args)
+
+    def test_fresh_value_is_not_refreshed(self):
+        """Entries within their ttl are returned without scheduling a refresh."""
+        calls = []
+
+        @st.cache_data(ttl=60, refresh="background")
+        def foo():
+            calls.append(None)
+            return len(calls)
+
+        assert foo() == 1
+        self.now += 59
+        assert foo() == 1
+        self.executor.submit.assert_not_called()
+
+    def test_stale_value_is_returned_while_refreshing(self):
+        """Stale entries are returned right away, and recomputed once in the
+        background no matter how often they're requested.
+        """
+        calls = []
+
+        @st.cache_data(ttl=60, refresh="background")
+        def foo():
+            calls.append(None)
+            return len(calls)
+
+        assert foo() == 1
+        self.now += 61
+        assert foo() == 1
+        assert foo() == 1
+        self.executor.submit.assert_called_once()
+        assert len(calls) == 1
+
+        self.run_submitted_refresh()
+        assert len(calls) == 2
+        assert foo() == 2
+
+        # The refreshed entry is fresh again, and a new refresh can be
+        # scheduled once it goes stale.
+        self.executor.submit.reset_mock()
+        self.now += 61
+        assert foo() == 2
+        self.executor.submit.assert_called_once()
+
+    def test_refresh_skipped_if_recomputed_meanwhile(self):
+        """A scheduled refresh doesn't rerun the function if the entry was
+        recomputed after it was scheduled.
+        """
+        calls = []
+
+        @st.cache_data(ttl=60, refresh="background")
+        def foo():
+            calls.append(None)
+            return len(calls)
+
+        foo()
+        self.now += 61
+        foo()
+        fn, *args = self.executor.submit.call_args.args
+        fn(*args)
+        fn(*args)
+        assert len(calls) == 2
+
+    def test_failed_refresh_keeps_stale_value(self):
+        """If recomputing fails, the stale value is still returned."""
+        should_fail = False
+
+        @st.cache_data(ttl=60, refresh="background")
+        def foo():
+            if should_fail:
+                raise RuntimeError("boom")
+            return "value"
+
+        foo()
+        should_fail = True
+        self.now += 61
+        assert foo() == "value"
+
+        with self.assertLogs(
+            "streamlit.runtime.caching.cache_utils", level=logging.ERROR
+        ) as logs:
+            self.run_submitted_refresh()
+        assert "Failed to refresh" in logs.output[0]
+
+        # The failed refresh can be retried.
+        self.executor.submit.reset_mock()
+        assert foo() == "value"
+        self.executor.submit.assert_called_once()
+
+    @parameterized.expand(
+        [
+            ("blocking", "blocking", None, 60),
+            ("default_staleness", "background", None, 120),
+            ("explicit_staleness", "background", 30, 90),
+            ("string_staleness", "background", "1m", 120),
+        ]
+    )
+    def test_storage_ttl(self, _, refresh, max_staleness, expected_ttl):
+        """Storage keeps entries for up to max_staleness past their ttl."""
+        cache = _data_caches.get_cache(
+            key="storage_ttl",
+            persist=None,
+            max_entries=None,
+            ttl=60,
+            display_name="storage_ttl",
+            refresh=refresh,
+            max_staleness=max_staleness,
+        )
+        assert cache.ttl_seconds == 60
+        assert cache.storage_ttl_seconds == expected_ttl
+
+    def test_refresh_requires_ttl(self):
+        with self.assertRaisesRegex(StreamlitAPIException, "requires a `ttl`"):
+
+            @st.cache_data(refresh="background")
+            def foo():
+                return 1
+
+    def test_invalid_refresh(self):
+        with self.assertRaisesRegex(StreamlitAPIException, "Unsupported refresh"):
+
+            @st.cache_data(ttl=60, refresh="eventually")  # type: ignore[arg-type]
+            def foo():
+                return 1
+
+
+class CacheDataSerializationTest(unittest.TestCase):
+    def test_plain_values_are_plain_pickles(self):
+        """Entries without out-of-band buffers stay readable as plain pickles."""
+        entry = as_cached_result({"a": [1, 2, 3]})
+        data = _serialize_entry(entry)
+
+        self.assertEqual(entry.value, pickle.loads(data).value)
+
+    def test_reads_plain_pickles(self):
+        """Entries written as plain pickles by earlier versions can be read."""
+        entry = as_cached_result(np.arange(10))
+        result = _deserialize_entry(pickle.dumps(entry), copy=False)
+
+        np.testing.assert_array_equal(np.arange(10), result.value)
+
+    @parameterized.expand([(False,), (True,)])
+    def test_round_trip(self, copy: bool):
+        df = pd.DataFrame(
+            {"a": np.arange(100), "b": np.random.rand(100), "c": ["x"] * 100}
+        )
+        fortran = np.asfortranarray(np.random.rand(5, 7))
+        entry = as_cached_result({"df": df, "fortran": fortran})
+
+        result = _deserialize_entry(_serialize_entry(entry), copy=copy)
+
+        pd.testing.assert_frame_equal(df, result.value["df"])
+        np.testing.assert_array_equal(fortran, result.value["fortran"])
+        self.assertEqual(copy, result.value["fortran"].flags.writeable)
+
+    def test_frames_are_aligned(self):
+        """Out-of-band buffers are stored at aligned offsets."""
+        data = _serialize_entry(as_cached_result([np.arange(3), np.arange(5)]))
+        result = _deserialize_entry(data, copy=False)
+
+        base_address = np.frombuffer(data, dtype=np.uint8).ctypes.data
+        for array in result.value:
+            self.assertTrue(array.flags.aligned)
+            self.assertEqual(0, (array.ctypes.data - base_address) % 64)
+
+    def test_truncated_entry(self):
+        data = _serialize_entry(as_cached_result(np.arange(1000)))
+
+        with self.assertRaises(pickle.UnpicklingError):
+            _deserialize_entry(data[:-10], copy=False)
+
+
 class CacheDataStatsProviderTest(unittest.TestCase):
     def setUp(self):
         # Caching functions rely on an active script run ctx
@@ -622,6 +865,39 @@ class CacheDataStatsProviderTest(unittest.TestCase):
             set(expected), set(get_data_cache_stats_provider().get_stats())
         )
 
+    def test_memory_usage_and_eviction(self):
+        """The data caches report their memory usage to the MemoryGovernor,
+        and can evict single entries.
+        """
+        call_count = [0]
+
+        @st.cache_data
+        def foo(count):
+            call_count[0] += 1
+            return [3.14] * count
+
+        foo(1)
+        foo(53)
+        provider = get_data_cache_stats_provider()
+
+        self.assertEqual(
+            sum(stat.byte_length for stat in provider.get_stats()),
+            provider.get_memory_usage(),
+        )
+
+        candidates = provider.get_eviction_candidates()
+        self.assertEqual(2, len(candidates))
+        largest = max(candidates, key=lambda candidate: candidate.byte_length)
+        self.assertEqual(largest.byte_length, provider.evict(largest.key))
+        self.assertEqual(0, provider.evict(largest.key))
+        self.assertEqual(1, len(provider.get_eviction_candidates()))
+
+        # The evicted entry is recomputed, the other one is still cached.
+        foo(1)
+        self.assertEqual(2, call_count[0])
+        foo(53)
+        self.assertEqual(3, call_count[0])
+
 
 class CacheDataValidateParamsTest(DeltaGeneratorTestCase):
     """st.cache_data disk persistence tests"""
@@ -721,6 +997,36 @@ class CacheDataMessageReplayTest(DeltaGeneratorTestCase):
             # The third time the cached function is called, the replay function is called
             replay_cached_messages_mock.assert_called()
 
+    def test_stale_element_replay_is_recomputed_in_foreground(self):
+        """Stale results that replay elements are recomputed before returning,
+        since elements can't be recorded on a background thread.
+        """
+        calls = []
+
+        @st.cache_data(ttl=60, refresh="background")
+        def cache_element():
+            calls.append(None)
+            st.text(f"call {len(calls)}")
+
+        executor = MagicMock()
+        with (
+            patch(
+                "streamlit.runtime.caching.cache_utils._get_refresh_executor",
+                return_value=executor,
+            ),
+            patch(
+                "streamlit.runtime.caching.cache_data_api.time.time",
+                return_value=1000.0,
+            ) as mock_time,
+        ):
+            cache_element()
+            mock_time.return_value = 1061.0
+            cache_element()
+
+        executor.submit.assert_not_called()
+        assert len(calls) == 2
+        assert self.get_delta_from_queue().new_element.text.body == "call 2"
+
 
 def get_byte_length(value):
     """Return the byte length of the pickled value."""
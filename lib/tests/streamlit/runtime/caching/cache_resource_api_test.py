@@ -21,6 +21,7 @@ import unittest
 from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock, patch
 
+import numpy as np
 from parameterized import parameterized
 
 import streamlit as st
@@ -30,8 +31,9 @@ from streamlit.runtime.caching import (
     get_resource_cache_stats_provider,
 )
 from streamlit.runtime.caching.hashing import UserHashError
+from streamlit.runtime.memory_governor import EvictableCache, MemoryUsageProvider
+from streamlit.runtime.object_size import measure_unknown_sizes
 from streamlit.runtime.scriptrunner import add_script_run_ctx
-from streamlit.runtime.stats import CacheStat
 from streamlit.vendor.pympler.asizeof import asizeof
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit.element_mocks import (
@@ -327,31 +329,69 @@ class CacheResourceStatsProviderTest(unittest.TestCase):
         foo(53)
         bar()
         bar()
+        # Neither value has a well-known type, so they're measured by the
+        # background sampler.
+        measure_unknown_sizes()
 
         foo_cache_name = f"{foo.__module__}.{foo.__qualname__}"
         bar_cache_name = f"{bar.__module__}.{bar.__qualname__}"
 
-        expected = [
-            CacheStat(
-                category_name="st_cache_resource",
-                cache_name=foo_cache_name,
-                byte_length=(
-                    get_byte_length(as_cached_result([3.14]))
-                    + get_byte_length(as_cached_result([3.14] * 53))
-                ),
+        expected = {
+            foo_cache_name: (
+                get_byte_length(as_cached_result([3.14]))
+                + get_byte_length(as_cached_result([3.14] * 53))
             ),
-            CacheStat(
-                category_name="st_cache_resource",
-                cache_name=bar_cache_name,
-                byte_length=get_byte_length(as_cached_result(bar())),
-            ),
-        ]
+            bar_cache_name: get_byte_length(as_cached_result(bar())),
+        }
+
+        stats = get_resource_cache_stats_provider().get_stats()
+        self.assertEqual({"st_cache_resource"}, {stat.category_name for stat in stats})
+        actual = {stat.cache_name: stat.byte_length for stat in stats}
+        self.assertEqual(expected.keys(), actual.keys())
+        for cache_name, byte_length in expected.items():
+            # asizeof's result varies by a few bytes depending on whether an
+            # object's instance dict was materialized when it was measured.
+            self.assertAlmostEqual(byte_length, actual[cache_name], delta=64)
+
+    def test_known_types_are_not_walked(self):
+        """Values of well-known types are measured cheaply when they're
+        written, without walking them.
+        """
+
+        @st.cache_resource
+        def foo():
+            return np.zeros(1000)
+
+        with patch("streamlit.runtime.object_size._measure_deep") as measure_deep:
+            foo()
+            measure_unknown_sizes()
+            stats = get_resource_cache_stats_provider().get_stats()
+
+        measure_deep.assert_not_called()
+        self.assertEqual(1, len(stats))
+        self.assertGreater(stats[0].byte_length, foo().nbytes)
+
+    def test_memory_usage_is_never_evicted(self):
+        """The resource caches report their memory usage to the MemoryGovernor,
+        but don't offer their entries for eviction, since the app may still
+        hold on to them.
+        """
+
+        @st.cache_resource
+        def foo(count):
+            return [3.14] * count
+
+        foo(1)
+        foo(53)
+        measure_unknown_sizes()
+        provider = get_resource_cache_stats_provider()
 
-        # The order of these is non-deterministic, so check Set equality
-        # instead of List equality
         self.assertEqual(
-            set(expected), set(get_resource_cache_stats_provider().get_stats())
+            sum(stat.byte_length for stat in provider.get_stats()),
+            provider.get_memory_usage(),
         )
+        self.assertIsInstance(provider, MemoryUsageProvider)
+        self.assertNotIsInstance(provider, EvictableCache)
 
 
 class CacheResourceMessageReplayTest(DeltaGeneratorTestCase):
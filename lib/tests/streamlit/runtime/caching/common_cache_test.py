@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
 import unittest
@@ -23,13 +24,16 @@ from datetime import timedelta
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 from parameterized import parameterized
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 from streamlit.runtime import Runtime
 from streamlit.runtime.caching import cache_data, cache_resource
 from streamlit.runtime.caching.cache_errors import CacheReplayClosureError
 from streamlit.runtime.caching.cache_utils import CachedResult
+from streamlit.runtime.caching.hashing import _NP_SIZE_LARGE
 from streamlit.runtime.caching.storage.dummy_cache_storage import (
     MemoryCacheStorageManager,
 )
@@ -113,6 +117,41 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         self.assertEqual(foo(1.0), 1.0)
         self.assertEqual(foo(3.0), 3.0)
 
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_full_hash_mode(self, _, cache_decorator):
+        """With hash_mode="full", every element of a large array is part of
+        the cache key.
+        """
+        call_count = [0]
+
+        @cache_decorator(hash_mode="full")
+        def foo(arr):
+            call_count[0] += 1
+            return arr.sum()
+
+        arr = np.zeros(_NP_SIZE_LARGE)
+        foo(arr)
+        foo(arr.copy())
+        self.assertEqual(1, call_count[0])
+
+        arr[-1] = 1
+        self.assertEqual(1, foo(arr))
+        self.assertEqual(2, call_count[0])
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_invalid_hash_mode(self, _, cache_decorator):
+        with self.assertRaisesRegex(
+            StreamlitAPIException, "Unsupported hash_mode option 'all'"
+        ):
+
+            @cache_decorator(hash_mode="all")
+            def foo():
+                return 42
+
     @parameterized.expand(
         [("cache_data", cache_data), ("cache_resource", cache_resource)]
     )
@@ -684,6 +723,139 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         self.assertEqual(empty_elements_count, 1)
 
 
+class CommonCacheAsyncTest(DeltaGeneratorTestCase):
+    def tearDown(self):
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        super().tearDown()
+
+    def get_text_delta_contents(self) -> list[str]:
+        deltas = self.get_all_deltas_from_queue()
+        return [
+            element.text.body
+            for element in (delta.new_element for delta in deltas)
+            if element.WhichOneof("type") == "text"
+        ]
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_async_simple(self, _, cache_decorator):
+        """Cached coroutine functions return awaitables of the cached value."""
+        calls = []
+
+        @cache_decorator
+        async def foo(x):
+            calls.append(x)
+            await asyncio.sleep(0)
+            return x * 2
+
+        assert asyncio.run(foo(21)) == 42
+        assert asyncio.run(foo(21)) == 42
+        assert asyncio.run(foo(1)) == 2
+        assert calls == [21, 1]
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_async_concurrent_misses_are_coalesced(self, _, cache_decorator):
+        """Concurrent misses on the same value await a single call."""
+        calls = []
+
+        @cache_decorator
+        async def foo():
+            calls.append(None)
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def main():
+            return await asyncio.gather(*(foo() for _ in range(5)))
+
+        assert asyncio.run(main()) == [42] * 5
+        assert len(calls) == 1
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_async_error_is_shared_and_not_cached(self, _, cache_decorator):
+        """Waiters get the error of the call they waited for, and the next
+        call retries.
+        """
+        calls = []
+
+        @cache_decorator
+        async def foo():
+            calls.append(None)
+            await asyncio.sleep(0.05)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return 42
+
+        async def main():
+            return await asyncio.gather(
+                *(foo() for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(calls) == 1
+
+        assert asyncio.run(foo()) == 42
+        assert len(calls) == 2
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_async_waiters_retry_if_owner_is_cancelled(self, _, cache_decorator):
+        """If the call that's awaited by others is cancelled, one of the
+        waiters calls the function instead.
+        """
+        calls = []
+
+        @cache_decorator
+        async def foo():
+            calls.append(None)
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def main():
+            owner = asyncio.ensure_future(foo())
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(foo())
+            await asyncio.sleep(0)
+            owner.cancel()
+            return await waiter
+
+        assert asyncio.run(main()) == 42
+        assert len(calls) == 2
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_async_st_function_replay(self, _, cache_decorator):
+        """Elements of cached coroutines awaited concurrently are recorded
+        separately, and replayed on cache hits.
+        """
+
+        @cache_decorator
+        async def foo(i):
+            st.text(f"{i}a")
+            await asyncio.sleep(0.01)
+            st.text(f"{i}b")
+            return i
+
+        async def main():
+            return await asyncio.gather(foo(1), foo(2))
+
+        assert asyncio.run(main()) == [1, 2]
+        assert sorted(self.get_text_delta_contents()) == ["1a", "1b", "2a", "2b"]
+
+        self.forward_msg_queue.clear()
+        assert asyncio.run(foo(1)) == 1
+        assert asyncio.run(foo(2)) == 2
+        assert self.get_text_delta_contents() == ["1a", "1b", "2a", "2b"]
+
+
 class CommonCacheTTLTest(unittest.TestCase):
     def setUp(self) -> None:
         # Caching functions rely on an active script run ctx
@@ -944,6 +1116,28 @@ class CommonCacheThreadingTest(unittest.TestCase):
         # Sanity check: ensure we can still call our cached function.
         self.assertEqual(42, foo())
 
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_async_compute_value_only_once(self, _, cache_decorator):
+        """Cached coroutines are awaited only once, even if multiple sessions,
+        each with its own event loop, read from an unwarmed cache
+        simultaneously.
+        """
+        cached_func_call_count = [0]
+
+        @cache_decorator
+        async def foo():
+            cached_func_call_count[0] += 1
+            await asyncio.sleep(0.25)
+            return 42
+
+        def call_foo(_: int) -> None:
+            self.assertEqual(42, asyncio.run(foo()))
+
+        call_on_threads(call_foo, num_threads=self.NUM_THREADS, timeout=0.5)
+        self.assertEqual(1, cached_func_call_count[0])
+
 
 def test_arrow_replay():
     """Regression test for https://github.com/streamlit/streamlit/issues/6103"""
@@ -18,7 +18,9 @@ from __future__ import annotations
 
 import datetime
 import functools
+import gc
 import hashlib
+import importlib.util
 import os
 import re
 import tempfile
@@ -29,10 +31,11 @@ import uuid
 from dataclasses import dataclass
 from enum import Enum, auto
 from io import BytesIO, StringIO
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 import pandas as pd
+import pytest
 from parameterized import parameterized
 from PIL import Image
 
@@ -41,9 +44,13 @@ from streamlit.runtime.caching import cache_data, cache_resource
 from streamlit.runtime.caching.cache_errors import UnhashableTypeError
 from streamlit.runtime.caching.cache_type import CacheType
 from streamlit.runtime.caching.hashing import (
+    _IDENTITY_MEMO_MIN_BYTES,
+    _MEMOIZE_BY_ID_MIN_SIZE,
     _NP_SIZE_LARGE,
     _PANDAS_ROWS_LARGE,
     UserHashError,
+    _CacheFuncHasher,
+    _identity_hash_memo,
     update_hash,
 )
 from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
@@ -52,10 +59,14 @@ from streamlit.type_util import is_type
 get_main_script_director = MagicMock(return_value=os.getcwd())
 
 
-def get_hash(value, hash_funcs=None, cache_type=None):
+def get_hash(value, hash_funcs=None, cache_type=None, hash_mode=None):
     hasher = hashlib.new("md5", usedforsecurity=False)
     update_hash(
-        value, hasher, cache_type=cache_type or MagicMock(), hash_funcs=hash_funcs
+        value,
+        hasher,
+        cache_type=cache_type or MagicMock(),
+        hash_funcs=hash_funcs,
+        hash_mode=hash_mode,
     )
     return hasher.digest()
 
@@ -264,6 +275,46 @@ class HashTest(unittest.TestCase):
         self.assertEqual(get_hash(df1), get_hash(df3))
         self.assertNotEqual(get_hash(df1), get_hash(df2))
 
+    @patch("streamlit.runtime.caching.hashing._FULL_HASH_CHUNK_ROWS", 30_000)
+    def test_pandas_large_dataframe_full_hash_mode(self):
+        """With hash_mode="full", a change outside the sampled rows changes the
+        hash.
+        """
+        df1 = pd.DataFrame(
+            {"A": np.arange(_PANDAS_ROWS_LARGE), "B": ["x"] * _PANDAS_ROWS_LARGE}
+        )
+        sampled_rows = set(df1.sample(n=10_000, random_state=0).index)
+        row = next(i for i in range(_PANDAS_ROWS_LARGE) if i not in sampled_rows)
+        df2 = df1.copy()
+        df2.loc[row, "A"] = -1
+        df3 = df1.copy()
+        df4 = df1.rename(index={row: -1})
+
+        self.assertEqual(get_hash(df1), get_hash(df2))
+        self.assertEqual(
+            get_hash(df1, hash_mode="full"), get_hash(df3, hash_mode="full")
+        )
+        self.assertNotEqual(
+            get_hash(df1, hash_mode="full"), get_hash(df2, hash_mode="full")
+        )
+        self.assertNotEqual(
+            get_hash(df1, hash_mode="full"), get_hash(df4, hash_mode="full")
+        )
+
+    def test_pandas_large_dataframe_full_hash_mode_unhashable_column(self):
+        df1 = pd.DataFrame({"A": [[1]] * _PANDAS_ROWS_LARGE})
+        df2 = pd.DataFrame({"A": [[2]] * _PANDAS_ROWS_LARGE})
+
+        self.assertNotEqual(
+            get_hash(df1, hash_mode="full"), get_hash(df2, hash_mode="full")
+        )
+
+    def test_pandas_small_dataframe_hash_mode(self):
+        """Both modes hash dataframes that are too small to sample the same way."""
+        df = pd.DataFrame({"A": [1, 2, 3]})
+
+        self.assertEqual(get_hash(df), get_hash(df, hash_mode="full"))
+
     @parameterized.expand(
         [
             (pd.DataFrame({"foo": [12]}), pd.DataFrame({"foo": [12]}), True),
@@ -354,6 +405,18 @@ class HashTest(unittest.TestCase):
 
         self.assertEqual(get_hash(series4), get_hash(series5))
 
+    def test_pandas_large_series_full_hash_mode(self):
+        series1 = pd.Series(range(_PANDAS_ROWS_LARGE))
+        sampled_rows = set(series1.sample(n=10_000, random_state=0).index)
+        row = next(i for i in range(_PANDAS_ROWS_LARGE) if i not in sampled_rows)
+        series2 = series1.copy()
+        series2[row] = -1
+
+        self.assertEqual(get_hash(series1), get_hash(series2))
+        self.assertNotEqual(
+            get_hash(series1, hash_mode="full"), get_hash(series2, hash_mode="full")
+        )
+
     def test_pandas_series_similar_dtypes(self):
         series1 = pd.Series([1, 2], dtype="UInt64")
         series2 = pd.Series([1, 2], dtype="Int64")
@@ -373,6 +436,36 @@ class HashTest(unittest.TestCase):
 
         self.assertEqual(get_hash(np4), get_hash(np5))
 
+    @patch("streamlit.runtime.caching.hashing._FULL_HASH_CHUNK_BYTES", 1_000_000)
+    def test_numpy_large_full_hash_mode(self):
+        """With hash_mode="full", a change outside the sampled elements changes
+        the hash.
+        """
+        np1 = np.zeros((_NP_SIZE_LARGE // 4, 4))
+        np2 = np1.copy()
+        # The last element is hashed in its own chunk.
+        np2[-1, -1] = 1
+        np3 = np.asfortranarray(np1)
+
+        self.assertEqual(get_hash(np1), get_hash(np2))
+        self.assertEqual(
+            get_hash(np1, hash_mode="full"), get_hash(np3, hash_mode="full")
+        )
+        self.assertNotEqual(
+            get_hash(np1, hash_mode="full"), get_hash(np2, hash_mode="full")
+        )
+        self.assertNotEqual(
+            get_hash(np1, hash_mode="full"),
+            get_hash(np1.astype("i8"), hash_mode="full"),
+        )
+
+    def test_numpy_large_object_array_full_hash_mode(self):
+        np1 = np.array([None] * _NP_SIZE_LARGE, dtype=object)
+
+        self.assertEqual(
+            get_hash(np1, hash_mode="full"), get_hash(np1, hash_mode="full")
+        )
+
     def test_numpy_similar_dtypes(self):
         np1 = np.ones(10, dtype="u8")
         np2 = np.ones(10, dtype="i8")
@@ -519,6 +612,278 @@ class HashTest(unittest.TestCase):
 
         self.assertNotEqual(get_hash(enum_a), get_hash(enum_b))
 
+    def test_bytearray(self):
+        self.assertEqual(get_hash(bytearray(b"123")), get_hash(bytearray(b"123")))
+        self.assertNotEqual(get_hash(bytearray(b"123")), get_hash(bytearray(b"124")))
+
+    def test_subclasses_of_dispatched_types(self):
+        """Subclasses of types with a dedicated handler are hashed by value,
+        but differently from the base type.
+        """
+
+        class MyStr(str):
+            pass
+
+        class MyList(list):
+            pass
+
+        self.assertEqual(get_hash(MyStr("a")), get_hash(MyStr("a")))
+        self.assertNotEqual(get_hash(MyStr("a")), get_hash(MyStr("b")))
+        self.assertNotEqual(get_hash(MyStr("a")), get_hash("a"))
+        self.assertEqual(get_hash(MyList([1, 2])), get_hash(MyList([1, 2])))
+        self.assertNotEqual(get_hash(MyList([1, 2])), get_hash([1, 2]))
+
+    def test_hash_funcs_override_dispatched_types(self):
+        """User hash functions take precedence over built-in handlers."""
+        self.assertEqual(
+            get_hash(["ab", 1], hash_funcs={str: len}),
+            get_hash(["cd", 1], hash_funcs={str: len}),
+        )
+        self.assertEqual(
+            get_hash(pd.DataFrame({"a": [1]}), hash_funcs={pd.DataFrame: len}),
+            get_hash(pd.DataFrame({"a": [2]}), hash_funcs={pd.DataFrame: len}),
+        )
+
+    def test_shared_immutable_objects_are_hashed_once(self):
+        """Large immutable objects referenced several times in one argument
+        are only hashed once.
+        """
+
+        class Item:
+            pass
+
+        calls = []
+
+        def hash_item(item):
+            calls.append(item)
+            return id(item)
+
+        shared = tuple(Item() for _ in range(_MEMOIZE_BY_ID_MIN_SIZE))
+        value = [shared, shared, {"nested": shared}]
+        h1 = get_hash(value, hash_funcs={Item: hash_item})
+        self.assertEqual(len(calls), _MEMOIZE_BY_ID_MIN_SIZE)
+
+        # Memoization doesn't change the hash.
+        copies = [tuple(shared), tuple(shared), {"nested": tuple(shared)}]
+        self.assertEqual(h1, get_hash(copies, hash_funcs={Item: hash_item}))
+
+    def test_read_only_numpy_arrays_are_hashed_once(self):
+        """Read-only arrays can't change while a key is computed, so they're
+        memoized by identity. Writable arrays aren't.
+        """
+        read_only = np.arange(100)
+        read_only.flags.writeable = False
+        writable = np.arange(100)
+
+        hasher = _CacheFuncHasher(CacheType.DATA)
+        hasher.to_bytes([read_only, read_only, writable])
+        self.assertIn(id(read_only), hasher._hashes_by_id)
+        self.assertNotIn(id(writable), hasher._hashes_by_id)
+
+        self.assertEqual(
+            get_hash([read_only, read_only]),
+            get_hash([np.arange(100), np.arange(100)]),
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("polars"), "polars is not installed")
+    def test_polars_dataframe(self):
+        import polars as pl
+
+        df1 = pl.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        df2 = pl.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        df3 = pl.DataFrame({"a": [1, 3], "b": ["x", "y"]})
+        df4 = pl.DataFrame({"a": [1, 2], "c": ["x", "y"]})
+        self.assertEqual(get_hash(df1), get_hash(df2))
+        self.assertNotEqual(get_hash(df1), get_hash(df3))
+        self.assertNotEqual(get_hash(df1), get_hash(df4))
+
+    @unittest.skipUnless(importlib.util.find_spec("polars"), "polars is not installed")
+    def test_polars_series(self):
+        import polars as pl
+
+        self.assertEqual(get_hash(pl.Series([1, 2])), get_hash(pl.Series([1, 2])))
+        self.assertNotEqual(get_hash(pl.Series([1, 2])), get_hash(pl.Series([1, 3])))
+        self.assertNotEqual(
+            get_hash(pl.Series([1, 2])), get_hash(pl.Series([1.0, 2.0]))
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("polars"), "polars is not installed")
+    def test_polars_large_dataframe(self):
+        """Large polars dataframes are hashed in full, unless sampling is
+        requested."""
+        import polars as pl
+
+        df1 = pl.DataFrame({"a": np.arange(_PANDAS_ROWS_LARGE)})
+        df2 = pl.DataFrame({"a": np.arange(_PANDAS_ROWS_LARGE)})
+        # Changes a single row, which is very unlikely to be sampled.
+        df3 = df1.with_columns(
+            pl.when(pl.col("a") == 12345).then(-1).otherwise(pl.col("a")).alias("a")
+        )
+
+        self.assertEqual(get_hash(df1), get_hash(df2))
+        self.assertNotEqual(get_hash(df1), get_hash(df3))
+        self.assertNotEqual(get_hash(df1.head(10)), get_hash(df1.slice(1, 10)))
+        self.assertEqual(
+            get_hash(df1, hash_mode="sample"), get_hash(df3, hash_mode="sample")
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("polars"), "polars is not installed")
+    def test_polars_large_series(self):
+        """Large polars series are hashed in full, unless sampling is
+        requested."""
+        import polars as pl
+
+        series1 = pl.Series(np.arange(_PANDAS_ROWS_LARGE))
+        series2 = series1.clone().scatter(12345, -1)
+
+        self.assertNotEqual(get_hash(series1), get_hash(series2))
+        self.assertEqual(
+            get_hash(series1, hash_mode="sample"),
+            get_hash(series2, hash_mode="sample"),
+        )
+
+
+def _make_frozen_dataframe(num_rows):
+    df = pd.DataFrame({"a": np.arange(num_rows), "b": np.linspace(0, 1, num_rows)})
+    for arr in df._mgr.arrays:
+        arr.flags.writeable = False
+    return df
+
+
+class IdentityHashMemoTest(unittest.TestCase):
+    """Tests for reusing the hashes of immutable objects across key
+    computations.
+    """
+
+    def setUp(self):
+        _identity_hash_memo.clear()
+
+    def tearDown(self):
+        _identity_hash_memo.clear()
+
+    def test_frozen_numpy_array(self):
+        arr = np.arange(_IDENTITY_MEMO_MIN_BYTES)
+        arr.flags.writeable = False
+
+        h = get_hash(arr)
+        self.assertEqual(1, len(_identity_hash_memo))
+        with patch.object(_CacheFuncHasher, "_to_bytes", side_effect=AssertionError):
+            self.assertEqual(h, get_hash(arr))
+
+    def test_frozen_numpy_array_view(self):
+        arr = np.arange(_IDENTITY_MEMO_MIN_BYTES)
+        view = arr[:]
+        view.flags.writeable = False
+
+        get_hash(view)
+        self.assertEqual(0, len(_identity_hash_memo))
+
+    def test_writable_numpy_array(self):
+        arr = np.arange(_IDENTITY_MEMO_MIN_BYTES)
+
+        h1 = get_hash(arr, hash_mode="full")
+        arr[0] = -1
+        self.assertEqual(0, len(_identity_hash_memo))
+        self.assertNotEqual(h1, get_hash(arr, hash_mode="full"))
+
+    def test_small_numpy_array(self):
+        arr = np.arange(10)
+        arr.flags.writeable = False
+
+        get_hash(arr)
+        self.assertEqual(0, len(_identity_hash_memo))
+
+    def test_frozen_dataframe(self):
+        df = _make_frozen_dataframe(_IDENTITY_MEMO_MIN_BYTES // 8)
+
+        h = get_hash(df)
+        self.assertEqual(1, len(_identity_hash_memo))
+        with patch.object(_CacheFuncHasher, "_to_bytes", side_effect=AssertionError):
+            self.assertEqual(h, get_hash(df))
+        # The hash for the other mode isn't shared.
+        self.assertNotEqual(h, get_hash(df, hash_mode="full"))
+
+    def test_frozen_dataframe_with_replaced_column(self):
+        """Replacing a column of a DataFrame invalidates its memoized hash."""
+        df = _make_frozen_dataframe(_IDENTITY_MEMO_MIN_BYTES // 8)
+
+        h = get_hash(df)
+        df["a"] = np.zeros(len(df), dtype=int)
+        self.assertNotEqual(h, get_hash(df))
+
+    def test_frozen_dataframe_with_renamed_columns(self):
+        df = _make_frozen_dataframe(_IDENTITY_MEMO_MIN_BYTES // 8)
+
+        h = get_hash(df)
+        df.columns = ["c", "d"]
+        self.assertNotEqual(h, get_hash(df))
+
+    def test_writable_dataframe(self):
+        df = pd.DataFrame({"a": np.arange(_IDENTITY_MEMO_MIN_BYTES // 8)})
+
+        get_hash(df)
+        self.assertEqual(0, len(_identity_hash_memo))
+
+    def test_hash_funcs_bypass_memo(self):
+        arr = np.arange(_IDENTITY_MEMO_MIN_BYTES)
+        arr.flags.writeable = False
+
+        get_hash(arr, hash_funcs={str: len})
+        self.assertEqual(0, len(_identity_hash_memo))
+
+    def test_entry_removed_with_object(self):
+        arr = np.arange(_IDENTITY_MEMO_MIN_BYTES)
+        arr.flags.writeable = False
+
+        get_hash(arr)
+        self.assertEqual(1, len(_identity_hash_memo))
+        del arr
+        gc.collect()
+        self.assertEqual(0, len(_identity_hash_memo))
+
+
+class HashPerformanceTest(unittest.TestCase):
+    """Benchmarks of computing cache keys for common argument shapes."""
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_list_of_dicts_performance(self):
+        rows = [
+            {"id": i, "name": f"row{i}", "score": i * 0.5, "tags": ["a", "b"]}
+            for i in range(10_000)
+        ]
+        self.benchmark(get_hash, rows)
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_nested_config_performance(self):
+        def make_config(depth):
+            if depth == 0:
+                return {"enabled": True, "name": "leaf", "threshold": 0.5}
+            return {f"section{i}": make_config(depth - 1) for i in range(5)}
+
+        self.benchmark(get_hash, make_config(5))
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_shared_tuples_performance(self):
+        shared = tuple({"x": i} for i in range(1_000))
+        self.benchmark(get_hash, [shared] * 100)
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_dataframe_performance(self):
+        df = pd.DataFrame({"a": np.arange(50_000), "b": np.linspace(0, 1, 50_000)})
+        self.benchmark(get_hash, df)
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_large_dataframe_full_hash_mode_performance(self):
+        df = pd.DataFrame(
+            {f"col{i}": np.random.default_rng(i).random(2_000_000) for i in range(8)}
+        )
+        self.benchmark(get_hash, df, hash_mode="full")
+
+    @pytest.mark.usefixtures("benchmark")
+    def test_repeated_frozen_dataframe_performance(self):
+        df = _make_frozen_dataframe(5_000_000)
+        self.benchmark(get_hash, df)
+
 
 class NotHashableTest(unittest.TestCase):
     """Tests for various unhashable types."""
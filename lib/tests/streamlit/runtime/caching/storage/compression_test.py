@@ -0,0 +1,125 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for cache entry compression"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import unittest
+from unittest.mock import patch
+
+from streamlit import config
+from streamlit.runtime.caching.storage import (
+    CacheStorageError,
+    CacheStorageKeyNotFoundError,
+)
+from streamlit.runtime.caching.storage.compression import (
+    CompressionStats,
+    compress_entry,
+    decompress_entry,
+)
+from tests.testutil import build_mock_config_get_option, patch_config_options
+
+
+class CompressionTest(unittest.TestCase):
+    def setUp(self):
+        # patch_config_options is a context manager, and can't decorate the
+        # whole class.
+        self.config_patch = patch.object(
+            config,
+            "get_option",
+            new=build_mock_config_get_option(
+                {"global.cacheCompressionThresholdBytes": 100}
+            ),
+        )
+        self.config_patch.start()
+
+    def tearDown(self):
+        self.config_patch.stop()
+
+    def test_round_trip(self):
+        value = pickle.dumps(["a compressible value"] * 100)
+        stats = CompressionStats()
+
+        entry = compress_entry(value, stats)
+        self.assertLess(len(entry), len(value))
+        self.assertEqual(value, decompress_entry(entry, stats))
+        self.assertEqual(value, decompress_entry(memoryview(entry), stats))
+
+        self.assertEqual(1, stats.num_compressed_entries)
+        self.assertEqual(len(value), stats.num_input_bytes)
+        self.assertEqual(len(entry), stats.num_output_bytes)
+
+    def test_small_entries_arent_compressed(self):
+        value = pickle.dumps("small")
+        stats = CompressionStats()
+
+        self.assertIs(value, compress_entry(value, stats))
+        self.assertIs(value, decompress_entry(value, stats))
+        self.assertEqual([], stats.get_counter_stats("st_cache_data", "func"))
+
+    def test_incompressible_entries_are_stored_as_is(self):
+        value = os.urandom(1000)
+        stats = CompressionStats()
+
+        self.assertIs(value, compress_entry(value, stats))
+        self.assertEqual(0, stats.num_compressed_entries)
+
+    @patch_config_options({"global.cacheCompressionThresholdBytes": 0})
+    def test_disabled(self):
+        value = b"a" * 1000
+        self.assertIs(value, compress_entry(value, CompressionStats()))
+
+    def test_unavailable_codec(self):
+        """Entries compressed with a codec that isn't installed are treated
+        as missing, so that they're recomputed.
+        """
+        stats = CompressionStats()
+        entry = compress_entry(b"a" * 1000, stats)
+
+        with (
+            patch(
+                "streamlit.runtime.caching.storage.compression._get_codecs",
+                return_value={},
+            ),
+            self.assertRaises(CacheStorageKeyNotFoundError),
+        ):
+            decompress_entry(entry, stats)
+
+    def test_corrupt_entry(self):
+        stats = CompressionStats()
+        entry = compress_entry(b"a" * 1000, stats)
+
+        with self.assertRaises(CacheStorageError):
+            decompress_entry(entry[:-10] + b"\xff" * 10, stats)
+
+    def test_counter_stats(self):
+        stats = CompressionStats()
+        compress_entry(b"a" * 1000, stats)
+
+        self.assertEqual(
+            [
+                "cache_compressed_entries",
+                "cache_compression_input_bytes",
+                "cache_compression_output_bytes",
+                "cache_compression_microseconds",
+                "cache_decompression_microseconds",
+            ],
+            [
+                stat.family_name
+                for stat in stats.get_counter_stats("st_cache_data", "func")
+            ],
+        )
@@ -32,6 +32,11 @@ from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorage,
 )
+from streamlit.runtime.memory_governor import (
+    REBUILD_COST_RECOMPUTE,
+    REBUILD_COST_RELOAD,
+)
+from tests.testutil import patch_config_options
 
 
 class InMemoryCacheStorageWrapperTest(unittest.TestCase):
@@ -179,3 +184,103 @@ class InMemoryCacheStorageWrapperTest(unittest.TestCase):
         ) as mock_persist_close:
             wrapped_storage.close()
             mock_persist_close.assert_called_once()
+
+    def test_in_memory_cache_storage_wrapper_evict(self):
+        """
+        Test that storage.evict() removes the entry from the in-memory cache
+        only, so it's read back from the persist storage
+        """
+        context = self.get_storage_context()
+        persist_storage = LocalDiskCacheStorage(context)
+        wrapped_storage = InMemoryCacheStorageWrapper(
+            persist_storage=persist_storage, context=context
+        )
+
+        wrapped_storage.set("some-key", b"some-value")
+        wrapped_storage.set("other-key", b"other")
+        self.assertEqual(15, wrapped_storage.get_memory_usage())
+        candidates = wrapped_storage.get_eviction_candidates()
+        self.assertEqual(
+            {
+                ("some-key", 10, REBUILD_COST_RELOAD),
+                ("other-key", 5, REBUILD_COST_RELOAD),
+            },
+            {(c.key, c.byte_length, c.rebuild_cost) for c in candidates},
+        )
+
+        self.assertEqual(10, wrapped_storage.evict("some-key"))
+        self.assertEqual(0, wrapped_storage.evict("some-key"))
+        self.assertEqual(5, wrapped_storage.get_memory_usage())
+
+        with patch.object(
+            persist_storage, "get", wraps=persist_storage.get
+        ) as mock_persist_get:
+            self.assertEqual(wrapped_storage.get("some-key"), b"some-value")
+            mock_persist_get.assert_called_once_with("some-key")
+
+    def test_in_memory_cache_storage_wrapper_eviction_cost_without_persistence(self):
+        """
+        Test that evicting entries that aren't persisted costs a recomputation
+        """
+        context = CacheStorageContext(
+            function_key="func-key", function_display_name="func-display-name"
+        )
+        wrapped_storage = InMemoryCacheStorageWrapper(
+            persist_storage=DummyCacheStorage(), context=context
+        )
+
+        wrapped_storage.set("some-key", b"some-value")
+        [candidate] = wrapped_storage.get_eviction_candidates()
+        self.assertEqual(REBUILD_COST_RECOMPUTE, candidate.rebuild_cost)
+
+    @patch_config_options({"global.cacheCompressionThresholdBytes": 100})
+    def test_in_memory_cache_storage_wrapper_compression(self):
+        """
+        Test that large entries are compressed in memory and on disk, and
+        decompressed when they're read
+        """
+        context = self.get_storage_context()
+        persist_storage = LocalDiskCacheStorage(context)
+        wrapped_storage = InMemoryCacheStorageWrapper(
+            persist_storage=persist_storage, context=context
+        )
+        large_value = b"a compressible value " * 100
+
+        wrapped_storage.set("small-key", b"small-value")
+        wrapped_storage.set("large-key", large_value)
+
+        self.assertEqual(b"small-value", persist_storage.get("small-key"))
+        compressed_size = len(persist_storage.get("large-key"))
+        self.assertLess(compressed_size, len(large_value) / 5)
+        self.assertEqual(
+            len(b"small-value") + compressed_size,
+            wrapped_storage.get_memory_usage(),
+        )
+
+        self.assertEqual(large_value, wrapped_storage.get("large-key"))
+        # Evicted entries are read back from disk.
+        wrapped_storage.evict("large-key")
+        self.assertEqual(large_value, wrapped_storage.get("large-key"))
+
+        counters = {
+            stat.family_name: stat.value for stat in wrapped_storage.get_counter_stats()
+        }
+        self.assertEqual(1, counters["cache_compressed_entries"])
+        self.assertEqual(len(large_value), counters["cache_compression_input_bytes"])
+        self.assertEqual(compressed_size, counters["cache_compression_output_bytes"])
+
+    def test_in_memory_cache_storage_wrapper_compression_disabled(self):
+        """
+        Test that entries aren't compressed by default
+        """
+        context = self.get_storage_context()
+        persist_storage = LocalDiskCacheStorage(context)
+        wrapped_storage = InMemoryCacheStorageWrapper(
+            persist_storage=persist_storage, context=context
+        )
+        large_value = b"a compressible value " * 100
+
+        wrapped_storage.set("large-key", large_value)
+
+        self.assertEqual(large_value, persist_storage.get("large-key"))
+        self.assertEqual([], wrapped_storage.get_counter_stats())
@@ -38,7 +38,9 @@ from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorage,
     LocalDiskCacheStorageManager,
+    _get_disk_cache_index,
 )
+from tests.testutil import patch_config_options
 
 
 class LocalDiskCacheStorageManagerTest(unittest.TestCase):
@@ -93,8 +95,9 @@ class LocalDiskCacheStorageManagerTest(unittest.TestCase):
         self.assertEqual(storage.max_entries, math.inf)
 
     def test_check_context_with_persist_and_ttl(self):
-        """Tests that LocalDiskCacheStorageManager.check_context() writes a warning
-        in logs when persist="disk" and ttl_seconds is not None
+        """Tests that LocalDiskCacheStorageManager.check_context() does not write
+        a warning in logs when persist="disk" and ttl_seconds is not None, since
+        persisted entries expire.
         """
         context = CacheStorageContext(
             function_key="func-key",
@@ -111,12 +114,12 @@ class LocalDiskCacheStorageManagerTest(unittest.TestCase):
             manager = LocalDiskCacheStorageManager()
             manager.check_context(context)
 
+            get_logger(
+                "streamlit.runtime.caching.storage.local_disk_cache_storage"
+            ).warning("irrelevant warning so assertLogs passes")
+
             output = "".join(logs.output)
-            self.assertIn(
-                "The cached function 'func-display-name' has a TTL that will be "
-                "ignored. Persistent cached functions currently don't support TTL.",
-                output,
-            )
+            self.assertNotIn("has a TTL that will be ignored", output)
 
     def test_check_context_without_persist(self):
         """Tests that LocalDiskCacheStorageManager.check_context() does not
@@ -275,3 +278,117 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
     def test_storage_close(self):
         """Test that storage.close() does not raise any exception."""
         self.storage.close()
+
+    def test_storage_set_is_atomic(self):
+        """Test that storage.set() doesn't leave temporary files behind."""
+        self.storage.set("some-key", b"some-value")
+
+        self.assertEqual(
+            {"func-key-some-key.memo", "memo-index.json"},
+            set(os.listdir(self.tempdir.path)),
+        )
+
+    def test_storage_get_expired(self):
+        """Test that entries expire after the context's TTL."""
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                ttl_seconds=60,
+            )
+        )
+
+        with patch("time.time", return_value=1000):
+            storage.set("some-key", b"some-value")
+        with patch("time.time", return_value=1059):
+            self.assertEqual(b"some-value", storage.get("some-key"))
+        with (
+            patch("time.time", return_value=1060),
+            self.assertRaises(CacheStorageKeyNotFoundError),
+        ):
+            storage.get("some-key")
+
+        self.assertFalse(os.path.exists(self.tempdir.path + "/func-key-some-key.memo"))
+
+    def test_storage_max_entries(self):
+        """Test that the least recently used entries beyond max_entries are
+        removed from disk."""
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                max_entries=2,
+            )
+        )
+
+        with patch("time.time", side_effect=range(1000, 1100)):
+            storage.set("key-1", b"value-1")
+            storage.set("key-2", b"value-2")
+            storage.get("key-1")
+            storage.set("key-3", b"value-3")
+
+        self.assertEqual(b"value-1", storage.get("key-1"))
+        self.assertEqual(b"value-3", storage.get("key-3"))
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("key-2")
+
+    @patch_config_options({"global.maxDiskCacheBytes": 20})
+    def test_storage_max_bytes(self):
+        """Test that the least recently used entries of all functions are
+        removed when the cache directory exceeds its byte budget."""
+        other_storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+                persist="disk",
+            )
+        )
+
+        with patch("time.time", side_effect=range(1000, 1100)):
+            other_storage.set("key-1", b"x" * 8)
+            self.storage.set("key-2", b"x" * 8)
+            self.storage.set("key-3", b"x" * 8)
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            other_storage.get("key-1")
+        self.assertEqual(b"x" * 8, self.storage.get("key-2"))
+        self.assertEqual(b"x" * 8, self.storage.get("key-3"))
+
+    def test_storage_index_is_reloaded(self):
+        """Test that the index is saved to disk, and that files missing from it
+        are added when it's loaded."""
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                ttl_seconds=60,
+            )
+        )
+        with patch("time.time", return_value=1000):
+            storage.set("some-key", b"some-value")
+        with open(self.tempdir.path + "/func-key-legacy-key.memo", "wb") as f:
+            f.write(b"legacy-value")
+
+        # Simulate a restart.
+        _get_disk_cache_index(self.tempdir.path).reset()
+
+        self.assertEqual(b"legacy-value", storage.get("legacy-key"))
+        with (
+            patch("time.time", return_value=1060),
+            self.assertRaises(CacheStorageKeyNotFoundError),
+        ):
+            storage.get("some-key")
+
+    def test_storage_get_large_value_is_mapped(self):
+        """Test that large values are returned as a view of the mapped file."""
+        value = os.urandom(2 * 1024 * 1024)
+        self.storage.set("some-key", value)
+
+        result = self.storage.get("some-key")
+
+        self.assertIsInstance(result, memoryview)
+        self.assertTrue(result.readonly)
+        self.assertEqual(value, result)
@@ -0,0 +1,141 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ForwardMsgBroadcaster"""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from streamlit import config
+from streamlit.hash_util import calc_hash
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.forward_msg_broadcaster import ForwardMsgBroadcaster
+from streamlit.runtime.forward_msg_cache import (
+    populate_hash_if_needed,
+    serialize_forward_msg_body,
+)
+from streamlit.runtime.stats import CounterStat
+from tests.streamlit.message_mocks import create_dataframe_msg
+from tests.testutil import build_mock_config_get_option
+
+
+def _get_counters(broadcaster: ForwardMsgBroadcaster) -> dict[str, int]:
+    return {stat.family_name: stat.value for stat in broadcaster.get_counter_stats()}
+
+
+class ForwardMsgBroadcasterTest(unittest.TestCase):
+    def setUp(self):
+        # Cache messages of any size.
+        self.config_patch = patch.object(
+            config,
+            "get_option",
+            new=build_mock_config_get_option({"global.minCachedMessageSize": 0}),
+        )
+        self.config_patch.start()
+
+    def tearDown(self):
+        self.config_patch.stop()
+
+    def test_identical_msgs_are_serialized_once(self):
+        """Identical messages from different sessions share their bytes, and
+        their payload is only hashed once."""
+        broadcaster = ForwardMsgBroadcaster()
+        msgs = [create_dataframe_msg([1, 2, 3]) for _ in range(3)]
+
+        with (
+            patch(
+                "streamlit.runtime.forward_msg_broadcaster.serialize_forward_msg_body",
+                wraps=serialize_forward_msg_body,
+            ) as serialize_body,
+            patch(
+                "streamlit.runtime.forward_msg_cache.calc_hash", wraps=calc_hash
+            ) as hash_body,
+        ):
+            broadcaster.prepare(msgs)
+            # Messages are compared by their serialized payloads.
+            self.assertEqual(len(msgs), serialize_body.call_count)
+            hash_body.assert_called_once()
+        self.assertEqual({msgs[0].hash}, {msg.hash for msg in msgs})
+
+        bodies = {id(broadcaster.get_serialized_body(msg)) for msg in msgs}
+        self.assertEqual(1, len(bodies))
+
+        serialized_msgs = [broadcaster.get_serialized_msg(msg) for msg in msgs]
+        self.assertIs(serialized_msgs[0], serialized_msgs[1])
+        self.assertIs(serialized_msgs[0], serialized_msgs[2])
+
+        decoded = ForwardMsg()
+        decoded.ParseFromString(serialized_msgs[0])
+        self.assertEqual(msgs[0], decoded)
+
+    def test_populates_hash_and_cacheable_flag(self):
+        """Prepared messages get the same hash a direct computation yields."""
+        broadcaster = ForwardMsgBroadcaster()
+        msg = create_dataframe_msg([1, 2, 3])
+        broadcaster.prepare([msg])
+
+        expected = create_dataframe_msg([1, 2, 3])
+        self.assertTrue(msg.metadata.cacheable)
+        self.assertEqual(populate_hash_if_needed(expected), msg.hash)
+
+    def test_different_msgs_are_not_shared(self):
+        """Messages with different payloads or metadata get their own bytes."""
+        broadcaster = ForwardMsgBroadcaster()
+        msg1 = create_dataframe_msg([1, 2, 3])
+        msg2 = create_dataframe_msg([4, 5, 6])
+        msg3 = create_dataframe_msg([1, 2, 3], 2)
+        broadcaster.prepare([msg1, msg2, msg3])
+
+        self.assertNotEqual(msg1.hash, msg2.hash)
+        # Only the metadata differs, so the hash is the same...
+        self.assertEqual(msg1.hash, msg3.hash)
+        # ...but the wire bytes are not.
+        self.assertIsNot(
+            broadcaster.get_serialized_msg(msg1), broadcaster.get_serialized_msg(msg3)
+        )
+        self.assertEqual(
+            {"forward_msg_broadcast_messages": 3, "forward_msg_broadcast_payloads": 3},
+            _get_counters(broadcaster),
+        )
+
+    def test_ignores_never_cached_msgs(self):
+        """Reference messages are not prepared."""
+        broadcaster = ForwardMsgBroadcaster()
+        msg = ForwardMsg(ref_hash="some_hash")
+        broadcaster.prepare([msg])
+
+        self.assertIsNone(broadcaster.get_serialized_body(msg))
+        self.assertIsNone(broadcaster.get_serialized_msg(msg))
+
+    def test_clear(self):
+        """Cleared messages are forgotten, but counters are kept."""
+        broadcaster = ForwardMsgBroadcaster()
+        msgs = [create_dataframe_msg([1, 2, 3]) for _ in range(4)]
+        broadcaster.prepare(msgs)
+        broadcaster.clear()
+
+        self.assertIsNone(broadcaster.get_serialized_msg(msgs[0]))
+        self.assertEqual(
+            [
+                CounterStat(
+                    "forward_msg_broadcast_messages", "ForwardMessageBroadcast", "", 4
+                ),
+                CounterStat(
+                    "forward_msg_broadcast_payloads", "ForwardMessageBroadcast", "", 1
+                ),
+            ],
+            broadcaster.get_counter_stats(),
+        )
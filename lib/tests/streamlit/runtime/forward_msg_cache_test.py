@@ -16,17 +16,22 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 
 from streamlit import config
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import app_session
 from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
     populate_hash_if_needed,
+    serialize_forward_msg_body,
+    serialize_forward_msg_envelope,
 )
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import CacheStat, CounterStat
 from streamlit.testing.v1.util import patch_config_options
 from tests.streamlit.message_mocks import create_dataframe_msg
 
@@ -53,6 +58,32 @@ class ForwardMsgCacheTest(unittest.TestCase):
         msg2 = create_dataframe_msg([1, 2, 3], 2)
         self.assertEqual(populate_hash_if_needed(msg1), populate_hash_if_needed(msg2))
 
+    def test_body_and_envelope_roundtrip(self):
+        """Test that a message's payload and envelope concatenate to the
+        full message, and that serializing the payload leaves the message intact.
+        """
+        msg = create_dataframe_msg([1, 2, 3], 7)
+        populate_hash_if_needed(msg)
+        original = ForwardMsg()
+        original.CopyFrom(msg)
+
+        body = serialize_forward_msg_body(msg)
+        self.assertEqual(original, msg)
+
+        decoded = ForwardMsg()
+        decoded.ParseFromString(body + serialize_forward_msg_envelope(msg))
+        self.assertEqual(original, decoded)
+        self.assertEqual(msg.ByteSize(), len(decoded.SerializeToString()))
+
+    def test_hash_from_precomputed_body(self):
+        """Test that passing a pre-serialized payload yields the same hash."""
+        msg1 = create_dataframe_msg([1, 2, 3], 1)
+        msg2 = create_dataframe_msg([1, 2, 3], 2)
+        self.assertEqual(
+            populate_hash_if_needed(msg1),
+            populate_hash_if_needed(msg2, serialize_forward_msg_body(msg2)),
+        )
+
     def test_reference_msg(self):
         """Test creation of 'reference' ForwardMsgs"""
         msg = create_dataframe_msg([1, 2, 3], 34)
@@ -81,6 +112,30 @@ class ForwardMsgCacheTest(unittest.TestCase):
         cache.add_message(msg, session, 0)
         self.assertEqual(msg, cache.get_message(msg_hash))
 
+    def test_get_serialized_body(self):
+        """Test that the cache returns the message's serialized payload."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        msg = create_dataframe_msg([1, 2, 3])
+        body = serialize_forward_msg_body(msg)
+
+        cache.add_message(msg, session, 0, body)
+        self.assertEqual(body, cache.get_serialized_body(msg.hash))
+        self.assertIsNone(cache.get_serialized_body("not-a-hash"))
+
+    def test_get_serialized_msg(self):
+        """Test that the cache serves a message's wire bytes."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        msg = create_dataframe_msg([1, 2, 3])
+        cache.add_message(msg, session, 0)
+
+        self.assertEqual(
+            serialize_forward_msg_body(msg) + serialize_forward_msg_envelope(msg),
+            cache.get_serialized_msg(msg.hash),
+        )
+        self.assertIsNone(cache.get_serialized_msg("not-a-hash"))
+
     def test_clear(self):
         """Test MessageCache.clear"""
         cache = ForwardMsgCache()
@@ -191,6 +246,7 @@ class ForwardMsgCacheTest(unittest.TestCase):
 
         # Cache should not store message content for messages.
         self.assertEqual(message_content, None)
+        self.assertEqual(cache.get_serialized_body(msg_hash), None)
 
     def test_cache_stats_provider(self):
         """Test ForwardMsgCache's CacheStatsProvider implementation."""
@@ -217,3 +273,243 @@ class ForwardMsgCacheTest(unittest.TestCase):
             ),
         ]
         self.assertEqual(set(expected), set(cache.get_stats()))
+
+    def test_evicts_lru_entries_over_byte_budget(self):
+        """Unreferenced entries are evicted in LRU order once the byte budget
+        is exceeded."""
+        cache = ForwardMsgCache()
+        live_session = _create_mock_session()
+        dead_session = _create_mock_session()
+
+        msgs = [create_dataframe_msg([i] * 10, i) for i in range(3)]
+        for msg in msgs:
+            populate_hash_if_needed(msg)
+        max_bytes = 2 * max(msg.ByteSize() for msg in msgs)
+
+        with patch_config_options({"global.maxMessageCacheBytes": max_bytes}):
+            cache.add_message(msgs[0], dead_session, 0)
+            cache.add_message(msgs[1], dead_session, 0)
+            # Simulate the session being garbage collected.
+            for msg in msgs[:2]:
+                cache._entries[msg.hash].remove_session_ref(dead_session)
+            # Touch the first message so that the second is the LRU entry.
+            cache.get_message(msgs[0].hash)
+            cache.add_message(msgs[2], live_session, 0)
+
+        self.assertIsNotNone(cache.get_message(msgs[0].hash))
+        self.assertIsNone(cache.get_message(msgs[1].hash))
+        self.assertIsNotNone(cache.get_message(msgs[2].hash))
+        self.assertEqual(1, cache._num_evictions)
+        self.assertEqual(0, cache._num_budget_overshoots)
+
+    def test_never_evicts_referenced_entries(self):
+        """Entries referenced by a live session are kept, and the budget
+        overshoot is counted instead."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+
+        msgs = [create_dataframe_msg([i] * 10, i) for i in range(3)]
+        for msg in msgs:
+            populate_hash_if_needed(msg)
+        max_bytes = max(msg.ByteSize() for msg in msgs)
+
+        with patch_config_options({"global.maxMessageCacheBytes": max_bytes}):
+            for msg in msgs:
+                cache.add_message(msg, session, 0)
+
+        for msg in msgs:
+            self.assertTrue(cache.has_message_reference(msg, session, 0))
+        self.assertEqual(0, cache._num_evictions)
+        self.assertEqual(2, cache._num_budget_overshoots)
+
+    @patch_config_options({"global.maxMessageCacheBytes": 0})
+    def test_no_byte_budget(self):
+        """A budget of 0 disables eviction."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        for i in range(10):
+            cache.add_message(create_dataframe_msg([i], i), session, 0)
+        self.assertEqual(10, len(cache._entries))
+
+    def test_counter_stats_provider(self):
+        """Test ForwardMsgCache's CounterStatsProvider implementation."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+
+        msgs = [create_dataframe_msg([i] * 10, i) for i in range(2)]
+        for msg in msgs:
+            populate_hash_if_needed(msg)
+
+        with patch_config_options(
+            {"global.maxMessageCacheBytes": max(msg.ByteSize() for msg in msgs)}
+        ):
+            cache.add_message(msgs[0], session, 0)
+            self.assertTrue(cache.has_message_reference(msgs[0], session, 0))
+            cache._entries[msgs[0].hash].remove_session_ref(session)
+            cache.add_message(msgs[1], session, 0)
+            # The remaining entry is referenced, so the cache can't shrink
+            # any further once another message is added.
+            cache.add_message(msgs[0], session, 0)
+
+        self.assertEqual(
+            [
+                CounterStat(
+                    family_name="forward_msg_cache_hits",
+                    category_name="ForwardMessageCache",
+                    cache_name="",
+                    value=1,
+                ),
+                CounterStat(
+                    family_name="forward_msg_cache_evictions",
+                    category_name="ForwardMessageCache",
+                    cache_name="",
+                    value=1,
+                ),
+                CounterStat(
+                    family_name="forward_msg_cache_evicted_bytes",
+                    category_name="ForwardMessageCache",
+                    cache_name="",
+                    value=msgs[0].ByteSize(),
+                ),
+                CounterStat(
+                    family_name="forward_msg_cache_spilled_bytes",
+                    category_name="ForwardMessageCache",
+                    cache_name="",
+                    value=0,
+                ),
+                CounterStat(
+                    family_name="forward_msg_cache_budget_overshoots",
+                    category_name="ForwardMessageCache",
+                    cache_name="",
+                    value=1,
+                ),
+            ],
+            cache.get_counter_stats(),
+        )
+
+    def test_spills_large_messages_to_disk(self):
+        """Large payloads are written to the spill dir and read back."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        small_msg = create_dataframe_msg([1])
+        large_msg = create_dataframe_msg(list(range(100)))
+        for msg in (small_msg, large_msg):
+            populate_hash_if_needed(msg)
+
+        with (
+            tempfile.TemporaryDirectory() as spill_dir,
+            patch_config_options(
+                {
+                    "global.messageCacheSpillDir": spill_dir,
+                    "global.messageCacheSpillThreshold": large_msg.ByteSize(),
+                }
+            ),
+        ):
+            cache.add_message(small_msg, session, 0)
+            cache.add_message(large_msg, session, 0)
+
+            self.assertFalse(cache._entries[small_msg.hash].is_spilled)
+            self.assertTrue(cache._entries[large_msg.hash].is_spilled)
+            self.assertEqual(large_msg, cache.get_message(large_msg.hash))
+            self.assertEqual(
+                serialize_forward_msg_body(large_msg),
+                cache.get_serialized_body(large_msg.hash),
+            )
+
+            self.assertEqual(
+                serialize_forward_msg_body(large_msg)
+                + serialize_forward_msg_envelope(large_msg),
+                cache.get_serialized_msg(large_msg.hash),
+            )
+
+            spill_path = cache._entries[large_msg.hash]._spill_path
+            self.assertTrue(os.path.exists(spill_path))
+
+            # Removing the entry deletes its file.
+            cache.remove_refs_for_session(session)
+            self.assertFalse(os.path.exists(spill_path))
+
+    def test_clear_removes_spill_dir(self):
+        """Clearing the cache deletes the directory messages were spilled to."""
+        cache = ForwardMsgCache()
+        msg = create_dataframe_msg(list(range(100)))
+        populate_hash_if_needed(msg)
+
+        with (
+            tempfile.TemporaryDirectory() as spill_root,
+            patch_config_options(
+                {
+                    "global.messageCacheSpillDir": spill_root,
+                    "global.messageCacheSpillThreshold": 1,
+                }
+            ),
+        ):
+            cache.add_message(msg, _create_mock_session(), 0)
+            spill_dir = cache._spill_dir
+            self.assertIsNotNone(spill_dir)
+            self.assertTrue(os.path.isdir(spill_dir))
+
+            cache.clear()
+            self.assertFalse(os.path.exists(spill_dir))
+            self.assertIsNone(cache._spill_dir)
+
+            # A later spill creates a new directory.
+            cache.add_message(msg, _create_mock_session(), 0)
+            self.assertTrue(os.path.isdir(cache._spill_dir))
+
+    def test_memory_governor_interface(self):
+        """Only messages held in memory are reported to the MemoryGovernor."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        small_msg = create_dataframe_msg([1])
+        large_msg = create_dataframe_msg(list(range(100)))
+        for msg in (small_msg, large_msg):
+            populate_hash_if_needed(msg)
+
+        with (
+            tempfile.TemporaryDirectory() as spill_dir,
+            patch_config_options(
+                {
+                    "global.messageCacheSpillDir": spill_dir,
+                    "global.messageCacheSpillThreshold": large_msg.ByteSize(),
+                }
+            ),
+        ):
+            cache.add_message(small_msg, session, 0)
+            cache.add_message(large_msg, session, 0)
+
+            small_entry = cache._entries[small_msg.hash]
+            self.assertEqual(small_entry.byte_length, cache.get_memory_usage())
+            candidates = cache.get_eviction_candidates()
+            self.assertEqual([small_msg.hash], [c.key for c in candidates])
+
+            self.assertEqual(small_entry.byte_length, cache.evict(small_msg.hash))
+            self.assertEqual(0, cache.evict(small_msg.hash))
+            self.assertEqual(0, cache.get_memory_usage())
+            self.assertIsNone(cache.get_message(small_msg.hash))
+            # Evictions by the MemoryGovernor are counted like the cache's own.
+            self.assertEqual(1, cache._num_evictions)
+            self.assertEqual(small_entry.byte_length, cache._num_evicted_bytes)
+
+            cache.clear()
+
+    def test_spill_failure_keeps_message_in_memory(self):
+        """If the spill dir can't be written to, the message stays in memory."""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        msg = create_dataframe_msg([1, 2, 3])
+        populate_hash_if_needed(msg)
+
+        with (
+            tempfile.NamedTemporaryFile() as not_a_dir,
+            patch_config_options(
+                {
+                    "global.messageCacheSpillDir": not_a_dir.name,
+                    "global.messageCacheSpillThreshold": 0,
+                }
+            ),
+        ):
+            cache.add_message(msg, session, 0)
+
+        self.assertFalse(cache._entries[msg.hash].is_spilled)
+        self.assertEqual(msg, cache.get_message(msg.hash))
@@ -21,6 +21,7 @@ import unittest
 
 from parameterized import parameterized
 
+from streamlit import dataframe_util
 from streamlit.cursor import make_delta_path
 from streamlit.elements import arrow
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
@@ -58,6 +59,26 @@ arrow.marshall(
 ADD_ROWS_MSG.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
 
 
+def _create_streamed_add_rows_msg(
+    data: dict[str, list[int]], schema_omitted: bool = False, name: str = ""
+) -> ForwardMsg:
+    msg = ForwardMsg()
+    arrow_bytes = dataframe_util.convert_anything_to_arrow_bytes(data)
+    add_rows = msg.delta.arrow_add_rows
+    add_rows.is_streamed = True
+    add_rows.schema_omitted = schema_omitted
+    add_rows.data.data = (
+        dataframe_util.strip_arrow_stream_schema(arrow_bytes)
+        if schema_omitted
+        else arrow_bytes
+    )
+    if name:
+        add_rows.name = name
+        add_rows.has_name = True
+    msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+    return msg
+
+
 class ForwardMsgQueueTest(unittest.TestCase):
     def test_simple_enqueue(self):
         """Enqueue a single ForwardMsg."""
@@ -167,6 +188,55 @@ class ForwardMsgQueueTest(unittest.TestCase):
         self.assertEqual(ADD_BLOCK_MSG, queue[0])
         self.assertEqual(other_msg, queue[1])
 
+    def test_compose_streamed_add_rows(self):
+        """Streamed add_rows deltas that continue the Arrow stream of an
+        earlier one in the queue are appended to it."""
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(DF_DELTA_MSG)
+        fmq.enqueue(_create_streamed_add_rows_msg({"col1": [3, 4]}))
+        fmq.enqueue(_create_streamed_add_rows_msg({"col1": [5]}, schema_omitted=True))
+        fmq.enqueue(_create_streamed_add_rows_msg({"col1": [6]}, schema_omitted=True))
+
+        queue = fmq.flush()
+        self.assertEqual(2, len(queue))
+        self.assertEqual(DF_DELTA_MSG, queue[0])
+        add_rows = queue[1].delta.arrow_add_rows
+        self.assertTrue(add_rows.is_streamed)
+        self.assertFalse(add_rows.schema_omitted)
+        df = dataframe_util.convert_arrow_bytes_to_pandas_df(add_rows.data.data)
+        self.assertEqual([3, 4, 5, 6], df["col1"].to_list())
+
+    @parameterized.expand(
+        [
+            (
+                "not_streamed",
+                ADD_ROWS_MSG,
+                _create_streamed_add_rows_msg({"col1": [5]}, schema_omitted=True),
+            ),
+            (
+                "new_schema",
+                _create_streamed_add_rows_msg({"col1": [3, 4]}),
+                _create_streamed_add_rows_msg({"col1": [5], "col2": [15]}),
+            ),
+            (
+                "other_dataset",
+                _create_streamed_add_rows_msg({"col1": [3, 4]}, name="foo"),
+                _create_streamed_add_rows_msg(
+                    {"col1": [5]}, schema_omitted=True, name="bar"
+                ),
+            ),
+        ]
+    )
+    def test_dont_compose_add_rows(self, _, msg1, msg2):
+        """add_rows deltas are only composed if the second one is streamed
+        without a schema, and appends to the same dataset as the first."""
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(msg1)
+        fmq.enqueue(msg2)
+
+        queue = fmq.flush()
+        self.assertEqual([msg1, msg2], queue)
+
     def test_multiple_containers(self):
         """Deltas should only be coalesced if they're in the same container"""
         fmq = ForwardMsgQueue()
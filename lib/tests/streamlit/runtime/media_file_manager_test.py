@@ -29,6 +29,7 @@ from streamlit.runtime.memory_media_file_storage import (
     _calculate_file_id,
 )
 from tests.exception_capturing_thread import call_on_threads
+from tests.testutil import patch_config_options
 
 
 def random_coordinates():
@@ -113,8 +114,9 @@ class MediaFileManagerTest(TestCase):
         """Test that file_id generation from data works as expected."""
 
         fake_bytes = "\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00\x00\xff\x00".encode()
-        test_hash = "2ba850426b188d25adc5a37ad313080c346f5e88e069e0807d0cdb2b"
-        self.assertEqual(test_hash, _calculate_file_id(fake_bytes, "media/any"))
+        test_hash = "9de78fc4f3b103f78b7f33a2c705e624"
+        with patch_config_options({"global.hashEngine": "sha256"}):
+            self.assertEqual(test_hash, _calculate_file_id(fake_bytes, "media/any"))
 
         # Make sure we get different file ids for files with same bytes but diff't mimetypes.
         self.assertNotEqual(
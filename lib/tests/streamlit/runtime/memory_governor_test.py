@@ -0,0 +1,162 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""MemoryGovernor unit tests."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from streamlit.runtime.memory_governor import (
+    REBUILD_COST_RECOMPUTE,
+    REBUILD_COST_RESEND,
+    EvictableCache,
+    EvictionCandidate,
+    MemoryGovernor,
+)
+from streamlit.runtime.stats import CacheStat, CacheStatsProvider, CounterStat
+from streamlit.testing.v1.util import patch_config_options
+
+
+class _FakeCache(EvictableCache, CacheStatsProvider):
+    """An evictable cache whose entries all have the given rebuild cost."""
+
+    def __init__(self, entries: dict[str, tuple[int, float]], rebuild_cost: float):
+        # key -> (byte_length, last_access)
+        self.entries = entries
+        self.rebuild_cost = rebuild_cost
+
+    def get_stats(self) -> list[CacheStat]:
+        raise AssertionError("get_memory_usage should be used instead")
+
+    def get_memory_usage(self) -> int:
+        return sum(byte_length for byte_length, _ in self.entries.values())
+
+    def get_eviction_candidates(self) -> list[EvictionCandidate]:
+        return [
+            EvictionCandidate(key, byte_length, last_access, self.rebuild_cost)
+            for key, (byte_length, last_access) in self.entries.items()
+        ]
+
+    def evict(self, key: str) -> int:
+        entry = self.entries.pop(key, None)
+        return 0 if entry is None else entry[0]
+
+
+class _FakeStatsProvider(CacheStatsProvider):
+    def __init__(self, byte_length: int):
+        self.byte_length = byte_length
+
+    def get_stats(self) -> list[CacheStat]:
+        return [CacheStat("uploads", "", self.byte_length)]
+
+
+@patch("streamlit.runtime.memory_governor.time.monotonic", return_value=100.0)
+class MemoryGovernorTest(unittest.TestCase):
+    def test_memory_usage(self, _):
+        governor = MemoryGovernor()
+        governor.register_provider(
+            "data", _FakeCache({"a": (10, 0), "b": (20, 0)}, REBUILD_COST_RECOMPUTE)
+        )
+        governor.register_provider("uploads", _FakeStatsProvider(5))
+
+        self.assertEqual(35, governor.get_memory_usage())
+
+    @patch_config_options({"global.maxCacheMemoryBytes": 0})
+    def test_no_budget(self, _):
+        """A budget of 0 disables the governor."""
+        cache = _FakeCache({"a": (10, 0)}, REBUILD_COST_RECOMPUTE)
+        governor = MemoryGovernor()
+        governor.register_provider("data", cache)
+
+        self.assertEqual(0, governor.enforce_budget())
+        self.assertEqual(["a"], list(cache.entries))
+
+    @patch_config_options({"global.maxCacheMemoryBytes": 100})
+    def test_under_budget(self, _):
+        cache = _FakeCache({"a": (60, 0), "b": (40, 0)}, REBUILD_COST_RECOMPUTE)
+        governor = MemoryGovernor()
+        governor.register_provider("data", cache)
+
+        self.assertEqual(0, governor.enforce_budget())
+        self.assertEqual(["a", "b"], list(cache.entries))
+
+    @patch_config_options({"global.maxCacheMemoryBytes": 100})
+    def test_evicts_idle_entries_first(self, _):
+        cache = _FakeCache(
+            {"recent": (50, 99.0), "idle": (50, 10.0), "other": (50, 90.0)},
+            REBUILD_COST_RECOMPUTE,
+        )
+        governor = MemoryGovernor()
+        governor.register_provider("data", cache)
+
+        self.assertEqual(50, governor.enforce_budget())
+        self.assertEqual(["recent", "other"], list(cache.entries))
+
+    @patch_config_options({"global.maxCacheMemoryBytes": 100})
+    def test_evicts_large_entries_first(self, _):
+        cache = _FakeCache(
+            {"small": (30, 50.0), "large": (80, 50.0)}, REBUILD_COST_RECOMPUTE
+        )
+        governor = MemoryGovernor()
+        governor.register_provider("data", cache)
+
+        self.assertEqual(80, governor.enforce_budget())
+        self.assertEqual(["small"], list(cache.entries))
+
+    @patch_config_options({"global.maxCacheMemoryBytes": 100})
+    def test_evicts_across_caches_by_rebuild_cost(self, _):
+        """Entries that are expensive to recreate are kept longer, and the
+        governor evicts from whichever cache holds the best candidate.
+        """
+        message_cache = _FakeCache({"a": (50, 50.0)}, REBUILD_COST_RESEND)
+        data_cache = _FakeCache({"b": (50, 50.0)}, REBUILD_COST_RECOMPUTE)
+        governor = MemoryGovernor()
+        governor.register_provider("data", data_cache)
+        governor.register_provider("messages", message_cache)
+        governor.register_provider("uploads", _FakeStatsProvider(20))
+
+        self.assertEqual(50, governor.enforce_budget())
+        self.assertEqual({}, message_cache.entries)
+        self.assertEqual(["b"], list(data_cache.entries))
+
+    @patch_config_options({"global.maxCacheMemoryBytes": 10})
+    def test_warns_once_if_budget_cant_be_met(self, _):
+        governor = MemoryGovernor()
+        governor.register_provider("uploads", _FakeStatsProvider(20))
+
+        with patch("streamlit.runtime.memory_governor._LOGGER") as mock_logger:
+            governor.enforce_budget()
+            governor.enforce_budget()
+        mock_logger.warning.assert_called_once()
+
+    @patch_config_options({"global.maxCacheMemoryBytes": 100})
+    def test_counter_stats(self, _):
+        cache = _FakeCache({"a": (60, 0.0), "b": (70, 0.0)}, REBUILD_COST_RECOMPUTE)
+        governor = MemoryGovernor()
+        governor.register_provider("data", cache)
+        governor.register_provider("uploads", _FakeStatsProvider(0))
+
+        governor.enforce_budget()
+
+        self.assertEqual(
+            [
+                CounterStat("memory_governor_evictions", "data", "", 1),
+                CounterStat("memory_governor_evictions", "uploads", "", 0),
+                CounterStat("memory_governor_evicted_bytes", "data", "", 70),
+                CounterStat("memory_governor_evicted_bytes", "uploads", "", 0),
+            ],
+            governor.get_counter_stats(),
+        )
@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from cachetools import TTLCache
 
@@ -69,3 +69,42 @@ class MemorySessionStorageTest(unittest.TestCase):
         store._cache["baz"] = "qux"
 
         self.assertEqual(store.list(), ["bar", "qux"])
+
+    def test_expiration_callback(self):
+        """Sessions dropped by the cache itself are reported; deleted ones aren't."""
+        store = MemorySessionStorage(maxsize=1)
+        callback = MagicMock()
+        store.set_expiration_callback(callback)
+
+        first, second = MagicMock(), MagicMock()
+        first.session.id = "first"
+        second.session.id = "second"
+
+        store.save(first)
+        store.save(second)
+        callback.assert_called_once_with(first)
+
+        store.delete("second")
+        callback.assert_called_once_with(first)
+
+    def test_expiration_callback_on_ttl_expiry(self):
+        """Expired sessions are reported, even by cachetools versions whose
+        TTLCache.expire doesn't return the expired items."""
+        store = MemorySessionStorage(ttl_seconds=10)
+        callback = MagicMock()
+        store.set_expiration_callback(callback)
+
+        session_info = MagicMock()
+        session_info.session.id = "foo"
+        store.save(session_info)
+
+        original_expire = TTLCache.expire
+
+        def expire_without_result(cache, time=None):
+            original_expire(cache, time)
+
+        with patch.object(TTLCache, "expire", expire_without_result):
+            store._cache.expire(store._cache.timer() + 11)
+
+        callback.assert_called_once_with(session_info)
+        self.assertEqual(store.list(), [])
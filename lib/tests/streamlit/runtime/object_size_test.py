@@ -0,0 +1,148 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""object_size unit tests."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from copy import deepcopy
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from parameterized import parameterized
+
+from streamlit.runtime.object_size import (
+    ObjectSizeCache,
+    _SizeSampler,
+    get_known_size,
+    measure_unknown_sizes,
+)
+from streamlit.vendor.pympler.asizeof import asizeof
+
+
+class GetKnownSizeTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("int", 12345),
+            ("str", "hello world"),
+            ("bytes", b"x" * 1000),
+        ]
+    )
+    def test_scalars(self, _, value):
+        self.assertEqual(sys.getsizeof(value), get_known_size(value))
+
+    def test_numpy(self):
+        arr = np.zeros(1000)
+        self.assertGreaterEqual(get_known_size(arr), arr.nbytes)
+        self.assertEqual(arr[::2].nbytes, get_known_size(arr[::2]))
+
+    def test_pandas(self):
+        df = pd.DataFrame({"a": range(1000), "b": np.zeros(1000)})
+        self.assertEqual(df.memory_usage(index=True).sum(), get_known_size(df))
+        self.assertEqual(df["b"].memory_usage(index=True), get_known_size(df["b"]))
+
+    def test_arrow(self):
+        table = pa.table({"a": range(1000)})
+        self.assertEqual(table.nbytes, get_known_size(table))
+
+    @parameterized.expand(
+        [
+            ("list", [1, 2, 3]),
+            ("dict", {"a": 1}),
+            ("object_array", np.array(["a", 1], dtype=object)),
+            ("object_dataframe", pd.DataFrame({"a": ["x", "y"]})),
+        ]
+    )
+    def test_unknown(self, _, value):
+        """Objects whose size can't be computed without walking them are
+        left to the sampler.
+        """
+        self.assertIsNone(get_known_size(value))
+
+
+class ObjectSizeCacheTest(unittest.TestCase):
+    def test_known_size(self):
+        sizes = ObjectSizeCache()
+        arr = np.zeros(100)
+        self.assertEqual(get_known_size(arr), sizes.get_size("a", arr))
+
+    def test_unknown_size_is_sampled(self):
+        sizes = ObjectSizeCache()
+        value = [[1, 2, 3], {"a": "b" * 1000}]
+
+        # Until it's sampled, only the shallow size is known.
+        with patch("streamlit.runtime.object_size._sampler.wake_up"):
+            self.assertEqual(sys.getsizeof(value), sizes.get_size("a", value))
+
+        measure_unknown_sizes()
+        self.assertEqual(asizeof(value), sizes.get_size("a", value))
+
+    def test_sizes_are_memoized(self):
+        sizes = ObjectSizeCache()
+        value = [1, 2, 3]
+        sizes.get_size("a", value)
+        measure_unknown_sizes()
+
+        with patch("streamlit.runtime.object_size._measure_deep") as measure_deep:
+            sizes.get_size("a", value)
+            measure_unknown_sizes()
+        measure_deep.assert_not_called()
+
+    def test_replaced_object_is_remeasured(self):
+        sizes = ObjectSizeCache()
+        sizes.get_size("a", b"short")
+        self.assertEqual(sys.getsizeof(b"x" * 100), sizes.get_size("a", b"x" * 100))
+
+    def test_unknown_size_is_resampled(self):
+        """Objects of unknown types may be mutated in place, so the sampler
+        measures them again once their measurement is stale.
+        """
+        # Keep the background sampler from measuring the value concurrently.
+        sizes = ObjectSizeCache(sampler=Mock(spec=_SizeSampler))
+        value = [1]
+        sizes.get_size("a", value)
+        sizes.sample(now=0.0)
+        value.extend(range(1000))
+
+        sizes.sample(now=1.0)
+        self.assertLess(sizes.get_size("a", value), asizeof(value))
+
+        sizes.sample(now=100.0)
+        self.assertEqual(asizeof(value), sizes.get_size("a", value))
+
+    def test_get_total_size(self):
+        sizes = ObjectSizeCache()
+        self.assertEqual(
+            sys.getsizeof(1) + sys.getsizeof("two"),
+            sizes.get_total_size([("a", 1), ("b", "two")]),
+        )
+        self.assertEqual(sys.getsizeof(1), sizes.get_total_size([("a", 1)]))
+        self.assertIsNone(sizes.discard("b"))
+
+    def test_discard(self):
+        sizes = ObjectSizeCache()
+        sizes.get_size("a", 1)
+        self.assertEqual(sys.getsizeof(1), sizes.discard("a"))
+        self.assertIsNone(sizes.discard("a"))
+
+    def test_deepcopy(self):
+        sizes = ObjectSizeCache()
+        sizes.get_size("a", 1)
+        sizes_copy = deepcopy(sizes)
+        self.assertIsNone(sizes_copy.discard("a"))
+        self.assertEqual(sys.getsizeof(1), sizes.discard("a"))
@@ -18,20 +18,27 @@ import asyncio
 import os
 import shutil
 import tempfile
+import time
 import unittest
-from unittest.mock import ANY, MagicMock, call, patch
+from typing import Callable
+from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
 
 import pytest
 
 from streamlit.components.lib.local_component_registry import LocalComponentRegistry
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import (
+    BatchingSessionClient,
+    BufferedSessionClient,
     Runtime,
     RuntimeConfig,
     RuntimeState,
     SessionClient,
     SessionClientDisconnectedError,
 )
+from streamlit.runtime.caching.storage.dummy_cache_storage import (
+    MemoryCacheStorageManager,
+)
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
@@ -46,7 +53,10 @@ from tests.streamlit.message_mocks import (
     create_dataframe_msg,
     create_script_finished_message,
 )
-from tests.streamlit.runtime.runtime_test_case import RuntimeTestCase
+from tests.streamlit.runtime.runtime_test_case import (
+    MockSessionManager,
+    RuntimeTestCase,
+)
 from tests.testutil import patch_config_options
 
 
@@ -74,6 +84,10 @@ class RuntimeConfigTests(unittest.TestCase):
         )
         self.assertIs(config.session_manager_class, WebsocketSessionManager)
         self.assertIsInstance(config.session_storage, MemorySessionStorage)
+        self.assertEqual(100, config.max_flush_msgs_per_session)
+        self.assertEqual(16 * 1024 * 1024, config.max_flush_bytes_per_session)
+        self.assertEqual(0.005, config.flush_latency_target)
+        self.assertEqual(64 * 1024 * 1024, config.max_buffered_bytes_per_session)
 
 
 class RuntimeSingletonTest(unittest.TestCase):
@@ -414,6 +428,36 @@ class RuntimeTest(RuntimeTestCase):
             "not_a_session_id", MagicMock()
         )
 
+    async def test_clears_message_cache_on_stop(self):
+        """When the Runtime stops, it clears the message cache, which also
+        removes its spill directory."""
+        await self.runtime.start()
+
+        with patch.object(self.runtime._message_cache, "clear") as patched_clear:
+            self.runtime.stop()
+            await self.runtime.stopped
+
+        patched_clear.assert_called_once()
+
+    async def test_enforces_memory_budget_periodically(self):
+        """The memory budget is enforced on a timer, even if nothing is sent,
+        until the Runtime stops."""
+        with (
+            patch("streamlit.runtime.runtime.BUDGET_CHECK_INTERVAL_SECONDS", 0.01),
+            patch.object(
+                self.runtime._memory_governor, "enforce_budget"
+            ) as enforce_budget,
+        ):
+            await self.runtime.start()
+            await asyncio.sleep(0.1)
+            self.assertGreaterEqual(enforce_budget.call_count, 2)
+
+            self.runtime.stop()
+            await self.runtime.stopped
+            num_calls = enforce_budget.call_count
+            await asyncio.sleep(0.05)
+            self.assertEqual(num_calls, enforce_budget.call_count)
+
     async def test_connect_session_after_stop(self):
         """After Runtime.stop is called, `connect_session` is an error."""
         await self.runtime.start()
@@ -493,6 +537,303 @@ class RuntimeTest(RuntimeTestCase):
         received = client.forward_msgs.pop()
         self.assertEqual(populate_hash_if_needed(msg), received.hash)
 
+    async def test_only_flushes_sessions_with_enqueued_msgs(self):
+        """The loop only flushes the queues of sessions that enqueued messages."""
+        await self.runtime.start()
+
+        session_id1 = self.runtime.connect_session(
+            client=MockSessionClient(), user_info=MagicMock()
+        )
+        session_id2 = self.runtime.connect_session(
+            client=MockSessionClient(), user_info=MagicMock()
+        )
+        # Let the loop process the wakeups caused by the new connections.
+        await self.tick_runtime_loop()
+
+        session2 = self.runtime._session_mgr.get_session_info(session_id2).session
+        with patch.object(
+            session2, "flush_browser_queue", wraps=session2.flush_browser_queue
+        ) as flush_browser_queue:
+            self.enqueue_forward_msg(session_id1, create_dataframe_msg([1, 2, 3]))
+            await self.tick_runtime_loop()
+
+            flush_browser_queue.assert_not_called()
+
+    async def test_flush_msg_budget_interleaves_sessions(self):
+        """A session with more messages than its per-tick budget doesn't delay
+        the messages of other sessions until all of its messages are sent."""
+        await self.runtime.start()
+        self.runtime._max_flush_msgs_per_session = 2
+
+        written: list[tuple[str, ForwardMsg]] = []
+
+        class RecordingSessionClient(SessionClient):
+            def __init__(self, name: str):
+                self.name = name
+
+            def write_forward_msg(self, msg: ForwardMsg) -> None:
+                written.append((self.name, msg))
+
+        busy_id = self.runtime.connect_session(
+            client=RecordingSessionClient("busy"), user_info=MagicMock()
+        )
+        quiet_id = self.runtime.connect_session(
+            client=RecordingSessionClient("quiet"), user_info=MagicMock()
+        )
+        await self.tick_runtime_loop()
+
+        busy_msgs = [create_dataframe_msg([i], i) for i in range(5)]
+        for msg in busy_msgs:
+            self.enqueue_forward_msg(busy_id, msg)
+        self.enqueue_forward_msg(quiet_id, create_dataframe_msg([42]))
+        await self.tick_runtime_loop()
+
+        names = [name for name, _ in written]
+        self.assertEqual(["busy", "busy", "quiet", "busy", "busy", "busy"], names)
+        # The busy session's messages are still written in order.
+        self.assertEqual(busy_msgs, [msg for name, msg in written if name == "busy"])
+
+    async def test_flush_byte_budget(self):
+        """Messages over a session's byte budget are written on a later tick."""
+        await self.runtime.start()
+        self.runtime._max_flush_bytes_per_session = 1
+        # Don't let our manual flush below yield to the Runtime's own loop.
+        self.runtime._flush_latency_target = float("inf")
+
+        client = MockSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+        await self.tick_runtime_loop()
+
+        with patch.object(
+            self.runtime, "_send_message", wraps=self.runtime._send_message
+        ) as send_message:
+            for i in range(3):
+                self.enqueue_forward_msg(session_id, create_dataframe_msg([i], i))
+            # Run a single iteration of the flush loop.
+            self.runtime._sessions_to_flush[session_id] = None
+            await self.runtime._flush_sessions()
+
+            # At least one message is always written per tick.
+            send_message.assert_called_once()
+
+        await self.tick_runtime_loop()
+        self.assertEqual(3, len(client.forward_msgs))
+
+    async def test_flush_byte_budget_counts_unprepared_msgs(self):
+        """Messages that the broadcaster doesn't serialize, like references,
+        count towards the byte budget too."""
+        await self.runtime.start()
+        self.runtime._max_flush_bytes_per_session = 1
+        self.runtime._flush_latency_target = float("inf")
+
+        client = MockSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+        await self.tick_runtime_loop()
+
+        with patch.object(
+            self.runtime, "_send_message", wraps=self.runtime._send_message
+        ) as send_message:
+            for i in range(3):
+                self.enqueue_forward_msg(session_id, ForwardMsg(ref_hash=f"hash{i}"))
+            self.runtime._sessions_to_flush[session_id] = None
+            await self.runtime._flush_sessions()
+
+            send_message.assert_called_once()
+
+    async def test_flush_yields_between_back_to_back_ticks(self):
+        """A tick that starts right after another one yields to the eventloop
+        if the previous one was writing for longer than the latency target."""
+        await self.runtime.start()
+        self.runtime._flush_latency_target = 0.5
+        self.runtime._last_flush_yield = time.monotonic() - 1
+
+        with patch(
+            "streamlit.runtime.runtime.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep:
+            await self.runtime._flush_sessions()
+
+        sleep.assert_awaited_once_with(0)
+
+    async def test_flush_writes_batch_to_batching_client(self):
+        """A BatchingSessionClient gets all of a tick's messages in one call."""
+        await self.runtime.start()
+
+        batches: list[list[ForwardMsg]] = []
+
+        class RecordingBatchingClient(BatchingSessionClient):
+            def write_forward_msg(self, msg: ForwardMsg) -> None:
+                batches.append([msg])
+
+            def write_forward_msg_batch(self, msgs: list[ForwardMsg]) -> None:
+                batches.append(list(msgs))
+
+        session_id = self.runtime.connect_session(
+            client=RecordingBatchingClient(), user_info=MagicMock()
+        )
+        await self.tick_runtime_loop()
+        batches.clear()
+
+        msgs = [create_dataframe_msg([i], i) for i in range(3)]
+        for msg in msgs:
+            self.enqueue_forward_msg(session_id, msg)
+        await self.tick_runtime_loop()
+
+        self.assertEqual([msgs], batches)
+
+    async def test_flush_batch_disconnected_client(self):
+        """A client that disconnects during a batch write gets disconnected."""
+        await self.runtime.start()
+
+        client = MagicMock(spec=BatchingSessionClient)
+        client.write_forward_msg_batch.side_effect = SessionClientDisconnectedError()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+        await self.tick_runtime_loop()
+
+        self.enqueue_forward_msg(session_id, create_dataframe_msg([1]))
+        await self.tick_runtime_loop()
+
+        self.assertFalse(self.runtime.is_active_session(session_id))
+
+    class _RecordingBufferedClient(BufferedSessionClient):
+        """A BufferedSessionClient whose buffer only drains when told to."""
+
+        def __init__(self) -> None:
+            self.sent: list[ForwardMsg] = []
+            self.num_buffered_bytes = 0
+            self.drain_callback: Callable[[], None] | None = None
+
+        @property
+        def buffered_bytes(self) -> int:
+            return self.num_buffered_bytes
+
+        def set_drain_callback(
+            self, callback: Callable[[], None] | None, high_water_mark: int
+        ) -> None:
+            self.drain_callback = callback
+
+        def write_forward_msg(self, msg: ForwardMsg) -> None:
+            self.sent.append(msg)
+            self.num_buffered_bytes += 1
+
+        def drain(self) -> None:
+            self.num_buffered_bytes = 0
+            assert self.drain_callback is not None
+            self.drain_callback()
+
+    async def test_flush_pauses_backed_up_client(self):
+        """A client with too much buffered data isn't written to until its
+        buffer has drained."""
+        await self.runtime.start()
+        self.runtime._max_buffered_bytes_per_session = 2
+
+        client = self._RecordingBufferedClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+        await self.tick_runtime_loop()
+        client.drain()
+        await self.tick_runtime_loop()
+        client.sent.clear()
+
+        msgs = [create_dataframe_msg([i], i) for i in range(5)]
+        for msg in msgs:
+            self.enqueue_forward_msg(session_id, msg)
+        await self.tick_runtime_loop()
+
+        # The client is backed up after two messages, and stays paused.
+        self.assertEqual(msgs[:2], client.sent)
+        await self.tick_runtime_loop()
+        self.assertEqual(msgs[:2], client.sent)
+
+        client.drain()
+        await self.tick_runtime_loop()
+        self.assertEqual(msgs[:4], client.sent)
+
+        client.drain()
+        await self.tick_runtime_loop()
+        self.assertEqual(msgs, client.sent)
+
+    async def test_flush_keeps_coalescing_for_backed_up_client(self):
+        """Messages enqueued while a client is backed up stay in the session's
+        queue."""
+        await self.runtime.start()
+
+        client = self._RecordingBufferedClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+        await self.tick_runtime_loop()
+        client.sent.clear()
+        client.num_buffered_bytes = self.runtime._max_buffered_bytes_per_session
+
+        msg = create_dataframe_msg([1])
+        self.enqueue_forward_msg(session_id, msg)
+        await self.tick_runtime_loop()
+
+        self.assertEqual([], client.sent)
+        self.assertNotIn(session_id, self.runtime._unsent_msgs)
+
+        client.drain()
+        await self.tick_runtime_loop()
+        self.assertEqual([msg], client.sent)
+
+    async def test_identical_forwardmsgs_share_serialized_bytes(self):
+        """Identical messages flushed by several sessions in the same tick are
+        serialized once and the same bytes are used for every client."""
+        await self.runtime.start()
+
+        clients = [MockSessionClient() for _ in range(3)]
+        session_ids = [
+            self.runtime.connect_session(client=client, user_info=MagicMock())
+            for client in clients
+        ]
+
+        serialized_msgs: list[bytes] = []
+        for client in clients:
+            client.write_forward_msg = lambda msg: serialized_msgs.append(
+                self.runtime.serialize_forward_msg(msg)
+            )
+
+        with patch_config_options({"global.minCachedMessageSize": 0}):
+            for session_id in session_ids:
+                self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2, 3]))
+            await self.tick_runtime_loop()
+
+        self.assertEqual(3, len(serialized_msgs))
+        self.assertIs(serialized_msgs[0], serialized_msgs[1])
+        self.assertIs(serialized_msgs[0], serialized_msgs[2])
+
+        counters = {
+            stat.family_name: stat.value
+            for stat in self.runtime.stats_mgr.get_counter_stats()
+        }
+        self.assertEqual(3, counters["forward_msg_broadcast_messages"])
+        self.assertEqual(1, counters["forward_msg_broadcast_payloads"])
+
+    async def test_memory_governor_evicts_cached_messages(self):
+        """The runtime keeps its caches within the memory budget."""
+        with (
+            patch("streamlit.runtime.runtime.BUDGET_CHECK_INTERVAL_SECONDS", 0.01),
+            patch_config_options(
+                {"global.minCachedMessageSize": 0, "global.maxCacheMemoryBytes": 1}
+            ),
+        ):
+            await self.runtime.start()
+            client = MockSessionClient()
+            session_id = self.runtime.connect_session(
+                client=client, user_info=MagicMock()
+            )
+
+            msg = create_dataframe_msg([1, 2, 3])
+            self.enqueue_forward_msg(session_id, msg)
+            await self.tick_runtime_loop()
+            await asyncio.sleep(0.05)
+
+        self.assertIsNone(self.runtime.message_cache.get_message(msg.hash))
+        counters = {
+            (stat.family_name, stat.category_name): stat.value
+            for stat in self.runtime.stats_mgr.get_counter_stats()
+        }
+        self.assertEqual(
+            1, counters["memory_governor_evictions", "ForwardMessageCache"]
+        )
+
     async def test_forwardmsg_cacheable_flag(self):
         """Test that the metadata.cacheable flag is set properly on outgoing
         ForwardMsgs."""
@@ -698,6 +1039,66 @@ class RuntimeTest(RuntimeTestCase):
         self.assertIsInstance(self.runtime._get_async_objs(), AsyncObjects)
 
 
+class RuntimeExpiringSessionStorageTest(RuntimeTestCase):
+    """Tests for a Runtime whose SessionStorage reports expired sessions."""
+
+    async def asyncSetUp(self):
+        config = RuntimeConfig(
+            script_path="mock/script/path.py",
+            command_line=None,
+            component_registry=LocalComponentRegistry(),
+            media_file_storage=MemoryMediaFileStorage("/mock/media"),
+            uploaded_file_manager=MemoryUploadedFileManager("/mock/upload"),
+            session_manager_class=MockSessionManager,
+            session_storage=MagicMock(spec=MemorySessionStorage),
+            cache_storage_manager=MemoryCacheStorageManager(),
+            is_hello=False,
+        )
+        self.runtime = Runtime(config)
+        self.session_storage = config.session_storage
+
+    async def test_registers_expiration_callback(self):
+        self.session_storage.set_expiration_callback.assert_called_once_with(
+            self.runtime._on_session_expired
+        )
+
+    async def test_disconnect_session_keeps_message_cache_refs(self):
+        """Disconnecting doesn't drop the session's ForwardMsgCache refs."""
+        await self.runtime.start()
+
+        session_id = self.runtime.connect_session(
+            client=MockSessionClient(), user_info=MagicMock()
+        )
+
+        with patch.object(
+            self.runtime._message_cache, "remove_refs_for_session", new=MagicMock()
+        ) as patched_remove_refs_for_session:
+            self.runtime.disconnect_session(session_id)
+            patched_remove_refs_for_session.assert_not_called()
+
+    async def test_session_expiration_removes_message_cache_refs(self):
+        """When the SessionStorage drops a session, its ForwardMsgCache refs are
+        removed on the eventloop."""
+        await self.runtime.start()
+
+        session_id = self.runtime.connect_session(
+            client=MockSessionClient(), user_info=MagicMock()
+        )
+        session_info = self.runtime._session_mgr.get_session_info(session_id)
+
+        with patch.object(
+            self.runtime._message_cache, "remove_refs_for_session", new=MagicMock()
+        ) as patched_remove_refs_for_session:
+            self.runtime._on_session_expired(session_info)
+            # The cleanup is deferred to the eventloop.
+            patched_remove_refs_for_session.assert_not_called()
+
+            await self.tick_runtime_loop()
+            patched_remove_refs_for_session.assert_called_once_with(
+                session_info.session
+            )
+
+
 @patch("streamlit.source_util._cached_pages", new=None)
 class ScriptCheckTest(RuntimeTestCase):
     """Tests for Runtime.does_script_run_without_error"""
@@ -53,7 +53,7 @@ class MockSessionManager(SessionManager):
         session_storage: SessionStorage,
         uploaded_file_manager: UploadedFileManager,
         script_cache: ScriptCache,
-        message_enqueued_callback: Callable[[], None] | None,
+        message_enqueued_callback: Callable[[str], None] | None,
     ) -> None:
         self._uploaded_file_mgr = uploaded_file_manager
         self._script_cache = script_cache
@@ -120,7 +120,7 @@ class RuntimeTestCase(IsolatedAsyncioTestCase):
             media_file_storage=MemoryMediaFileStorage("/mock/media"),
             uploaded_file_manager=MemoryUploadedFileManager("/mock/upload"),
             session_manager_class=MockSessionManager,
-            session_storage=mock.MagicMock(),
+            session_storage=mock.MagicMock(spec=SessionStorage),
             cache_storage_manager=MemoryCacheStorageManager(),
             is_hello=False,
         )
@@ -20,6 +20,7 @@ import unittest
 
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import runtime_util
+from streamlit.runtime.forward_msg_cache import serialize_forward_msg_body
 from streamlit.runtime.runtime_util import is_cacheable_msg, serialize_forward_msg
 from tests.streamlit.message_mocks import create_dataframe_msg
 from tests.testutil import patch_config_options
@@ -34,6 +35,22 @@ class RuntimeUtilTest(unittest.TestCase):
         with patch_config_options({"global.minCachedMessageSize": 1000}):
             self.assertFalse(is_cacheable_msg(create_dataframe_msg([1, 2, 3])))
 
+    def test_serialize_forward_msg(self):
+        """Test that serialize_forward_msg produces a decodable message with a
+        populated hash, whether or not a pre-serialized payload is given.
+        """
+        msg = create_dataframe_msg([1, 2, 3])
+        body = serialize_forward_msg_body(msg)
+
+        for serialized in (
+            serialize_forward_msg(msg),
+            serialize_forward_msg(msg, body),
+        ):
+            deserialized_msg = ForwardMsg()
+            deserialized_msg.ParseFromString(serialized)
+            self.assertNotEqual("", deserialized_msg.hash)
+            self.assertEqual(msg, deserialized_msg)
+
     def test_should_limit_msg_size(self):
         max_message_size_mb = 50
 
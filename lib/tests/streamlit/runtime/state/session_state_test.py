@@ -22,6 +22,7 @@ from datetime import date, datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as hst
@@ -34,6 +35,7 @@ from streamlit.errors import (
 )
 from streamlit.proto.Common_pb2 import FileURLs as FileURLsProto
 from streamlit.proto.WidgetStates_pb2 import WidgetState as WidgetStateProto
+from streamlit.runtime.object_size import measure_unknown_sizes
 from streamlit.runtime.scriptrunner import get_script_run_ctx
 from streamlit.runtime.state import SessionState, get_session_state
 from streamlit.runtime.state.common import GENERATED_ELEMENT_ID_PREFIX
@@ -913,6 +915,32 @@ class SessionStateStatProviderTests(DeltaGeneratorTestCase):
         new_size_4 = state.get_stats()[0].byte_length
         assert new_size_4 <= new_size_3
 
+    def test_session_state_stats_are_incremental(self):
+        """Values of well-known types are measured without walking them, and
+        each value is only measured again once it's replaced.
+        """
+        state = _raw_session_state()
+        init_size = state.get_stats()[0].byte_length
+
+        arr = np.zeros(10_000)
+        state["arr"] = arr
+        state["items"] = [1, 2, 3]
+        with patch(
+            "streamlit.runtime.object_size._measure_deep", return_value=1000
+        ) as measure_deep:
+            state.get_stats()
+            measure_unknown_sizes()
+            size = state.get_stats()[0].byte_length
+            measure_unknown_sizes()
+            assert state.get_stats()[0].byte_length == size
+
+        # Only the list has an unknown type, and it's only measured once.
+        measure_deep.assert_called_once_with([1, 2, 3])
+        assert size >= init_size + arr.nbytes + 1000
+
+        del state["arr"]
+        assert state.get_stats()[0].byte_length < init_size + arr.nbytes
+
 
 class KeyIdMapperTest(unittest.TestCase):
     def test_key_id_mapping(self):
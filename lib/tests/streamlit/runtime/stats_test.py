@@ -19,6 +19,8 @@ import unittest
 from streamlit.runtime.stats import (
     CacheStat,
     CacheStatsProvider,
+    CounterStat,
+    CounterStatsProvider,
     StatsManager,
     group_stats,
 )
@@ -32,6 +34,14 @@ class MockStatsProvider(CacheStatsProvider):
         return self.stats
 
 
+class MockCounterStatsProvider(CounterStatsProvider):
+    def __init__(self):
+        self.stats: list[CounterStat] = []
+
+    def get_counter_stats(self) -> list[CounterStat]:
+        return self.stats
+
+
 class StatsManagerTest(unittest.TestCase):
     def test_get_stats(self):
         """StatsManager.get_stats should return all providers' stats."""
@@ -57,6 +67,24 @@ class StatsManagerTest(unittest.TestCase):
 
         self.assertEqual(provider1.stats + provider2.stats, manager.get_stats())
 
+    def test_get_counter_stats(self):
+        """StatsManager.get_counter_stats should return all counter providers' stats."""
+        manager = StatsManager()
+        provider1 = MockCounterStatsProvider()
+        provider2 = MockCounterStatsProvider()
+        manager.register_counter_provider(provider1)
+        manager.register_counter_provider(provider2)
+
+        # No stats
+        self.assertEqual([], manager.get_counter_stats())
+
+        provider1.stats = [CounterStat("hits", "provider1", "foo", 1)]
+        provider2.stats = [CounterStat("misses", "provider2", "bar", 2)]
+
+        self.assertEqual(provider1.stats + provider2.stats, manager.get_counter_stats())
+        # Counters are not mixed into the memory stats.
+        self.assertEqual([], manager.get_stats())
+
     def test_group_stats(self):
         """Should return stats grouped by category_name and cache_name.
         byte_length should be summed."""
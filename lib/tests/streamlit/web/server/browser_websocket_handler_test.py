@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import ANY, MagicMock, patch
 
 import tornado.httpserver
@@ -24,6 +25,7 @@ import tornado.websocket
 from streamlit.proto.BackMsg_pb2 import BackMsg
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import Runtime, SessionClientDisconnectedError
+from streamlit.web.server.browser_websocket_handler import pack_batch_frame
 from streamlit.web.server.server import BrowserWebSocketHandler
 from tests.streamlit.web.server.server_test_case import ServerTestCase
 from tests.testutil import patch_config_options
@@ -100,6 +102,138 @@ class BrowserWebSocketHandlerTest(ServerTestCase):
 
                 write_message_mock.assert_called_once()
 
+    def _create_script_finished_msgs(self, count: int) -> list[ForwardMsg]:
+        msgs = []
+        for _ in range(count):
+            msg = ForwardMsg()
+            msg.script_finished = ForwardMsg.ScriptFinishedStatus.FINISHED_SUCCESSFULLY
+            msgs.append(msg)
+        return msgs
+
+    @tornado.testing.gen_test
+    async def test_write_forward_msg_batch_single_frame(self):
+        """A client that negotiated batching gets a batch in a single frame."""
+        with (
+            self._patch_app_session(),
+            patch_config_options({"server.enableWebsocketBatching": True}),
+        ):
+            await self.server.start()
+            await self.ws_connect(protocol="streamlit-batch")
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            with patch.object(websocket_handler, "write_message") as write_message_mock:
+                msgs = self._create_script_finished_msgs(2)
+                websocket_handler.write_forward_msg_batch(msgs)
+
+                write_message_mock.assert_called_once_with(
+                    pack_batch_frame(
+                        [self.server._runtime.serialize_forward_msg(m) for m in msgs]
+                    ),
+                    binary=True,
+                )
+
+    @tornado.testing.gen_test
+    async def test_write_forward_msg_batch_not_negotiated(self):
+        """Without batching, every message of a batch gets its own frame."""
+        for protocol, enabled in [
+            ("streamlit", True),
+            ("streamlit-batch", False),
+        ]:
+            with (
+                self._patch_app_session(),
+                patch_config_options({"server.enableWebsocketBatching": enabled}),
+            ):
+                await self.server.start()
+                await self.ws_connect(protocol=protocol)
+
+                session_info = self.server._runtime._session_mgr.list_active_sessions()[
+                    -1
+                ]
+                websocket_handler = session_info.client
+
+                with patch.object(
+                    websocket_handler, "write_message"
+                ) as write_message_mock:
+                    msgs = self._create_script_finished_msgs(2)
+                    websocket_handler.write_forward_msg_batch(msgs)
+
+                    self.assertEqual(2, write_message_mock.call_count)
+
+    @tornado.testing.gen_test
+    async def test_write_forward_msg_batch_reraises_websocket_closed_error(self):
+        with (
+            self._patch_app_session(),
+            patch_config_options({"server.enableWebsocketBatching": True}),
+        ):
+            await self.server.start()
+            await self.ws_connect(protocol="streamlit-batch")
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            with patch.object(websocket_handler, "write_message") as write_message_mock:
+                write_message_mock.side_effect = tornado.websocket.WebSocketClosedError
+
+                with self.assertRaises(SessionClientDisconnectedError):
+                    websocket_handler.write_forward_msg_batch(
+                        self._create_script_finished_msgs(2)
+                    )
+
+    @tornado.testing.gen_test
+    async def test_tracks_buffered_bytes(self):
+        """Written data counts as buffered until tornado has sent it, and the
+        drain callback is only called when a backed-up buffer drops below the
+        high-water mark again.
+        """
+        with self._patch_app_session():
+            await self.server.start()
+            await self.ws_connect()
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            loop = asyncio.get_running_loop()
+            futures = [loop.create_future() for _ in range(3)]
+            msgs = self._create_script_finished_msgs(3)
+            num_bytes = len(self.server._runtime.serialize_forward_msg(msgs[0]))
+
+            drain_callback = MagicMock()
+            websocket_handler.set_drain_callback(drain_callback, 2 * num_bytes)
+
+            with patch.object(websocket_handler, "write_message", side_effect=futures):
+                # A write that drains without the buffer ever backing up
+                # doesn't call the callback.
+                websocket_handler.write_forward_msg(msgs[0])
+                self.assertEqual(num_bytes, websocket_handler.buffered_bytes)
+                futures[0].set_result(None)
+                await asyncio.sleep(0)
+                self.assertEqual(0, websocket_handler.buffered_bytes)
+                drain_callback.assert_not_called()
+
+                websocket_handler.write_forward_msg(msgs[1])
+                websocket_handler.write_forward_msg(msgs[2])
+            self.assertEqual(2 * num_bytes, websocket_handler.buffered_bytes)
+
+            futures[1].set_result(None)
+            await asyncio.sleep(0)
+            self.assertEqual(num_bytes, websocket_handler.buffered_bytes)
+            drain_callback.assert_called_once()
+
+            # A failed write doesn't count as buffered either, and draining
+            # further doesn't call the callback again.
+            futures[2].set_exception(tornado.websocket.WebSocketClosedError())
+            await asyncio.sleep(0)
+            self.assertEqual(0, websocket_handler.buffered_bytes)
+            drain_callback.assert_called_once()
+
+    def test_pack_batch_frame(self):
+        self.assertEqual(
+            b"\x00\x00\x00\x00\x01a\x00\x00\x00\x02bc",
+            pack_batch_frame([b"a", b"bc"]),
+        )
+
     @tornado.testing.gen_test
     async def test_backmsg_deserialization_exception(self):
         """If BackMsg deserialization raises an Exception, we should call the Runtime's
@@ -18,7 +18,7 @@ import json
 import mimetypes
 import os
 import tempfile
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import tornado.httpserver
 import tornado.testing
@@ -127,6 +127,37 @@ class MessageCacheHandlerTest(tornado.testing.AsyncHTTPTestCase):
         self.assertEqual(404, self.fetch("/_stcore/message").code)
         self.assertEqual(404, self.fetch("/_stcore/message?id=non_existent").code)
 
+    def test_message_cache_headers(self):
+        """Cached messages are served with immutable caching headers, and
+        revalidation requests get a 304."""
+        msg = create_dataframe_msg([1, 2, 3])
+        msg_hash = populate_hash_if_needed(msg)
+        self._cache.add_message(msg, MagicMock(), 0)
+
+        response = self.fetch("/_stcore/message?hash=%s" % msg_hash)
+        self.assertEqual(f'"{msg_hash}"', response.headers["ETag"])
+        self.assertIn("immutable", response.headers["Cache-Control"])
+        self.assertEqual(str(len(response.body)), response.headers["Content-Length"])
+
+        response = self.fetch(
+            "/_stcore/message?hash=%s" % msg_hash,
+            headers={"If-None-Match": f'"{msg_hash}"'},
+        )
+        self.assertEqual(304, response.code)
+        self.assertEqual(b"", response.body)
+
+    def test_message_cache_chunked(self):
+        """Messages larger than a chunk are written in several parts."""
+        msg = create_dataframe_msg(list(range(1000)))
+        msg_hash = populate_hash_if_needed(msg)
+        self._cache.add_message(msg, MagicMock(), 0)
+
+        with patch("streamlit.web.server.routes._MESSAGE_CHUNK_SIZE", 100):
+            response = self.fetch("/_stcore/message?hash=%s" % msg_hash)
+
+        self.assertEqual(200, response.code)
+        self.assertEqual(serialize_forward_msg(msg), response.body)
+
 
 class StaticFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def setUp(self) -> None:
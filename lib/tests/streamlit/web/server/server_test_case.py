@@ -68,7 +68,9 @@ class ServerTestCase(tornado.testing.AsyncHTTPTestCase):
         parts[0] = "ws"
         return urllib.parse.urlunparse(tuple(parts))
 
-    async def ws_connect(self, existing_session_id=None) -> WebSocketClientConnection:
+    async def ws_connect(
+        self, existing_session_id=None, protocol="streamlit"
+    ) -> WebSocketClientConnection:
         """Open a websocket connection to the server.
 
         Returns
@@ -79,9 +81,9 @@ class ServerTestCase(tornado.testing.AsyncHTTPTestCase):
         # See the comment in WebsocketConnection.tsx about how we repurpose the
         # Sec-WebSocket-Protocol header for more information on how this works.
         if existing_session_id is None:
-            subprotocols = ["streamlit", "PLACEHOLDER_AUTH_TOKEN"]
+            subprotocols = [protocol, "PLACEHOLDER_AUTH_TOKEN"]
         else:
-            subprotocols = ["streamlit", "PLACEHOLDER_AUTH_TOKEN", existing_session_id]
+            subprotocols = [protocol, "PLACEHOLDER_AUTH_TOKEN", existing_session_id]
 
         return await tornado.websocket.websocket_connect(
             self.get_ws_url("/_stcore/stream"),
@@ -22,7 +22,7 @@ from google.protobuf.json_format import MessageToDict
 from tornado.httputil import HTTPHeaders
 
 from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import CacheStat, CounterStat
 from streamlit.web.server.server import METRIC_ENDPOINT
 from streamlit.web.server.stats_request_handler import StatsRequestHandler
 
@@ -30,8 +30,12 @@ from streamlit.web.server.stats_request_handler import StatsRequestHandler
 class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def get_app(self):
         self.mock_stats = []
+        self.mock_counter_stats = []
         mock_stats_manager = MagicMock()
         mock_stats_manager.get_stats = MagicMock(side_effect=lambda: self.mock_stats)
+        mock_stats_manager.get_counter_stats = MagicMock(
+            side_effect=lambda: self.mock_counter_stats
+        )
         return tornado.web.Application(
             [
                 (
@@ -97,6 +101,61 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
 
         self.assertEqual(expected_body, response.body)
 
+    def test_has_counter_stats(self):
+        self.mock_stats = [CacheStat("st.memo", "bar", 256)]
+        self.mock_counter_stats = [
+            CounterStat("cache_hits", "st.memo", "bar", 3),
+            CounterStat("cache_misses", "st.memo", "bar", 1),
+            CounterStat("cache_hits", "st.memo", "baz", 5),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            b"# TYPE cache_memory_bytes gauge\n"
+            b"# UNIT cache_memory_bytes bytes\n"
+            b"# HELP Total memory consumed by a cache.\n"
+            b'cache_memory_bytes{cache_type="st.memo",cache="bar"} 256\n'
+            b"# TYPE cache_hits counter\n"
+            b'cache_hits_total{cache_type="st.memo",cache="bar"} 3\n'
+            b'cache_hits_total{cache_type="st.memo",cache="baz"} 5\n'
+            b"# TYPE cache_misses counter\n"
+            b'cache_misses_total{cache_type="st.memo",cache="bar"} 1\n'
+            b"# EOF\n"
+        )
+
+        self.assertEqual(expected_body, response.body)
+
+    def test_protobuf_counter_stats(self):
+        """Counters are returned as COUNTER metric families in protobuf format."""
+        self.mock_counter_stats = [CounterStat("cache_hits", "st.memo", "bar", 3)]
+
+        headers = HTTPHeaders()
+        headers.add("Accept", "application/x-protobuf")
+        response = self.fetch("/_stcore/metrics", headers=headers)
+        self.assertEqual(200, response.code)
+
+        metric_set = MetricSetProto()
+        metric_set.ParseFromString(response.body)
+
+        self.assertEqual(
+            {
+                "name": "cache_hits",
+                "type": "COUNTER",
+                "metrics": [
+                    {
+                        "labels": [
+                            {"name": "cache_type", "value": "st.memo"},
+                            {"name": "cache", "value": "bar"},
+                        ],
+                        "metricPoints": [{"counterValue": {"intValue": "3"}}],
+                    }
+                ],
+            },
+            MessageToDict(metric_set)["metricFamilies"][1],
+        )
+
     def test_new_metrics_endpoint_should_not_display_deprecation_warning(self):
         response = self.fetch("/_stcore/metrics")
         self.assertNotIn("link", response.headers)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare converting Polars dataframes to Arrow bytes directly with the
+previous round-trip through Pandas.
+
+Each conversion runs in a fresh process, so that its peak memory can be
+measured as the growth of the process's maximum resident set size. Arrow
+truncation is disabled, so both variants serialize the whole frame.
+
+Requires `polars`. Only works on Unix-like systems.
+
+Usage: python scripts/benchmark_arrow_conversion.py [--rows 10000000]
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+
+
+def _max_rss_mib() -> float:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere.
+    return max_rss / 1024 / 1024 if sys.platform == "darwin" else max_rss / 1024
+
+
+def _make_frame(num_rows: int):
+    import numpy as np
+    import polars as pl
+
+    rng = np.random.default_rng(0)
+    return pl.DataFrame(
+        {
+            "int": np.arange(num_rows),
+            "float": rng.random(num_rows),
+            "str": pl.Series(rng.integers(0, 1000, num_rows)).cast(pl.String),
+            "category": pl.Series(rng.integers(0, 10, num_rows))
+            .cast(pl.String)
+            .cast(pl.Categorical),
+        }
+    )
+
+
+def _run(variant: str, num_rows: int) -> tuple[float, float, int]:
+    from streamlit import config, dataframe_util
+
+    config.set_option("server.enableArrowTruncation", False)
+    df = _make_frame(num_rows)
+    rss_before = _max_rss_mib()
+
+    start = time.perf_counter()
+    if variant == "direct":
+        data = dataframe_util.convert_anything_to_arrow_bytes(df)
+    else:
+        data = dataframe_util.convert_pandas_df_to_arrow_bytes(
+            dataframe_util.convert_anything_to_pandas_df(df)
+        )
+    duration = time.perf_counter() - start
+
+    return duration, _max_rss_mib() - rss_before, len(data)
+
+
+@click.command()
+@click.option("--rows", default=10_000_000, help="Number of rows per frame.")
+@click.option("--repeat", default=3, help="Take the best of this many runs.")
+def main(rows: int, repeat: int) -> None:
+    click.secho(f"\n{rows:,} rows", bold=True)
+    context = multiprocessing.get_context("spawn")
+
+    for variant in ("direct", "via pandas"):
+        results = []
+        for _ in range(repeat):
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                results.append(executor.submit(_run, variant, rows).result())
+
+        duration, peak_mib, num_bytes = min(results)
+        click.echo(
+            f"  {variant:<12} {duration * 1000:9.1f} ms"
+            f"  {peak_mib:9.1f} MiB peak"
+            f"  {num_bytes / 1024 / 1024:9.1f} MiB Arrow bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2025)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the throughput of the hash engines in streamlit.hash_util.
+
+The previous hashes (md5 for ForwardMsgs and element IDs, sha224 for media
+files) are included as a baseline. Engines whose module isn't installed are
+skipped; install `xxhash` and/or `blake3` to include them.
+
+Usage: python scripts/benchmark_hash_engines.py [--sizes-mb 1 8 64]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import timeit
+
+import click
+
+from streamlit import hash_util
+
+
+def _baseline_sha224():
+    return hashlib.new("sha224", usedforsecurity=False)
+
+
+@click.command()
+@click.option(
+    "--sizes-mb",
+    multiple=True,
+    type=float,
+    default=[1, 8, 64],
+    help="Payload sizes to hash, in MiB.",
+)
+@click.option("--repeat", default=5, help="Take the best of this many runs.")
+def main(sizes_mb: tuple[float, ...], repeat: int) -> None:
+    engines = {
+        name: factory
+        for name, factory in hash_util.HASH_ENGINES.items()
+        if hash_util._is_engine_available(name)
+    }
+    engines["sha224 (baseline)"] = _baseline_sha224
+
+    for size_mb in sizes_mb:
+        payload = os.urandom(int(size_mb * 1024 * 1024))
+        click.secho(f"\n{size_mb:g} MiB payload", bold=True)
+
+        for name, factory in engines.items():
+
+            def run(factory=factory, payload=payload):
+                h = factory()
+                h.update(payload)
+                h.hexdigest()
+
+            best = min(timeit.repeat(run, number=1, repeat=repeat))
+            throughput = size_mb / 1024 / best
+            click.echo(f"  {name:<20} {best * 1000:9.2f} ms  {throughput:7.2f} GiB/s")
+
+
+if __name__ == "__main__":
+    main()